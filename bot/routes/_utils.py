@@ -1,11 +1,23 @@
-"""Shared utilities for dashboard routes — SSH proxy for fresh data from Pro."""
+"""Shared utilities for dashboard routes — SSH proxy for fresh data from Pro,
+and file-keyed response caching for JSON routes."""
 from __future__ import annotations
 
+import copy
+import fnmatch
+import functools
+import gzip
+import hashlib
 import json
 import logging
+import os
 import subprocess
+import threading
 import time
+from collections import defaultdict
 from pathlib import Path
+from typing import Callable, Iterable, Union
+
+from flask import Response, make_response, request
 
 log = logging.getLogger(__name__)
 
@@ -119,3 +131,225 @@ def read_fresh_jsonl(local_path: Path, remote_path: str, stale_seconds: int = 12
         except Exception:
             pass
     return lines
+
+
+# ── File-keyed response cache ───────────────────────────────────────
+#
+# Dashboard tabs poll the same JSON routes every few seconds while the data
+# files underneath change every few minutes. @file_cached(inputs...) keys a
+# route's response on its path + query string and the (mtime, size) of the
+# files it reads, serves the stored body while they're unchanged, answers
+# If-None-Match with 304 and gzips large bodies once at store time.
+
+FileInput = Union[Path, str, Callable[[], Iterable[Path]]]
+
+GZIP_MIN_BYTES = 2048
+ROUTE_CACHE_MAX_ENTRIES = 512
+
+_route_cache: dict[tuple, dict] = {}
+_route_stats: dict[str, dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0, "not_modified": 0})
+_route_lock = threading.Lock()
+
+
+def _fingerprint(inputs: tuple[FileInput, ...]) -> tuple:
+    """(path, mtime_ns, size) for every declared input; missing files count as (0, -1)."""
+    parts = []
+    for item in inputs:
+        paths = item() if callable(item) else (item,)
+        for p in paths:
+            try:
+                st = os.stat(p)
+                parts.append((str(p), st.st_mtime_ns, st.st_size))
+            except OSError:
+                parts.append((str(p), 0, -1))
+    return tuple(parts)
+
+
+def _cached_response(entry: dict, name: str, fresh: bool) -> Response:
+    if entry["etag"] in request.headers.get("If-None-Match", ""):
+        with _route_lock:
+            _route_stats[name]["not_modified"] += 1
+        resp = Response(status=304)
+    elif entry["gz"] is not None and "gzip" in request.headers.get("Accept-Encoding", ""):
+        resp = Response(entry["gz"], mimetype=entry["mimetype"])
+        resp.headers["Content-Encoding"] = "gzip"
+    else:
+        resp = Response(entry["body"], mimetype=entry["mimetype"])
+    resp.headers["ETag"] = entry["etag"]
+    resp.headers["Vary"] = "Accept-Encoding"
+    resp.headers["Cache-Control"] = "no-cache"  # always revalidate — cheap 304 when idle
+    resp.headers["X-Route-Cache"] = "miss" if fresh else "hit"
+    return resp
+
+
+def file_cached(*inputs: FileInput, max_age: float = 300):
+    """Cache a JSON route's response until one of its input files changes.
+
+    inputs: paths the route reads, or callables returning paths (e.g. a glob).
+    max_age: upper bound on reuse, for routes that also fold in clock time,
+             SSH-fetched data or other state the fingerprint can't see.
+    """
+    def decorator(view):
+        name = view.__name__
+
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            key = (name, request.path, request.query_string)
+            fp = _fingerprint(inputs)
+            now = time.time()
+
+            with _route_lock:
+                entry = _route_cache.get(key)
+            if entry and entry["fp"] == fp and now - entry["at"] < max_age:
+                with _route_lock:
+                    _route_stats[name]["hits"] += 1
+                return _cached_response(entry, name, fresh=False)
+
+            with _route_lock:
+                _route_stats[name]["misses"] += 1
+            resp = make_response(view(*args, **kwargs))
+            if resp.status_code != 200 or resp.is_streamed:
+                return resp
+
+            body = resp.get_data()
+            entry = {
+                "fp": fp,
+                "at": now,
+                "etag": '"%s"' % hashlib.sha1(body).hexdigest()[:20],
+                "body": body,
+                "gz": gzip.compress(body, compresslevel=5) if len(body) >= GZIP_MIN_BYTES else None,
+                "mimetype": resp.mimetype,
+            }
+            with _route_lock:
+                _route_cache[key] = entry
+                if len(_route_cache) > ROUTE_CACHE_MAX_ENTRIES:
+                    # Odd query strings shouldn't grow this forever — drop the oldest
+                    oldest = min(_route_cache, key=lambda k: _route_cache[k]["at"])
+                    del _route_cache[oldest]
+            return _cached_response(entry, name, fresh=True)
+
+        return wrapper
+    return decorator
+
+
+def route_cache_stats() -> dict:
+    """Per-route hit/miss/304 counters for @file_cached routes."""
+    with _route_lock:
+        out = {}
+        for name, c in _route_stats.items():
+            served = c["hits"] + c["misses"]
+            out[name] = {**c, "hit_rate": round(c["hits"] / served, 4) if served else 0.0}
+        return out
+
+
+# ── Per-file summaries ──────────────────────────────────────────────
+#
+# Aggregate routes (/api/overview, /api/intelligence) reduce dozens of agent
+# data files — some of them large JSONL logs — to a few counters each.
+# file_summary(path, reducer) keeps each reducer's result in memory keyed by
+# the file's (mtime_ns, size) and only re-runs it when that changes, so a
+# request costs one stat() per source no matter how big the files grow.
+
+_summary_cache: dict[tuple[str, Callable], tuple[tuple[int, int], object]] = {}
+_summary_stats = {"hits": 0, "refreshes": 0}
+_summary_lock = threading.Lock()
+
+
+def file_summary(path: Path | str, reducer: Callable[[Path], object], default=None):
+    """reducer(path), recomputed only when the file's mtime or size changes.
+
+    Missing files return default. A reducer that raises is cached too, and
+    re-raises until the file changes, so callers keep their error handling.
+    Reducers must be module-level functions (they are part of the key) and
+    callers must treat the result as read-only.
+    """
+    key = (str(path), reducer)
+    try:
+        st = os.stat(path)
+    except OSError:
+        with _summary_lock:
+            _summary_cache.pop(key, None)
+        return default
+    sig = (st.st_mtime_ns, st.st_size)
+
+    with _summary_lock:
+        cached = _summary_cache.get(key)
+    if cached is not None and cached[0] == sig:
+        with _summary_lock:
+            _summary_stats["hits"] += 1
+        value = cached[1]
+    else:
+        try:
+            value = reducer(path)
+        except Exception as e:
+            value = e.with_traceback(None)
+        with _summary_lock:
+            _summary_stats["refreshes"] += 1
+            _summary_cache[key] = (sig, value)
+    if isinstance(value, Exception):
+        raise _fresh_exception(value)
+    return value
+
+
+def _fresh_exception(e: Exception) -> Exception:
+    """Copy of a cached reducer error, so raising it never grows one shared traceback."""
+    try:
+        return copy.copy(e)
+    except Exception:
+        return e.with_traceback(None)
+
+
+def file_summaries(directory: Path, pattern: str, reducer: Callable[[Path], object]) -> list:
+    """file_summary() for every file matching pattern in directory, in name order.
+
+    Unreadable files are skipped. Cached summaries of matching files that
+    have since been deleted are dropped.
+    """
+    base = str(directory)
+    try:
+        names = sorted(e.name for e in os.scandir(directory) if fnmatch.fnmatchcase(e.name, pattern))
+    except OSError:
+        names = []
+    _drop_stale_summaries(base, pattern, reducer, set(names))
+    out = []
+    for name in names:
+        try:
+            value = file_summary(os.path.join(base, name), reducer)
+        except Exception:
+            continue
+        if value is not None:
+            out.append(value)
+    return out
+
+
+def _drop_stale_summaries(base: str, pattern: str, reducer: Callable, present: set[str]) -> None:
+    with _summary_lock:
+        stale = [
+            key for key in _summary_cache
+            if key[1] is reducer and os.path.dirname(key[0]) == base
+            and fnmatch.fnmatchcase(os.path.basename(key[0]), pattern)
+            and os.path.basename(key[0]) not in present
+        ]
+        for key in stale:
+            del _summary_cache[key]
+
+
+def read_json(path: Path):
+    """Parse a JSON file (reducer for file_summary when the whole document is small)."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def json_len(path: Path) -> int:
+    """len() of a JSON document."""
+    return len(read_json(path))
+
+
+def summary_cache_stats() -> dict:
+    """Hit/refresh counters for file_summary()."""
+    with _summary_lock:
+        stats = dict(_summary_stats)
+        stats["sources"] = len(_summary_cache)
+    served = stats["hits"] + stats["refreshes"]
+    stats["hit_rate"] = round(stats["hits"] / served, 4) if served else 0.0
+    return stats
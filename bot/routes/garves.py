@@ -22,7 +22,7 @@ from bot.shared import (
     SHELBY_ROOT_DIR,
     SHELBY_TASKS_FILE,
 )
-from bot.routes._utils import read_fresh
+from bot.routes._utils import file_cached, read_fresh
 
 garves_bp = Blueprint("garves", __name__)
 
@@ -207,6 +207,7 @@ def api_garves_toggle_mode():
 
 
 @garves_bp.route("/api/trades")
+@file_cached(TRADES_FILE, max_age=60)
 def api_trades():
     trades = _load_trades()
     now = time.time()
@@ -365,6 +366,7 @@ def api_trades():
 
 
 @garves_bp.route("/api/trades/live")
+@file_cached(TRADES_FILE, max_age=60)
 def api_trades_live():
     """Live (real money) trades only."""
     all_trades = _load_trades()
@@ -373,6 +375,7 @@ def api_trades_live():
 
 
 @garves_bp.route("/api/trades/sim")
+@file_cached(TRADES_FILE, max_age=60)
 def api_trades_sim():
     """Dry-run (simulation) trades only."""
     all_trades = _load_trades()
@@ -1494,9 +1497,10 @@ def ml_status():
 
     # FinBERT
     try:
-        from shared.sentiment import _pipeline, _load_attempted
+        from shared.sentiment import _pipeline, _load_attempted, configured_backend
         if _pipeline is not None:
-            status["finbert"] = {"status": "loaded", "model": "ProsusAI/finbert"}
+            status["finbert"] = {"status": "loaded", "model": "ProsusAI/finbert",
+                                 "backend": configured_backend()}
         elif _load_attempted:
             status["finbert"] = {"status": "failed"}
         else:
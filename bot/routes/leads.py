@@ -1,21 +1,15 @@
 """Leads Pipeline Dashboard routes: /api/leads/*"""
 from __future__ import annotations
 
-import json
 import logging
 import time
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 
 from flask import Blueprint, jsonify
 
 log = logging.getLogger(__name__)
 leads_bp = Blueprint("leads", __name__)
 
-DATA_DIR = Path(__file__).parent.parent.parent / "data"
-OUTREACH_QUEUE = DATA_DIR / "outreach_queue.json"
-OUTREACH_SEQ = DATA_DIR / "outreach_sequences.json"
-
 ET = timezone(timedelta(hours=-5))
 
 NICHE_COLORS = {
@@ -32,7 +26,7 @@ NICHE_COLORS = {
     "periodontics": "#3b82f6",
 }
 
-# Simple TTL cache to avoid re-reading JSON every 10s
+# Simple TTL cache to avoid re-reading the state store on every poll
 _cache: dict = {}
 
 
@@ -46,25 +40,19 @@ def _niche_color(niche: str) -> str:
     return "#64748b"
 
 
-def _load_json_cached(path: Path, ttl: int = 30):
-    """Load JSON with stat-based TTL cache."""
+def _load_store_cached(name: str, loader, ttl: int = 10):
+    """Read queue/sequence state from the Viper state store with a short TTL cache."""
     now = time.monotonic()
-    entry = _cache.get(path)
-    if entry:
-        try:
-            mtime = path.stat().st_mtime if path.exists() else 0
-        except OSError:
-            mtime = 0
-        if now - entry["ts"] < ttl and mtime == entry["mtime"]:
-            return entry["data"]
-    if not path.exists():
-        return None
+    entry = _cache.get(name)
+    if entry and now - entry["ts"] < ttl:
+        return entry["data"]
     try:
-        data = json.loads(path.read_text())
-        _cache[path] = {"data": data, "ts": now, "mtime": path.stat().st_mtime}
-        return data
-    except Exception:
-        return None
+        data = loader()
+    except Exception as e:
+        log.debug("leads: %s load failed: %s", name, e)
+        return entry["data"] if entry else None
+    _cache[name] = {"data": data, "ts": now}
+    return data
 
 
 @leads_bp.route("/api/leads/pipeline")
@@ -72,8 +60,10 @@ def api_leads_pipeline():
     """Full pipeline data for the Leads Dashboard."""
     now = time.time()
 
-    queue = _load_json_cached(OUTREACH_QUEUE) or []
-    sequences = _load_json_cached(OUTREACH_SEQ) or []
+    from viper.outreach.approval_queue import _load_queue
+    from viper.outreach.email_sequences import _load_sequences
+    queue = _load_store_cached("queue", _load_queue) or []
+    sequences = _load_store_cached("sequences", _load_sequences) or []
 
     # Single pass over queue for all counters + lead table
     stage_counts: dict[str, int] = {}
@@ -62,10 +62,9 @@ def llm_status():
 def llm_costs():
     """Cost tracking data — local vs cloud calls, daily savings."""
     try:
-        sys.path.insert(0, str(SHARED_DIR))
-        from llm_client import get_cost_summary
-        summary_24h = get_cost_summary(hours=24)
-        summary_7d = get_cost_summary(hours=168)
+        from shared.llm_cost_index import summary
+        summary_24h = summary(hours=24)
+        summary_7d = summary(hours=168)
     except Exception as e:
         log.debug("LLM cost summary failed: %s", str(e)[:100])
         summary_24h = {"total_calls": 0, "total_cost": 0}
@@ -110,7 +109,6 @@ def llm_memory_all():
     agents = [
         "shelby", "atlas", "lisa", "soren",
         "garves", "quant", "viper", "robotox", "thor",
-        ,
     ]
     try:
         sys.path.insert(0, str(SHARED_DIR))
@@ -251,27 +249,18 @@ def llm_cost_savings():
     total_cloud_cost = 0.0
     estimated_savings = 0.0
 
-    if COSTS_FILE.exists():
-        try:
-            lines = COSTS_FILE.read_text().strip().split("\n")
-            for line in lines:
-                if not line.strip():
-                    continue
-                try:
-                    entry = json.loads(line)
-                    provider = entry.get("provider", "")
-                    cost = entry.get("cost", 0)
-                    if "local" in provider.lower():
-                        total_local_calls += 1
-                        # Estimated cloud cost if this had been a cloud call
-                        estimated_savings += 0.002  # ~$0.002 per call saved
-                    else:
-                        total_cloud_calls += 1
-                        total_cloud_cost += cost if isinstance(cost, (int, float)) else 0
-                except (json.JSONDecodeError, Exception):
-                    continue
-        except Exception:
-            pass
+    try:
+        from shared.llm_cost_index import totals
+        for row in totals():
+            if "local" in row["provider"].lower():
+                total_local_calls += row["calls"]
+                # Estimated cloud cost if these had been cloud calls
+                estimated_savings += row["calls"] * 0.002  # ~$0.002 per call saved
+            else:
+                total_cloud_calls += row["calls"]
+                total_cloud_cost += row["cost"]
+    except Exception as e:
+        log.debug("LLM cost savings failed: %s", str(e)[:100])
 
     return jsonify({
         "local_calls": total_local_calls,
@@ -477,12 +466,19 @@ def llm_reset_agent_memory():
 
 @llm_bp.route("/api/llm/actions/compact-costs", methods=["POST"])
 def llm_compact_costs():
-    """Compact cost log — keep last 7 days, archive the rest."""
+    """Compact cost log — keep last 7 days, archive the rest.
+
+    Aggregates in shared.llm_cost_index are brought up to date first and the
+    index cursor is moved to the end of the rewritten file, so running totals
+    survive compaction without double counting.
+    """
     if not COSTS_FILE.exists():
         return jsonify({"message": "No cost log to compact"})
 
     try:
+        from shared import llm_cost_index
         lines = COSTS_FILE.read_text().strip().split("\n")
+        llm_cost_index.ingest(COSTS_FILE)
         original_count = len(lines)
         cutoff = time.time() - (7 * 86400)
 
@@ -513,6 +509,7 @@ def llm_compact_costs():
             with open(archive_path, "a") as f:
                 f.write("\n".join(archived) + "\n")
             COSTS_FILE.write_text("\n".join(kept) + "\n")
+            llm_cost_index.mark_compacted(COSTS_FILE)
 
         return jsonify({
             "original_lines": original_count,
@@ -9,7 +9,7 @@ from pathlib import Path
 
 from flask import Blueprint, jsonify
 
-from bot.routes._utils import read_fresh
+from bot.routes._utils import file_cached, read_fresh
 
 log = logging.getLogger(__name__)
 oracle_bp = Blueprint("oracle", __name__)
@@ -41,6 +41,7 @@ def _query_db(query: str, params: tuple = ()) -> list[dict]:
 
 
 @oracle_bp.route("/api/oracle")
+@file_cached(STATUS_FILE, DB_FILE, DB_FILE.with_name(DB_FILE.name + "-wal"), max_age=120)
 def api_oracle():
     """Oracle overview — status + latest cycle info."""
     status = _load_status()
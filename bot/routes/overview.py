@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import json
 import os
-import subprocess
 import sys
 import time
 from datetime import datetime, timezone, timedelta
@@ -12,7 +11,15 @@ from pathlib import Path
 
 from flask import Blueprint, jsonify
 
-from bot.routes._utils import read_fresh, read_fresh_list
+from bot.routes._utils import (
+    file_summaries,
+    file_summary,
+    json_len,
+    read_fresh,
+    read_fresh_list,
+    read_json,
+)
+from bot.routes.system import process_running
 
 from bot.shared import (
     _load_trades,
@@ -20,6 +27,7 @@ from bot.shared import (
     ET,
     DATA_DIR,
     INDICATOR_ACCURACY_FILE,
+    TRADES_FILE,
     SOREN_QUEUE_FILE,
     ATLAS_ROOT,
     MERCURY_ROOT,
@@ -34,6 +42,197 @@ overview_bp = Blueprint("overview", __name__)
 THOR_DATA = Path.home() / "thor" / "data"
 
 
+# ── Source reducers ─────────────────────────────────────────────────
+#
+# /api/overview and /api/intelligence only need a few counters from each
+# agent's data files. Each reducer turns one file into that summary;
+# file_summary() keeps it until the file's mtime/size changes.
+
+def _iter_jsonl(path: Path):
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _reduce_overview_trades(path: Path) -> dict:
+    """Garves counts for the overview grid (deduped like _load_trades)."""
+    trades = _load_trades()
+    resolved = [t for t in trades if t.get("resolved") and t.get("outcome") not in ("unknown", None)]
+    return {
+        "total": len(trades),
+        "resolved": len(resolved),
+        "wins": sum(1 for t in resolved if t.get("won")),
+        "unresolved": sum(1 for t in trades if not t.get("resolved")),
+    }
+
+
+_EMPTY_TRADE_LOG = {
+    "total": 0, "resolved": 0, "wins": 0, "assets": frozenset(), "timeframes": frozenset(),
+    "categories": frozenset(), "avg_edge": 0, "avg_resolved_edge": 0,
+}
+_EMPTY_HISTORY = {
+    "total": 0, "resolved": 0, "wins": 0, "days": 0, "avg_edge": 0,
+    "assets": frozenset(), "timeframes": frozenset(),
+}
+
+
+def _reduce_trade_log(path: Path) -> dict:
+    """Raw trades.jsonl / hawk_trades.jsonl stats (every line, no dedupe)."""
+    total = resolved = wins = 0
+    assets, timeframes, categories = set(), set(), set()
+    resolved_edges, edges = [], []
+    for t in _iter_jsonl(path):
+        total += 1
+        assets.add(t.get("asset", ""))
+        timeframes.add(t.get("timeframe", ""))
+        if t.get("category"):
+            categories.add(t["category"])
+        if t.get("edge"):
+            edges.append(t["edge"])
+        if t.get("resolved"):
+            resolved += 1
+            wins += 1 if t.get("won") else 0
+            if t.get("edge"):
+                resolved_edges.append(t["edge"])
+    return {
+        "total": total,
+        "resolved": resolved,
+        "wins": wins,
+        "assets": frozenset(assets),
+        "timeframes": frozenset(timeframes),
+        "categories": frozenset(categories),
+        "avg_edge": sum(edges) / len(edges) if edges else 0,
+        "avg_resolved_edge": sum(resolved_edges) / len(resolved_edges) if resolved_edges else 0,
+    }
+
+
+def _reduce_daily_reports(path: Path) -> dict:
+    out = dict(_EMPTY_HISTORY)
+    try:
+        with open(path) as f:
+            daily_reports = json.load(f)
+        assets, timeframes = set(), set()
+        edge_sum = 0
+        for dr in daily_reports:
+            s = dr.get("summary", {})
+            out["total"] += s.get("total_trades", 0)
+            out["resolved"] += s.get("resolved", 0)
+            out["wins"] += s.get("wins", 0)
+            out["days"] += 1
+            edge_sum += s.get("avg_edge", 0)
+            assets.update(dr.get("by_asset", {}))
+            timeframes.update(dr.get("by_timeframe", {}))
+        out["avg_edge"] = edge_sum / out["days"] if out["days"] else 0
+        out["assets"], out["timeframes"] = frozenset(assets), frozenset(timeframes)
+    except Exception:
+        pass
+    return out
+
+
+def _reduce_content_queue(path: Path) -> dict:
+    queue = read_json(path)
+    return {
+        "size": len(queue),
+        "posted": sum(1 for x in queue if x.get("status") == "posted"),
+        "pending": sum(1 for x in queue if x.get("status") == "pending"),
+        "approved": sum(1 for x in queue if x.get("status") == "approved"),
+        "pillars": len(set(i.get("pillar", "") for i in queue if i.get("pillar"))),
+        "platforms": len(set(i.get("platform", "") for i in queue if i.get("platform"))),
+    }
+
+
+def _reduce_posting_log(path: Path) -> dict:
+    mlog = read_json(path)
+    reviewed = [p for p in mlog if p.get("review_score") is not None and p.get("review_score", -1) != -1]
+    avg = round(sum(p["review_score"] for p in reviewed) / len(reviewed), 1) if reviewed else None
+    return {"total": len(mlog), "review_avg": avg}
+
+
+def _reduce_improvements(path: Path) -> int:
+    return sum(len(v) for v in read_json(path).values() if isinstance(v, list))
+
+
+def _reduce_assessments(path: Path) -> dict:
+    assessments = read_json(path)
+    avg = 0
+    if assessments:
+        agent_scores = [a.get("score", 0) for a in assessments.values()]
+        avg = sum(agent_scores) / len(agent_scores) if agent_scores else 0
+    return {"count": len(assessments), "avg_score": avg}
+
+
+def _reduce_shelby_tasks(path: Path) -> tuple[int, int]:
+    tasks = read_json(path)
+    return sum(1 for t in tasks if t.get("done") or t.get("status") == "done"), len(tasks)
+
+
+def _reduce_insights_count(path: Path) -> int:
+    return len(read_json(path).get("insights", []))
+
+
+def _reduce_review_avg(path: Path) -> float:
+    reviews = read_json(path)
+    scores_list = [r.get("score", 0) for r in reviews if r.get("score")] if reviews else []
+    return sum(scores_list) / len(scores_list) if scores_list else 0
+
+
+def _reduce_str_len(path: Path) -> int:
+    return len(str(read_json(path)))
+
+
+def _reduce_scans(path: Path) -> tuple[int, int]:
+    scans = read_json(path)
+    if not isinstance(scans, list):
+        return 0, 0
+    return len(scans), sum(s.get("issues_found", s.get("issues", 0)) for s in scans)
+
+
+def _reduce_config_agents(path: Path) -> int:
+    return len(read_json(path).get("agents", {}))
+
+
+def _reduce_thor_task(path: Path) -> tuple[str, str, int]:
+    td = read_json(path)
+    return td.get("status", ""), td.get("agent", ""), td.get("retries", 0)
+
+
+def _reduce_thor_activity(path: Path) -> dict:
+    out = {"tokens": 0, "sonnet": 0, "opus": 0, "test_passes": 0, "test_total": 0}
+    for a in read_json(path):
+        out["tokens"] += a.get("tokens", 0)
+        model = a.get("model", "")
+        if "sonnet" in model:
+            out["sonnet"] += 1
+        elif "opus" in model:
+            out["opus"] += 1
+        if a.get("test_passed") is True:
+            out["test_passes"] += 1
+            out["test_total"] += 1
+        elif a.get("test_passed") is False:
+            out["test_total"] += 1
+    return out
+
+
+def _reduce_test_passed(path: Path):
+    return read_json(path).get("test_passed")
+
+
+def _reduce_opportunities_len(path: Path) -> int:
+    return len(read_json(path).get("opportunities", []))
+
+
+def _reduce_has_opportunities(path: Path) -> bool:
+    so = read_json(path)
+    return so.get("count", 0) > 0 or len(so.get("opportunities", [])) > 0
+
+
+def _reduce_odin_trades(path: Path) -> tuple[int, int]:
+    trades = [json.loads(l) for l in path.read_text().strip().split("\n") if l.strip()]
+    return len(trades), sum(1 for t in trades if t.get("is_win"))
+
+
 def _get_thor_overview() -> dict:
     """Quick Thor status for overview grid."""
     try:
@@ -43,18 +242,10 @@ def _get_thor_overview() -> dict:
         if data:
             state = data.get("state", "offline")
 
-        pending = completed = 0
-        tasks_dir = THOR_DATA / "tasks"
-        if tasks_dir.exists():
-            for f in tasks_dir.glob("task_*.json"):
-                try:
-                    td = json.loads(f.read_text())
-                    if td.get("status") == "pending":
-                        pending += 1
-                    elif td.get("status") == "completed":
-                        completed += 1
-                except Exception:
-                    pass
+        statuses = [status for status, _, _ in
+                    file_summaries(THOR_DATA / "tasks", "task_*.json", _reduce_thor_task)]
+        pending = statuses.count("pending")
+        completed = statuses.count("completed")
 
         return {"state": state, "pending": pending, "completed": completed}
     except Exception:
@@ -97,59 +288,40 @@ def api_overview():
             pass
 
     # Garves
-    trades = _load_trades()
-    resolved = [t for t in trades if t.get("resolved") and t.get("outcome") not in ("unknown", None)]
-    wins = sum(1 for t in resolved if t.get("won"))
-    garves_wr = (wins / len(resolved) * 100) if resolved else 0
-    garves_running = False
-    try:
-        result = subprocess.run(["pgrep", "-f", "bot.main"], capture_output=True, text=True)
-        garves_running = bool(result.stdout.strip())
-    except Exception:
-        pass
+    garves = file_summary(TRADES_FILE, _reduce_overview_trades,
+                          {"total": 0, "resolved": 0, "wins": 0, "unresolved": 0})
+    garves_wr = (garves["wins"] / garves["resolved"] * 100) if garves["resolved"] else 0
+    garves_running = process_running("bot.main")
 
     # Indicator accuracy
     accuracy_data = {}
-    if INDICATOR_ACCURACY_FILE.exists():
-        try:
-            with open(INDICATOR_ACCURACY_FILE) as f:
-                accuracy_data = json.load(f)
-        except Exception:
-            pass
+    try:
+        accuracy_data = file_summary(INDICATOR_ACCURACY_FILE, read_json, {})
+    except Exception:
+        pass
 
     # Soren
     soren_queue = 0
     soren_posted = 0
-    if SOREN_QUEUE_FILE.exists():
-        try:
-            with open(SOREN_QUEUE_FILE) as f:
-                q = json.load(f)
-                soren_queue = sum(1 for x in q if x.get("status") == "pending")
-                soren_posted = sum(1 for x in q if x.get("status") == "posted")
-        except Exception:
-            pass
-
-    # Shelby
-    shelby_running = False
     try:
-        result = subprocess.run(["pgrep", "-f", "app.py"], capture_output=True, text=True)
-        shelby_running = bool(result.stdout.strip())
+        q = file_summary(SOREN_QUEUE_FILE, _reduce_content_queue)
+        if q:
+            soren_queue, soren_posted = q["pending"], q["posted"]
     except Exception:
         pass
 
+    # Shelby
+    shelby_running = process_running("app.py")
+
     # Mercury review stats
     mercury_review_avg = None
     mercury_total_posts = 0
-    if MERCURY_POSTING_LOG.exists():
-        try:
-            with open(MERCURY_POSTING_LOG) as f:
-                mlog = json.load(f)
-            mercury_total_posts = len(mlog)
-            reviewed = [p for p in mlog if p.get("review_score") is not None and p.get("review_score", -1) != -1]
-            if reviewed:
-                mercury_review_avg = round(sum(p["review_score"] for p in reviewed) / len(reviewed), 1)
-        except Exception:
-            pass
+    try:
+        mlog = file_summary(MERCURY_POSTING_LOG, _reduce_posting_log)
+        if mlog:
+            mercury_total_posts, mercury_review_avg = mlog["total"], mlog["review_avg"]
+    except Exception:
+        pass
 
     # Hawk
     hawk_status = read_fresh(DATA_DIR / "hawk_status.json", "~/polymarket-bot/data/hawk_status.json")
@@ -168,11 +340,11 @@ def api_overview():
         "garves": {
             "running": garves_running,
             "win_rate": round(garves_wr, 1),
-            "total_trades": len(trades),
-            "resolved": len(resolved),
-            "wins": wins,
-            "losses": len(resolved) - wins,
-            "pending": len(trades) - len([t for t in trades if t.get("resolved")]),
+            "total_trades": garves["total"],
+            "resolved": garves["resolved"],
+            "wins": garves["wins"],
+            "losses": garves["resolved"] - garves["wins"],
+            "pending": garves["unresolved"],
             "indicator_accuracy": accuracy_data,
         },
         "soren": {
@@ -417,64 +589,22 @@ def api_intelligence():
     # -- GARVES -- The Trader --
     try:
         garves = {"dimensions": {}, "overall": 0, "title": "The Trader"}
-        trades_file = DATA_DIR / "trades.jsonl"
-        trades = []
-        if trades_file.exists():
-            with open(trades_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        trades.append(json.loads(line))
-
-        resolved = [t for t in trades if t.get("resolved")]
-        wins = sum(1 for t in resolved if t.get("won"))
-        wr = (wins / len(resolved) * 100) if resolved else 0
-        total = len(trades)
+        tl = file_summary(DATA_DIR / "trades.jsonl", _reduce_trade_log, _EMPTY_TRADE_LOG)
+        total = tl["total"]
 
         # Merge in historical data from daily reports for cumulative intelligence
-        daily_reports_file = DATA_DIR / "daily_reports.json"
-        hist_total = 0
-        hist_resolved = 0
-        hist_wins = 0
-        hist_days = 0
-        hist_assets = set()
-        hist_timeframes = set()
-        hist_avg_edge = 0
-        if daily_reports_file.exists():
-            try:
-                with open(daily_reports_file) as f:
-                    daily_reports = json.load(f)
-                for dr in daily_reports:
-                    s = dr.get("summary", {})
-                    hist_total += s.get("total_trades", 0)
-                    hist_resolved += s.get("resolved", 0)
-                    hist_wins += s.get("wins", 0)
-                    hist_days += 1
-                    hist_avg_edge += s.get("avg_edge", 0)
-                    for a in dr.get("by_asset", {}):
-                        hist_assets.add(a)
-                    for tf in dr.get("by_timeframe", {}):
-                        hist_timeframes.add(tf)
-                if hist_days > 0:
-                    hist_avg_edge /= hist_days
-            except Exception:
-                pass
+        hist = file_summary(DATA_DIR / "daily_reports.json", _reduce_daily_reports, _EMPTY_HISTORY)
 
         # Combined stats (today + history)
-        combined_total = total + hist_total
-        combined_resolved = len(resolved) + hist_resolved
-        combined_wins = wins + hist_wins
+        combined_total = total + hist["total"]
+        combined_resolved = tl["resolved"] + hist["resolved"]
+        combined_wins = tl["wins"] + hist["wins"]
         combined_wr = (combined_wins / combined_resolved * 100) if combined_resolved > 0 else 0
-        all_assets = set(t.get("asset", "") for t in trades) | hist_assets
-        all_timeframes = set(t.get("timeframe", "") for t in trades) | hist_timeframes
+        all_assets = tl["assets"] | hist["assets"]
+        all_timeframes = tl["timeframes"] | hist["timeframes"]
 
         # 1. Market Knowledge (indicators, regime, assets — capabilities don't reset)
-        indicators_file = DATA_DIR / "indicator_accuracy.json"
-        indicator_count = 0
-        if indicators_file.exists():
-            with open(indicators_file) as f:
-                ind = json.load(f)
-            indicator_count = len(ind)
+        indicator_count = file_summary(DATA_DIR / "indicator_accuracy.json", json_len, 0)
         regime_file = DATA_DIR / "regime_state.json"
         has_regime = regime_file.exists()
         knowledge = min(100, indicator_count * 6 + (20 if has_regime else 0) + len(all_assets) * 10)
@@ -492,11 +622,10 @@ def api_intelligence():
         straddle_file = DATA_DIR / "straddle_trades.json"
         has_straddle = straddle_file.exists()
         avg_edge = 0
-        if resolved:
-            edges = [t.get("edge", 0) for t in resolved if t.get("edge")]
-            avg_edge = sum(edges) / len(edges) if edges else 0
-        elif hist_avg_edge > 0:
-            avg_edge = hist_avg_edge / 100  # stored as percentage
+        if tl["resolved"]:
+            avg_edge = tl["avg_resolved_edge"]
+        elif hist["avg_edge"] > 0:
+            avg_edge = hist["avg_edge"] / 100  # stored as percentage
         # ConvictionEngine and daily cycle add to risk management
         has_conviction = (DATA_DIR.parent / "bot" / "conviction.py").exists()
         has_daily_cycle = (DATA_DIR.parent / "bot" / "daily_cycle.py").exists()
@@ -518,41 +647,30 @@ def api_intelligence():
     try:
         soren = {"dimensions": {}, "overall": 0, "title": "The Thinker"}
         queue_file = Path.home() / "soren-content" / "data" / "content_queue.json"
-        queue = []
-        if queue_file.exists():
-            with open(queue_file) as f:
-                queue = json.load(f)
-
-        posted = [i for i in queue if i.get("status") == "posted"]
-        pending = [i for i in queue if i.get("status") == "pending"]
-        approved = [i for i in queue if i.get("status") == "approved"]
-        pillars = set(i.get("pillar", "") for i in queue if i.get("pillar"))
-        platforms = set(i.get("platform", "") for i in queue if i.get("platform"))
+        q = file_summary(queue_file, _reduce_content_queue) or {
+            "size": 0, "posted": 0, "pending": 0, "approved": 0, "pillars": 0, "platforms": 0}
 
         # 1. Creativity
-        creativity = min(100, len(pillars) * 15 + len(queue) * 2)
+        creativity = min(100, q["pillars"] * 15 + q["size"] * 2)
         soren["dimensions"]["Creativity"] = creativity
 
         # 2. Productivity
-        productivity = min(100, len(posted) * 10 + len(approved) * 5 + len(pending) * 2)
+        productivity = min(100, q["posted"] * 10 + q["approved"] * 5 + q["pending"] * 2)
         soren["dimensions"]["Productivity"] = productivity
 
         # 3. Brand Consistency
         ab_file = Path.home() / "soren-content" / "data" / "ab_results.json"
         has_ab = ab_file.exists()
-        consistency = 55 + (15 if has_ab else 0) + min(30, len(pillars) * 6)
+        consistency = 55 + (15 if has_ab else 0) + min(30, q["pillars"] * 6)
         soren["dimensions"]["Brand Voice"] = min(100, consistency)
 
         # 4. Platform Awareness
-        platform_score = min(100, len(platforms) * 25 + 20)
+        platform_score = min(100, q["platforms"] * 25 + 20)
         soren["dimensions"]["Platform Reach"] = platform_score
 
         # 5. Trend Awareness
         trend_file = Path.home() / "soren-content" / "data" / "trend_topics.json"
-        trends_count = 0
-        if trend_file.exists():
-            with open(trend_file) as f:
-                trends_count = len(json.load(f))
+        trends_count = file_summary(trend_file, json_len, 0)
         trend_score = min(100, 30 + trends_count * 5)
         soren["dimensions"]["Trend Awareness"] = trend_score
 
@@ -596,11 +714,7 @@ def api_intelligence():
         # 5. Synthesis
         exp_stats = atlas.hypothesis.stats() if atlas else {}
         improvements_file = Path.home() / "atlas" / "data" / "improvements.json"
-        imp_count = 0
-        if improvements_file.exists():
-            with open(improvements_file) as f:
-                imp_data = json.load(f)
-            imp_count = sum(len(v) for v in imp_data.values() if isinstance(v, list))
+        imp_count = file_summary(improvements_file, _reduce_improvements, 0)
         synthesis = min(100, exp_stats.get("completed", 0) * 10 + imp_count * 3 + 20)
         atlas_intel["dimensions"]["Synthesis"] = synthesis
 
@@ -616,48 +730,33 @@ def api_intelligence():
 
         # 1. Team Awareness
         assess_file = SHELBY_ROOT_DIR / "data" / "agent_assessments.json"
-        assessments = {}
-        if assess_file.exists():
-            with open(assess_file) as f:
-                assessments = json.load(f)
-        awareness = min(100, len(assessments) * 15 + 25)
+        assessments = file_summary(assess_file, _reduce_assessments, {"count": 0, "avg_score": 0})
+        awareness = min(100, assessments["count"] * 15 + 25)
         shelby["dimensions"]["Team Awareness"] = awareness
 
         # 2. Task Management
         tasks_file = SHELBY_ROOT_DIR / "data" / "tasks.json"
         task_completion = 50
         if tasks_file.exists():
-            with open(tasks_file) as f:
-                tasks = json.load(f)
-            done = sum(1 for t in tasks if t.get("done") or t.get("status") == "done")
-            total = len(tasks)
+            done, total = file_summary(tasks_file, _reduce_shelby_tasks, (0, 0))
             if total > 0:
                 task_completion = min(100, int(done / total * 100) + 10)
         shelby["dimensions"]["Task Management"] = task_completion
 
         # 3. Communication
         bc_file = SHELBY_ROOT_DIR / "data" / "broadcasts.json"
-        bc_count = 0
-        if bc_file.exists():
-            with open(bc_file) as f:
-                bc_count = len(json.load(f))
+        bc_count = file_summary(bc_file, json_len, 0)
         comm = min(100, 40 + bc_count * 5)
         shelby["dimensions"]["Communication"] = comm
 
         # 4. Scheduling
         sched_file = SHELBY_ROOT_DIR / "data" / "scheduler_log.json"
-        sched_count = 0
-        if sched_file.exists():
-            with open(sched_file) as f:
-                sched_count = len(json.load(f))
+        sched_count = file_summary(sched_file, json_len, 0)
         scheduling = min(100, 35 + sched_count * 3)
         shelby["dimensions"]["Scheduling"] = scheduling
 
         # 5. Decision Quality
-        avg_score = 0
-        if assessments:
-            agent_scores = [a.get("score", 0) for a in assessments.values()]
-            avg_score = sum(agent_scores) / len(agent_scores) if agent_scores else 0
+        avg_score = assessments["avg_score"]
         decision = min(100, int(avg_score * 1.2) + 10)
         shelby["dimensions"]["Decision Quality"] = decision
 
@@ -674,32 +773,19 @@ def api_intelligence():
 
         # 1. Platform Knowledge
         brain_file = mercury_root / "data" / "brain.json"
-        insights_count = 0
-        if brain_file.exists():
-            with open(brain_file) as f:
-                brain = json.load(f)
-            insights_count = len(brain.get("insights", []))
+        insights_count = file_summary(brain_file, _reduce_insights_count, 0)
         platform_knowledge = min(100, 25 + insights_count * 3)
         lisa["dimensions"]["Platform Knowledge"] = platform_knowledge
 
         # 2. Posting Discipline
         posting_log = mercury_root / "data" / "posting_log.json"
-        post_count = 0
-        if posting_log.exists():
-            with open(posting_log) as f:
-                post_count = len(json.load(f))
+        post_count = file_summary(posting_log, json_len, 0)
         discipline = min(100, 20 + post_count * 5)
         lisa["dimensions"]["Posting Discipline"] = discipline
 
         # 3. Brand Alignment
         review_file = mercury_root / "data" / "brand_reviews.json"
-        avg_review = 0
-        if review_file.exists():
-            with open(review_file) as f:
-                reviews = json.load(f)
-            if reviews:
-                scores_list = [r.get("score", 0) for r in reviews if r.get("score")]
-                avg_review = sum(scores_list) / len(scores_list) if scores_list else 0
+        avg_review = file_summary(review_file, _reduce_review_avg, 0)
         brand = min(100, int(avg_review * 10) + 20) if avg_review else 40
         lisa["dimensions"]["Brand Alignment"] = brand
 
@@ -707,17 +793,12 @@ def api_intelligence():
         plan_file = mercury_root / "data" / "strategy_plan.json"
         plan_depth = 30
         if plan_file.exists():
-            with open(plan_file) as f:
-                plan = json.load(f)
-            plan_depth = min(100, 30 + len(str(plan)) // 100)
+            plan_depth = min(100, 30 + file_summary(plan_file, _reduce_str_len, 0) // 100)
         lisa["dimensions"]["Strategy Depth"] = plan_depth
 
         # 5. Engagement IQ
         reply_file = mercury_root / "data" / "reply_templates.json"
-        reply_count = 0
-        if reply_file.exists():
-            with open(reply_file) as f:
-                reply_count = len(json.load(f))
+        reply_count = file_summary(reply_file, json_len, 0)
         engagement = min(100, 25 + reply_count * 5 + insights_count * 2)
         lisa["dimensions"]["Engagement IQ"] = engagement
 
@@ -734,23 +815,13 @@ def api_intelligence():
 
         # 1. Detection
         scan_file = sentinel_root / "data" / "scan_results.json"
-        total_issues = 0
-        scan_count = 0
-        if scan_file.exists():
-            with open(scan_file) as f:
-                scans = json.load(f)
-            if isinstance(scans, list):
-                scan_count = len(scans)
-                total_issues = sum(s.get("issues_found", s.get("issues", 0)) for s in scans)
+        scan_count, total_issues = file_summary(scan_file, _reduce_scans, (0, 0))
         detection = min(100, 40 + scan_count * 3 + total_issues * 2)
         robotox["dimensions"]["Detection"] = detection
 
         # 2. Auto-Fix
         fix_file = sentinel_root / "data" / "fix_log.json"
-        fix_count = 0
-        if fix_file.exists():
-            with open(fix_file) as f:
-                fix_count = len(json.load(f))
+        fix_count = file_summary(fix_file, json_len, 0)
         autofix = min(100, 30 + fix_count * 8)
         robotox["dimensions"]["Auto-Fix"] = autofix
 
@@ -760,11 +831,7 @@ def api_intelligence():
 
         # 4. Coverage
         config_file = sentinel_root / "config.json"
-        agents_monitored = 5  # default
-        if config_file.exists():
-            with open(config_file) as f:
-                cfg = json.load(f)
-            agents_monitored = len(cfg.get("agents", {}))
+        agents_monitored = file_summary(config_file, _reduce_config_agents, 5)  # default 5
         coverage = min(100, agents_monitored * 15 + 20)
         robotox["dimensions"]["Coverage"] = coverage
 
@@ -786,74 +853,38 @@ def api_intelligence():
         # Gather task stats
         tasks_dir = thor_data_dir / "tasks"
         results_dir = thor_data_dir / "results"
-        pending = completed = failed = in_progress = total_tasks = 0
-        agents_worked_on = set()
-        total_retries = 0
-        if tasks_dir.exists():
-            for f in tasks_dir.glob("task_*.json"):
-                try:
-                    td = json.loads(f.read_text())
-                    total_tasks += 1
-                    s = td.get("status", "")
-                    if s == "pending":
-                        pending += 1
-                    elif s == "completed":
-                        completed += 1
-                    elif s == "failed":
-                        failed += 1
-                    elif s == "in_progress":
-                        in_progress += 1
-                    ag = td.get("agent", "")
-                    if ag:
-                        agents_worked_on.add(ag)
-                    total_retries += td.get("retries", 0)
-                except Exception:
-                    pass
+        tasks = file_summaries(tasks_dir, "task_*.json", _reduce_thor_task)
+        statuses = [status for status, _, _ in tasks]
+        completed = statuses.count("completed")
+        failed = statuses.count("failed")
+        agents_worked_on = {agent for _, agent, _ in tasks if agent}
+        total_retries = sum(retries for _, _, retries in tasks)
 
         # Knowledge entries
         kb_index = thor_data_dir / "knowledge" / "index.json"
         kb_entries = 0
-        if kb_index.exists():
-            try:
-                kb_entries = len(json.loads(kb_index.read_text()))
-            except Exception:
-                pass
+        try:
+            kb_entries = file_summary(kb_index, json_len, 0)
+        except Exception:
+            pass
 
         # Activity log for token/model stats
         activity_file = thor_data_dir / "activity.json"
-        sonnet_uses = opus_uses = 0
-        total_tokens = 0
-        test_passes = test_total = 0
-        if activity_file.exists():
-            try:
-                activities = json.loads(activity_file.read_text())
-                for a in activities:
-                    total_tokens += a.get("tokens", 0)
-                    model = a.get("model", "")
-                    if "sonnet" in model:
-                        sonnet_uses += 1
-                    elif "opus" in model:
-                        opus_uses += 1
-                    if a.get("test_passed") is True:
-                        test_passes += 1
-                        test_total += 1
-                    elif a.get("test_passed") is False:
-                        test_total += 1
-            except Exception:
-                pass
+        activity = {"tokens": 0, "sonnet": 0, "opus": 0, "test_passes": 0, "test_total": 0}
+        try:
+            activity = file_summary(activity_file, _reduce_thor_activity, activity)
+        except Exception:
+            pass
+        sonnet_uses, opus_uses = activity["sonnet"], activity["opus"]
+        test_passes, test_total = activity["test_passes"], activity["test_total"]
 
         # Results for test pass rate
-        if results_dir.exists():
-            for f in results_dir.glob("result_*.json"):
-                try:
-                    rd = json.loads(f.read_text())
-                    if rd.get("test_passed") is True:
-                        test_passes += 1
-                        test_total += 1
-                    elif rd.get("test_passed") is False:
-                        test_total += 1
-                except Exception:
-                    pass
+        for passed in file_summaries(results_dir, "result_*.json", _reduce_test_passed):
+            if passed is True:
+                test_passes += 1
+                test_total += 1
+            elif passed is False:
+                test_total += 1
 
         # 1. Code Quality — task completion rate + test pass rate
         completion_rate = (completed / max(1, completed + failed)) * 100 if (completed + failed) > 0 else 0
@@ -895,43 +926,32 @@ def api_intelligence():
         hawk_opps_file = DATA_DIR / "hawk_opportunities.json"
         hawk_status_file = DATA_DIR / "hawk_status.json"
 
-        hawk_trades = []
-        if hawk_trades_file.exists():
-            with open(hawk_trades_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        hawk_trades.append(json.loads(line))
-
-        hawk_resolved = [t for t in hawk_trades if t.get("resolved")]
-        hawk_wins = sum(1 for t in hawk_resolved if t.get("won"))
-        hawk_wr = (hawk_wins / len(hawk_resolved) * 100) if hawk_resolved else 0
-        hawk_cats = set(t.get("category", "") for t in hawk_trades if t.get("category"))
-
-        hawk_opps = []
-        if hawk_opps_file.exists():
-            try:
-                with open(hawk_opps_file) as f:
-                    hawk_opps = json.loads(f.read()).get("opportunities", [])
-            except Exception:
-                pass
+        ht = file_summary(hawk_trades_file, _reduce_trade_log, _EMPTY_TRADE_LOG)
+
+        hawk_wr = (ht["wins"] / ht["resolved"] * 100) if ht["resolved"] else 0
+        hawk_cats = ht["categories"]
+
+        hawk_opps_count = 0
+        try:
+            hawk_opps_count = file_summary(hawk_opps_file, _reduce_opportunities_len, 0)
+        except Exception:
+            pass
 
         # 1. Market Scanning — categories covered + opportunities found
-        scanning = min(100, len(hawk_cats) * 12 + len(hawk_opps) * 3 + 15)
+        scanning = min(100, len(hawk_cats) * 12 + hawk_opps_count * 3 + 15)
         hawk_intel["dimensions"]["Market Scanning"] = scanning
 
         # 2. Edge Detection — average edge quality
-        hawk_edges = [t.get("edge", 0) for t in hawk_trades if t.get("edge")]
-        avg_edge = sum(hawk_edges) / len(hawk_edges) if hawk_edges else 0
+        avg_edge = ht["avg_edge"]
         edge_detect = min(100, int(avg_edge * 300) + 20)
         hawk_intel["dimensions"]["Edge Detection"] = edge_detect
 
         # 3. Win Rate — trading accuracy
-        accuracy = min(100, int(hawk_wr * 1.2)) if hawk_resolved else 15
+        accuracy = min(100, int(hawk_wr * 1.2)) if ht["resolved"] else 15
         hawk_intel["dimensions"]["Accuracy"] = accuracy
 
         # 4. Experience — total trades + resolved
-        experience = min(100, len(hawk_trades) * 2 + len(hawk_resolved) * 3 + 5)
+        experience = min(100, ht["total"] * 2 + ht["resolved"] * 3 + 5)
         hawk_intel["dimensions"]["Experience"] = experience
 
         # 5. Category Breadth — how many market categories covered
@@ -976,9 +996,9 @@ def api_intelligence():
         pushed = viper_status.get("pushed_to_shelby", viper_status.get("pushes", 0))
         # Also count from dedup file if status hasn't been updated yet
         pushed_file = DATA_DIR / "viper_pushed.json"
-        if pushed == 0 and pushed_file.exists():
+        if pushed == 0:
             try:
-                pushed = len(json.loads(pushed_file.read_text()))
+                pushed = file_summary(pushed_file, json_len, 0)
             except Exception:
                 pass
         push_rate = min(100, pushed * 8 + 10)
@@ -987,11 +1007,10 @@ def api_intelligence():
         # 5. Monetization IQ — Soren metrics/opportunities awareness
         has_soren_metrics = (DATA_DIR / "viper_soren_metrics.json").exists() or viper_status.get("soren_metrics_ready", False)
         # Soren opportunities file also counts as monetization awareness
-        if not has_soren_metrics and (DATA_DIR / "soren_opportunities.json").exists():
+        if not has_soren_metrics:
             try:
-                so = json.loads((DATA_DIR / "soren_opportunities.json").read_text())
-                if so.get("count", 0) > 0 or len(so.get("opportunities", [])) > 0:
-                    has_soren_metrics = True
+                has_soren_metrics = file_summary(
+                    DATA_DIR / "soren_opportunities.json", _reduce_has_opportunities, False)
             except Exception:
                 pass
         monetization = 30 + (30 if has_soren_metrics else 0) + min(40, len(viper_opps) * 3)
@@ -1060,14 +1079,12 @@ def api_intelligence():
         odin_sf = Path.home() / "odin" / "data" / "odin_status.json"
         odin_st = read_fresh(odin_sf, "~/odin/data/odin_status.json")
         o_trades_f = Path.home() / "odin" / "data" / "odin_trades.jsonl"
-        o_trades = []
-        if o_trades_f.exists():
-            try:
-                o_trades = [json.loads(l) for l in o_trades_f.read_text().strip().split("\n") if l.strip()]
-            except Exception:
-                pass
-        o_wins = [t for t in o_trades if t.get("is_win")]
-        o_wr = (len(o_wins) / len(o_trades) * 100) if o_trades else 0
+        o_count, o_wins = 0, 0
+        try:
+            o_count, o_wins = file_summary(o_trades_f, _reduce_odin_trades, (0, 0))
+        except Exception:
+            pass
+        o_wr = (o_wins / o_count * 100) if o_count else 0
 
         # 1. Regime Detection
         regime_score = odin_st.get("regime", {}).get("global_score", 50)
@@ -1080,7 +1097,7 @@ def api_intelligence():
         odin_intel["dimensions"]["Risk Management"] = risk_dim
 
         # 3. Accuracy
-        accuracy = min(100, int(o_wr * 1.2)) if o_trades else 30
+        accuracy = min(100, int(o_wr * 1.2)) if o_count else 30
         odin_intel["dimensions"]["Accuracy"] = accuracy
 
         # 4. Capital Efficiency
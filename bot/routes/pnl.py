@@ -11,7 +11,7 @@ from zoneinfo import ZoneInfo
 
 from flask import Blueprint, jsonify
 
-from bot.routes._utils import read_fresh_jsonl
+from bot.routes._utils import file_cached, read_fresh_jsonl
 
 log = logging.getLogger(__name__)
 
@@ -191,6 +191,11 @@ def api_pnl_indicators():
 
 
 @pnl_bp.route("/api/pnl")
+@file_cached(
+    GARVES_TRADES, *GARVES_STATIC_FILES, GARVES_ARCHIVE_DIR,
+    lambda: sorted(GARVES_ARCHIVE_DIR.glob("trades_*.jsonl")), LLM_COSTS_FILE,
+    max_age=120,  # read_fresh_jsonl may pull a newer copy from Pro
+)
 def api_pnl():
     """Unified P&L across all trading agents."""
     garves = _compute_agent_pnl(_load_garves_trades(), "garves")
@@ -9,6 +9,8 @@ from pathlib import Path
 
 from flask import Blueprint, jsonify
 
+from bot.routes._utils import file_cached
+
 log = logging.getLogger(__name__)
 quant_bp = Blueprint("quant", __name__)
 
@@ -49,6 +51,7 @@ def _load_json(path: Path) -> dict:
 
 
 @quant_bp.route("/api/quant")
+@file_cached(STATUS_FILE, RESULTS_FILE, RECS_FILE)
 def api_quant_status():
     """Quant status + summary."""
     status = _load_json(STATUS_FILE)
@@ -79,6 +82,7 @@ def api_quant_status():
 
 
 @quant_bp.route("/api/quant/results")
+@file_cached(RESULTS_FILE)
 def api_quant_results():
     """Full backtest results (top 20 + sensitivity grid)."""
     data = _load_json(RESULTS_FILE)
@@ -86,6 +90,7 @@ def api_quant_results():
 
 
 @quant_bp.route("/api/quant/recommendations")
+@file_cached(RECS_FILE)
 def api_quant_recommendations():
     """Parameter change suggestions for Garves."""
     data = _load_json(RECS_FILE)
@@ -135,6 +140,7 @@ def api_quant_params():
 
 
 @quant_bp.route("/api/quant/analytics")
+@file_cached(ANALYTICS_FILE)
 def api_quant_analytics():
     """Kelly sizing, indicator diversity, strategy decay."""
     data = _load_json(ANALYTICS_FILE)
@@ -142,6 +148,7 @@ def api_quant_analytics():
 
 
 @quant_bp.route("/api/quant/live-params")
+@file_cached(LIVE_PARAMS_FILE)
 def api_quant_live_params():
     """Current auto-applied param overrides from Quant validation."""
     data = _load_json(LIVE_PARAMS_FILE)
@@ -156,6 +163,7 @@ def api_quant_live_params():
 
 
 @quant_bp.route("/api/quant/walk-forward")
+@file_cached(WF_FILE)
 def api_quant_walk_forward():
     """Walk-forward validation results + bootstrap confidence intervals."""
     data = _load_json(WF_FILE)
@@ -163,6 +171,7 @@ def api_quant_walk_forward():
 
 
 @quant_bp.route("/api/quant/phase1")
+@file_cached(PHASE1_FILE)
 def api_quant_phase1():
     """Phase 1 intelligence: WFV2, Monte Carlo, CUSUM, version history."""
     data = _load_json(PHASE1_FILE)
@@ -178,6 +187,7 @@ def api_quant_phase1():
 
 
 @quant_bp.route("/api/quant/phase2")
+@file_cached(PHASE2_FILE)
 def api_quant_phase2():
     """Phase 2 intelligence: regime, correlation, self-learning."""
     data = _load_json(PHASE2_FILE)
@@ -192,6 +202,7 @@ def api_quant_phase2():
 
 
 @quant_bp.route("/api/quant/correlation")
+@file_cached(CORRELATION_FILE)
 def api_quant_correlation():
     """Cross-trader correlation between Garves and Odin."""
     data = _load_json(CORRELATION_FILE)
@@ -201,6 +212,7 @@ def api_quant_correlation():
 
 
 @quant_bp.route("/api/quant/learning")
+@file_cached(LEARNING_FILE)
 def api_quant_learning():
     """Self-learning state: recommendation accuracy, param confidence."""
     data = _load_json(LEARNING_FILE)
@@ -213,6 +225,7 @@ def api_quant_learning():
 
 
 @quant_bp.route("/api/quant/pnl-impact")
+@file_cached(PNL_IMPACT_FILE)
 def api_quant_pnl_impact():
     """PNL impact estimator: dollar impact of proposed parameter changes."""
     data = _load_json(PNL_IMPACT_FILE)
@@ -227,6 +240,7 @@ def api_quant_pnl_impact():
 
 
 @quant_bp.route("/api/quant/trade-learning")
+@file_cached(TRADE_STUDIES_FILE, MINI_OPT_FILE)
 def api_quant_trade_learning():
     """Per-trade learning: recent studies + mini-opt results + indicator accuracy."""
     # Load recent trade studies
@@ -296,6 +310,7 @@ def api_quant_trade_learning():
 
 
 @quant_bp.route("/api/quant/odin-backtest")
+@file_cached(ODIN_BT_FILE)
 def api_quant_odin_backtest():
     """Odin strategy backtest results (SMC + regime + conviction on historical candles)."""
     data = _load_json(ODIN_BT_FILE)
@@ -1,11 +1,20 @@
-"""System/Infrastructure routes — real-time OS metrics, processes, ports, LaunchAgents."""
+"""System/Infrastructure routes — real-time OS metrics, processes, ports, LaunchAgents.
+
+Anything that needs a subprocess (vm_stat, ps, lsof, launchctl) or a walk of
+the source tree is sampled by a background thread on a fixed cadence (see
+SAMPLE_INTERVALS) into an in-memory snapshot; routes only read the snapshot,
+so a dashboard refresh starts no subprocesses.
+"""
 from __future__ import annotations
 
+import functools
 import json
+import logging
 import os
 import re
 import shutil
 import subprocess
+import threading
 import time
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
@@ -13,6 +22,8 @@ from pathlib import Path
 
 from flask import Blueprint, jsonify
 
+log = logging.getLogger(__name__)
+
 system_bp = Blueprint("system", __name__)
 
 ET = ZoneInfo("America/New_York")
@@ -35,12 +46,26 @@ WATCHED_PORTS = {
 }
 
 
-def _get_memory_info() -> dict:
-    """Get memory usage via vm_stat + sysctl."""
+@functools.lru_cache(maxsize=1)
+def _total_memory_bytes() -> int:
+    return int(subprocess.check_output(["sysctl", "-n", "hw.memsize"], timeout=5).strip())
+
+
+@functools.lru_cache(maxsize=1)
+def _boot_time() -> int | None:
+    """Boot timestamp from sysctl, read once (None if unavailable)."""
+    try:
+        out = subprocess.check_output(["sysctl", "-n", "kern.boottime"], timeout=5).decode()
+    except Exception:
+        return None
+    m = re.search(r"sec = (\d+)", out)
+    return int(m.group(1)) if m else None
+
+
+def _probe_memory() -> dict:
+    """Memory usage via vm_stat (total from sysctl, read once)."""
     try:
-        total_bytes = int(subprocess.check_output(
-            ["sysctl", "-n", "hw.memsize"], timeout=5
-        ).strip())
+        total_bytes = _total_memory_bytes()
         total_gb = total_bytes / (1024 ** 3)
 
         vm_stat = subprocess.check_output(["vm_stat"], timeout=5).decode()
@@ -101,41 +126,41 @@ def _get_disk_info() -> dict:
 
 
 def _get_uptime() -> dict:
-    """Get system uptime."""
+    """Get system uptime (boot time is read once)."""
     try:
-        out = subprocess.check_output(["sysctl", "-n", "kern.boottime"], timeout=5).decode()
-        m = re.search(r"sec = (\d+)", out)
-        if m:
-            boot_ts = int(m.group(1))
-            uptime_s = int(time.time() - boot_ts)
-            days = uptime_s // 86400
-            hours = (uptime_s % 86400) // 3600
-            mins = (uptime_s % 3600) // 60
-            if days > 0:
-                text = f"{days}d {hours}h"
-            elif hours > 0:
-                text = f"{hours}h {mins}m"
-            else:
-                text = f"{mins}m"
-            return {"seconds": uptime_s, "text": text}
-        return {"seconds": 0, "text": "unknown"}
+        boot_ts = _boot_time()
+        if boot_ts is None:
+            return {"seconds": 0, "text": "unknown"}
+        uptime_s = int(time.time() - boot_ts)
+        days = uptime_s // 86400
+        hours = (uptime_s % 86400) // 3600
+        mins = (uptime_s % 3600) // 60
+        if days > 0:
+            text = f"{days}d {hours}h"
+        elif hours > 0:
+            text = f"{hours}h {mins}m"
+        else:
+            text = f"{mins}m"
+        return {"seconds": uptime_s, "text": text}
     except Exception as e:
         return {"seconds": 0, "text": "error", "error": str(e)[:100]}
 
 
-def _get_python_processes() -> list:
-    """Get all running Python processes with details."""
+def _probe_ps() -> dict:
+    """One `ps` of every process: command lines plus the Python process table."""
     try:
         out = subprocess.check_output(
             ["ps", "-eo", "pid,pcpu,pmem,rss,etime,command"],
             timeout=5,
         ).decode()
+        commands = []
         processes = []
         for line in out.strip().split("\n")[1:]:
             parts = line.split(None, 5)
             if len(parts) < 6:
                 continue
             pid, cpu, mem, rss, etime, cmd = parts
+            commands.append(cmd)
             if "python" not in cmd.lower():
                 continue
             # Try to identify which agent this is
@@ -153,12 +178,22 @@ def _get_python_processes() -> list:
                 "command": cmd[:120],
                 "agent": agent,
             })
-        return sorted(processes, key=lambda p: p["agent"])
+        return {"commands": commands, "python": sorted(processes, key=lambda p: p["agent"])}
     except Exception as e:
-        return [{"error": str(e)[:200]}]
+        return {"commands": [], "python": [{"error": str(e)[:200]}]}
 
 
-def _get_listening_ports() -> list:
+def _get_python_processes() -> list:
+    """All running Python processes with details (from the latest sample)."""
+    return _sampled("ps")["python"]
+
+
+def process_running(pattern: str) -> bool:
+    """True if any process command line contains pattern (like `pgrep -f`), from the latest sample."""
+    return any(pattern in cmd for cmd in _sampled("ps")["commands"])
+
+
+def _probe_ports() -> list:
     """Get listening TCP ports."""
     try:
         out = subprocess.check_output(
@@ -200,7 +235,7 @@ BROTHERHOOD_LABELS = {
 }
 
 
-def _get_launchagents() -> list:
+def _probe_launchagents() -> list:
     """Get Brotherhood LaunchAgent statuses."""
     home = Path.home()
     la_dir = home / "Library" / "LaunchAgents"
@@ -279,14 +314,24 @@ CODE_EXTENSIONS = {".py", ".html", ".js", ".css", ".json", ".sh", ".yml", ".yaml
 SKIP_DIRS = {"__pycache__", ".venv", "venv", "node_modules", ".git", ".mypy_cache", ".pytest_cache", "egg-info"}
 
 
+# path -> (mtime_ns, size, line count); only files whose mtime/size changed are re-read
+_file_lines: dict[str, tuple[int, int, int]] = {}
+
+
 def _get_codebase_stats() -> dict:
-    """Scan all Brotherhood directories for file count, lines, and size."""
+    """Scan all Brotherhood directories for file count, lines, and size.
+
+    Line counts are cached per file and only recounted when the file's
+    mtime or size changes, so a rescan is a stat() walk.
+    """
+    global _file_lines
     home = Path.home()
     total_files = 0
     total_lines = 0
     total_bytes = 0
     by_project = {}
     by_ext = {}
+    seen: dict[str, tuple[int, int, int]] = {}
 
     for dirname, label in BROTHERHOOD_DIRS.items():
         proj_dir = home / dirname
@@ -299,17 +344,24 @@ def _get_codebase_stats() -> dict:
             # Prune skipped directories in-place
             dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.startswith(".")]
             for fname in files:
-                fpath = Path(root) / fname
-                ext = fpath.suffix.lower()
+                ext = os.path.splitext(fname)[1].lower()
                 if ext not in CODE_EXTENSIONS:
                     continue
+                fpath = os.path.join(root, fname)
                 try:
-                    size = fpath.stat().st_size
+                    st = os.stat(fpath)
+                    size = st.st_size
                     if size > 2_000_000:  # skip files > 2MB
                         continue
+                    cached = _file_lines.get(fpath)
+                    if cached and cached[0] == st.st_mtime_ns and cached[1] == size:
+                        lines = cached[2]
+                    else:
+                        with open(fpath, "rb") as f:
+                            lines = f.read().count(b"\n")
+                    seen[fpath] = (st.st_mtime_ns, size, lines)
                     proj_files += 1
                     proj_bytes += size
-                    lines = fpath.read_text(errors="replace").count("\n")
                     proj_lines += lines
                     by_ext[ext] = by_ext.get(ext, 0) + lines
                 except Exception:
@@ -323,6 +375,7 @@ def _get_codebase_stats() -> dict:
             "lines": proj_lines,
             "size_kb": round(proj_bytes / 1024, 1),
         }
+    _file_lines = seen  # drops deleted files
 
     # Format total size
     if total_bytes >= 1024 * 1024:
@@ -343,19 +396,87 @@ def _get_codebase_stats() -> dict:
     }
 
 
-_codebase_stats_cache = {"data": None, "ts": 0}
+# ---------------------------------------------------------------------------
+# Background sampler
+# ---------------------------------------------------------------------------
+
+# name -> (probe, refresh interval seconds)
+SAMPLE_INTERVALS: dict[str, tuple] = {
+    "memory": (_probe_memory, 10),
+    "ps": (_probe_ps, 10),
+    "ports": (_probe_ports, 30),
+    "launchagents": (_probe_launchagents, 30),
+    "codebase": (_get_codebase_stats, 300),
+}
+_SAMPLER_TICK_S = 2
+
+_snapshot: dict[str, tuple[float, object]] = {}  # name -> (sampled_at, value)
+_snapshot_lock = threading.Lock()
+_probe_locks = {name: threading.Lock() for name in SAMPLE_INTERVALS}
+_sampler_thread: threading.Thread | None = None
+
+
+def _refresh(name: str) -> object:
+    probe, _ = SAMPLE_INTERVALS[name]
+    with _probe_locks[name]:
+        value = probe()
+        with _snapshot_lock:
+            _snapshot[name] = (time.time(), value)
+    return value
+
+
+def _sampler_loop() -> None:
+    while True:
+        now = time.time()
+        for name, (_, interval) in SAMPLE_INTERVALS.items():
+            sampled_at = _snapshot.get(name, (0, None))[0]
+            if now - sampled_at >= interval:
+                try:
+                    _refresh(name)
+                except Exception:
+                    log.exception("System sampler: %s probe failed", name)
+        time.sleep(_SAMPLER_TICK_S)
+
+
+def _sampled(name: str):
+    """Latest sampled value for name.
+
+    Starts the sampler thread on first use (so importing this module never
+    spawns it). A metric that has never been sampled is probed inline once.
+    """
+    global _sampler_thread
+    if _sampler_thread is None:
+        with _snapshot_lock:
+            if _sampler_thread is None:
+                _sampler_thread = threading.Thread(
+                    target=_sampler_loop, name="system-sampler", daemon=True,
+                )
+                _sampler_thread.start()
+    entry = _snapshot.get(name)
+    if entry is None:
+        with _probe_locks[name]:
+            entry = _snapshot.get(name)
+        if entry is None:
+            return _refresh(name)
+    return entry[1]
+
+
+def _get_memory_info() -> dict:
+    return _sampled("memory")
+
+
+def _get_listening_ports() -> list:
+    return _sampled("ports")
+
+
+def _get_launchagents() -> list:
+    return _sampled("launchagents")
+
 
 @system_bp.route("/api/system/codebase-stats")
 def api_codebase_stats():
-    """Codebase statistics across all Brotherhood projects (cached 5 min)."""
-    import time as _t
-    now = _t.time()
-    if _codebase_stats_cache["data"] and now - _codebase_stats_cache["ts"] < 300:
-        return jsonify(_codebase_stats_cache["data"])
-    stats = _get_codebase_stats()
-    _codebase_stats_cache["data"] = stats
-    _codebase_stats_cache["ts"] = now
-    return jsonify(stats)
+    """Codebase statistics across all Brotherhood projects (resampled every 5 min)."""
+    return jsonify(_sampled("codebase"))
 
 
 @system_bp.route("/api/system/metrics")
@@ -404,6 +525,13 @@ def api_system_costs():
         return jsonify({"error": str(e)[:200], "total_calls": 0, "total_cost": 0})
 
 
+@system_bp.route("/api/system/route-cache")
+def api_system_route_cache():
+    """Hit/miss/304 counters for file-cached dashboard routes (+ per-file summary cache)."""
+    from bot.routes._utils import route_cache_stats, summary_cache_stats
+    return jsonify({**route_cache_stats(), "_file_summaries": summary_cache_stats()})
+
+
 @system_bp.route("/api/system/health")
 def api_system_health():
     """Unified agent health status."""
@@ -10,15 +10,20 @@ Phase 1 sources (all free):
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import requests
+import requests.adapters
 
 from oracle.config import OracleConfig
 
@@ -123,24 +128,152 @@ class MarketContext:
 
 
 def gather_context(cfg: OracleConfig) -> MarketContext:
-    """Pull all external data and return unified context."""
+    """Pull all external data and return unified context.
+
+    Every request runs concurrently on a shared pooled session, so the build
+    takes about as long as the slowest source instead of the sum of all of
+    them. Responses are cached on disk per source TTL, so a re-run minutes
+    later only refetches what has expired. Fetchers return field updates
+    instead of mutating ctx, so a source that misses GATHER_DEADLINE_S is
+    simply left out.
+    """
     ctx = MarketContext(
         timestamp=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
     )
 
-    _fetch_prices(cfg, ctx)
-    _fetch_fear_greed(ctx)
-    _fetch_coinglass(cfg, ctx)
-    _fetch_fred(cfg, ctx)
-    _fetch_atlas_intel(cfg, ctx)
+    tasks: list[tuple[str, Callable[[], dict[str, Any]]]] = [
+        ("coingecko_price", lambda: _fetch_prices(cfg)),
+        ("fear_greed", _fetch_fear_greed),
+        ("atlas", _fetch_atlas_intel),
+    ]
+    for asset, cg_id in COINGECKO_IDS.items():
+        tasks.append((f"coingecko_chart:{asset}", lambda a=asset, c=cg_id: _fetch_weekly_range(a, c)))
+    if cfg.coinglass_api_key:
+        tasks += [
+            ("coinglass_funding", lambda: _fetch_coinglass_funding(cfg)),
+            ("coinglass_oi", lambda: _fetch_coinglass_oi(cfg)),
+            ("coinglass_liquidations", lambda: _fetch_coinglass_liquidations(cfg)),
+        ]
+    else:
+        log.debug("No CoinGlass API key, skipping derivatives data")
+    if cfg.fred_api_key:
+        tasks += [
+            ("fred_dxy", lambda: _fetch_fred_series(cfg, "DTWEXBGS", "dxy")),
+            ("fred_fed_rate", lambda: _fetch_fred_series(cfg, "FEDFUNDS", "fed_rate")),
+        ]
+    else:
+        log.debug("No FRED API key, skipping macro data")
+
+    t0 = time.perf_counter()
+    pool = ThreadPoolExecutor(max_workers=min(len(tasks), FETCH_WORKERS), thread_name_prefix="oracle-fetch")
+    futures = {pool.submit(fn): name for name, fn in tasks}
+    try:
+        for future in as_completed(futures, timeout=GATHER_DEADLINE_S):
+            name = futures[future]
+            try:
+                _apply(ctx, future.result())
+            except Exception:
+                log.warning("%s fetch failed", name)
+    except FuturesTimeout:
+        late = [name for f, name in futures.items() if not f.done()]
+        log.warning("Context deadline (%.0fs) hit, skipping: %s", GATHER_DEADLINE_S, ", ".join(late))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
     log.info(
-        "Context gathered: %d prices, FnG=%s, %d atlas insights",
-        len(ctx.prices), ctx.fear_greed, len(ctx.atlas_insights),
+        "Context gathered in %.1fs: %d prices, FnG=%s, %d atlas insights",
+        time.perf_counter() - t0, len(ctx.prices), ctx.fear_greed, len(ctx.atlas_insights),
     )
     return ctx
 
 
+def _apply(ctx: MarketContext, updates: dict[str, Any]) -> None:
+    """Merge a fetcher's field updates into ctx (dict fields merge, lists extend)."""
+    for key, value in updates.items():
+        current = getattr(ctx, key)
+        if isinstance(current, dict):
+            current.update(value)
+        elif isinstance(current, list):
+            current.extend(value)
+        else:
+            setattr(ctx, key, value)
+
+
+# ---------------------------------------------------------------------------
+# Shared HTTP session + on-disk TTL cache
+# ---------------------------------------------------------------------------
+
+COINGECKO_API = "https://api.coingecko.com/api/v3"
+FEAR_GREED_URL = "https://api.alternative.me/fng/"
+COINGLASS_API = "https://open-api-v3.coinglass.com/api/futures"
+FRED_API = "https://api.stlouisfed.org/fred/series/observations"
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "oracle_http_cache"
+
+FETCH_WORKERS = 12
+GATHER_DEADLINE_S = 30.0
+
+# Per-source (timeout seconds, cache TTL seconds)
+SOURCE_LIMITS: dict[str, tuple[float, int]] = {
+    "coingecko_price": (10, 300),
+    "coingecko_chart": (10, 1800),
+    "fear_greed": (5, 3600),
+    "coinglass": (10, 300),
+    "fred": (10, 6 * 3600),
+}
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def _http() -> requests.Session:
+    """Process-wide session with a connection pool sized for the fetch fan-out."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=FETCH_WORKERS)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def _cache_file(source: str, url: str, params: dict | None) -> Path:
+    key = json.dumps([url, sorted((params or {}).items())], default=str)
+    return CACHE_DIR / f"{source}-{hashlib.sha1(key.encode()).hexdigest()[:16]}.json"
+
+
+def _get_json(
+    source: str,
+    url: str,
+    params: dict | None = None,
+    headers: dict | None = None,
+) -> Any:
+    """GET url as JSON through the TTL cache. Non-200 responses raise and are not cached."""
+    timeout, ttl = SOURCE_LIMITS[source]
+    path = _cache_file(source, url, params)
+    try:
+        cached = json.loads(path.read_text())
+        if time.time() - cached["fetched_at"] < ttl:
+            return cached["body"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass
+
+    resp = _http().get(url, params=params, headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    body = resp.json()
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"fetched_at": time.time(), "body": body}))
+        os.replace(tmp, path)
+    except OSError:
+        log.debug("Failed to cache %s response", source)
+    return body
+
+
 # ---------------------------------------------------------------------------
 # Data source fetchers
 # ---------------------------------------------------------------------------
@@ -152,170 +285,113 @@ COINGECKO_IDS = {
     "xrp": "ripple",
 }
 
+COINGLASS_SYMBOLS = {"bitcoin": "BTC", "ethereum": "ETH", "solana": "SOL", "xrp": "XRP"}
 
-def _fetch_prices(cfg: OracleConfig, ctx: MarketContext) -> None:
-    """Fetch current prices + 7-day range from CoinGecko (free, no key)."""
+
+def _fetch_prices(cfg: OracleConfig) -> dict[str, Any]:
+    """Fetch current prices + 7-day change from CoinGecko (free, no key)."""
     ids = ",".join(COINGECKO_IDS[a] for a in cfg.assets if a in COINGECKO_IDS)
-    try:
-        resp = requests.get(
-            "https://api.coingecko.com/api/v3/simple/price",
-            params={
-                "ids": ids,
-                "vs_currencies": "usd",
-                "include_24hr_change": "true",
-                "include_7d_change": "true",
-            },
-            timeout=10,
-        )
-        data = resp.json()
-        for asset, cg_id in COINGECKO_IDS.items():
-            if cg_id in data:
-                ctx.prices[asset] = data[cg_id].get("usd", 0)
-                ctx.weekly_change_pct[asset] = data[cg_id].get("usd_7d_change", 0)
-    except Exception:
-        log.warning("CoinGecko price fetch failed")
-
-    # Weekly high/low from CoinGecko market chart
+    data = _get_json(
+        "coingecko_price",
+        f"{COINGECKO_API}/simple/price",
+        params={
+            "ids": ids,
+            "vs_currencies": "usd",
+            "include_24hr_change": "true",
+            "include_7d_change": "true",
+        },
+    )
+    prices, change = {}, {}
     for asset, cg_id in COINGECKO_IDS.items():
-        try:
-            resp = requests.get(
-                f"https://api.coingecko.com/api/v3/coins/{cg_id}/market_chart",
-                params={"vs_currency": "usd", "days": "7"},
-                timeout=10,
-            )
-            data = resp.json()
-            prices_list = [p[1] for p in data.get("prices", [])]
-            if prices_list:
-                ctx.weekly_high[asset] = max(prices_list)
-                ctx.weekly_low[asset] = min(prices_list)
-        except Exception:
-            pass
+        if cg_id in data:
+            prices[asset] = data[cg_id].get("usd", 0)
+            change[asset] = data[cg_id].get("usd_7d_change", 0)
+    return {"prices": prices, "weekly_change_pct": change}
+
+
+def _fetch_weekly_range(asset: str, cg_id: str) -> dict[str, Any]:
+    """Weekly high/low for one asset from the CoinGecko market chart."""
+    data = _get_json(
+        "coingecko_chart",
+        f"{COINGECKO_API}/coins/{cg_id}/market_chart",
+        params={"vs_currency": "usd", "days": "7"},
+    )
+    prices_list = [p[1] for p in data.get("prices", [])]
+    if not prices_list:
+        return {}
+    return {"weekly_high": {asset: max(prices_list)}, "weekly_low": {asset: min(prices_list)}}
 
 
-def _fetch_fear_greed(ctx: MarketContext) -> None:
+def _fetch_fear_greed() -> dict[str, Any]:
     """Fetch crypto Fear & Greed index."""
-    try:
-        resp = requests.get("https://api.alternative.me/fng/?limit=1", timeout=5)
-        data = resp.json().get("data", [{}])[0]
-        ctx.fear_greed = int(data.get("value", 50))
-        ctx.fear_greed_label = data.get("value_classification", "Neutral")
-    except Exception:
-        log.warning("Fear & Greed fetch failed")
-
-
-def _fetch_coinglass(cfg: OracleConfig, ctx: MarketContext) -> None:
-    """Fetch derivatives data from CoinGlass API."""
-    if not cfg.coinglass_api_key:
-        log.debug("No CoinGlass API key, skipping derivatives data")
-        return
-
-    headers = {"coinglassSecret": cfg.coinglass_api_key}
-    symbols = {"bitcoin": "BTC", "ethereum": "ETH", "solana": "SOL", "xrp": "XRP"}
-
-    # Funding rates
-    try:
-        resp = requests.get(
-            "https://open-api-v3.coinglass.com/api/futures/funding-rate/current",
-            headers=headers,
-            timeout=10,
-        )
-        if resp.status_code == 200:
-            data = resp.json().get("data", [])
-            for item in data:
-                symbol = item.get("symbol", "")
-                for asset, sym in symbols.items():
-                    if symbol == sym:
-                        ctx.funding_rates[asset] = float(item.get("rate", 0)) * 100
-    except Exception:
-        log.warning("CoinGlass funding rate fetch failed")
-
-    # Open interest
-    try:
-        resp = requests.get(
-            "https://open-api-v3.coinglass.com/api/futures/open-interest/aggregated",
-            headers=headers,
-            timeout=10,
-        )
-        if resp.status_code == 200:
-            data = resp.json().get("data", [])
-            for item in data:
-                symbol = item.get("symbol", "")
-                for asset, sym in symbols.items():
-                    if symbol == sym:
-                        oi = float(item.get("openInterest", 0))
-                        ctx.open_interest[asset] = oi / 1e6  # Convert to millions
-                        ctx.oi_change_24h_pct[asset] = float(item.get("change24h", 0))
-    except Exception:
-        log.warning("CoinGlass OI fetch failed")
-
-    # Liquidations
-    try:
-        resp = requests.get(
-            "https://open-api-v3.coinglass.com/api/futures/liquidation/aggregated",
-            headers=headers,
-            params={"timeType": "1"},  # 24h
-            timeout=10,
-        )
-        if resp.status_code == 200:
-            data = resp.json().get("data", [])
-            for item in data:
-                symbol = item.get("symbol", "")
-                for asset, sym in symbols.items():
-                    if symbol == sym:
-                        total = float(item.get("totalVolUsd", 0))
-                        ctx.liquidations_24h[asset] = total / 1e6
-    except Exception:
-        log.warning("CoinGlass liquidation fetch failed")
-
-
-def _fetch_fred(cfg: OracleConfig, ctx: MarketContext) -> None:
-    """Fetch macro data from FRED (Federal Reserve)."""
-    if not cfg.fred_api_key:
-        log.debug("No FRED API key, skipping macro data")
-        return
-
-    # DXY (Dollar Index)
-    try:
-        resp = requests.get(
-            "https://api.stlouisfed.org/fred/series/observations",
-            params={
-                "series_id": "DTWEXBGS",
-                "api_key": cfg.fred_api_key,
-                "file_type": "json",
-                "sort_order": "desc",
-                "limit": 1,
-            },
-            timeout=10,
-        )
-        obs = resp.json().get("observations", [])
-        if obs and obs[0].get("value", ".") != ".":
-            ctx.dxy = float(obs[0]["value"])
-    except Exception:
-        log.warning("FRED DXY fetch failed")
-
-    # Fed Funds Rate
-    try:
-        resp = requests.get(
-            "https://api.stlouisfed.org/fred/series/observations",
-            params={
-                "series_id": "FEDFUNDS",
-                "api_key": cfg.fred_api_key,
-                "file_type": "json",
-                "sort_order": "desc",
-                "limit": 1,
-            },
-            timeout=10,
-        )
-        obs = resp.json().get("observations", [])
-        if obs and obs[0].get("value", ".") != ".":
-            ctx.fed_rate = float(obs[0]["value"])
-    except Exception:
-        log.warning("FRED Fed rate fetch failed")
-
-
-def _fetch_atlas_intel(cfg: OracleConfig, ctx: MarketContext) -> None:
+    data = _get_json("fear_greed", FEAR_GREED_URL, params={"limit": 1}).get("data", [{}])[0]
+    return {
+        "fear_greed": int(data.get("value", 50)),
+        "fear_greed_label": data.get("value_classification", "Neutral"),
+    }
+
+
+def _coinglass_items(cfg: OracleConfig, endpoint: str, params: dict | None = None):
+    """Yield (asset, item) for tracked symbols from a CoinGlass futures endpoint."""
+    data = _get_json(
+        "coinglass",
+        f"{COINGLASS_API}/{endpoint}",
+        params=params,
+        headers={"coinglassSecret": cfg.coinglass_api_key},
+    ).get("data", [])
+    for item in data:
+        symbol = item.get("symbol", "")
+        for asset, sym in COINGLASS_SYMBOLS.items():
+            if symbol == sym:
+                yield asset, item
+
+
+def _fetch_coinglass_funding(cfg: OracleConfig) -> dict[str, Any]:
+    """Funding rates from CoinGlass."""
+    rates = {asset: float(item.get("rate", 0)) * 100
+             for asset, item in _coinglass_items(cfg, "funding-rate/current")}
+    return {"funding_rates": rates}
+
+
+def _fetch_coinglass_oi(cfg: OracleConfig) -> dict[str, Any]:
+    """Aggregated open interest from CoinGlass."""
+    oi, change = {}, {}
+    for asset, item in _coinglass_items(cfg, "open-interest/aggregated"):
+        oi[asset] = float(item.get("openInterest", 0)) / 1e6  # Convert to millions
+        change[asset] = float(item.get("change24h", 0))
+    return {"open_interest": oi, "oi_change_24h_pct": change}
+
+
+def _fetch_coinglass_liquidations(cfg: OracleConfig) -> dict[str, Any]:
+    """24h liquidations from CoinGlass."""
+    liq = {asset: float(item.get("totalVolUsd", 0)) / 1e6
+           for asset, item in _coinglass_items(cfg, "liquidation/aggregated", {"timeType": "1"})}
+    return {"liquidations_24h": liq}
+
+
+def _fetch_fred_series(cfg: OracleConfig, series_id: str, field_name: str) -> dict[str, Any]:
+    """Latest observation of a FRED series (DTWEXBGS = dollar index, FEDFUNDS = fed rate)."""
+    obs = _get_json(
+        "fred",
+        FRED_API,
+        params={
+            "series_id": series_id,
+            "api_key": cfg.fred_api_key,
+            "file_type": "json",
+            "sort_order": "desc",
+            "limit": 1,
+        },
+    ).get("observations", [])
+    if obs and obs[0].get("value", ".") != ".":
+        return {field_name: float(obs[0]["value"])}
+    return {}
+
+
+def _fetch_atlas_intel() -> dict[str, Any]:
     """Read Atlas knowledge base for macro research and news catalysts."""
     atlas_root = Path.home() / "atlas" / "data"
+    insights: list[str] = []
+    catalysts: list[str] = []
 
     # Atlas KB entries
     kb_file = atlas_root / "knowledge_base.json"
@@ -328,7 +404,7 @@ def _fetch_atlas_intel(cfg: OracleConfig, ctx: MarketContext) -> None:
                 title = entry.get("title", "") if isinstance(entry, dict) else str(entry)
                 if any(kw in title.lower() for kw in ("bitcoin", "ethereum", "crypto", "macro", "fed", "etf", "halving")):
                     summary = entry.get("summary", title) if isinstance(entry, dict) else title
-                    ctx.atlas_insights.append(str(summary)[:200])
+                    insights.append(str(summary)[:200])
         except Exception:
             log.debug("Failed to read Atlas KB")
 
@@ -340,6 +416,8 @@ def _fetch_atlas_intel(cfg: OracleConfig, ctx: MarketContext) -> None:
             findings = research.get("findings", []) if isinstance(research, dict) else []
             for f in findings[:5]:
                 text = f.get("text", str(f)) if isinstance(f, dict) else str(f)
-                ctx.news_catalysts.append(text[:200])
+                catalysts.append(text[:200])
         except Exception:
             pass
+
+    return {"atlas_insights": insights, "news_catalysts": catalysts}
@@ -9,10 +9,12 @@ Provides advanced analysis beyond basic backtesting:
 """
 from __future__ import annotations
 
+import json
 import logging
 import math
+import os
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -333,6 +335,29 @@ class CUSUMResult:
     cusum_history: list[dict] = field(default_factory=list)
 
 
+def _classify_decay(result: CUSUMResult) -> None:
+    """Set severity and alert message from the pre/post change-point WR drop."""
+    if result.wr_drop_pp >= 15:
+        result.severity = "critical"
+        result.alert_message = (
+            f"CRITICAL: Strategy edge collapsed {result.wr_drop_pp:.0f}pp "
+            f"({result.pre_change_wr:.0f}% → {result.post_change_wr:.0f}%) "
+            f"at trade #{result.change_point_index}. Recommend pausing live trading."
+        )
+    elif result.wr_drop_pp >= 8:
+        result.severity = "warning"
+        result.alert_message = (
+            f"WARNING: Edge decay detected ({result.wr_drop_pp:.0f}pp drop). "
+            f"WR declined from {result.pre_change_wr:.0f}% to {result.post_change_wr:.0f}%. "
+            f"Reduce position sizes."
+        )
+    else:
+        result.severity = "warning"
+        result.alert_message = (
+            f"Mild edge decay: {result.wr_drop_pp:.0f}pp drop detected. Monitoring."
+        )
+
+
 def cusum_edge_decay(
     trades: list[dict],
     target_wr: float | None = None,
@@ -353,6 +378,9 @@ def cusum_edge_decay(
       rolling_window: Window for current WR calculation
 
     Returns CUSUMResult with change detection info and severity.
+
+    Recomputes over the full history on every call. The live path is
+    CUSUMMonitor; this stays as the reference it must agree with.
     """
     result = CUSUMResult(threshold=threshold)
 
@@ -426,26 +454,7 @@ def cusum_edge_decay(
             result.post_change_wr = round(sum(post) / len(post) * 100, 1)
         result.wr_drop_pp = round(result.pre_change_wr - result.post_change_wr, 1)
 
-        # Severity classification
-        if result.wr_drop_pp >= 15:
-            result.severity = "critical"
-            result.alert_message = (
-                f"CRITICAL: Strategy edge collapsed {result.wr_drop_pp:.0f}pp "
-                f"({result.pre_change_wr:.0f}% → {result.post_change_wr:.0f}%) "
-                f"at trade #{change_idx}. Recommend pausing live trading."
-            )
-        elif result.wr_drop_pp >= 8:
-            result.severity = "warning"
-            result.alert_message = (
-                f"WARNING: Edge decay detected ({result.wr_drop_pp:.0f}pp drop). "
-                f"WR declined from {result.pre_change_wr:.0f}% to {result.post_change_wr:.0f}%. "
-                f"Reduce position sizes."
-            )
-        else:
-            result.severity = "warning"
-            result.alert_message = (
-                f"Mild edge decay: {result.wr_drop_pp:.0f}pp drop detected. Monitoring."
-            )
+        _classify_decay(result)
     else:
         result.alert_message = f"Strategy stable: no significant decay detected (WR={result.current_rolling_wr:.0f}%)"
 
@@ -456,6 +465,231 @@ def cusum_edge_decay(
     return result
 
 
+CUSUM_STATE_FILE = Path(__file__).resolve().parent.parent / "data" / "quant_cusum_state.json"
+CUSUM_MIN_TRADES = 20
+_CUSUM_SEEN_RING = 500       # trade ids remembered for dedupe between sync() and update()
+_CUSUM_HISTORY_POINTS = 50   # history is decimated to stay within 2x this
+
+
+class CUSUMMonitor:
+    """Online CUSUM edge-decay monitor — O(1) per resolved trade.
+
+    Runs the same recurrences as cusum_edge_decay(), but keeps the running
+    sums, change point, win counts and rolling window in a small JSON
+    checkpoint, so each update only folds in trades it has not seen. The
+    alarm fires on the update that crosses the threshold.
+
+    Trades are applied in arrival order. Replaying history sorted by
+    timestamp (sync() on a fresh monitor) reproduces cusum_edge_decay(); once
+    live, a trade resolving after a newer one is applied when it arrives.
+
+    Without an explicit target_wr, the target is calibrated like the batch
+    version — first half of the resolved trades available once there are
+    CUSUM_MIN_TRADES — and then frozen.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 5.0,
+        drift: float = 0.5,
+        rolling_window: int = 30,
+        target_wr: float | None = None,
+        path: Path | None = None,
+    ):
+        self.path = path or CUSUM_STATE_FILE
+        self.threshold = threshold
+        self.drift = drift
+        self.rolling_window = rolling_window
+        self.fixed_target = target_wr
+        self.target_wr = target_wr
+        self.n = 0
+        self.wins = 0
+        self.cusum_pos = 0.0
+        self.cusum_neg = 0.0
+        self.change_idx = -1
+        self.change_ts = 0.0
+        self.pre_change_wins = 0
+        self.recent: deque[int] = deque(maxlen=rolling_window)
+        self.history: list[dict] = []
+        self.history_stride = 1
+        self.last_point: dict = {}
+        self.pending: list[list] = []  # [timestamp, outcome] waiting for target calibration
+        self.seen: deque[list] = deque(maxlen=_CUSUM_SEEN_RING)  # [trade_id, timestamp]
+        self._seen_ids: set[str] = set()
+
+    # ── Checkpoint ──
+
+    def _params(self) -> dict:
+        return {"threshold": self.threshold, "drift": self.drift,
+                "rolling_window": self.rolling_window, "target_wr": self.fixed_target}
+
+    @classmethod
+    def load(cls, path: Path | None = None, **params) -> CUSUMMonitor:
+        """Restore from the checkpoint; start fresh if missing, corrupt or params changed."""
+        monitor = cls(path=path, **params)
+        try:
+            state = json.loads(monitor.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return monitor
+        if state.get("params") != monitor._params():
+            log.info("CUSUM monitor params changed — rebuilding from history")
+            return monitor
+        for key in ("target_wr", "n", "wins", "cusum_pos", "cusum_neg", "change_idx",
+                    "change_ts", "pre_change_wins", "history", "history_stride",
+                    "last_point", "pending"):
+            setattr(monitor, key, state[key])
+        monitor.recent.extend(state["recent"])
+        monitor.seen.extend(state["seen"])
+        monitor._seen_ids = {tid for tid, _ in monitor.seen}
+        return monitor
+
+    def save(self) -> None:
+        """Write the checkpoint atomically (tmp + rename)."""
+        state = {
+            "params": self._params(),
+            "target_wr": self.target_wr,
+            "n": self.n,
+            "wins": self.wins,
+            "cusum_pos": self.cusum_pos,
+            "cusum_neg": self.cusum_neg,
+            "change_idx": self.change_idx,
+            "change_ts": self.change_ts,
+            "pre_change_wins": self.pre_change_wins,
+            "recent": list(self.recent),
+            "history": self.history,
+            "history_stride": self.history_stride,
+            "last_point": self.last_point,
+            "pending": self.pending,
+            "seen": list(self.seen),
+            "updated_at": time.time(),
+        }
+        tmp = self.path.with_suffix(".json.tmp")
+        try:
+            self.path.parent.mkdir(exist_ok=True)
+            tmp.write_text(json.dumps(state))
+            os.replace(str(tmp), str(self.path))
+        except Exception:
+            log.exception("Failed to write CUSUM checkpoint")
+
+    # ── Updates ──
+
+    def update(self, trade: dict) -> bool:
+        """Fold in one resolved trade. Returns True if this update raised the alarm."""
+        if not trade.get("resolved", True) or trade.get("won") is None:
+            return False
+        tid = str(trade.get("trade_id") or trade.get("timestamp", ""))
+        if tid in self._seen_ids:
+            return False
+        return self._ingest([(tid, trade.get("timestamp", 0), 1 if trade.get("won") else 0)])
+
+    def sync(self, trades: list[dict]) -> bool:
+        """Fold in any resolved trades from a full trade list not yet seen.
+
+        Trades older than everything in the dedupe ring are assumed already
+        counted. Returns True if the alarm was raised.
+        """
+        floor = min(ts for _, ts in self.seen) if len(self.seen) == self.seen.maxlen else None
+        new = []
+        for t in sorted(trades, key=lambda t: t.get("timestamp", 0)):
+            if not t.get("resolved") or t.get("won") is None:
+                continue
+            ts = t.get("timestamp", 0)
+            tid = str(t.get("trade_id") or ts)
+            if tid in self._seen_ids or (floor is not None and ts <= floor):
+                continue
+            new.append((tid, ts, 1 if t.get("won") else 0))
+        return self._ingest(new) if new else False
+
+    def _ingest(self, items: list[tuple]) -> bool:
+        for tid, ts, _ in items:
+            self.seen.append([tid, ts])
+            self._seen_ids.add(tid)
+        if len(self._seen_ids) > 2 * _CUSUM_SEEN_RING:
+            self._seen_ids = {tid for tid, _ in self.seen}
+
+        steps = [[ts, outcome] for _, ts, outcome in items]
+        if self.target_wr is None:
+            self.pending.extend(steps)
+            if len(self.pending) < CUSUM_MIN_TRADES:
+                return False
+            first_half = self.pending[:len(self.pending) // 2]
+            wins_first = sum(outcome for _, outcome in first_half)
+            self.target_wr = wins_first / len(first_half) * 100
+            steps, self.pending = self.pending, []
+
+        alarm = False
+        for ts, outcome in steps:
+            alarm |= self._step(ts, outcome)
+        if alarm:
+            result = self.result()
+            log.warning("CUSUM ALARM [%s] at trade #%d: %s",
+                        result.severity, result.change_point_index, result.alert_message)
+        return alarm
+
+    def _step(self, ts: float, outcome: int) -> bool:
+        deviation = outcome - self.target_wr / 100.0
+        self.cusum_pos = max(0, self.cusum_pos - deviation - self.drift / 100)
+        self.cusum_neg = max(0, self.cusum_neg + deviation - self.drift / 100)
+
+        i = self.n
+        self.n += 1
+        self.wins += outcome
+        self.recent.append(outcome)
+
+        self.last_point = {
+            "index": i,
+            "timestamp": ts,
+            "cusum_pos": round(self.cusum_pos, 3),
+            "cusum_neg": round(self.cusum_neg, 3),
+            "outcome": outcome,
+        }
+        if i % self.history_stride == 0:
+            self.history.append(self.last_point)
+            if len(self.history) > 2 * _CUSUM_HISTORY_POINTS:
+                self.history = self.history[::2]
+                self.history_stride *= 2
+
+        if self.cusum_pos > self.threshold and self.change_idx == -1:
+            self.change_idx = i
+            self.change_ts = ts
+            self.pre_change_wins = self.wins - outcome
+            return True
+        return False
+
+    # ── Result ──
+
+    def result(self) -> CUSUMResult:
+        """Current state as a CUSUMResult (same fields as cusum_edge_decay)."""
+        result = CUSUMResult(threshold=self.threshold)
+        have = self.n + len(self.pending)
+        if have < CUSUM_MIN_TRADES:
+            result.alert_message = f"Need {CUSUM_MIN_TRADES}+ resolved trades for CUSUM (have {have})"
+            return result
+
+        result.target_wr = round(self.target_wr, 1)
+        result.cusum_pos = round(self.cusum_pos, 3)
+        result.cusum_neg = round(self.cusum_neg, 3)
+        result.cusum_history = list(self.history)
+        if self.last_point and (not self.history or self.history[-1]["index"] != self.last_point["index"]):
+            result.cusum_history.append(self.last_point)
+        result.current_rolling_wr = round(sum(self.recent) / len(self.recent) * 100, 1)
+
+        if self.change_idx >= 0:
+            result.change_detected = True
+            result.change_point_index = self.change_idx
+            result.change_point_timestamp = self.change_ts
+            result.trades_since_change = self.n - self.change_idx
+            if self.change_idx:
+                result.pre_change_wr = round(self.pre_change_wins / self.change_idx * 100, 1)
+            post_wins = self.wins - self.pre_change_wins
+            result.post_change_wr = round(post_wins / result.trades_since_change * 100, 1)
+            result.wr_drop_pp = round(result.pre_change_wr - result.post_change_wr, 1)
+            _classify_decay(result)
+        else:
+            result.alert_message = f"Strategy stable: no significant decay detected (WR={result.current_rolling_wr:.0f}%)"
+        return result
+
+
 # ─── Indicator Diversity / Correlation Analysis ───
 
 @dataclass
@@ -1,30 +1,50 @@
 """Bulk download Binance historical klines from data.binance.vision.
 
-Downloads monthly ZIP files for BTC/ETH/SOL/XRP at 5m, 15m, 1h intervals,
-converts CSV → JSONL matching Quant's Candle dataclass format.
+Downloads monthly ZIP files for BTC/ETH/SOL/XRP at 5m, 15m, 1h intervals
+and merges them into Quant's candle store (JSONL matching the Candle
+dataclass format).
+
+Months for all requested assets download concurrently (bounded by
+--workers). Each archive streams to a .part file that later runs resume
+with an HTTP Range request, and is verified against Binance's published
+.CHECKSUM (SHA-256) before use. Verified archives are kept under
+data/klines_zips/ so re-runs skip them. The CSV inside is streamed out of
+the ZIP and parsed in vectorized numpy chunks straight into the per-asset
+merge — no extraction, no per-row dicts. Each asset is merged into its
+store as soon as its last month finishes, so only the assets still
+downloading hold month arrays in memory.
 
 Usage:
     .venv/bin/python -m quant.bulk_download --all-assets --interval 5m --months 12
     .venv/bin/python -m quant.bulk_download --asset bitcoin --interval 1h --months 6
+    .venv/bin/python -m quant.bulk_download --all-assets --months 36 --workers 8
 """
 from __future__ import annotations
 
 import argparse
-import csv
+import hashlib
 import io
 import json
 import logging
+import os
+import re
 import shutil
+import threading
+import time
 import zipfile
-from datetime import datetime, timedelta
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import requests
 
 log = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 CANDLE_DIR = DATA_DIR / "candles"
+ZIP_DIR = DATA_DIR / "klines_zips"
 
 # Asset name -> Binance symbol
 ASSET_SYMBOLS = {
@@ -36,148 +56,347 @@ ASSET_SYMBOLS = {
 
 BASE_URL = "https://data.binance.vision/data/spot/monthly/klines"
 
+DEFAULT_WORKERS = 4
+CSV_CHUNK_BYTES = 4 * 1024 * 1024
+_STREAM_BYTES = 1 << 16
+_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
 
-def _download_monthly_zip(symbol: str, interval: str, year: int, month: int) -> bytes | None:
-    """Download a single monthly klines ZIP file from Binance."""
-    month_str = f"{year}-{month:02d}"
-    filename = f"{symbol}-{interval}-{month_str}.zip"
-    url = f"{BASE_URL}/{symbol}/{interval}/{filename}"
+_local = threading.local()
+
+
+def _session() -> requests.Session:
+    """One HTTP session per worker thread (requests.Session isn't thread-safe)."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _local.session = session
+    return session
 
+
+def _month_range(months: int) -> list[tuple[int, int]]:
+    """The last N calendar months as (year, month), newest first."""
+    now = datetime.utcnow()
+    year, month = now.year, now.month
+    out = []
+    for _ in range(months):
+        out.append((year, month))
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    return out
+
+
+# ── Download ───────────────────────────────────────────────────────
+
+def _expected_sha256(url: str) -> str | None:
+    """Binance publishes '<sha256>  <filename>' next to every archive."""
     try:
-        resp = requests.get(url, timeout=30)
+        resp = _session().get(url + ".CHECKSUM", timeout=30)
         if resp.status_code == 200:
-            return resp.content
-        elif resp.status_code == 404:
-            log.debug("Not found: %s", url)
-            return None
-        else:
-            log.warning("HTTP %d for %s", resp.status_code, url)
-            return None
+            return resp.text.split()[0].lower()
     except Exception as e:
-        log.warning("Download failed for %s: %s", url, str(e)[:100])
+        log.debug("Checksum fetch failed for %s: %s", url, str(e)[:100])
+    return None
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _stream_to_part(url: str, part: Path) -> int | None:
+    """Download url into part, resuming from its current size. Returns bytes fetched or None."""
+    offset = part.stat().st_size if part.exists() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    try:
+        with _session().get(url, headers=headers, stream=True, timeout=30) as resp:
+            if resp.status_code == 416:
+                return 0  # part already holds the whole file
+            if resp.status_code == 404:
+                log.debug("Not found: %s", url)
+                return None
+            if resp.status_code not in (200, 206):
+                log.warning("HTTP %d for %s", resp.status_code, url)
+                return None
+            mode = "ab" if resp.status_code == 206 else "wb"
+            fetched = 0
+            with open(part, mode) as f:
+                for block in resp.iter_content(_STREAM_BYTES):
+                    f.write(block)
+                    fetched += len(block)
+            return fetched
+    except Exception as e:
+        log.warning("Download failed for %s: %s (partial kept for resume)", url, str(e)[:100])
         return None
 
 
-def _parse_csv_from_zip(zip_bytes: bytes) -> list[dict]:
-    """Extract CSV from ZIP and parse into candle dicts."""
-    candles = []
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+def _fetch_month(symbol: str, interval: str, year: int, month: int) -> tuple[Path | None, int]:
+    """Fetch and verify one monthly archive. Returns (zip path or None, bytes downloaded)."""
+    filename = f"{symbol}-{interval}-{year}-{month:02d}.zip"
+    url = f"{BASE_URL}/{symbol}/{interval}/{filename}"
+    ZIP_DIR.mkdir(parents=True, exist_ok=True)
+    final = ZIP_DIR / filename
+    part = ZIP_DIR / (filename + ".part")
+
+    expected = _expected_sha256(url)
+    if final.exists() and (expected is None or _sha256(final) == expected):
+        return final, 0
+
+    downloaded = 0
+    for attempt in range(2):
+        fetched = _stream_to_part(url, part)
+        if fetched is None:
+            return None, downloaded
+        downloaded += fetched
+        if expected is None:
+            if zipfile.is_zipfile(part):
+                log.warning("No checksum published for %s — accepted on ZIP integrity only", filename)
+                break
+        elif _sha256(part) == expected:
+            break
+        log.warning("Checksum mismatch for %s (attempt %d) — refetching from scratch", filename, attempt + 1)
+        part.unlink(missing_ok=True)
+    else:
+        return None, downloaded
+
+    os.replace(str(part), str(final))
+    return final, downloaded
+
+
+# ── Parse ──────────────────────────────────────────────────────────
+
+def _parse_block(data: bytes) -> np.ndarray:
+    """Parse complete CSV lines into an (n, 6) array of the first six columns."""
+    try:
+        return np.loadtxt(io.BytesIO(data), delimiter=",", usecols=range(6),
+                          dtype=np.float64, ndmin=2)
+    except ValueError:
+        pass
+    # Row-by-row fallback for a block numpy rejects (malformed rows are skipped)
+    rows = []
+    for line in data.splitlines():
+        parts = line.split(b",")
+        if len(parts) < 6:
+            continue
+        try:
+            rows.append([float(p) for p in parts[:6]])
+        except ValueError:
+            continue
+    return np.array(rows, dtype=np.float64).reshape(-1, 6)
+
+
+def _line_blocks(f) -> Iterator[bytes]:
+    """Read a binary stream in CSV_CHUNK_BYTES blocks cut at line boundaries."""
+    tail = b""
+    while True:
+        block = f.read(CSV_CHUNK_BYTES)
+        data = tail + block
+        cut = data.rfind(b"\n") + 1 if block else len(data)
+        data, tail = data[:cut], data[cut:]
+        if data.strip():
+            yield data
+        if not block:
+            return
+
+
+def _parse_zip(path: Path) -> np.ndarray:
+    """Stream the CSV out of a monthly ZIP into an (n, 6) array:
+    timestamp (s), open, high, low, close, volume.
+
+    Binance CSV columns: 0 open_time, 1 open, 2 high, 3 low, 4 close,
+    5 volume, 6 close_time, ...
+    """
+    chunks = []
+    with zipfile.ZipFile(path) as zf:
         for name in zf.namelist():
             if not name.endswith(".csv"):
                 continue
             with zf.open(name) as f:
-                reader = csv.reader(io.TextIOWrapper(f, encoding="utf-8"))
-                for row in reader:
-                    if len(row) < 6:
-                        continue
-                    try:
-                        # Binance CSV columns:
-                        # 0: open_time, 1: open, 2: high, 3: low, 4: close,
-                        # 5: volume, 6: close_time, ...
-                        open_time_ms = int(row[0])
-                        # Handle microsecond timestamps (from Jan 2025+)
-                        if open_time_ms > 1e15:
-                            open_time_ms = open_time_ms // 1000
-                        timestamp = open_time_ms / 1000.0
-
-                        candles.append({
-                            "timestamp": timestamp,
-                            "open": float(row[1]),
-                            "high": float(row[2]),
-                            "low": float(row[3]),
-                            "close": float(row[4]),
-                            "volume": float(row[5]),
-                        })
-                    except (ValueError, IndexError):
-                        continue
-    return candles
+                for i, data in enumerate(_line_blocks(f)):
+                    if i == 0 and not data[:1].isdigit():
+                        data = data[data.find(b"\n") + 1:]  # header row (newer archives)
+                    chunks.append(_parse_block(data))
+
+    if not chunks:
+        return np.empty((0, 6))
+    out = np.concatenate(chunks)
+    # open_time is ms; archives from Jan 2025+ use microseconds
+    open_time = out[:, 0]
+    open_time = np.where(open_time > 1e15, np.floor(open_time / 1000), open_time)
+    out[:, 0] = open_time / 1000.0
+    return out
+
+
+# ── Candle store ───────────────────────────────────────────────────
+
+# One store line exactly as _merge_into_store writes it, captured as a CSV row
+_STORE_LINE = re.compile(
+    rb'^\{"timestamp": ([^,]+), "open": ([^,]+), "high": ([^,]+), '
+    rb'"low": ([^,]+), "close": ([^,]+), "volume": ([^,}]+)\}[ \t\r]*$',
+    re.M,
+)
+
+
+def _store_rows_json(data: bytes) -> np.ndarray:
+    rows = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            c = json.loads(line)
+            rows.append([c[k] for k in _FIELDS])
+        except (json.JSONDecodeError, KeyError, TypeError):
+            continue
+    return np.array(rows, dtype=np.float64).reshape(-1, 6)
 
 
-def download_asset(
-    asset: str,
-    interval: str = "5m",
-    months: int = 12,
-) -> int:
-    """Download historical candles for one asset.
+def _load_store(path: Path) -> np.ndarray:
+    """Read a JSONL candle store into an (n, 6) array.
 
-    Returns total candle count written.
-    Non-5m intervals write to candles_{interval}/ (e.g. candles_4h/).
+    Blocks in the layout this module writes are rewritten to CSV with one
+    regex pass and handed to _parse_block; a block containing any other
+    line (other key order, extra keys) is decoded with json line by line.
     """
-    symbol = ASSET_SYMBOLS.get(asset)
-    if not symbol:
-        log.error("Unknown asset: %s", asset)
-        return 0
+    chunks = []
+    with open(path, "rb") as f:
+        for data in _line_blocks(f):
+            csv = _STORE_LINE.sub(rb"\1,\2,\3,\4,\5,\6", data)
+            # Any "{" left means a line the regex didn't take — decode that block as JSON
+            chunks.append(_store_rows_json(data) if b"{" in csv else _parse_block(csv))
+    return np.concatenate(chunks) if chunks else np.empty((0, 6))
+
 
+def _merge_into_store(asset: str, interval: str, months: list[np.ndarray]) -> tuple[int, int]:
+    """Merge downloaded months into the asset's JSONL store. Returns (total, new)."""
     # Use interval-specific directory for non-default intervals
     out_dir = CANDLE_DIR if interval == "5m" else DATA_DIR / f"candles_{interval}"
     out_dir.mkdir(parents=True, exist_ok=True)
     output_file = out_dir / f"{asset}.jsonl"
 
-    # Backup existing file
+    existing = np.empty((0, 6))
     if output_file.exists():
-        backup = CANDLE_DIR / f"{asset}.jsonl.bak"
+        backup = out_dir / f"{asset}.jsonl.bak"
         shutil.copy2(output_file, backup)
         log.info("Backed up %s → %s", output_file.name, backup.name)
+        existing = _load_store(output_file)
+        log.info("Loaded %d existing candles for %s", len(existing), asset)
+
+    combined = np.concatenate([existing, *months]) if months else existing
+    # Deduplicate by timestamp keeping the last occurrence (downloaded data wins), sorted
+    _, last_idx = np.unique(combined[::-1, 0], return_index=True)
+    merged = combined[::-1][last_idx]
+    new_count = len(merged) - len(np.unique(existing[:, 0]))
+
+    tmp = output_file.with_suffix(".jsonl.tmp")
+    with open(tmp, "w") as f:
+        for ts, o, h, l, c, v in merged.tolist():
+            f.write(f'{{"timestamp": {ts!r}, "open": {o!r}, "high": {h!r}, '
+                    f'"low": {l!r}, "close": {c!r}, "volume": {v!r}}}\n')
+    os.replace(str(tmp), str(output_file))
+    return len(merged), new_count
+
+
+# ── Orchestration ──────────────────────────────────────────────────
+
+def _month_job(symbol: str, interval: str, year: int, month: int) -> dict:
+    t0 = time.perf_counter()
+    path, nbytes = _fetch_month(symbol, interval, year, month)
+    t_fetch = time.perf_counter() - t0
+    if path is None:
+        return {"candles": None, "bytes": nbytes, "fetch_s": t_fetch, "parse_s": 0.0}
+    t0 = time.perf_counter()
+    candles = _parse_zip(path)
+    return {"candles": candles, "bytes": nbytes, "fetch_s": t_fetch,
+            "parse_s": time.perf_counter() - t0, "cached": nbytes == 0}
+
+
+def download_assets(
+    assets: list[str],
+    interval: str = "5m",
+    months: int = 12,
+    workers: int = DEFAULT_WORKERS,
+) -> dict[str, int]:
+    """Download and merge historical candles for several assets concurrently.
 
-    # Load existing candles for dedup
-    existing_timestamps: set[float] = set()
-    existing_candles: list[dict] = []
-    if output_file.exists():
-        with open(output_file) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    c = json.loads(line)
-                    existing_timestamps.add(c["timestamp"])
-                    existing_candles.append(c)
-                except (json.JSONDecodeError, KeyError):
-                    continue
-        log.info("Loaded %d existing candles for %s", len(existing_candles), asset)
-
-    # Calculate month range
-    now = datetime.utcnow()
-    all_candles = list(existing_candles)
-    new_count = 0
-
-    for i in range(months):
-        target = now - timedelta(days=30 * i)
-        year = target.year
-        month = target.month
-
-        log.info("Downloading %s %s %d-%02d...", symbol, interval, year, month)
-        zip_bytes = _download_monthly_zip(symbol, interval, year, month)
-        if zip_bytes is None:
-            continue
-
-        parsed = _parse_csv_from_zip(zip_bytes)
-        for c in parsed:
-            if c["timestamp"] not in existing_timestamps:
-                existing_timestamps.add(c["timestamp"])
-                all_candles.append(c)
-                new_count += 1
-
-        log.info("  → %d candles parsed (%d new)", len(parsed), new_count)
-
-    # Sort by timestamp and write
-    all_candles.sort(key=lambda c: c["timestamp"])
+    Returns {asset: total candle count written}.
+    Non-5m intervals write to candles_{interval}/ (e.g. candles_4h/).
+    """
+    symbols = {}
+    for asset in assets:
+        if asset in ASSET_SYMBOLS:
+            symbols[asset] = ASSET_SYMBOLS[asset]
+        else:
+            log.error("Unknown asset: %s", asset)
+
+    month_list = _month_range(months)
+    per_asset: dict[str, list[np.ndarray]] = {a: [] for a in symbols}
+    stats = {a: {"months": 0, "missing": 0, "bytes": 0, "candles": 0} for a in symbols}
+    totals: dict[str, int] = {}
+    t_start = time.perf_counter()
+
+    def merge(asset: str) -> None:
+        # Runs as soon as the asset's last month lands; its arrays are released here
+        total, new_count = _merge_into_store(asset, interval, per_asset.pop(asset))
+        totals[asset] = total
+        st = stats[asset]
+        elapsed = time.perf_counter() - t_start
+        log.info(
+            "%s: %d total candles written (%d new from Binance) — %d/%d months, "
+            "%.1f MB downloaded, %.0f candles/s",
+            asset, total, new_count, st["months"], len(month_list),
+            st["bytes"] / 1e6, st["candles"] / elapsed if elapsed else 0,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(_month_job, symbol, interval, y, m): (asset, symbol, y, m)
+            for asset, symbol in symbols.items()
+            for y, m in month_list
+        }
+        for future in as_completed(futures):
+            asset, symbol, y, m = futures[future]
+            try:
+                job = future.result()
+            except Exception:
+                log.exception("%s %s %d-%02d failed", symbol, interval, y, m)
+                job = {"candles": None, "bytes": 0}
+            st = stats[asset]
+            st["bytes"] += job["bytes"]
+            if job["candles"] is None:
+                st["missing"] += 1
+            else:
+                per_asset[asset].append(job["candles"])
+                st["months"] += 1
+                st["candles"] += len(job["candles"])
+                rate = job["bytes"] / 1024 / job["fetch_s"] if job["bytes"] and job["fetch_s"] else 0
+                log.info("  %s %s %d-%02d: %d candles, %s, parsed in %.2fs",
+                         symbol, interval, y, m, len(job["candles"]),
+                         "cached" if job.get("cached") else
+                         f"{job['bytes'] / 1024:.0f} KB in {job['fetch_s']:.1f}s ({rate:.0f} KB/s)",
+                         job["parse_s"])
+            if st["months"] + st["missing"] == len(month_list):
+                merge(asset)
+
+    for asset in list(per_asset):  # only when there were no months to wait for
+        merge(asset)
+    return totals
 
-    # Deduplicate by timestamp (keep last occurrence)
-    seen: dict[float, dict] = {}
-    for c in all_candles:
-        seen[c["timestamp"]] = c
-    all_candles = sorted(seen.values(), key=lambda c: c["timestamp"])
 
-    with open(output_file, "w") as f:
-        for c in all_candles:
-            f.write(json.dumps(c) + "\n")
+def download_asset(
+    asset: str,
+    interval: str = "5m",
+    months: int = 12,
+    workers: int = DEFAULT_WORKERS,
+) -> int:
+    """Download historical candles for one asset.
 
-    log.info(
-        "%s: %d total candles written (%d new from Binance)",
-        asset, len(all_candles), new_count,
-    )
-    return len(all_candles)
+    Returns total candle count written.
+    Non-5m intervals write to candles_{interval}/ (e.g. candles_4h/).
+    """
+    return download_assets([asset], interval, months, workers).get(asset, 0)
 
 
 def main():
@@ -191,6 +410,8 @@ def main():
     parser.add_argument("--all-assets", action="store_true", help="Download all assets")
     parser.add_argument("--interval", type=str, default="5m", help="Kline interval (5m, 15m, 1h)")
     parser.add_argument("--months", type=int, default=12, help="Number of months to download")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Concurrent month downloads")
     args = parser.parse_args()
 
     if args.all_assets:
@@ -201,12 +422,8 @@ def main():
         parser.error("Specify --asset or --all-assets")
         return
 
-    total = 0
-    for asset in assets:
-        count = download_asset(asset, args.interval, args.months)
-        total += count
-
-    log.info("Done. Total candles across all assets: %d", total)
+    totals = download_assets(assets, args.interval, args.months, args.workers)
+    log.info("Done. Total candles across all assets: %d", sum(totals.values()))
 
 
 if __name__ == "__main__":
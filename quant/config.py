@@ -55,3 +55,7 @@ class QuantConfig:
     odin_backtest_balance: float = 1000.0
     odin_backtest_step: int = 6      # 4H bars between analysis (6 = 1 day)
     odin_backtest_window: int = 200  # lookback bars for SMC
+
+    # ── Cycle scheduler ──
+    phase_workers: int = 8           # threads for concurrent cycle phases
+    phase_processes: int = 4         # processes for CPU-bound phases (0 = threads only)
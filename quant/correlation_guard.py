@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -154,15 +155,14 @@ def _get_correlation(asset_a: str, asset_b: str) -> float:
     return ASSET_CORRELATIONS.get(key, 0.0)
 
 
-def _compute_trade_correlation(
+def _compute_trade_correlation_reference(
     garves_trades: list[dict],
     odin_trades: list[dict],
     window_hours: float = 24.0,
 ) -> float:
-    """Compute directional correlation between Garves V2 and Odin recent trades.
+    """Reference nested-loop version of _compute_trade_correlation (O(G×O)).
 
-    Looks at overlapping time windows where both traders had positions.
-    Returns correlation coefficient (-1 to 1).
+    Kept for the parity check in scripts/bench_correlation_guard.py.
     """
     if not garves_trades or not odin_trades:
         return 0.0
@@ -208,6 +208,87 @@ def _compute_trade_correlation(
     return float(np.corrcoef(g, o)[0, 1])
 
 
+def _direction_counts(
+    trades: list[dict], cutoff: float, ts_key: str, asset_of, is_up,
+) -> dict[str, list[int]]:
+    """Bucket in-window trades by asset → [up_count, down_count]."""
+    buckets: dict[str, list[int]] = {}
+    for t in trades:
+        if t.get(ts_key, 0) < cutoff:
+            continue
+        asset = asset_of(t)
+        if asset is None:
+            continue
+        slot = buckets.setdefault(asset, [0, 0])
+        slot[0 if is_up(t) else 1] += 1
+    return buckets
+
+
+def _compute_trade_correlation(
+    garves_trades: list[dict],
+    odin_trades: list[dict],
+    window_hours: float = 24.0,
+) -> float:
+    """Compute directional correlation between Garves V2 and Odin recent trades.
+
+    Looks at overlapping time windows where both traders had positions.
+    Returns correlation coefficient (-1 to 1).
+
+    Every in-window Garves trade pairs with every in-window Odin trade on an
+    asset correlated ≥0.5, so the pair set is a cross product per asset
+    bucket. Instead of materialising it, trades are bucketed by asset and
+    direction and the Pearson moments are summed per bucket pair — O(G+O)
+    with the same pairs and result as _compute_trade_correlation_reference.
+    """
+    if not garves_trades or not odin_trades:
+        return 0.0
+
+    cutoff = time.time() - window_hours * 3600
+
+    garves = _direction_counts(
+        garves_trades, cutoff, "timestamp",
+        lambda t: t.get("asset") if t.get("asset") and t.get("direction") else None,
+        lambda t: t.get("direction") == "up",
+    )
+    odin = _direction_counts(
+        odin_trades, cutoff, "entry_time",
+        lambda t: ODIN_TO_GARVES.get(t.get("symbol", ""), ""),
+        lambda t: t.get("side", "").lower() == "long",
+    )
+
+    # Pair moments: g = ±1, o = ±corr, summed over the cross product of each bucket pair
+    n = sum_g = sum_gg = 0          # integer moments stay exact at 10k×10k
+    sum_o = sum_oo = sum_go = 0.0
+    odin_values: set[float] = set()
+    for g_asset, (g_up, g_down) in garves.items():
+        n_g, net_g = g_up + g_down, g_up - g_down
+        for o_asset, (o_up, o_down) in odin.items():
+            corr = _get_correlation(g_asset, o_asset)
+            if corr < 0.5:
+                continue
+            n_o, net_o = o_up + o_down, o_up - o_down
+            n += n_g * n_o
+            sum_g += net_g * n_o
+            sum_o += corr * net_o * n_g
+            sum_gg += n_g * n_o
+            sum_oo += corr * corr * n_g * n_o
+            sum_go += corr * net_g * net_o
+            if o_up:
+                odin_values.add(corr)
+            if o_down:
+                odin_values.add(-corr)
+
+    if n < 3:
+        return 0.0
+
+    var_g = n * sum_gg - sum_g * sum_g
+    var_o = n * sum_oo - sum_o * sum_o
+    if var_g <= 0 or len(odin_values) < 2 or var_o <= 0:
+        return 0.0
+    r = (n * sum_go - sum_g * sum_o) / math.sqrt(var_g * var_o)
+    return max(-1.0, min(1.0, r))
+
+
 def check_correlation(
     correlation_threshold: float = 0.7,
     max_combined_exposure_usd: float = 50.0,
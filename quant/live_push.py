@@ -14,16 +14,20 @@ Includes:
 """
 from __future__ import annotations
 
+import fcntl
 import json
 import logging
 import os
+import struct
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 from quant.analytics import MonteCarloResult, CUSUMResult
+from quant.reporter import publish_json
 from quant.walk_forward import WalkForwardV2Result
 
 log = logging.getLogger(__name__)
@@ -33,7 +37,6 @@ DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 VERSIONS_DIR = DATA_DIR / "quant_versions"
 GARVES_PARAMS_FILE = DATA_DIR / "quant_live_params.json"
 ODIN_DATA_DIR = Path.home() / "odin" / "data"
-MAX_VERSIONS = 20
 
 
 def _now_et() -> str:
@@ -229,12 +232,8 @@ def _push_to_garves(
         "applied_at": _now_et(),
     }
 
-    tmp = GARVES_PARAMS_FILE.with_suffix(".json.tmp")
     try:
-        DATA_DIR.mkdir(exist_ok=True)
-        with open(tmp, "w") as f:
-            json.dump(output, indent=2, fp=f)
-        os.replace(str(tmp), str(GARVES_PARAMS_FILE))
+        publish_json(GARVES_PARAMS_FILE, output, volatile=())
         log.info("Garves V2 params updated: v%d, %s", version, list(params.keys()))
         return True
     except Exception:
@@ -303,6 +302,115 @@ def _push_to_odin(
 
 
 # ─── Strategy Version Control ───
+# Every push is one JSON line appended to HISTORY_LOG (never rewritten) and one
+# fixed-size (version, offset, length) record appended to HISTORY_INDEX. Versions
+# are consecutive, so version N sits at index slot N - first_version: lookups
+# and "last N versions" read only the records they return, however long the
+# history gets. The index is the source of truth — a log line without an index
+# record (crash mid-append) is never referenced.
+
+HISTORY_LOG = VERSIONS_DIR / "history.jsonl"
+HISTORY_INDEX = VERSIONS_DIR / "history.idx"
+HISTORY_LOCK = VERSIONS_DIR / "history.lock"
+_INDEX_RECORD = struct.Struct("<IQI")  # version, byte offset in log, line length
+
+
+def _index_slots(idx) -> int:
+    idx.seek(0, os.SEEK_END)
+    return idx.tell() // _INDEX_RECORD.size  # ignores a torn trailing record
+
+
+def _read_slot(idx, slot: int) -> tuple[int, int, int]:
+    idx.seek(slot * _INDEX_RECORD.size)
+    return _INDEX_RECORD.unpack(idx.read(_INDEX_RECORD.size))
+
+
+def _find_slot(idx, version: int) -> tuple[int, int, int] | None:
+    """Index record for version: direct slot, binary search if there are gaps."""
+    n = _index_slots(idx)
+    if n == 0:
+        return None
+    first = _read_slot(idx, 0)[0]
+    slot = version - first
+    if 0 <= slot < n:
+        rec = _read_slot(idx, slot)
+        if rec[0] == version:
+            return rec
+    lo, hi = 0, n - 1
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        rec = _read_slot(idx, mid)
+        if rec[0] == version:
+            return rec
+        if rec[0] < version:
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return None
+
+
+def _read_snapshots(records: list[tuple[int, int, int]]) -> list[dict]:
+    snapshots = []
+    with open(HISTORY_LOG, "rb") as f:
+        for _, offset, length in records:
+            f.seek(offset)
+            snapshots.append(json.loads(f.read(length)))
+    return snapshots
+
+
+@contextmanager
+def _history_lock():
+    """Exclusive lock for writers (pushes from Quant, migration from either process)."""
+    VERSIONS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(HISTORY_LOCK, "a") as lock_fd:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+
+
+def _append_snapshot(snapshot_fn) -> dict:
+    """Append snapshot_fn(version) to the history as the next version."""
+    _migrate_legacy_versions()
+    with _history_lock(), open(HISTORY_INDEX, "ab+") as idx:
+        n = _index_slots(idx)
+        if idx.tell() != n * _INDEX_RECORD.size:
+            idx.truncate(n * _INDEX_RECORD.size)  # drop a torn trailing record
+        version = _read_slot(idx, n - 1)[0] + 1 if n else 1
+        snapshot = snapshot_fn(version)
+        line = (json.dumps(snapshot) + "\n").encode()
+        with open(HISTORY_LOG, "ab") as log_f:
+            offset = log_f.seek(0, os.SEEK_END)
+            log_f.write(line)
+        idx.write(_INDEX_RECORD.pack(version, offset, len(line)))
+    return snapshot
+
+
+def _migrate_legacy_versions() -> None:
+    """One-time import of the old per-version v*.json snapshots into the log."""
+    if HISTORY_INDEX.exists() or not any(VERSIONS_DIR.glob("v*.json")):
+        return
+    with _history_lock():
+        if HISTORY_INDEX.exists():
+            return
+        legacy = sorted(VERSIONS_DIR.glob("v*.json"))
+        tmp_index = HISTORY_INDEX.with_suffix(".idx.tmp")
+        offset = 0
+        with open(HISTORY_LOG, "wb") as log_f, open(tmp_index, "wb") as idx:
+            for vf in legacy:
+                try:
+                    snapshot = json.loads(vf.read_text())
+                except Exception:
+                    continue
+                snapshot.setdefault("version", int(vf.stem.lstrip("v")))
+                line = (json.dumps(snapshot) + "\n").encode()
+                log_f.write(line)
+                idx.write(_INDEX_RECORD.pack(snapshot["version"], offset, len(line)))
+                offset += len(line)
+        os.replace(tmp_index, HISTORY_INDEX)
+    log.info("Migrated %d version snapshots into %s", len(legacy), HISTORY_LOG.name)
+
 
 def _save_version(
     params: dict,
@@ -312,16 +420,6 @@ def _save_version(
     target: str,
 ) -> int:
     """Save a version snapshot before applying new params. Returns version number."""
-    VERSIONS_DIR.mkdir(parents=True, exist_ok=True)
-
-    # Determine next version number
-    existing = sorted(VERSIONS_DIR.glob("v*.json"))
-    if existing:
-        last_num = int(existing[-1].stem.lstrip("v"))
-        version = last_num + 1
-    else:
-        version = 1
-
     # Load current live params for diff
     current_params = {}
     if GARVES_PARAMS_FILE.exists():
@@ -329,15 +427,16 @@ def _save_version(
             current_params = json.loads(GARVES_PARAMS_FILE.read_text()).get("params", {})
         except Exception:
             pass
+    diff = _compute_diff(current_params, params)
 
-    snapshot = {
+    snapshot = _append_snapshot(lambda version: {
         "version": version,
         "timestamp": time.time(),
         "applied_at": _now_et(),
         "target": target,
         "previous_params": current_params,
         "new_params": params,
-        "diff": _compute_diff(current_params, params),
+        "diff": diff,
         "validation": {
             "wfv2_passed": validation.wfv2_passed,
             "monte_carlo_passed": validation.monte_carlo_passed,
@@ -347,19 +446,9 @@ def _save_version(
         },
         "baseline_wr": round(baseline_wr, 1),
         "best_wr": round(best_wr, 1),
-    }
-
-    version_file = VERSIONS_DIR / f"v{version:04d}.json"
-    version_file.write_text(json.dumps(snapshot, indent=2))
-    log.info("Saved version v%d to %s", version, version_file)
-
-    # Prune old versions (keep last MAX_VERSIONS)
-    all_versions = sorted(VERSIONS_DIR.glob("v*.json"))
-    if len(all_versions) > MAX_VERSIONS:
-        for old in all_versions[:-MAX_VERSIONS]:
-            old.unlink()
-
-    return version
+    })
+    log.info("Saved version v%d to %s", snapshot["version"], HISTORY_LOG)
+    return snapshot["version"]
 
 
 def _compute_diff(old: dict, new: dict) -> list[dict]:
@@ -379,27 +468,38 @@ def _compute_diff(old: dict, new: dict) -> list[dict]:
     return diff
 
 
+def get_version(version: int | None = None) -> dict | None:
+    """Return the stored snapshot for version (latest if None), or None."""
+    _migrate_legacy_versions()
+    if not HISTORY_INDEX.exists():
+        return None
+    with open(HISTORY_INDEX, "rb") as idx:
+        if version is None:
+            n = _index_slots(idx)
+            rec = _read_slot(idx, n - 1) if n else None
+        else:
+            rec = _find_slot(idx, version)
+    return _read_snapshots([rec])[0] if rec else None
+
+
 def rollback(version: int | None = None) -> bool:
     """Rollback to a previous version. If version is None, rollback to previous.
 
     Returns True if rollback succeeded.
     """
-    all_versions = sorted(VERSIONS_DIR.glob("v*.json"))
-    if not all_versions:
-        log.warning("No versions to rollback to")
+    try:
+        snapshot = get_version(version)
+    except Exception:
+        log.exception("Rollback failed")
         return False
-
-    if version is not None:
-        target_file = VERSIONS_DIR / f"v{version:04d}.json"
-        if not target_file.exists():
+    if snapshot is None:
+        if version is None:
+            log.warning("No versions to rollback to")
+        else:
             log.warning("Version v%d not found", version)
-            return False
-    else:
-        # Rollback to the most recent version's previous_params
-        target_file = all_versions[-1]
+        return False
 
     try:
-        snapshot = json.loads(target_file.read_text())
         prev_params = snapshot.get("previous_params", {})
 
         if not prev_params:
@@ -413,10 +513,7 @@ def rollback(version: int | None = None) -> bool:
             "applied_at": _now_et(),
             "rollback_from_version": snapshot.get("version", 0),
         }
-        tmp = GARVES_PARAMS_FILE.with_suffix(".json.tmp")
-        with open(tmp, "w") as f:
-            json.dump(output, indent=2, fp=f)
-        os.replace(str(tmp), str(GARVES_PARAMS_FILE))
+        publish_json(GARVES_PARAMS_FILE, output, volatile=())
 
         log.info("Rolled back to pre-v%d params", snapshot.get("version", 0))
         return True
@@ -427,23 +524,23 @@ def rollback(version: int | None = None) -> bool:
 
 def get_version_history(limit: int = 10) -> list[dict]:
     """Return recent version history for dashboard display."""
-    VERSIONS_DIR.mkdir(parents=True, exist_ok=True)
-    all_versions = sorted(VERSIONS_DIR.glob("v*.json"), reverse=True)[:limit]
+    _migrate_legacy_versions()
+    if not HISTORY_INDEX.exists():
+        return []
+    with open(HISTORY_INDEX, "rb") as idx:
+        n = _index_slots(idx)
+        records = [_read_slot(idx, slot) for slot in range(n - 1, max(n - limit, 0) - 1, -1)]
     history = []
-    for vf in all_versions:
-        try:
-            data = json.loads(vf.read_text())
-            history.append({
-                "version": data.get("version", 0),
-                "applied_at": data.get("applied_at", ""),
-                "target": data.get("target", ""),
-                "baseline_wr": data.get("baseline_wr", 0),
-                "best_wr": data.get("best_wr", 0),
-                "estimated_daily_pnl": data.get("validation", {}).get("estimated_daily_pnl", 0),
-                "diff_count": len(data.get("diff", [])),
-            })
-        except Exception:
-            continue
+    for data in _read_snapshots(records):
+        history.append({
+            "version": data.get("version", 0),
+            "applied_at": data.get("applied_at", ""),
+            "target": data.get("target", ""),
+            "baseline_wr": data.get("baseline_wr", 0),
+            "best_wr": data.get("best_wr", 0),
+            "estimated_daily_pnl": data.get("validation", {}).get("estimated_daily_pnl", 0),
+            "diff_count": len(data.get("diff", [])),
+        })
     return history
 
 
@@ -5,10 +5,11 @@ import asyncio
 import json
 import logging
 import time
+from functools import partial
 from pathlib import Path
 
 from quant.config import QuantConfig
-from quant.data_loader import load_all_candles, load_all_trades, load_indicator_accuracy
+from quant.data_loader import load_all_candles, load_all_trades
 from quant.backtester import replay_historical_trades, backtest_candle_indicators
 from quant.optimizer import run_optimization, get_live_params
 from quant.walk_forward import (
@@ -17,11 +18,11 @@ from quant.walk_forward import (
 )
 from quant.reporter import (
     write_status, write_results, write_recommendations,
-    write_hawk_review, publish_events, write_live_params,
+    write_hawk_review, publish_events, write_live_params, publish_json,
 )
 from quant.analytics import (
     compute_kelly, analyze_indicator_diversity, detect_strategy_decay,
-    monte_carlo_simulate, cusum_edge_decay,
+    monte_carlo_simulate, cusum_edge_decay, CUSUMMonitor,
 )
 from quant.live_push import validate_push, push_params, get_version_history
 from quant.regime import tag_trades_with_regime, analyze_regime_performance
@@ -29,6 +30,7 @@ from quant.correlation_guard import check_correlation, write_correlation_report
 from quant.self_learner import run_learning_cycle, load_odin_trades
 from quant.pnl_estimator import estimate_pnl_impact, write_pnl_impact
 from quant.odin_optimizer import load_odin_trades as load_odin_trades_opt, analyze_odin_trades, write_odin_recommendations
+from quant.scheduler import Phase, PhaseError, PhaseRun, run_phases
 from quant.scorer import score_result
 from quant.ml_predictor import retrain_model
 from quant.odin_backtester import run_multi_asset_backtest
@@ -58,6 +60,11 @@ class QuantBot:
         self._trades_studied_since_opt = 0  # reset after each mini-opt
         self._total_trades_studied = 0
         self._mini_opts_run = 0
+        self._cusum = CUSUMMonitor.load(
+            threshold=self.cfg.cusum_threshold,
+            drift=self.cfg.cusum_drift,
+            rolling_window=self.cfg.cusum_rolling_window,
+        )
 
     async def run(self):
         """Run backtesting cycles forever, polling event bus between cycles."""
@@ -91,149 +98,229 @@ class QuantBot:
                 await asyncio.sleep(self.cfg.event_poll_interval)
 
     async def _run_cycle(self):
-        """Single backtest cycle with Phase 1 intelligence engine."""
+        """Single backtest cycle with Phase 1 intelligence engine.
+
+        The steps are a dependency graph (_cycle_phases) run concurrently by
+        quant.scheduler; per-phase timings are written to quant_status.json,
+        also when a phase fails.
+        """
         log.info("=== Cycle %d starting ===", self.cycle)
 
-        # 1. Load data
-        log.info("Loading historical data...")
-        trades = load_all_trades()
-        candles = load_all_candles()
-        accuracy = load_indicator_accuracy()
+        try:
+            run = run_phases(
+                self._cycle_phases(),
+                max_workers=self.cfg.phase_workers,
+                max_processes=self.cfg.phase_processes,
+            )
+        except PhaseError as e:
+            self._write_cycle_status(e.run)
+            raise
+        self._write_cycle_status(run)
+
+        r = run.results
+        trades = r["trades"]
+        baseline, scored = r["optimize"]
+        baseline_ci = r["bootstrap_ci"]
+        wfv2_result = r["walk_forward_v2"]
+        mc_result = r["monte_carlo"]
+        cusum_result = r["cusum"]
+        regime_analysis = r["regime"]
+        corr_report = r["correlation"]
+        learning_summary = r["self_learning"]
+
+        log.info("Phases: %.1fs wall (%.1fs if serial), critical path %.1fs: %s",
+                 run.wall_seconds, run.serial_seconds, run.critical_path_seconds,
+                 " -> ".join(run.critical_path))
+
+        best_wr = scored[0][1].win_rate if scored and scored[0][1].total_signals >= 20 else 0
+
+        # 16. Log summary
+        log.info("=== Cycle %d complete ===", self.cycle)
+        log.info("Baseline: WR=%.1f%% (%d signals) CI=[%.1f%%, %.1f%%]",
+                 baseline.win_rate, baseline.total_signals,
+                 baseline_ci.ci_lower, baseline_ci.ci_upper)
+        log.info("Best found: WR=%.1f%% | WFV2: %s (gap=%.1fpp) | MC ruin=%.2f%% | CUSUM=%s",
+                 best_wr,
+                 "PASS" if wfv2_result.passed else "FAIL",
+                 wfv2_result.overfit_gap,
+                 mc_result.ruin_probability,
+                 cusum_result.severity)
+        log.info("Phase 2: regime=%s, correlation=%s, learning=%.0f%% accuracy, Odin=%d trades",
+                 regime_analysis.current_regime.combined,
+                 corr_report.overall_risk,
+                 learning_summary.get("recommendation_accuracy", 0),
+                 learning_summary.get("odin_trades", 0))
+
+        # Brain: record backtest findings + outcome
+        if _quant_brain:
+            try:
+                _did = _quant_brain.remember_decision(
+                    context=(
+                        f"Backtest cycle {self.cycle}: {len(scored)} combos on {len(trades)} trades. "
+                        f"WFV2={'PASS' if wfv2_result.passed else 'FAIL'}, "
+                        f"MC ruin={mc_result.ruin_probability:.1f}%, CUSUM={cusum_result.severity}"
+                    ),
+                    decision=(
+                        f"Baseline WR={baseline.win_rate:.1f}%, best WR={best_wr:.1f}%, "
+                        f"WFV2 OOS={wfv2_result.avg_test_wr:.1f}%, stability={wfv2_result.stability_score:.0f}"
+                    ),
+                    confidence=0.5,
+                    tags=["backtest", "phase1"],
+                )
+                _improvement = best_wr - baseline.win_rate
+                _score = min(1.0, _improvement / 10.0) if _improvement > 0 else -0.5
+                _quant_brain.remember_outcome(
+                    _did,
+                    f"Improvement={_improvement:+.1f}pp, WFV2={'PASS' if wfv2_result.passed else 'FAIL'}, "
+                    f"ruin={mc_result.ruin_probability:.1f}%, CUSUM={cusum_result.severity}",
+                    score=_score,
+                )
+                if _improvement > 2.0 and wfv2_result.passed and mc_result.ruin_probability < 5:
+                    _quant_brain.learn_pattern(
+                        "strong_validated_backtest",
+                        f"+{_improvement:.1f}pp improvement passed all 3 gates "
+                        f"(WFV2 gap={wfv2_result.overfit_gap:.1f}pp, ruin={mc_result.ruin_probability:.1f}%)",
+                        evidence_count=1, confidence=0.75,
+                    )
+            except Exception:
+                pass
+
+    def _cycle_phases(self) -> list[Phase]:
+        """The steps of a cycle and the results each one needs.
 
-        candle_counts = {asset: len(c) for asset, c in candles.items()}
-        log.info("Data: %d trades, candles: %s", len(trades), candle_counts)
+        Everything hangs off the loaded trades/candles; reports are written as
+        soon as their inputs exist. The Optuna searches and Monte Carlo run in
+        the process pool (module-level partials), the rest on threads.
+        """
+        cfg = self.cfg
 
-        if len(trades) < self.cfg.min_trades_for_significance:
-            log.warning("Only %d trades — need %d for significance. Running baseline only.",
-                        len(trades), self.cfg.min_trades_for_significance)
+        # 1. Load data
+        def load_trades():
+            trades = load_all_trades()
+            log.info("Data: %d trades", len(trades))
+            if len(trades) < cfg.min_trades_for_significance:
+                log.warning("Only %d trades — need %d for significance. Running baseline only.",
+                            len(trades), cfg.min_trades_for_significance)
+            return trades
+
+        def load_candles():
+            candles = load_all_candles()
+            log.info("Data: candles %s", {asset: len(c) for asset, c in candles.items()})
+            return candles
+
+        def wf_folds(trades):
+            return cfg.wfv2_folds if len(trades) >= 100 else 3
 
         # 2. Run optimization (Optuna if available, else grid)
         if HAS_OPTUNA:
-            baseline, scored = optuna_full_optimization(
-                trades=trades,
-                n_trials=self.cfg.max_combinations,
-                min_trades=self.cfg.min_trades_for_significance,
-            )
+            optimize = partial(optuna_full_optimization,
+                               n_trials=cfg.max_combinations,
+                               min_trades=cfg.min_trades_for_significance)
         else:
-            baseline, scored = run_optimization(
-                trades=trades,
-                max_combinations=self.cfg.max_combinations,
-                min_trades=self.cfg.min_trades_for_significance,
-            )
+            optimize = partial(run_optimization,
+                               max_combinations=cfg.max_combinations,
+                               min_trades=cfg.min_trades_for_significance)
 
         # 3. Bootstrap CI on baseline
-        baseline_ci = bootstrap_confidence_interval(baseline.wins, baseline.losses)
-        log.info("Baseline CI: %.1f%% [%.1f%%, %.1f%%] ±%.1f%%",
-                 baseline_ci.point_estimate, baseline_ci.ci_lower,
-                 baseline_ci.ci_upper, baseline_ci.margin_of_error)
-
-        # 4a. Walk-forward V1 (legacy compatibility)
-        n_folds = self.cfg.wfv2_folds if len(trades) >= 100 else 3
-        wf_result = walk_forward_validation(
-            trades=trades,
-            n_folds=n_folds,
-            max_optuna_trials=50,
-            min_trades_per_fold=10,
-        )
-
-        # 4b. Walk-Forward V2 with strict OOS gates
-        wfv2_result = walk_forward_v2(
-            trades=trades,
-            n_folds=n_folds,
-            max_optuna_trials=50,
-            min_trades_per_fold=10,
-            max_overfit_gap=self.cfg.wfv2_max_overfit_gap,
-            method=self.cfg.wfv2_method,
-        )
-        log.info("WFV2: %s (gap=%.1fpp, stability=%d, PNL=$%.2f/day)",
-                 "PASSED" if wfv2_result.passed else f"REJECTED ({wfv2_result.rejection_reason})",
-                 wfv2_result.overfit_gap, wfv2_result.stability_score,
-                 wfv2_result.estimated_daily_pnl)
-
-        # 5. Monte Carlo Risk Engine (10K simulations)
-        mc_result = monte_carlo_simulate(
-            trades=trades,
-            n_simulations=self.cfg.monte_carlo_sims,
-            bankroll=self.cfg.kelly_bankroll,
-            ruin_threshold_pct=self.cfg.monte_carlo_ruin_threshold,
-        )
-        log.info("Monte Carlo: ruin=%.2f%%, avg DD=%.1f%%, Sharpe=%.2f, profitable=%.1f%%",
-                 mc_result.ruin_probability, mc_result.avg_max_drawdown_pct,
-                 mc_result.avg_sharpe, mc_result.profitable_pct)
-
-        # 6. CUSUM Edge Decay Detection
-        cusum_result = cusum_edge_decay(
-            trades=trades,
-            threshold=self.cfg.cusum_threshold,
-            drift=self.cfg.cusum_drift,
-            rolling_window=self.cfg.cusum_rolling_window,
-        )
-        if cusum_result.change_detected:
-            log.warning("CUSUM ALERT [%s]: %s", cusum_result.severity, cusum_result.alert_message)
+        def bootstrap_ci(optimized):
+            baseline, _ = optimized
+            baseline_ci = bootstrap_confidence_interval(baseline.wins, baseline.losses)
+            log.info("Baseline CI: %.1f%% [%.1f%%, %.1f%%] ±%.1f%%",
+                     baseline_ci.point_estimate, baseline_ci.ci_lower,
+                     baseline_ci.ci_upper, baseline_ci.margin_of_error)
+            return baseline_ci
+
+        # 6. CUSUM Edge Decay Detection (online — folds in only trades not yet seen)
+        def cusum(trades):
+            if self._cusum.sync(trades):
+                self._publish_cusum_alarm()
+            self._cusum.save()
+            cusum_result = self._cusum.result()
+            if cusum_result.change_detected:
+                log.warning("CUSUM ALERT [%s]: %s", cusum_result.severity, cusum_result.alert_message)
+            return cusum_result
 
         # ── Phase 2: Regime, Correlation, Self-Learning ──
 
         # 7. Regime-Tagged Backtesting
-        tagged_trades = tag_trades_with_regime(trades, candles)
-        regime_analysis = analyze_regime_performance(tagged_trades)
-        log.info("Regime analysis: %d regimes, best=%s, worst=%s",
-                 regime_analysis.regime_count, regime_analysis.best_regime,
-                 regime_analysis.worst_regime)
+        def regime(trades, candles):
+            tagged_trades = tag_trades_with_regime(trades, candles)
+            regime_analysis = analyze_regime_performance(tagged_trades)
+            log.info("Regime analysis: %d regimes, best=%s, worst=%s",
+                     regime_analysis.regime_count, regime_analysis.best_regime,
+                     regime_analysis.worst_regime)
+            return regime_analysis
 
         # 8. Cross-Trader Correlation Guard
-        odin_trades = load_odin_trades() if self.cfg.odin_enabled else []
-        corr_report = check_correlation(
-            garves_trades=trades,
-            odin_trades=odin_trades,
-        )
-        write_correlation_report(corr_report)
-        if corr_report.overall_risk in ("high", "critical"):
-            log.warning("CORRELATION ALERT [%s]: %s", corr_report.overall_risk,
-                        corr_report.alert_message)
+        def odin_trades():
+            return load_odin_trades() if cfg.odin_enabled else []
+
+        def correlation(trades, odin):
+            corr_report = check_correlation(
+                garves_trades=trades,
+                odin_trades=odin,
+            )
+            write_correlation_report(corr_report)
+            if corr_report.overall_risk in ("high", "critical"):
+                log.warning("CORRELATION ALERT [%s]: %s", corr_report.overall_risk,
+                            corr_report.alert_message)
+            return corr_report
 
         # 9. Self-Learning from Live Performance
-        learning_summary = run_learning_cycle(
-            garves_trades=trades,
-            odin_trades=odin_trades,
-        )
-        log.info("Self-learning: accuracy=%.0f%%, combined WR=%.1f%% (%d trades), "
-                 "%d outcomes measured, %d Odin insights",
-                 learning_summary.get("recommendation_accuracy", 0),
-                 learning_summary.get("combined_wr", 0),
-                 learning_summary.get("combined_trades", 0),
-                 learning_summary.get("outcomes_measured", 0),
-                 len(learning_summary.get("odin_insights", [])))
+        def self_learning(trades, odin):
+            learning_summary = run_learning_cycle(
+                garves_trades=trades,
+                odin_trades=odin,
+            )
+            log.info("Self-learning: accuracy=%.0f%%, combined WR=%.1f%% (%d trades), "
+                     "%d outcomes measured, %d Odin insights",
+                     learning_summary.get("recommendation_accuracy", 0),
+                     learning_summary.get("combined_wr", 0),
+                     learning_summary.get("combined_trades", 0),
+                     learning_summary.get("outcomes_measured", 0),
+                     len(learning_summary.get("odin_insights", [])))
+            return learning_summary
 
         # 10. PNL Impact Estimator
-        pnl_impact = None
-        if scored and scored[0][1].total_signals >= 20:
-            best_p = scored[0][1].params
-            pnl_impact = estimate_pnl_impact(
+        def pnl_impact(trades, optimized):
+            _, scored = optimized
+            if not (scored and scored[0][1].total_signals >= 20):
+                return None
+            impact = estimate_pnl_impact(
                 trades=trades,
-                proposed_params=best_p,
+                proposed_params=scored[0][1].params,
             )
-            write_pnl_impact(pnl_impact)
+            write_pnl_impact(impact)
             log.info("PNL Impact: $%.2f/day ($%.2f/mo), %+d trades, WR %+.1fpp",
-                     pnl_impact.daily_pnl, pnl_impact.monthly_pnl,
-                     pnl_impact.net_trade_change, pnl_impact.wr_delta)
-
-        # 11. Load Hawk trades for calibration review
-        hawk_trades = self._load_hawk_trades()
+                     impact.daily_pnl, impact.monthly_pnl,
+                     impact.net_trade_change, impact.wr_delta)
+            return impact
 
         # 12. Write all reports
-        write_status(self.cycle, baseline, len(scored), len(trades), candle_counts)
-        write_results(baseline, scored)
-        write_recommendations(baseline, scored)
-        _write_walk_forward(wf_result, baseline_ci)
-        _write_analytics(trades, baseline)
-        _write_phase1_reports(wfv2_result, mc_result, cusum_result)
-        _write_phase2_reports(regime_analysis, corr_report, learning_summary)
-        if self.cfg.hawk_review:
-            write_hawk_review(hawk_trades)
+        def report_results(optimized):
+            baseline, scored = optimized
+            write_results(baseline, scored)
+            write_recommendations(baseline, scored)
+
+        def report_analytics(trades, optimized):
+            _write_analytics(trades, optimized[0])
+
+        def report_phase1(wfv2_result, mc_result, cusum_result):
+            log.info("WFV2: %s (gap=%.1fpp, stability=%d, PNL=$%.2f/day)",
+                     "PASSED" if wfv2_result.passed else f"REJECTED ({wfv2_result.rejection_reason})",
+                     wfv2_result.overfit_gap, wfv2_result.stability_score,
+                     wfv2_result.estimated_daily_pnl)
+            log.info("Monte Carlo: ruin=%.2f%%, avg DD=%.1f%%, Sharpe=%.2f, profitable=%.1f%%",
+                     mc_result.ruin_probability, mc_result.avg_max_drawdown_pct,
+                     mc_result.avg_sharpe, mc_result.profitable_pct)
+            _write_phase1_reports(wfv2_result, mc_result, cusum_result)
 
         # 13. Live Parameter Push with triple-gate validation
-        best_wr = scored[0][1].win_rate if scored and scored[0][1].total_signals >= 20 else 0
-        if scored and scored[0][1].total_signals >= 20:
+        # (after report_phase1, which snapshots the version history)
+        def live_push(optimized, wf_result, wfv2_result, mc_result, cusum_result, _phase1):
+            baseline, scored = optimized
+            if not (scored and scored[0][1].total_signals >= 20):
+                return
             best_result = scored[0][1]
 
             # Validate through all three gates
@@ -243,7 +330,7 @@ class QuantBot:
                 cusum=cusum_result,
                 baseline_wr=baseline.win_rate,
                 best_wr=best_result.win_rate,
-                max_ruin_pct=self.cfg.max_ruin_pct,
+                max_ruin_pct=cfg.max_ruin_pct,
             )
 
             if push_validation.passed:
@@ -266,8 +353,8 @@ class QuantBot:
                         validation=push_validation,
                         baseline_wr=baseline.win_rate,
                         best_wr=best_result.win_rate,
-                        target=self.cfg.push_target,
-                        dry_run=self.cfg.push_dry_run,
+                        target=cfg.push_target,
+                        dry_run=cfg.push_dry_run,
                     )
                     log.info("Push result: %s", result.message)
             else:
@@ -281,72 +368,135 @@ class QuantBot:
                 wf_overfit_drop=wf_result.overfit_drop,
             )
 
-        # 14. Odin Strategy Backtest (SMC + regime + conviction on historical candles)
-        if self.cfg.odin_backtest_enabled:
-            try:
-                candle_dir = DATA_DIR / "candles_4h"
-                if candle_dir.exists() and list(candle_dir.glob("*.jsonl")):
-                    log.info("Running Odin strategy backtest...")
-                    odin_bt_results = run_multi_asset_backtest(
-                        candle_dir=candle_dir,
-                        symbols=self.cfg.odin_backtest_symbols,
-                        risk_per_trade_usd=self.cfg.odin_backtest_risk_per_trade,
-                        min_trade_score=self.cfg.odin_backtest_min_score,
-                        min_confidence=self.cfg.odin_backtest_min_confidence,
-                        min_rr=self.cfg.odin_backtest_min_rr,
-                        balance=self.cfg.odin_backtest_balance,
-                        step_size=self.cfg.odin_backtest_step,
-                        window_size=self.cfg.odin_backtest_window,
+        phases = [
+            Phase("trades", load_trades),
+            Phase("candles", load_candles),
+            Phase("wf_folds", wf_folds, ("trades",)),
+            Phase("optimize", optimize, ("trades",), process=True),
+            Phase("bootstrap_ci", bootstrap_ci, ("optimize",)),
+            # 4a. Walk-forward V1 (legacy compatibility)
+            Phase("walk_forward", partial(walk_forward_validation,
+                                          max_optuna_trials=50,
+                                          min_trades_per_fold=10),
+                  ("trades", "wf_folds"), process=True),
+            # 4b. Walk-Forward V2 with strict OOS gates
+            Phase("walk_forward_v2", partial(walk_forward_v2,
+                                             max_optuna_trials=50,
+                                             min_trades_per_fold=10,
+                                             max_overfit_gap=cfg.wfv2_max_overfit_gap,
+                                             method=cfg.wfv2_method),
+                  ("trades", "wf_folds"), process=True),
+            # 5. Monte Carlo Risk Engine (10K simulations)
+            Phase("monte_carlo", partial(monte_carlo_simulate,
+                                         n_simulations=cfg.monte_carlo_sims,
+                                         bankroll=cfg.kelly_bankroll,
+                                         ruin_threshold_pct=cfg.monte_carlo_ruin_threshold),
+                  ("trades",), process=True),
+            Phase("cusum", cusum, ("trades",)),
+            Phase("regime", regime, ("trades", "candles")),
+            Phase("odin_trades", odin_trades),
+            Phase("correlation", correlation, ("trades", "odin_trades")),
+            Phase("self_learning", self_learning, ("trades", "odin_trades")),
+            Phase("pnl_impact", pnl_impact, ("trades", "optimize")),
+            Phase("report_results", report_results, ("optimize",)),
+            Phase("report_walk_forward", _write_walk_forward, ("walk_forward", "bootstrap_ci")),
+            Phase("report_analytics", report_analytics, ("trades", "optimize")),
+            Phase("report_phase1", report_phase1, ("walk_forward_v2", "monte_carlo", "cusum")),
+            Phase("report_phase2", _write_phase2_reports, ("regime", "correlation", "self_learning")),
+            Phase("live_push", live_push, ("optimize", "walk_forward", "walk_forward_v2",
+                                           "monte_carlo", "cusum", "report_phase1")),
+            Phase("ml_retrain", self._retrain_ml),
+            # 15. Publish to event bus
+            Phase("publish_events", lambda optimized, _reports: publish_events(*optimized),
+                  ("optimize", "report_results")),
+        ]
+        # 11. Hawk trades for calibration review
+        if cfg.hawk_review:
+            phases.append(Phase("hawk_review", lambda: write_hawk_review(self._load_hawk_trades())))
+        if cfg.odin_backtest_enabled:
+            phases.append(Phase("odin_backtest", self._run_odin_backtest))
+        phases.append(Phase("odin_analyzer", self._analyze_odin_trades))
+        return phases
+
+    def _write_cycle_status(self, run: PhaseRun) -> None:
+        """12. Write quant_status.json with the phase timings (partial if a phase failed)."""
+        r = run.results
+        if not all(k in r for k in ("trades", "candles", "optimize")):
+            log.warning("Phase %s failed before the status inputs were ready; "
+                        "quant_status.json not updated", run.failed)
+            return
+        baseline, scored = r["optimize"]
+        candle_counts = {asset: len(c) for asset, c in r["candles"].items()}
+        write_status(self.cycle, baseline, len(scored), len(r["trades"]), candle_counts,
+                     phase_timings=run.to_dict())
+
+    def _run_odin_backtest(self):
+        """14. Odin Strategy Backtest (SMC + regime + conviction on historical candles)."""
+        try:
+            candle_dir = DATA_DIR / "candles_4h"
+            if candle_dir.exists() and list(candle_dir.glob("*.jsonl")):
+                log.info("Running Odin strategy backtest...")
+                odin_bt_results = run_multi_asset_backtest(
+                    candle_dir=candle_dir,
+                    symbols=self.cfg.odin_backtest_symbols,
+                    risk_per_trade_usd=self.cfg.odin_backtest_risk_per_trade,
+                    min_trade_score=self.cfg.odin_backtest_min_score,
+                    min_confidence=self.cfg.odin_backtest_min_confidence,
+                    min_rr=self.cfg.odin_backtest_min_rr,
+                    balance=self.cfg.odin_backtest_balance,
+                    step_size=self.cfg.odin_backtest_step,
+                    window_size=self.cfg.odin_backtest_window,
+                )
+                if odin_bt_results:
+                    odin_score = score_odin_backtest(
+                        odin_bt_results,
+                        starting_balance=self.cfg.odin_backtest_balance,
+                    )
+                    write_odin_backtest_report(odin_score, DATA_DIR)
+                    log.info(
+                        "Odin backtest: %d trades, WR=%.1f%%, PnL=$%.2f, "
+                        "Sharpe=%.2f, maxDD=%.1f%%",
+                        odin_score.total_trades, odin_score.win_rate,
+                        odin_score.total_pnl, odin_score.sharpe_ratio,
+                        odin_score.max_drawdown_pct,
                     )
-                    if odin_bt_results:
-                        odin_score = score_odin_backtest(
-                            odin_bt_results,
-                            starting_balance=self.cfg.odin_backtest_balance,
-                        )
-                        write_odin_backtest_report(odin_score, DATA_DIR)
-                        log.info(
-                            "Odin backtest: %d trades, WR=%.1f%%, PnL=$%.2f, "
-                            "Sharpe=%.2f, maxDD=%.1f%%",
-                            odin_score.total_trades, odin_score.win_rate,
-                            odin_score.total_pnl, odin_score.sharpe_ratio,
-                            odin_score.max_drawdown_pct,
-                        )
 
-                        # Publish to event bus
-                        try:
-                            import sys as _sys
-                            _shared = str(Path.home() / "shared")
-                            if _shared not in _sys.path:
-                                _sys.path.insert(0, _shared)
-                            from events import publish
-                            publish(
-                                agent="quant",
-                                event_type="odin_backtest_complete",
-                                severity="info",
-                                summary=(
-                                    f"Odin BT: {odin_score.total_trades} trades, "
-                                    f"WR={odin_score.win_rate:.1f}%, "
-                                    f"PnL=${odin_score.total_pnl:.2f}, "
-                                    f"Sharpe={odin_score.sharpe_ratio:.2f}"
-                                ),
-                                data={
-                                    "trades": odin_score.total_trades,
-                                    "win_rate": odin_score.win_rate,
-                                    "total_pnl": odin_score.total_pnl,
-                                    "sharpe": odin_score.sharpe_ratio,
-                                    "max_dd": odin_score.max_drawdown_pct,
-                                },
-                            )
-                        except Exception:
-                            pass
-                    else:
-                        log.info("Odin backtest: no candle data matched symbols")
+                    # Publish to event bus
+                    try:
+                        import sys as _sys
+                        _shared = str(Path.home() / "shared")
+                        if _shared not in _sys.path:
+                            _sys.path.insert(0, _shared)
+                        from events import publish
+                        publish(
+                            agent="quant",
+                            event_type="odin_backtest_complete",
+                            severity="info",
+                            summary=(
+                                f"Odin BT: {odin_score.total_trades} trades, "
+                                f"WR={odin_score.win_rate:.1f}%, "
+                                f"PnL=${odin_score.total_pnl:.2f}, "
+                                f"Sharpe={odin_score.sharpe_ratio:.2f}"
+                            ),
+                            data={
+                                "trades": odin_score.total_trades,
+                                "win_rate": odin_score.win_rate,
+                                "total_pnl": odin_score.total_pnl,
+                                "sharpe": odin_score.sharpe_ratio,
+                                "max_dd": odin_score.max_drawdown_pct,
+                            },
+                        )
+                    except Exception:
+                        pass
                 else:
-                    log.info("Odin backtest: no 4H candle data in %s (run: .venv/bin/python -m quant.bulk_download --all-assets --interval 4h --months 12)", candle_dir)
-            except Exception:
-                log.exception("Odin strategy backtest failed (non-fatal)")
+                    log.info("Odin backtest: no candle data matched symbols")
+            else:
+                log.info("Odin backtest: no 4H candle data in %s (run: .venv/bin/python -m quant.bulk_download --all-assets --interval 4h --months 12)", candle_dir)
+        except Exception:
+            log.exception("Odin strategy backtest failed (non-fatal)")
 
-        # 14b. Odin Trade Analyzer — analyze real paper/live trades
+    def _analyze_odin_trades(self):
+        """14b. Odin Trade Analyzer — analyze real paper/live trades."""
         try:
             odin_real_trades = load_odin_trades_opt()
             if len(odin_real_trades) >= 5:
@@ -367,13 +517,17 @@ class QuantBot:
         except Exception:
             log.exception("Odin trade analysis failed (non-fatal)")
 
-        # 15. ML Model retrain (XGBoost on resolved trades)
-        # (was step 14 before Odin backtest added)
+    def _retrain_ml(self):
+        """15. ML Model retrain (XGBoost on resolved trades)."""
         try:
             ml_metrics = retrain_model()
             if ml_metrics.get("status") == "trained":
-                log.info("ML model retrained: acc=%.3f, f1=%.3f, samples=%d",
-                         ml_metrics["accuracy"], ml_metrics["f1"], ml_metrics["num_samples"])
+                log.info("ML model retrained (%s): acc=%.3f, f1=%.3f, samples=%d (+%d new)",
+                         ml_metrics.get("mode", "full"), ml_metrics["accuracy"], ml_metrics["f1"],
+                         ml_metrics["num_samples"], ml_metrics.get("num_new", 0))
+            elif ml_metrics.get("status") == "up_to_date":
+                log.info("ML model up to date (%d samples, no newly resolved trades)",
+                         ml_metrics.get("num_samples", 0))
             else:
                 log.info("ML model: %s (%d/%d samples)",
                          ml_metrics.get("status"), ml_metrics.get("num_samples", 0),
@@ -381,60 +535,6 @@ class QuantBot:
         except Exception:
             log.exception("ML model retrain failed (non-fatal)")
 
-        # 15. Publish to event bus
-        publish_events(baseline, scored)
-
-        # 16. Log summary
-        log.info("=== Cycle %d complete ===", self.cycle)
-        log.info("Baseline: WR=%.1f%% (%d signals) CI=[%.1f%%, %.1f%%]",
-                 baseline.win_rate, baseline.total_signals,
-                 baseline_ci.ci_lower, baseline_ci.ci_upper)
-        log.info("Best found: WR=%.1f%% | WFV2: %s (gap=%.1fpp) | MC ruin=%.2f%% | CUSUM=%s",
-                 best_wr,
-                 "PASS" if wfv2_result.passed else "FAIL",
-                 wfv2_result.overfit_gap,
-                 mc_result.ruin_probability,
-                 cusum_result.severity)
-        log.info("Phase 2: regime=%s, correlation=%s, learning=%.0f%% accuracy, Odin=%d trades",
-                 regime_analysis.current_regime.combined,
-                 corr_report.overall_risk,
-                 learning_summary.get("recommendation_accuracy", 0),
-                 learning_summary.get("odin_trades", 0))
-
-        # Brain: record backtest findings + outcome
-        if _quant_brain:
-            try:
-                _did = _quant_brain.remember_decision(
-                    context=(
-                        f"Backtest cycle {self.cycle}: {len(scored)} combos on {len(trades)} trades. "
-                        f"WFV2={'PASS' if wfv2_result.passed else 'FAIL'}, "
-                        f"MC ruin={mc_result.ruin_probability:.1f}%, CUSUM={cusum_result.severity}"
-                    ),
-                    decision=(
-                        f"Baseline WR={baseline.win_rate:.1f}%, best WR={best_wr:.1f}%, "
-                        f"WFV2 OOS={wfv2_result.avg_test_wr:.1f}%, stability={wfv2_result.stability_score:.0f}"
-                    ),
-                    confidence=0.5,
-                    tags=["backtest", "phase1"],
-                )
-                _improvement = best_wr - baseline.win_rate
-                _score = min(1.0, _improvement / 10.0) if _improvement > 0 else -0.5
-                _quant_brain.remember_outcome(
-                    _did,
-                    f"Improvement={_improvement:+.1f}pp, WFV2={'PASS' if wfv2_result.passed else 'FAIL'}, "
-                    f"ruin={mc_result.ruin_probability:.1f}%, CUSUM={cusum_result.severity}",
-                    score=_score,
-                )
-                if _improvement > 2.0 and wfv2_result.passed and mc_result.ruin_probability < 5:
-                    _quant_brain.learn_pattern(
-                        "strong_validated_backtest",
-                        f"+{_improvement:.1f}pp improvement passed all 3 gates "
-                        f"(WFV2 gap={wfv2_result.overfit_gap:.1f}pp, ruin={mc_result.ruin_probability:.1f}%)",
-                        evidence_count=1, confidence=0.75,
-                    )
-            except Exception:
-                pass
-
     # ── Per-Trade Learning (event-driven) ──
 
     async def _poll_trade_events(self):
@@ -462,6 +562,14 @@ class QuantBot:
                 self._study_single_trade(data)
             except Exception:
                 log.exception("Failed to study trade %s", data.get("trade_id"))
+            # Same population as the cycle's sync(): load_all_trades() drops
+            # trades without indicator_votes, so they never reach the monitor
+            # there either and the live and cycle statistics stay identical.
+            if data.get("indicator_votes") and self._cusum.update(data):
+                self._publish_cusum_alarm()
+
+        if trade_events:
+            self._cusum.save()
 
         # Check if mini-opt threshold reached
         if self._trades_studied_since_opt >= self.cfg.mini_opt_threshold:
@@ -470,6 +578,31 @@ class QuantBot:
             except Exception:
                 log.exception("Mini-optimization failed")
 
+    def _publish_cusum_alarm(self):
+        """Publish the CUSUM decay alarm as soon as the monitor trips."""
+        result = self._cusum.result()
+        try:
+            import sys
+            _shared = str(Path.home() / "shared")
+            if _shared not in sys.path:
+                sys.path.insert(0, _shared)
+            from events import publish
+            publish(
+                agent="quant",
+                event_type="cusum_alarm",
+                severity="critical" if result.severity == "critical" else "warning",
+                summary=result.alert_message,
+                data={
+                    "change_point_index": result.change_point_index,
+                    "pre_change_wr": result.pre_change_wr,
+                    "post_change_wr": result.post_change_wr,
+                    "target_wr": result.target_wr,
+                    "cusum_pos": result.cusum_pos,
+                },
+            )
+        except Exception as e:
+            log.warning("Failed to publish CUSUM alarm: %s", e)
+
     def _study_single_trade(self, trade_data: dict):
         """Analyze a single resolved trade against current live params."""
         trade_id = trade_data.get("trade_id", "unknown")
@@ -686,10 +819,9 @@ def _write_phase1_reports(wfv2, mc, cusum):
         "version_history": get_version_history(5),
         "updated": _now_et(),
     }
-    DATA_DIR.mkdir(exist_ok=True)
-    (DATA_DIR / "quant_phase1.json").write_text(json.dumps(output, indent=2))
-    log.info("Wrote quant_phase1.json (WFV2=%s, MC ruin=%.2f%%, CUSUM=%s)",
-             "PASS" if wfv2.passed else "FAIL", mc.ruin_probability, cusum.severity)
+    if publish_json(DATA_DIR / "quant_phase1.json", output):
+        log.info("Wrote quant_phase1.json (WFV2=%s, MC ruin=%.2f%%, CUSUM=%s)",
+                 "PASS" if wfv2.passed else "FAIL", mc.ruin_probability, cusum.severity)
 
 
 def _write_phase2_reports(regime_analysis, corr_report, learning_summary):
@@ -721,12 +853,11 @@ def _write_phase2_reports(regime_analysis, corr_report, learning_summary):
         "learning": learning_summary,
         "updated": _now_et(),
     }
-    DATA_DIR.mkdir(exist_ok=True)
-    (DATA_DIR / "quant_phase2.json").write_text(json.dumps(output, indent=2))
-    log.info("Wrote quant_phase2.json (regime=%s, corr=%s, learning=%.0f%%)",
-             regime_analysis.current_regime.combined if regime_analysis.current_regime else "?",
-             corr_report.overall_risk,
-             learning_summary.get("recommendation_accuracy", 0))
+    if publish_json(DATA_DIR / "quant_phase2.json", output):
+        log.info("Wrote quant_phase2.json (regime=%s, corr=%s, learning=%.0f%%)",
+                 regime_analysis.current_regime.combined if regime_analysis.current_regime else "?",
+                 corr_report.overall_risk,
+                 learning_summary.get("recommendation_accuracy", 0))
 
 
 def _write_analytics(trades: list[dict], baseline: BacktestResult):
@@ -770,10 +901,9 @@ def _write_analytics(trades: list[dict], baseline: BacktestResult):
         },
         "updated": _now_et(),
     }
-    DATA_DIR.mkdir(exist_ok=True)
-    (DATA_DIR / "quant_analytics.json").write_text(json.dumps(output, indent=2))
-    log.info("Wrote quant_analytics.json (Kelly=$%.2f, diversity=%.0f, decay=%s)",
-             kelly.recommended_usd, diversity.diversity_score, decay.trend_direction)
+    if publish_json(DATA_DIR / "quant_analytics.json", output):
+        log.info("Wrote quant_analytics.json (Kelly=$%.2f, diversity=%.0f, decay=%s)",
+                 kelly.recommended_usd, diversity.diversity_score, decay.trend_direction)
 
 
 def _write_walk_forward(wf: walk_forward_validation.__class__, ci: bootstrap_confidence_interval.__class__):
@@ -800,9 +930,8 @@ def _write_walk_forward(wf: walk_forward_validation.__class__, ci: bootstrap_con
         },
         "updated": _now_et(),
     }
-    DATA_DIR.mkdir(exist_ok=True)
-    (DATA_DIR / "quant_walk_forward.json").write_text(json.dumps(output, indent=2))
-    log.info("Wrote quant_walk_forward.json")
+    if publish_json(DATA_DIR / "quant_walk_forward.json", output):
+        log.info("Wrote quant_walk_forward.json")
 
 
 def run_single_backtest(progress_callback=None) -> dict:
@@ -7,17 +7,30 @@ risk_score, regime, indicator agreement, sportsbook backing.
 Auto-trains when enough resolved trades exist (MIN_SAMPLES).
 Model saved to data/models/xgb_trade_predictor.json.
 
+Features for resolved trades are cached in an append-only feature store
+(data/models/xgb_feature_store.jsonl, keyed by trade id), so each retrain
+only featurizes newly resolved trades. While FEATURE_SCHEMA_VERSION is
+unchanged, retraining warm-starts from the saved booster with a few extra
+rounds; a schema bump (or an oversized ensemble) forces a full refit.
+Warm-start trees are grown on the new trades plus the most recent
+WARM_CONTEXT_ROWS of history, not the whole store, so their cost tracks
+the number of new trades; the full history is only refit on a full run.
+
 Usage:
     from quant.ml_predictor import predict_trade, retrain_model
 
     # Score a new opportunity
     win_prob = predict_trade(opportunity_dict)
 
+    # Score many at once (one feature matrix, one model call)
+    enriched = score_opportunities(opportunity_dicts)
+
     # Retrain from latest data
     metrics = retrain_model()
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from pathlib import Path
@@ -30,18 +43,94 @@ DATA_DIR = Path(__file__).parent.parent / "data"
 MODEL_PATH = DATA_DIR / "models" / "xgb_trade_predictor.json"
 HAWK_TRADES = DATA_DIR / "hawk_trades.jsonl"
 GARVES_TRADES = DATA_DIR / "trades.jsonl"
+FEATURE_STORE = DATA_DIR / "models" / "xgb_feature_store.jsonl"
 
 MIN_SAMPLES = 30  # Minimum resolved trades to train
+# Bump whenever FEATURES changes — invalidates the store and forces a full refit
+FEATURE_SCHEMA_VERSION = 1
+FULL_ROUNDS = 100          # Trees in a from-scratch fit
+WARM_ROUNDS_MIN = 5        # Extra trees per warm start...
+WARM_ROUNDS_PER_TRADE = 0.5  # ...scaled by the number of newly resolved trades
+WARM_ROUNDS_MAX = 25
+WARM_CONTEXT_ROWS = 2000   # Recent already-seen rows each warm start also trains on
+MAX_TREES = 300            # Beyond this, refit from scratch to keep the ensemble compact
 CATEGORY_MAP = {"sports": 0, "politics": 1, "crypto_event": 2, "other": 3, "crypto": 4}
 DIRECTION_MAP = {"yes": 1, "no": 0, "up": 1, "down": 0}
 
 _model = None
 
 
-def _load_trades() -> list[dict]:
-    """Load all resolved trades from Hawk + Garves."""
-    trades = []
-    for path in [HAWK_TRADES, GARVES_TRADES]:
+def _vote_margin(t: dict) -> float:
+    """Indicator vote margin (Garves has indicator_votes dict); 0.5 when unknown."""
+    votes = t.get("indicator_votes", {})
+    if not votes:
+        return 0.5
+    up = sum(1 for v in votes.values() if v == "up")
+    down = sum(1 for v in votes.values() if v == "down")
+    return abs(up - down) / max(len(votes), 1)
+
+
+# The one feature definition: (name, value-from-trade) in column order.
+# Both _extract_features and _extract_feature_matrix are built from it.
+FEATURES = (
+    ("edge", lambda t: t.get("edge", 0)),
+    ("confidence", lambda t: t.get("confidence", 0.5)),
+    ("category", lambda t: CATEGORY_MAP.get(t.get("category", "other"), 3)),
+    ("direction", lambda t: DIRECTION_MAP.get(t.get("direction", "yes"), 1)),
+    ("entry_price", lambda t: t.get("entry_price", 0.5)),
+    ("size_usd", lambda t: t.get("size_usd", 15)),
+    ("risk_score", lambda t: t.get("risk_score", 5)),
+    ("time_left_hours", lambda t: t.get("time_left_hours", 24)),
+    ("estimated_prob", lambda t: t.get("estimated_prob", 0.5)),
+    ("expected_value", lambda t: t.get("expected_value", 0)),
+    ("has_sportsbook", lambda t: t.get("edge_source") == "sportsbook_divergence"),
+    ("log_volume", lambda t: np.log1p(float(t.get("volume", t.get("ob_liquidity_usd", 10000))))),
+    ("kelly_fraction", lambda t: t.get("kelly_fraction", 0.1)),
+    ("vote_margin", _vote_margin),
+)
+FEATURE_NAMES = [name for name, _ in FEATURES]
+
+
+def _extract_features(t: dict) -> list[float]:
+    """Feature vector for one trade dict, in FEATURES order (14 floats)."""
+    return [float(get(t)) for _, get in FEATURES]
+
+
+def _extract_feature_matrix(trades: list[dict]) -> np.ndarray:
+    """_extract_features over many trades — one (n, 14) float64 matrix.
+
+    Each column is filled from the same FEATURES getter, so row i always
+    equals _extract_features(trades[i]).
+    """
+    n = len(trades)
+    if n == 0:
+        return np.empty((0, len(FEATURES)), dtype=np.float64)
+    return np.column_stack([
+        np.fromiter((float(get(t)) for t in trades), dtype=np.float64, count=n)
+        for _, get in FEATURES
+    ])
+
+
+# Set when the trade is placed and never rewritten on resolution (unlike
+# resolved/won/pnl/payout/resolved_at), so the fallback id survives updates
+_TRADE_KEY_FIELDS = ("timestamp", "market_id", "condition_id", "question",
+                     "market", "direction", "entry_price", "size_usd")
+
+
+def _trade_id(t: dict, source: str) -> str:
+    """Stable key for a resolved trade (explicit id, else a hash of its entry fields)."""
+    tid = t.get("trade_id") or t.get("id")
+    if tid:
+        return f"{source}:{tid}"
+    entry = {k: t.get(k) for k in _TRADE_KEY_FIELDS}
+    digest = hashlib.sha1(json.dumps(entry, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    return f"{source}:{digest}"
+
+
+def _load_resolved_by_id() -> dict[str, dict]:
+    """Resolved trades from Hawk + Garves keyed by _trade_id."""
+    trades: dict[str, dict] = {}
+    for source, path in (("hawk", HAWK_TRADES), ("garves", GARVES_TRADES)):
         if not path.exists():
             continue
         for line in open(path):
@@ -50,86 +139,107 @@ def _load_trades() -> list[dict]:
                 continue
             try:
                 t = json.loads(line)
-                if t.get("resolved"):
-                    trades.append(t)
             except json.JSONDecodeError:
                 continue
+            if t.get("resolved"):
+                trades[_trade_id(t, source)] = t
     return trades
 
 
-def _extract_features(t: dict) -> list[float]:
-    """Extract feature vector from a trade dict.
-
-    Features (14):
-        0: edge
-        1: confidence
-        2: category_encoded
-        3: direction_encoded
-        4: entry_price
-        5: size_usd
-        6: risk_score
-        7: time_left_hours
-        8: estimated_prob
-        9: expected_value
-        10: has_sportsbook (1/0)
-        11: volume (log-scaled)
-        12: kelly_fraction
-        13: vote_margin (from indicator_votes if available)
+def _load_feature_store() -> dict[str, tuple[list[float], int]]:
+    """{trade_id: (features, label)} for rows written under the current schema."""
+    store: dict[str, tuple[list[float], int]] = {}
+    if not FEATURE_STORE.exists():
+        return store
+    stale = 0
+    for line in open(FEATURE_STORE):
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if row.get("v") != FEATURE_SCHEMA_VERSION:
+            stale += 1
+            continue
+        store[row["id"]] = (row["x"], row["y"])
+    if stale and not store:
+        # Whole file predates the current schema — start it over
+        FEATURE_STORE.unlink()
+    return store
+
+
+def _append_feature_store(rows: list[tuple[str, list[float], int]]) -> None:
+    FEATURE_STORE.parent.mkdir(parents=True, exist_ok=True)
+    with open(FEATURE_STORE, "a") as f:
+        for tid, x, y in rows:
+            f.write(json.dumps({"id": tid, "v": FEATURE_SCHEMA_VERSION, "x": x, "y": y}) + "\n")
+
+
+def _sync_feature_store() -> tuple[np.ndarray, np.ndarray, int]:
+    """Featurize only trades missing from the store. Returns (X, y, num_new).
+
+    Rows already in the store come first (in trade-log order), new rows last.
     """
-    category = CATEGORY_MAP.get(t.get("category", "other"), 3)
-    direction = DIRECTION_MAP.get(t.get("direction", "yes"), 1)
-    volume = t.get("volume", t.get("ob_liquidity_usd", 10000))
+    store = _load_feature_store()
+    resolved = _load_resolved_by_id()
+
+    new_ids = [tid for tid in resolved if tid not in store]
+    if new_ids:
+        new_trades = [resolved[tid] for tid in new_ids]
+        X_new = _extract_feature_matrix(new_trades)
+        rows = [(tid, x.tolist(), 1 if t.get("won") else 0)
+                for tid, x, t in zip(new_ids, X_new, new_trades)]
+        _append_feature_store(rows)
+        for tid, x, y in rows:
+            store[tid] = (x, y)
+
+    new_set = set(new_ids)
+    ids = [tid for tid in resolved if tid in store and tid not in new_set] + new_ids
+    if not ids:
+        return np.empty((0, len(FEATURES))), np.empty(0, dtype=int), 0
+    X = np.array([store[tid][0] for tid in ids], dtype=np.float64)
+    y = np.array([store[tid][1] for tid in ids], dtype=int)
+    return X, y, len(new_ids)
+
+
+def _load_prev_metrics() -> dict:
+    metrics_path = MODEL_PATH.with_suffix(".metrics.json")
+    try:
+        return json.loads(metrics_path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
 
-    # Indicator vote margin (Garves has indicator_votes dict)
-    votes = t.get("indicator_votes", {})
-    if votes:
-        up = sum(1 for v in votes.values() if v == "up")
-        down = sum(1 for v in votes.values() if v == "down")
-        vote_margin = abs(up - down) / max(len(votes), 1)
-    else:
-        vote_margin = 0.5  # Unknown
-
-    return [
-        float(t.get("edge", 0)),
-        float(t.get("confidence", 0.5)),
-        float(category),
-        float(direction),
-        float(t.get("entry_price", 0.5)),
-        float(t.get("size_usd", 15)),
-        float(t.get("risk_score", 5)),
-        float(t.get("time_left_hours", 24)),
-        float(t.get("estimated_prob", 0.5)),
-        float(t.get("expected_value", 0)),
-        1.0 if t.get("edge_source") == "sportsbook_divergence" else 0.0,
-        float(np.log1p(volume)),
-        float(t.get("kelly_fraction", 0.1)),
-        float(vote_margin),
-    ]
-
-
-def retrain_model() -> dict:
+
+def retrain_model(force_full: bool = False) -> dict:
     """Retrain XGBoost model on all resolved trades.
 
+    Warm-starts from the saved booster when only new trades were added under
+    the same feature schema; otherwise refits from scratch with CV.
+
     Returns metrics dict with accuracy, precision, recall, f1, num_samples.
     """
     import xgboost as xgb
     from sklearn.model_selection import cross_val_score
     from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 
-    trades = _load_trades()
-    if len(trades) < MIN_SAMPLES:
-        log.info("Not enough resolved trades to train: %d < %d", len(trades), MIN_SAMPLES)
+    X, y, num_new = _sync_feature_store()
+    if len(y) < MIN_SAMPLES:
+        log.info("Not enough resolved trades to train: %d < %d", len(y), MIN_SAMPLES)
         return {
             "status": "insufficient_data",
-            "num_samples": len(trades),
+            "num_samples": len(y),
             "min_required": MIN_SAMPLES,
         }
 
-    X = np.array([_extract_features(t) for t in trades])
-    y = np.array([1 if t.get("won") else 0 for t in trades])
+    prev = _load_prev_metrics()
+    prev_model = _get_model() if MODEL_PATH.exists() else None
+    same_schema = prev.get("schema_version") == FEATURE_SCHEMA_VERSION
 
-    model = xgb.XGBClassifier(
-        n_estimators=100,
+    if (not force_full and prev_model is not None and same_schema
+            and num_new == 0 and prev.get("num_samples") == len(y)):
+        log.info("XGBoost model up to date (%d samples, no new resolved trades)", len(y))
+        return {**prev, "status": "up_to_date"}
+
+    params = dict(
         max_depth=4,
         learning_rate=0.1,
         min_child_weight=3,
@@ -139,16 +249,30 @@ def retrain_model() -> dict:
         eval_metric="logloss",
         use_label_encoder=False,
     )
-
-    # Cross-validation if enough data
-    if len(trades) >= 50:
-        cv_scores = cross_val_score(model, X, y, cv=5, scoring="accuracy")
-        log.info("XGBoost CV accuracy: %.3f ± %.3f", cv_scores.mean(), cv_scores.std())
+    warm_rounds = int(min(WARM_ROUNDS_MAX, max(WARM_ROUNDS_MIN, num_new * WARM_ROUNDS_PER_TRADE)))
+    prev_trees = prev.get("num_trees", FULL_ROUNDS)
+    warm = (not force_full and prev_model is not None and same_schema
+            and prev_trees + warm_rounds <= MAX_TREES)
+
+    if warm:
+        # New rows are last in X; train the extra trees on them plus recent context
+        window = slice(-(num_new + WARM_CONTEXT_ROWS), None)
+        model = xgb.XGBClassifier(n_estimators=warm_rounds, **params)
+        model.fit(X[window], y[window], xgb_model=prev_model.get_booster())
+        num_trees = prev_trees + warm_rounds
+        cv_scores = None
+        log.info("XGBoost warm start: +%d trees for %d new trades on %d rows (%d total trees)",
+                 warm_rounds, num_new, len(y[window]), num_trees)
     else:
-        cv_scores = np.array([0.0])
-
-    # Train on full data
-    model.fit(X, y)
+        model = xgb.XGBClassifier(n_estimators=FULL_ROUNDS, **params)
+        # Cross-validation if enough data
+        cv_scores = None
+        if len(y) >= 50:
+            cv_scores = cross_val_score(model, X, y, cv=5, scoring="accuracy")
+            log.info("XGBoost CV accuracy: %.3f ± %.3f", cv_scores.mean(), cv_scores.std())
+        # Train on full data
+        model.fit(X, y)
+        num_trees = FULL_ROUNDS
 
     # Save model
     MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -156,27 +280,26 @@ def retrain_model() -> dict:
 
     # Full-data metrics
     preds = model.predict(X)
-    probs = model.predict_proba(X)[:, 1]
 
     # Feature importance
-    feature_names = [
-        "edge", "confidence", "category", "direction", "entry_price",
-        "size_usd", "risk_score", "time_left_hours", "estimated_prob",
-        "expected_value", "has_sportsbook", "log_volume", "kelly_fraction",
-        "vote_margin",
-    ]
-    importances = dict(zip(feature_names, model.feature_importances_.tolist()))
+    importances = dict(zip(FEATURE_NAMES, model.feature_importances_.tolist()))
     top_features = sorted(importances.items(), key=lambda x: x[1], reverse=True)[:5]
 
     metrics = {
         "status": "trained",
-        "num_samples": len(trades),
+        "mode": "warm_start" if warm else "full",
+        "num_samples": len(y),
+        "num_new": num_new,
+        "num_trees": num_trees,
+        "schema_version": FEATURE_SCHEMA_VERSION,
         "win_rate": float(y.mean()),
         "accuracy": float(accuracy_score(y, preds)),
         "precision": float(precision_score(y, preds, zero_division=0)),
         "recall": float(recall_score(y, preds, zero_division=0)),
         "f1": float(f1_score(y, preds, zero_division=0)),
-        "cv_accuracy": float(cv_scores.mean()) if len(trades) >= 50 else None,
+        # Warm starts skip CV and carry the last full fit's score forward
+        "cv_accuracy": (float(cv_scores.mean()) if cv_scores is not None
+                        else prev.get("cv_accuracy") if warm else None),
         "top_features": top_features,
         "model_path": str(MODEL_PATH),
     }
@@ -185,8 +308,8 @@ def retrain_model() -> dict:
     metrics_path = MODEL_PATH.with_suffix(".metrics.json")
     metrics_path.write_text(json.dumps(metrics, indent=2))
 
-    log.info("XGBoost model trained: %d samples, acc=%.3f, f1=%.3f",
-             len(trades), metrics["accuracy"], metrics["f1"])
+    log.info("XGBoost model trained (%s): %d samples, acc=%.3f, f1=%.3f",
+             metrics["mode"], len(y), metrics["accuracy"], metrics["f1"])
     log.info("Top features: %s", ", ".join(f"{n}={v:.3f}" for n, v in top_features))
 
     global _model
@@ -229,14 +352,36 @@ def predict_trade(trade: dict) -> float | None:
         return None
 
 
+def predict_batch(trades: list[dict]) -> np.ndarray | None:
+    """Win probabilities for many trades with one feature pass and one model call.
+
+    Returns the same values as predict_trade row by row, or None if model not ready.
+    """
+    model = _get_model()
+    if model is None:
+        return None
+    if not trades:
+        return np.empty(0, dtype=np.float64)
+    return model.predict_proba(_extract_feature_matrix(trades))[:, 1]
+
+
 def score_opportunities(opportunities: list[dict]) -> list[dict]:
     """Add ml_win_prob to each opportunity dict. Returns enriched list."""
     model = _get_model()
     if model is None:
         return opportunities
 
-    for opp in opportunities:
-        prob = predict_trade(opp)
-        if prob is not None:
-            opp["ml_win_prob"] = round(prob, 4)
+    try:
+        probs = predict_batch(opportunities)
+    except Exception:
+        # A malformed opportunity poisons the whole matrix — score row by row instead
+        log.warning("Batch scoring failed — falling back to per-trade predictions")
+        for opp in opportunities:
+            prob = predict_trade(opp)
+            if prob is not None:
+                opp["ml_win_prob"] = round(prob, 4)
+        return opportunities
+
+    for opp, prob in zip(opportunities, probs):
+        opp["ml_win_prob"] = round(float(prob), 4)
     return opportunities
@@ -1,8 +1,12 @@
 """Reporter — writes data files and publishes to event bus."""
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import tempfile
+import threading
 from dataclasses import asdict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -21,9 +25,63 @@ def _now_et() -> str:
     return datetime.now(ET).strftime("%Y-%m-%d %I:%M %p ET")
 
 
+# ── Publishing ──
+# The dashboard and Garves read these files while Quant rewrites them, so every
+# write goes to a temp file in the same directory and is swapped in with
+# os.replace: readers see the old document or the new one, never half of one.
+
+COMPACT_JSON_BYTES = 64 * 1024  # larger documents are written without indentation
+
+_published: dict[str, tuple[str, int]] = {}  # path -> (content digest, mtime_ns we wrote)
+_publish_lock = threading.Lock()
+
+
+def publish_json(path: Path, payload: dict, volatile: tuple[str, ...] = ("updated",)) -> bool:
+    """Atomically replace path with payload as JSON.
+
+    Top-level keys in volatile (timestamps) are ignored when deciding whether
+    the content changed; if nothing else did and the file is still the one we
+    last wrote, the write is skipped. Returns True if the file was written.
+    """
+    stable = {k: v for k, v in payload.items() if k not in volatile}
+    digest = hashlib.blake2b(
+        json.dumps(stable, separators=(",", ":")).encode(), digest_size=16,
+    ).hexdigest()
+    key = str(path)
+
+    with _publish_lock:
+        try:
+            on_disk = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            on_disk = None
+        if _published.get(key) == (digest, on_disk):
+            return False
+
+        text = json.dumps(payload, separators=(",", ":"))
+        if len(text) < COMPACT_JSON_BYTES:
+            text = json.dumps(payload, indent=2)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            os.fchmod(fd, 0o644)
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        _published[key] = (digest, os.stat(path).st_mtime_ns)
+    return True
+
+
 def write_status(cycle: int, baseline: BacktestResult, total_combos: int,
-                 trade_count: int, candle_counts: dict[str, int]) -> None:
-    """Write data/quant_status.json — cycle info and data stats."""
+                 trade_count: int, candle_counts: dict[str, int],
+                 phase_timings: dict | None = None) -> None:
+    """Write data/quant_status.json — cycle info, data stats and phase timings."""
     status = {
         "running": True,
         "cycle": cycle,
@@ -37,9 +95,10 @@ def write_status(cycle: int, baseline: BacktestResult, total_combos: int,
         "filter_reasons": baseline.filter_reasons,
         "mode": "historical_replay",
     }
-    DATA_DIR.mkdir(exist_ok=True)
-    (DATA_DIR / "quant_status.json").write_text(json.dumps(status, indent=2))
-    log.info("Wrote quant_status.json (cycle %d)", cycle)
+    if phase_timings:
+        status["phase_timings"] = phase_timings
+    if publish_json(DATA_DIR / "quant_status.json", status, volatile=("last_run",)):
+        log.info("Wrote quant_status.json (cycle %d)", cycle)
 
 
 def write_results(baseline: BacktestResult,
@@ -116,8 +175,8 @@ def write_results(baseline: BacktestResult,
         },
         "updated": _now_et(),
     }
-    (DATA_DIR / "quant_results.json").write_text(json.dumps(output, indent=2))
-    log.info("Wrote quant_results.json (%d top results)", len(top_results))
+    if publish_json(DATA_DIR / "quant_results.json", output):
+        log.info("Wrote quant_results.json (%d top results)", len(top_results))
 
 
 def write_recommendations(baseline: BacktestResult,
@@ -129,7 +188,7 @@ def write_recommendations(baseline: BacktestResult,
 
     if not scored:
         output = {"recommendations": [], "updated": _now_et()}
-        (DATA_DIR / "quant_recommendations.json").write_text(json.dumps(output, indent=2))
+        publish_json(DATA_DIR / "quant_recommendations.json", output)
         return
 
     best_score, best_result = scored[0]
@@ -263,8 +322,8 @@ def write_recommendations(baseline: BacktestResult,
         "best_params": best_result.params if scored else {},
         "updated": _now_et(),
     }
-    (DATA_DIR / "quant_recommendations.json").write_text(json.dumps(output, indent=2))
-    log.info("Wrote quant_recommendations.json (%d recommendations)", len(recommendations))
+    if publish_json(DATA_DIR / "quant_recommendations.json", output):
+        log.info("Wrote quant_recommendations.json (%d recommendations)", len(recommendations))
 
 
 def write_live_params(
@@ -335,13 +394,10 @@ def write_live_params(
         "applied_at": _now_et(),
     }
 
-    import os
-    tmp = (DATA_DIR / "quant_live_params.json.tmp")
     try:
-        DATA_DIR.mkdir(exist_ok=True)
-        with open(tmp, "w") as f:
-            json.dump(output, indent=2, fp=f)
-        os.replace(str(tmp), str(DATA_DIR / "quant_live_params.json"))
+        if not publish_json(DATA_DIR / "quant_live_params.json", output, volatile=("applied_at",)):
+            log.info("Live params: unchanged since last write (%s)", live_params)
+            return True
         log.info(
             "LIVE PARAMS UPDATED: %s (WR %.1f%% → %.1f%%, OOS %.1f%%, overfit %.1fpp)",
             live_params, baseline.win_rate, best.win_rate, wf_test_wr, wf_overfit_drop,
@@ -375,7 +431,7 @@ def write_hawk_review(hawk_trades: list[dict]) -> None:
     """Write data/quant_hawk_review.json — Hawk trade calibration analysis."""
     if not hawk_trades:
         output = {"trades": [], "summary": {}, "updated": _now_et()}
-        (DATA_DIR / "quant_hawk_review.json").write_text(json.dumps(output, indent=2))
+        publish_json(DATA_DIR / "quant_hawk_review.json", output)
         return
 
     resolved = [t for t in hawk_trades if t.get("resolved")]
@@ -393,8 +449,8 @@ def write_hawk_review(hawk_trades: list[dict]) -> None:
         },
         "updated": _now_et(),
     }
-    (DATA_DIR / "quant_hawk_review.json").write_text(json.dumps(output, indent=2))
-    log.info("Wrote quant_hawk_review.json (%d Hawk trades reviewed)", len(resolved))
+    if publish_json(DATA_DIR / "quant_hawk_review.json", output):
+        log.info("Wrote quant_hawk_review.json (%d Hawk trades reviewed)", len(resolved))
 
 
 def publish_events(baseline: BacktestResult,
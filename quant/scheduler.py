@@ -0,0 +1,209 @@
+"""Phase scheduler — runs a Quant cycle as a dependency graph of phases.
+
+Each Phase lists the phases whose results it needs; those results are
+passed to its fn positionally, in deps order. A phase is started as soon as
+all of its deps have finished, so a cycle takes roughly as long as its
+critical path instead of the sum of every phase.
+
+Phases run on a shared thread pool. The Optuna searches and the Monte Carlo
+loop are pure Python and hold the GIL, so they can be marked process=True to
+run in a spawn process pool instead — their fn (a module-level function or a
+functools.partial of one), inputs and result must be picklable.
+
+A failing phase aborts the run like an exception in a serial cycle would:
+no new phases start and, once running phases finish, a PhaseError is raised
+from the original exception. It carries the partial PhaseRun, so callers can
+still report what did complete. Phases whose failure should be non-fatal
+catch their own exceptions.
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Phase:
+    """One step of a cycle: fn(*[results[d] for d in deps])."""
+    name: str
+    fn: Callable[..., Any]
+    deps: tuple[str, ...] = ()
+    process: bool = False   # run in the process pool (fn and args must pickle)
+
+
+@dataclass
+class PhaseTiming:
+    started: float      # seconds after the run started
+    seconds: float
+    process: bool = False
+
+
+@dataclass
+class PhaseRun:
+    """Results and timings of one run_phases() call."""
+    results: dict[str, Any] = field(default_factory=dict)
+    timings: dict[str, PhaseTiming] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+    critical_path: list[str] = field(default_factory=list)
+    critical_path_seconds: float = 0.0
+    failed: str | None = None   # name of the phase that aborted the run
+
+    @property
+    def serial_seconds(self) -> float:
+        return sum(t.seconds for t in self.timings.values())
+
+    def to_dict(self) -> dict:
+        """JSON-ready timing summary for the status file."""
+        return {
+            "wall_seconds": round(self.wall_seconds, 2),
+            "serial_seconds": round(self.serial_seconds, 2),
+            "critical_path_seconds": round(self.critical_path_seconds, 2),
+            "critical_path": self.critical_path,
+            **({"failed": self.failed} if self.failed else {}),
+            "phases": {
+                name: {
+                    "started": round(t.started, 2),
+                    "seconds": round(t.seconds, 2),
+                    **({"process": True} if t.process else {}),
+                }
+                for name, t in sorted(self.timings.items(), key=lambda kv: kv[1].started)
+            },
+        }
+
+
+class PhaseError(Exception):
+    """A phase raised; run holds the results and timings of the phases that finished."""
+
+    def __init__(self, phase: str, run: PhaseRun, error: BaseException):
+        super().__init__(f"Phase {phase!r} failed: {error}")
+        self.phase = phase
+        self.run = run
+
+
+def _topological_order(phases: list[Phase]) -> list[Phase]:
+    by_name: dict[str, Phase] = {}
+    for p in phases:
+        if p.name in by_name:
+            raise ValueError(f"Duplicate phase {p.name!r}")
+        by_name[p.name] = p
+    for p in phases:
+        missing = [d for d in p.deps if d not in by_name]
+        if missing:
+            raise ValueError(f"Phase {p.name!r} depends on unknown {missing}")
+
+    order: list[Phase] = []
+    done: set[str] = set()
+    remaining = list(phases)
+    while remaining:
+        ready = [p for p in remaining if all(d in done for d in p.deps)]
+        if not ready:
+            raise ValueError(f"Phase dependency cycle among {[p.name for p in remaining]}")
+        for p in ready:
+            order.append(p)
+            done.add(p.name)
+        remaining = [p for p in remaining if p.name not in done]
+    return order
+
+
+def _timed(fn: Callable[..., Any], args: list) -> tuple[Any, float, float]:
+    """Run fn(*args) and return (result, wall-clock start, duration)."""
+    start = time.time()
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, start, time.perf_counter() - t0
+
+
+def _init_worker(level: int, fmt: str | None, datefmt: str | None) -> None:
+    logging.basicConfig(level=level, format=fmt, datefmt=datefmt)
+
+
+def _worker_logging() -> tuple[int, str | None, str | None]:
+    root = logging.getLogger()
+    fmt = datefmt = None
+    if root.handlers and root.handlers[0].formatter:
+        fmt = root.handlers[0].formatter._fmt
+        datefmt = root.handlers[0].formatter.datefmt
+    return root.level, fmt, datefmt
+
+
+def _critical_path(order: list[Phase], timings: dict[str, PhaseTiming]) -> tuple[list[str], float]:
+    """Longest chain of phase durations through the graph."""
+    length: dict[str, float] = {}
+    via: dict[str, str | None] = {}
+    for p in order:
+        if p.name not in timings:
+            continue
+        prev = max((d for d in p.deps if d in length), key=lambda d: length[d], default=None)
+        length[p.name] = timings[p.name].seconds + (length[prev] if prev else 0.0)
+        via[p.name] = prev
+    if not length:
+        return [], 0.0
+    tail = max(length, key=length.get)
+    path = [tail]
+    while via[path[-1]]:
+        path.append(via[path[-1]])
+    return path[::-1], length[tail]
+
+
+def run_phases(phases: list[Phase], max_workers: int = 8, max_processes: int = 0) -> PhaseRun:
+    """Run phases as soon as their deps are done. Returns a PhaseRun.
+
+    With max_processes=0, process=True phases run on the thread pool.
+    Results don't depend on scheduling: every phase sees exactly its deps'
+    results, as in a serial run in declaration order. Raises PhaseError
+    if any phase fails.
+    """
+    order = _topological_order(phases)
+    use_processes = max_processes > 0 and any(p.process for p in order)
+    run = PhaseRun()
+    pending = list(order)
+    running: dict = {}
+    error: BaseException | None = None
+    t0 = time.time()
+
+    procs_ctx = (
+        ProcessPoolExecutor(
+            max_workers=max_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=_worker_logging(),
+        )
+        if use_processes else nullcontext()
+    )
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="quant-phase") as threads, \
+            procs_ctx as procs:
+        while pending or running:
+            if error is None:
+                for p in [p for p in pending if all(d in run.results for d in p.deps)]:
+                    pending.remove(p)
+                    pool = procs if (p.process and use_processes) else threads
+                    args = [run.results[d] for d in p.deps]
+                    running[pool.submit(_timed, p.fn, args)] = p
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                p = running.pop(fut)
+                try:
+                    value, started, seconds = fut.result()
+                except Exception as e:
+                    log.error("Phase %s failed: %s", p.name, e)
+                    if error is None:
+                        error, run.failed = e, p.name
+                    continue
+                run.results[p.name] = value
+                run.timings[p.name] = PhaseTiming(started - t0, seconds, p.process and use_processes)
+
+    run.wall_seconds = time.time() - t0
+    run.critical_path, run.critical_path_seconds = _critical_path(order, run.timings)
+    if error is not None:
+        raise PhaseError(run.failed, run, error) from error
+    return run
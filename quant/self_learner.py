@@ -74,6 +74,63 @@ class LearningState:
     updated: str = ""
 
 
+@dataclass
+class TradeArrays:
+    """Resolved trades as time-sorted numpy columns, built once per learning cycle.
+
+    Outcome windows ("trades after applied_at") are a binary search plus a
+    prefix-sum lookup instead of a scan of the whole trade list.
+    """
+    trades: list[dict]      # resolved trades, ascending timestamp
+    timestamp: np.ndarray   # float64
+    won: np.ndarray         # bool (won is truthy)
+    decided: np.ndarray     # bool (won is not None)
+    pnl: np.ndarray         # float64
+    cum_wins: np.ndarray    # cum_wins[i] = wins among the first i trades
+    loaded: int = 0         # trades passed in, resolved or not
+
+    @classmethod
+    def from_trades(cls, trades: list[dict]) -> TradeArrays:
+        resolved = sorted((t for t in trades if t.get("resolved")),
+                          key=lambda t: t.get("timestamp") or 0)
+        won = np.fromiter((bool(t.get("won")) for t in resolved), dtype=bool, count=len(resolved))
+        return cls(
+            trades=resolved,
+            timestamp=np.fromiter((t.get("timestamp") or 0 for t in resolved),
+                                  dtype=np.float64, count=len(resolved)),
+            won=won,
+            decided=np.fromiter((t.get("won") is not None for t in resolved),
+                                dtype=bool, count=len(resolved)),
+            pnl=np.fromiter((t.get("pnl", 0) for t in resolved), dtype=np.float64, count=len(resolved)),
+            cum_wins=np.concatenate(([0], np.cumsum(won, dtype=np.int64))),
+            loaded=len(trades),
+        )
+
+    def __len__(self) -> int:
+        return len(self.trades)
+
+    def after(self, timestamps: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """(trade count, win count) strictly after each timestamp."""
+        start = np.searchsorted(self.timestamp, timestamps, side="right")
+        return len(self) - start, self.cum_wins[-1] - self.cum_wins[start]
+
+
+def _group_stats(keys: list, won: np.ndarray, pnl: np.ndarray | None = None) -> dict[str, dict]:
+    """{key: {"wins", "losses"[, "pnl"]}} in first-seen key order, via bincount."""
+    index: dict = {}
+    codes = np.fromiter((index.setdefault(k, len(index)) for k in keys), dtype=np.int64, count=len(keys))
+    n = len(index)
+    totals = np.bincount(codes, minlength=n)
+    wins = np.bincount(codes, weights=won, minlength=n).astype(np.int64)
+    pnls = np.bincount(codes, weights=pnl, minlength=n) if pnl is not None else None
+    stats = {}
+    for key, i in index.items():
+        stats[key] = {"wins": int(wins[i]), "losses": int(totals[i] - wins[i])}
+        if pnls is not None:
+            stats[key]["pnl"] = float(pnls[i])
+    return stats
+
+
 def load_odin_trades(since_timestamp: float = 0) -> list[dict]:
     """Load Odin's closed trades from odin_trades.jsonl.
 
@@ -171,6 +228,28 @@ def _save_learning_state(state: LearningState):
         "updated": datetime.now(ET).strftime("%Y-%m-%d %I:%M %p ET"),
     }
     LEARNING_FILE.write_text(json.dumps(output, indent=2))
+    _cache_confidence(state.param_confidence)
+
+
+# param -> learned confidence, keyed by LEARNING_FILE (mtime_ns, size)
+_confidence_cache: tuple[tuple[int, int], dict[str, float]] | None = None
+
+
+def _cache_confidence(table: dict[str, float]) -> None:
+    global _confidence_cache
+    st = LEARNING_FILE.stat()
+    _confidence_cache = ((st.st_mtime_ns, st.st_size), dict(table))
+
+
+def _param_confidence_table() -> dict[str, float]:
+    """Per-parameter confidence table, re-read only when the learning file changes."""
+    try:
+        st = LEARNING_FILE.stat()
+    except FileNotFoundError:
+        return {}
+    if _confidence_cache is None or _confidence_cache[0] != (st.st_mtime_ns, st.st_size):
+        _cache_confidence(_load_learning_state().param_confidence)
+    return _confidence_cache[1]
 
 
 def track_recommendation(
@@ -204,8 +283,9 @@ def track_recommendation(
 
 
 def measure_outcomes(
-    garves_trades: list[dict],
+    garves_trades: list[dict] | TradeArrays,
     min_trades_after: int = 15,
+    state: LearningState | None = None,
 ) -> list[RecommendationOutcome]:
     """Measure real-world outcomes of past recommendations.
 
@@ -214,37 +294,35 @@ def measure_outcomes(
     - If enough trades (min_trades_after), compute post-application WR
     - Determine if the recommendation was successful (WR improved)
     - Update confidence for that parameter type
+
+    All pending windows are resolved at once against the time-sorted trades.
+    With state=None the learning state is loaded and saved here; otherwise
+    the caller's state is updated in place and the caller saves it.
     """
-    state = _load_learning_state()
+    owns_state = state is None
+    if owns_state:
+        state = _load_learning_state()
+    arrays = garves_trades if isinstance(garves_trades, TradeArrays) else TradeArrays.from_trades(garves_trades)
     measured = []
 
-    for outcome in state.recent_outcomes:
-        if outcome.get("measured"):
-            continue
-
-        applied_at = outcome.get("applied_at", 0)
-        if applied_at == 0:
-            continue
-
-        # Find trades after this recommendation was applied
-        post_trades = [
-            t for t in garves_trades
-            if t.get("timestamp", 0) > applied_at and t.get("resolved")
-        ]
+    pending = [o for o in state.recent_outcomes
+               if not o.get("measured") and o.get("applied_at", 0) != 0]
+    counts, wins = arrays.after(np.array([o["applied_at"] for o in pending], dtype=np.float64))
 
-        if len(post_trades) < min_trades_after:
+    for outcome, n_post, post_wins in zip(pending, counts.tolist(), wins.tolist()):
+        applied_at = outcome["applied_at"]
+        if n_post < min_trades_after:
             continue  # Not enough data yet
 
         # Compute post-application WR
-        post_wins = sum(1 for t in post_trades if t.get("won"))
-        post_wr = post_wins / len(post_trades) * 100
+        post_wr = post_wins / n_post * 100
 
         pre_wr = outcome.get("pre_wr", 50.0)
         wr_change = post_wr - pre_wr
         successful = wr_change > 0
 
         outcome["post_wr"] = round(post_wr, 1)
-        outcome["post_trades"] = len(post_trades)
+        outcome["post_trades"] = n_post
         outcome["wr_change_pp"] = round(wr_change, 1)
         outcome["successful"] = successful
         outcome["measured"] = True
@@ -274,7 +352,7 @@ def measure_outcomes(
             pre_wr=pre_wr,
             pre_trades=outcome.get("pre_trades", 0),
             post_wr=post_wr,
-            post_trades=len(post_trades),
+            post_trades=n_post,
             wr_change_pp=wr_change,
             successful=successful,
             measured_at=time.time(),
@@ -289,67 +367,43 @@ def measure_outcomes(
     total_success = sum(1 for o in state.recent_outcomes if o.get("successful"))
     state.accuracy = round(total_success / total_measured * 100, 1) if total_measured > 0 else 0.0
 
-    _save_learning_state(state)
+    if owns_state:
+        _save_learning_state(state)
     return measured
 
 
 def analyze_odin_performance(
-    odin_trades: list[dict] | None = None,
+    odin_trades: list[dict] | TradeArrays | None = None,
+    state: LearningState | None = None,
 ) -> dict:
     """Analyze Odin's trading performance for cross-learning.
 
     Returns insights that can help Garves V2 (and vice versa).
+    With state=None the learning state is loaded and saved here; otherwise
+    the caller's state is updated in place and the caller saves it.
     """
     if odin_trades is None:
         odin_trades = load_odin_trades()
+    arrays = odin_trades if isinstance(odin_trades, TradeArrays) else TradeArrays.from_trades(odin_trades)
 
-    if not odin_trades:
+    if not arrays.loaded:
         return {"status": "no_odin_trades", "insights": []}
-
-    resolved = [t for t in odin_trades if t.get("resolved")]
-    if not resolved:
+    if not len(arrays):
         return {"status": "no_resolved_trades", "insights": []}
+    resolved = arrays.trades
 
-    wins = sum(1 for t in resolved if t.get("won"))
-    total = len(resolved)
+    total = len(arrays)
+    wins = int(arrays.won.sum())
     wr = wins / total * 100
-    avg_pnl = sum(t.get("pnl", 0) for t in resolved) / total
-    total_pnl = sum(t.get("pnl", 0) for t in resolved)
-
-    # Analyze by exit reason
-    exit_reasons: dict[str, dict] = {}
-    for t in resolved:
-        reason = t.get("exit_reason", "unknown")
-        if reason not in exit_reasons:
-            exit_reasons[reason] = {"wins": 0, "losses": 0, "pnl": 0}
-        if t.get("won"):
-            exit_reasons[reason]["wins"] += 1
-        else:
-            exit_reasons[reason]["losses"] += 1
-        exit_reasons[reason]["pnl"] += t.get("pnl", 0)
-
-    # Analyze by asset
-    by_asset: dict[str, dict] = {}
-    for t in resolved:
-        asset = t.get("asset", "unknown")
-        if asset not in by_asset:
-            by_asset[asset] = {"wins": 0, "losses": 0, "pnl": 0}
-        if t.get("won"):
-            by_asset[asset]["wins"] += 1
-        else:
-            by_asset[asset]["losses"] += 1
-        by_asset[asset]["pnl"] += t.get("pnl", 0)
-
-    # Analyze by macro regime
-    by_regime: dict[str, dict] = {}
-    for t in resolved:
-        regime = t.get("macro_regime", "unknown")
-        if regime not in by_regime:
-            by_regime[regime] = {"wins": 0, "losses": 0}
-        if t.get("won"):
-            by_regime[regime]["wins"] += 1
-        else:
-            by_regime[regime]["losses"] += 1
+    total_pnl = float(np.cumsum(arrays.pnl)[-1])  # sequential sum, like sum()
+    avg_pnl = total_pnl / total
+
+    # Analyze by exit reason, asset and macro regime
+    exit_reasons = _group_stats([t.get("exit_reason", "unknown") for t in resolved],
+                                arrays.won, arrays.pnl)
+    by_asset = _group_stats([t.get("asset", "unknown") for t in resolved],
+                            arrays.won, arrays.pnl)
+    by_regime = _group_stats([t.get("macro_regime", "unknown") for t in resolved], arrays.won)
 
     # Generate cross-learning insights
     insights = []
@@ -401,12 +455,15 @@ def analyze_odin_performance(
             )
 
     # Save Odin analysis
-    state = _load_learning_state()
-    state.odin_trades_analyzed = len(resolved)
+    owns_state = state is None
+    if owns_state:
+        state = _load_learning_state()
+    state.odin_trades_analyzed = total
     state.odin_win_rate = round(wr, 1)
     state.odin_avg_pnl = round(avg_pnl, 2)
     state.cross_learnings = insights
-    _save_learning_state(state)
+    if owns_state:
+        _save_learning_state(state)
 
     return {
         "status": "analyzed",
@@ -448,23 +505,23 @@ def run_learning_cycle(
     """
     state = _load_learning_state()
     state.last_learning_cycle = time.time()
+    garves = TradeArrays.from_trades(garves_trades)
 
     # 1. Measure past recommendations
-    outcomes = measure_outcomes(garves_trades)
+    outcomes = measure_outcomes(garves, state=state)
 
     # 2. Load and analyze Odin trades
     if odin_trades is None:
         odin_trades = load_odin_trades()
-    odin_analysis = analyze_odin_performance(odin_trades)
+    odin = TradeArrays.from_trades(odin_trades)
+    odin_analysis = analyze_odin_performance(odin, state=state)
 
     # 3. Combined Garves V2 + Odin WR
-    garves_resolved = [t for t in garves_trades if t.get("resolved") and t.get("won") is not None]
-    garves_wins = sum(1 for t in garves_resolved if t.get("won"))
-    garves_total = len(garves_resolved)
+    garves_wins = int((garves.won & garves.decided).sum())
+    garves_total = int(garves.decided.sum())
 
-    odin_resolved = [t for t in odin_trades if t.get("resolved") and t.get("won") is not None]
-    odin_wins = sum(1 for t in odin_resolved if t.get("won"))
-    odin_total = len(odin_resolved)
+    odin_wins = int((odin.won & odin.decided).sum())
+    odin_total = int(odin.decided.sum())
 
     combined_total = garves_total + odin_total
     combined_wins = garves_wins + odin_wins
@@ -520,6 +577,4 @@ def get_adjusted_confidence(param_name: str, base_confidence: float = 0.5) -> fl
 
     Used by live_push to decide whether to apply a recommendation.
     """
-    state = _load_learning_state()
-    learned = state.param_confidence.get(param_name, base_confidence)
-    return learned
+    return _param_confidence_table().get(param_name, base_confidence)
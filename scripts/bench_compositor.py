@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark viper.demos.compositor: cold render vs render-cache reuse.
+
+Renders a synthetic 1920x1080 recording with ffmpeg and a silent WAV, then
+times composite_horizontal():
+
+  cold       — empty render cache (full libx264 encode)
+  warm       — same recording + voiceover (segment reused, stream-copy mux)
+  new VO     — same recording, different voiceover length (segment reused)
+  draft      — cold render with the "draft" profile
+
+Needs ffmpeg and moviepy.
+
+Usage:
+    python scripts/bench_compositor.py
+    python scripts/bench_compositor.py --duration 60
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from viper.demos import compositor
+
+
+def _silent_wav(path: Path, seconds: float, rate: int = 22050) -> None:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"\0\0" * int(seconds * rate))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=30.0, help="recording length (s)")
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="compositor_bench_"))
+    compositor.RENDER_CACHE_DIR = root / "render_cache"
+    video = root / "recording.webm"
+    subprocess.run([
+        "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", f"testsrc2=s=1920x1080:d={args.duration + 2}:r=30",
+        "-c:v", "libvpx-vp9", "-deadline", "realtime", "-b:v", "2M", str(video),
+    ], check=True)
+    vo_a, vo_b = root / "vo_a.wav", root / "vo_b.wav"
+    _silent_wav(vo_a, args.duration)
+    _silent_wav(vo_b, args.duration - 3)
+
+    runs = [
+        ("cold", vo_a, "final"),
+        ("warm", vo_a, "final"),
+        ("new VO", vo_b, "final"),
+        ("draft", vo_a, "draft"),
+    ]
+    timings = {}
+    for label, audio, profile in runs:
+        t0 = time.perf_counter()
+        compositor.composite_horizontal(video, audio, root / "out", profile)
+        timings[label] = time.perf_counter() - t0
+
+    print()
+    for label, secs in timings.items():
+        print(f"  {label:<8} {secs:6.2f}s  ({secs / timings['cold']:.0%} of cold)")
+
+
+if __name__ == "__main__":
+    main()
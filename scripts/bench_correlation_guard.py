@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark quant.correlation_guard trade correlation: nested loop vs bucketed join.
+
+Builds synthetic Garves V2 and Odin trade histories (all inside the 24h
+window, a mix of mapped/unmapped symbols), checks the bucketed version
+returns the same correlation as the O(G×O) reference, and times both.
+
+The reference materialises every pair, so by default it is only run up to
+--ref-max trades per side and extrapolated beyond that.
+
+Usage:
+    python scripts/bench_correlation_guard.py
+    python scripts/bench_correlation_guard.py --sizes 1000 10000 --ref-max 10000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quant.correlation_guard import (
+    ODIN_TO_GARVES, _compute_trade_correlation, _compute_trade_correlation_reference,
+)
+
+GARVES_ASSETS = ["bitcoin", "ethereum", "solana", "xrp"]
+ODIN_SYMBOLS = list(ODIN_TO_GARVES) + ["ADAUSDT"]
+
+
+def _synthetic(n: int, rng: random.Random) -> tuple[list[dict], list[dict]]:
+    now = time.time()
+    garves, odin = [], []
+    for _ in range(n):
+        # Skew direction per asset so the correlation is not ~0
+        asset = rng.choice(GARVES_ASSETS)
+        bias = 0.6 if asset in ("bitcoin", "ethereum") else 0.45
+        garves.append({
+            "timestamp": now - rng.uniform(0, 30 * 3600),
+            "asset": asset,
+            "direction": "up" if rng.random() < bias else "down",
+        })
+        symbol = rng.choice(ODIN_SYMBOLS)
+        odin.append({
+            "entry_time": now - rng.uniform(0, 30 * 3600),
+            "symbol": symbol,
+            "side": "LONG" if rng.random() < (0.65 if symbol == "BTCUSDT" else 0.5) else "SHORT",
+        })
+    return garves, odin
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--ref-max", type=int, default=2_000,
+                        help="largest size the reference loop is actually run at")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'G x O':>14} {'reference (s)':>14} {'bucketed (s)':>13} {'speedup':>9}  match")
+    ref_rate = None  # seconds per G*O pair, for extrapolation
+    for n in args.sizes:
+        garves, odin = _synthetic(n, rng)
+
+        t0 = time.perf_counter()
+        got = _compute_trade_correlation(garves, odin)
+        t_new = time.perf_counter() - t0
+
+        if n <= args.ref_max:
+            t0 = time.perf_counter()
+            ref = _compute_trade_correlation_reference(garves, odin)
+            t_ref = time.perf_counter() - t0
+            ref_rate = t_ref / (n * n)
+            match = f"{abs(ref - got) < 1e-9} (r={got:.6f}, ref={ref:.6f})"
+            ref_col = f"{t_ref:>14.3f}"
+        else:
+            t_ref = ref_rate * n * n if ref_rate else float("nan")
+            match = f"n/a (r={got:.6f})"
+            ref_col = f"{'~' + format(t_ref, '.1f'):>14}"
+
+        print(f"{f'{n}x{n}':>14} {ref_col} {t_new:>13.4f} {t_ref / max(t_new, 1e-9):>8.0f}x  {match}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark quant.ml_predictor scoring: per-trade loop vs batched matrix path.
+
+Fits a throwaway XGBoost model on synthetic trades (the saved model is not
+touched), then times predict_trade in a loop against predict_batch at 100,
+1k and 10k candidate rows and checks both return the same probabilities.
+
+Before that (and without xgboost installed) it asserts the batched feature
+matrix equals the stacked per-trade feature rows, including trades with
+missing fields. Exits 1 on a mismatch.
+
+Usage:
+    python scripts/bench_ml_scoring.py
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from quant import ml_predictor
+
+SIZES = (100, 1_000, 10_000)
+
+
+def _synthetic_trade(rng: random.Random) -> dict:
+    trade = {
+        "edge": rng.uniform(-0.1, 0.3),
+        "confidence": rng.random(),
+        "category": rng.choice(list(ml_predictor.CATEGORY_MAP)),
+        "direction": rng.choice(list(ml_predictor.DIRECTION_MAP)),
+        "entry_price": rng.uniform(0.05, 0.95),
+        "size_usd": rng.uniform(5, 50),
+        "risk_score": rng.randint(1, 10),
+        "time_left_hours": rng.uniform(0, 72),
+        "estimated_prob": rng.random(),
+        "volume": rng.uniform(100, 1e6),
+    }
+    if rng.random() < 0.3:
+        trade["edge_source"] = "sportsbook_divergence"
+    if rng.random() < 0.5:
+        trade["indicator_votes"] = {f"ind{i}": rng.choice(["up", "down"]) for i in range(6)}
+    return trade
+
+
+def _check_feature_parity(rng: random.Random) -> None:
+    trades = [_synthetic_trade(rng) for _ in range(1_000)]
+    trades += [{}, {"ob_liquidity_usd": 5e4, "category": "nope", "indicator_votes": {}}]
+    rows = np.array([ml_predictor._extract_features(t) for t in trades], dtype=np.float64)
+    matrix = ml_predictor._extract_feature_matrix(trades)
+    assert matrix.shape == rows.shape == (len(trades), len(ml_predictor.FEATURES)), matrix.shape
+    assert np.array_equal(matrix, rows), "feature matrix differs from per-trade features"
+    print(f"feature parity: {len(trades)} trades x {matrix.shape[1]} features identical")
+
+
+def main() -> None:
+    rng = random.Random(42)
+    try:
+        _check_feature_parity(rng)
+    except AssertionError as e:
+        sys.exit(f"FAIL {e}")
+
+    try:
+        import xgboost as xgb
+    except ImportError:
+        print("xgboost not installed — skipping the scoring benchmark")
+        return
+
+    train = [_synthetic_trade(rng) for _ in range(2_000)]
+    X = ml_predictor._extract_feature_matrix(train)
+    y = np.array([1 if t["edge"] + rng.gauss(0, 0.1) > 0.1 else 0 for t in train])
+    model = xgb.XGBClassifier(n_estimators=100, max_depth=4, learning_rate=0.1,
+                              objective="binary:logistic", eval_metric="logloss")
+    model.fit(X, y)
+    ml_predictor._model = model
+
+    print(f"{'rows':>8} {'per-trade (s)':>14} {'batched (s)':>12} {'speedup':>8}  identical")
+    for n in SIZES:
+        trades = [_synthetic_trade(rng) for _ in range(n)]
+
+        t0 = time.perf_counter()
+        loop = np.array([ml_predictor.predict_trade(t) for t in trades])
+        t_loop = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        batch = ml_predictor.predict_batch(trades)
+        t_batch = time.perf_counter() - t0
+
+        same = bool(np.array_equal(loop, batch))
+        print(f"{n:>8} {t_loop:>14.3f} {t_batch:>12.4f} {t_loop / max(t_batch, 1e-9):>7.0f}x  {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Benchmark /api/overview and /api/intelligence against growing data files.
+
+Builds a throwaway HOME + data dir with realistically sized agent files
+(trades.jsonl, hawk/odin trade logs, Soren queue, Mercury posting log,
+Thor task/result dirs, ...), then for each size multiplier times:
+
+  cold — first request after the files change (every source is reduced)
+  warm — median of repeated requests with unchanged files
+
+The route-level 120s cache files are removed before every request so each
+one really aggregates. Warm latency should stay flat as the files grow.
+
+Usage:
+    python scripts/bench_overview.py
+    python scripts/bench_overview.py --trades 100000 --scales 1 5 20
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _jsonl(path: Path, rows) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+
+
+def _json(path: Path, obj) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(obj))
+
+
+def _build(home: Path, data: Path, n: int) -> None:
+    rng = random.Random(n)
+    assets = ["bitcoin", "ethereum", "solana", "xrp"]
+    _jsonl(data / "trades.jsonl", (
+        {"trade_id": f"t{i}", "asset": rng.choice(assets), "timeframe": rng.choice(["5m", "15m", "1h"]),
+         "resolved": i % 3 != 0, "outcome": "up", "won": rng.random() < 0.55,
+         "edge": round(rng.random() * 0.1, 4), "timestamp": 1.7e9 + i, "indicator_votes": {"rsi": "up"}}
+        for i in range(n)))
+    _jsonl(data / "hawk_trades.jsonl", (
+        {"category": rng.choice(["sports", "politics", "crypto"]), "resolved": i % 2 == 0,
+         "won": rng.random() < 0.5, "edge": rng.random() * 0.2} for i in range(n // 2)))
+    _jsonl(home / "odin" / "data" / "odin_trades.jsonl", (
+        {"is_win": rng.random() < 0.5, "pnl": rng.random()} for _ in range(n // 5)))
+    _json(data / "daily_reports.json", [
+        {"summary": {"total_trades": 40, "resolved": 30, "wins": 17, "avg_edge": 4.2},
+         "by_asset": {a: {} for a in assets}, "by_timeframe": {"5m": {}, "1h": {}}}
+        for _ in range(max(30, n // 200))])
+    _json(data / "indicator_accuracy.json", {f"ind{i}": {"accuracy": 0.5} for i in range(25)})
+    for name in ("hawk_status", "viper_status", "oracle_status", "quant_status", "quant_results",
+                 "viper_opportunities", "viper_costs", "quant_walk_forward", "quant_analytics"):
+        _json(data / f"{name}.json", {"running": True})
+    _json(data / "hawk_opportunities.json", {"opportunities": [{"id": i} for i in range(n // 50)]})
+    _json(home / "odin" / "data" / "odin_status.json", {"running": True})
+    _json(home / "thor" / "data" / "status.json", {"state": "idle"})
+
+    queue = [{"status": rng.choice(["posted", "pending", "approved"]), "pillar": f"p{i % 7}",
+              "platform": rng.choice(["x", "ig", "tiktok"]), "text": "lorem ipsum " * 20}
+             for i in range(n // 10)]
+    _json(home / "soren-content" / "data" / "content_queue.json", queue)
+    _json(home / "soren-content" / "data" / "trend_topics.json", [f"t{i}" for i in range(40)])
+    _json(home / "mercury" / "data" / "posting_log.json", [
+        {"review_score": rng.randint(5, 10), "text": "post body " * 30} for _ in range(n // 10)])
+    _json(home / "mercury" / "data" / "brain.json", {"insights": ["i"] * 50})
+    _json(home / "shelby" / "data" / "agent_assessments.json", {f"a{i}": {"score": 70} for i in range(10)})
+    _json(home / "shelby" / "data" / "tasks.json", [{"done": i % 2 == 0} for i in range(200)])
+    _json(home / "sentinel" / "data" / "scan_results.json", [{"issues_found": 1} for _ in range(n // 20)])
+    _json(home / "thor" / "data" / "activity.json", [
+        {"tokens": 1000, "model": rng.choice(["sonnet", "opus"]), "test_passed": True}
+        for _ in range(n // 10)])
+    for i in range(300):
+        _json(home / "thor" / "data" / "tasks" / f"task_{i}.json",
+              {"status": rng.choice(["pending", "completed", "failed"]), "agent": f"a{i % 6}", "retries": 1})
+        _json(home / "thor" / "data" / "results" / f"result_{i}.json", {"test_passed": i % 4 != 0})
+
+
+def _size_mb(*roots: Path) -> float:
+    return sum(p.stat().st_size for r in roots for p in r.rglob("*") if p.is_file()) / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trades", type=int, default=20000, help="trades.jsonl rows at scale 1")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="overview_bench_"))
+    home, data = root / "home", root / "data"
+    os.environ["HOME"] = str(home)
+
+    from flask import Flask
+    import bot.shared
+    from bot.routes import overview
+
+    # Point every path the two routes read at the fixture tree
+    bot.shared.TRADES_FILE = overview.TRADES_FILE = data / "trades.jsonl"
+    overview.DATA_DIR = data
+    overview.INDICATOR_ACCURACY_FILE = data / "indicator_accuracy.json"
+    overview.SOREN_QUEUE_FILE = home / "soren-content" / "data" / "content_queue.json"
+    overview.MERCURY_POSTING_LOG = home / "mercury" / "data" / "posting_log.json"
+    overview.SHELBY_ROOT_DIR = home / "shelby"
+    overview.THOR_DATA = home / "thor" / "data"
+    overview.get_atlas = lambda: None
+    overview.process_running = lambda pattern: False
+
+    app = Flask(__name__)
+    app.register_blueprint(overview.overview_bp)
+    client = app.test_client()
+
+    def request_ms() -> float:
+        for name in ("overview_cache.json", "intelligence_cache.json"):
+            (data / name).unlink(missing_ok=True)
+        t0 = time.perf_counter()
+        for route in ("/api/overview", "/api/intelligence"):
+            assert client.get(route).status_code == 200
+        return (time.perf_counter() - t0) * 1000
+
+    print(f"{'scale':>5} {'data MB':>8} {'trades':>8} {'cold ms':>8} {'warm ms':>8}")
+    for scale in args.scales:
+        n = args.trades * scale
+        _build(home, data, n)
+        cold = request_ms()
+        warm = statistics.median(request_ms() for _ in range(args.repeat))
+        print(f"{scale:>5} {_size_mb(home, data):>8.1f} {n:>8} {cold:>8.1f} {warm:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark quant.self_learner outcome measurement and Odin analysis.
+
+Points the learning state and Odin trade log at a throwaway directory,
+tracks a batch of recommendations spread over the trade history, then for
+growing trade counts times:
+
+  measure   — measure_outcomes() over all pending recommendations
+  odin      — analyze_odin_performance() on the Odin trades
+  cycle     — run_learning_cycle() end to end
+  confidence — get_adjusted_confidence() (cached per-parameter table)
+
+Every measure result is compared with a direct per-recommendation scan of
+the trade list (the old implementation) and the Odin group stats with a
+plain dict accumulation. Exits 1 on any mismatch.
+
+Usage:
+    python scripts/bench_self_learner.py
+    python scripts/bench_self_learner.py --trades 10000 100000 --recs 200
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quant import self_learner
+
+
+def _garves_trades(rng: random.Random, n: int) -> list[dict]:
+    trades = [{"timestamp": 1.7e9 + rng.random() * 1e7, "resolved": rng.random() < 0.9,
+               "won": rng.choice([True, False, None])} for _ in range(n)]
+    return trades  # deliberately unsorted
+
+
+def _odin_lines(rng: random.Random, n: int) -> str:
+    return "".join(json.dumps({
+        "trade_id": f"o{i}", "symbol": rng.choice(["BTCUSDT", "ETHUSDT", "SOLUSDT", "DOGEUSDT"]),
+        "side": rng.choice(["long", "short"]), "is_win": rng.random() < 0.5,
+        "pnl_usd": round(rng.uniform(-20, 25), 2), "entry_time": 1.7e9 + i * 60,
+        "exit_reason": rng.choice(["TP", "SL", "trail", "time"]),
+        "macro_regime": rng.choice(["risk_on", "risk_off", "neutral"]),
+    }) + "\n" for i in range(n))
+
+
+def _pending(rng: random.Random, n: int) -> list[dict]:
+    return [{"rec_id": f"rec_{i}", "param_name": rng.choice(["min_confidence", "consensus_floor"]),
+             "applied_at": 1.7e9 + rng.random() * 1e7, "pre_wr": rng.uniform(45, 60),
+             "measured": False} for i in range(n)]
+
+
+def _reference_measure(trades: list[dict], outcome: dict, min_after: int) -> tuple[int, float] | None:
+    post = [t for t in trades if t.get("timestamp", 0) > outcome["applied_at"] and t.get("resolved")]
+    if len(post) < min_after:
+        return None
+    return len(post), sum(1 for t in post if t.get("won")) / len(post) * 100
+
+
+def _reference_groups(resolved: list[dict], key: str) -> dict:
+    groups: dict[str, dict] = {}
+    for t in resolved:
+        g = groups.setdefault(t.get(key, "unknown"), {"wins": 0, "losses": 0, "pnl": 0})
+        g["wins" if t.get("won") else "losses"] += 1
+        g["pnl"] += t.get("pnl", 0)
+    return groups
+
+
+def _write_state(pending: list[dict]) -> None:
+    self_learner.LEARNING_FILE.write_text(json.dumps({"recent_outcomes": pending}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trades", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--recs", type=int, default=200, help="pending recommendations")
+    args = parser.parse_args()
+
+    logging.getLogger("quant").setLevel(logging.WARNING)
+    root = Path(tempfile.mkdtemp(prefix="self_learner_bench_"))
+    self_learner.DATA_DIR = root
+    self_learner.LEARNING_FILE = root / "quant_learning.json"
+    self_learner.ODIN_TRADES_FILE = root / "odin_trades.jsonl"
+    rng = random.Random(11)
+    failures = []
+
+    print(f"{'trades':>8} {'measure ms':>11} {'odin ms':>9} {'cycle ms':>9} {'confidence us':>14}")
+    for n in args.trades:
+        trades = _garves_trades(rng, n)
+        self_learner.ODIN_TRADES_FILE.write_text(_odin_lines(rng, n // 10))
+        odin = self_learner.load_odin_trades()
+        pending = _pending(rng, args.recs)
+
+        _write_state(json.loads(json.dumps(pending)))
+        t0 = time.perf_counter()
+        measured = self_learner.measure_outcomes(trades)
+        measure_ms = (time.perf_counter() - t0) * 1000
+
+        expected = {}
+        for o in pending[:50]:  # the reference scan is O(recs x trades)
+            ref = _reference_measure(trades, o, 15)
+            if ref:
+                expected[o["rec_id"]] = ref
+        got = {m.rec_id: (m.post_trades, m.post_wr) for m in measured if m.rec_id in expected}
+        if got != expected:
+            failures.append(f"{n} trades: measure_outcomes differs from a direct scan")
+
+        t0 = time.perf_counter()
+        analysis = self_learner.analyze_odin_performance(odin)
+        odin_ms = (time.perf_counter() - t0) * 1000
+        for key, field in (("asset", "by_asset"), ("exit_reason", "by_exit_reason")):
+            ref = {k: v for k, v in _reference_groups(odin, key).items() if v["wins"] + v["losses"] >= 3}
+            for k, v in ref.items():
+                got_v = analysis[field].get(k, {})
+                if (got_v.get("wins"), got_v.get("losses")) != (v["wins"], v["losses"]) \
+                        or not math.isclose(got_v.get("pnl", 0), v["pnl"], rel_tol=1e-12, abs_tol=1e-9):
+                    failures.append(f"{n} trades: Odin {field}[{k}] differs")
+
+        _write_state(json.loads(json.dumps(pending)))
+        t0 = time.perf_counter()
+        summary = self_learner.run_learning_cycle(trades, odin)
+        cycle_ms = (time.perf_counter() - t0) * 1000
+        state = json.loads(self_learner.LEARNING_FILE.read_text())
+        if summary["outcomes_measured"] != len(measured) or state["odin_trades_analyzed"] != len(odin):
+            failures.append(f"{n} trades: learning cycle summary/state inconsistent")
+        if sum(1 for o in state["recent_outcomes"] if o.get("measured")) != min(len(measured), 20) \
+                and len(measured) <= 20:
+            failures.append(f"{n} trades: measured outcomes not persisted")
+
+        t0 = time.perf_counter()
+        for _ in range(10_000):
+            self_learner.get_adjusted_confidence("min_confidence")
+        conf_us = (time.perf_counter() - t0) / 10_000 * 1e6
+        if self_learner.get_adjusted_confidence("min_confidence") != \
+                state["param_confidence"].get("min_confidence", 0.5):
+            failures.append(f"{n} trades: cached confidence differs from the learning file")
+
+        print(f"{n:>8} {measure_ms:>11.1f} {odin_ms:>9.1f} {cycle_ms:>9.1f} {conf_us:>14.1f}")
+
+    for f in failures:
+        print(f"  FAIL {f}")
+    print("OK" if not failures else f"{len(failures)} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
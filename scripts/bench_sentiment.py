@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark shared.sentiment on a recorded headline corpus (CPU).
+
+Compares the old path (every headline straight through the FinBERT
+pipeline in arrival order) against score_batch with the result cache,
+in-batch dedup and length-sorted batches. The corpus is replayed
+--cycles times to mimic news/RSS re-polling the same headlines.
+
+Corpus: one headline per line, or JSONL with a "title"/"headline"/"text" field.
+
+Usage:
+    python scripts/bench_sentiment.py data/headlines.txt
+    python scripts/bench_sentiment.py data/news_log.jsonl --cycles 5 --batch-size 32
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from shared import sentiment
+
+
+def _load_corpus(path: Path) -> list[str]:
+    texts = []
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                rec = json.loads(line)
+                line = rec.get("title") or rec.get("headline") or rec.get("text") or ""
+            except json.JSONDecodeError:
+                pass
+        if line:
+            texts.append(line)
+    return texts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", type=Path)
+    parser.add_argument("--cycles", type=int, default=3, help="times the corpus is re-polled")
+    parser.add_argument("--batch-size", type=int, default=16)
+    args = parser.parse_args()
+
+    texts = _load_corpus(args.corpus)
+    if not texts:
+        sys.exit(f"No headlines in {args.corpus}")
+
+    sentiment.CACHE_PATH = Path(tempfile.mkdtemp()) / "finbert_cache.db"
+    pipe = sentiment._get_pipeline()
+    if pipe is None:
+        sys.exit("FinBERT pipeline unavailable (transformers/torch not installed?)")
+    pipe(texts[:4], batch_size=4, top_k=None)  # warm up
+
+    total = len(texts) * args.cycles
+    print(f"Corpus: {len(texts)} headlines ({len(set(texts))} unique) x {args.cycles} cycles")
+
+    t0 = time.perf_counter()
+    for _ in range(args.cycles):
+        pipe([t[:sentiment.MAX_CHARS] for t in texts], batch_size=args.batch_size, top_k=None)
+    before = time.perf_counter() - t0
+    print(f"  before: {total / before:8.1f} headlines/s  (no cache, arrival order)")
+
+    t0 = time.perf_counter()
+    for _ in range(args.cycles):
+        sentiment.score_batch(texts, batch_size=args.batch_size)
+    after = time.perf_counter() - t0
+    stats = sentiment.cache_stats()
+    print(f"  after:  {total / after:8.1f} headlines/s  "
+          f"(cache hit rate {stats['hit_rate']:.1%}, {stats['misses']} inferred)")
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Benchmark viper.demos.video_pipeline: serial vs parallel record + composite.
+
+Serves a local fixture page with the same chat widget selectors the dental
+actions drive (#chatFab, #chatInput, #chatBody, lead form), builds a short
+cue sheet and a silent WAV, then times:
+
+  serial   — record desktop, record mobile, composite horizontal, composite vertical
+  parallel — record_all() then render_all() (two worker processes per stage)
+
+Needs playwright (with chromium) and moviepy. No network or API keys.
+
+Usage:
+    python scripts/bench_video_pipeline.py
+    python scripts/bench_video_pipeline.py --duration 12
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from viper.demos.compositor import composite_horizontal, composite_vertical
+from viper.demos.recorder import record_with_verify
+from viper.demos.video_pipeline import VIEWPORTS, DemoConfig, record_all, render_all
+from viper.demos.voiceover import CuePoint
+
+FIXTURE_HTML = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Fixture Dental</title>
+<style>
+  body { font-family: sans-serif; margin: 0; background: #f8fafc; }
+  header { padding: 40px; font-size: 32px; background: #0f766e; color: white; }
+  #chatFab { position: fixed; right: 24px; bottom: 24px; width: 64px; height: 64px;
+             border-radius: 32px; background: #0f766e; color: white; border: 0; }
+  .chat-window { display: none; position: fixed; right: 24px; bottom: 100px; width: 340px;
+                 height: 480px; background: white; box-shadow: 0 4px 24px #0003; flex-direction: column; }
+  .chat-window.open { display: flex; }
+  #chatBody { flex: 1; overflow-y: auto; padding: 12px; font-size: 14px; }
+  .chat-input { display: flex; border-top: 1px solid #ddd; }
+  #chatInput { flex: 1; padding: 10px; border: 0; }
+  .lead-form input { display: block; width: 90%; margin: 4px 0; padding: 6px; }
+</style></head>
+<body>
+<header>Fixture Dental — Demo</header>
+<button id="chatFab">Chat</button>
+<div class="chat-window">
+  <div id="chatBody"><p>Hi! How can I help?</p></div>
+  <div class="chat-input"><input id="chatInput"><button>Send</button></div>
+</div>
+<script>
+  const body = document.getElementById('chatBody');
+  document.getElementById('chatFab').onclick = () =>
+    document.querySelector('.chat-window').classList.add('open');
+  document.querySelector('.chat-input button').onclick = () => {
+    const input = document.getElementById('chatInput');
+    body.innerHTML += `<p><b>You:</b> ${input.value}</p>`;
+    const q = input.value.toLowerCase();
+    input.value = '';
+    setTimeout(() => {
+      body.innerHTML += q.includes('insurance')
+        ? '<p>We accept Cigna, MetLife and Blue Cross.</p>'
+        : '<p>Leave your details and we will call you.</p>' +
+          '<div class="lead-form"><input id="leadName"><input id="leadPhone">' +
+          '<input id="leadEmail"><button>Send</button></div>';
+      body.scrollTop = body.scrollHeight;
+    }, 400);
+  };
+</script>
+</body></html>
+"""
+
+
+def _silent_wav(path: Path, seconds: float, rate: int = 22050) -> None:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"\0\0" * int(seconds * rate))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=9.0, help="voiceover length (s)")
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="demo_bench_"))
+    page = root / "fixture.html"
+    page.write_text(FIXTURE_HTML)
+    audio = root / "voiceover.wav"
+    _silent_wav(audio, args.duration)
+
+    step = args.duration / 6
+    cues = [
+        CuePoint("open_chat", step * 1),
+        CuePoint("type_insurance", step * 2),
+        CuePoint("type_booking", step * 3),
+        CuePoint("form_fill", step * 4),
+        CuePoint("submit", step * 5),
+    ]
+
+    def config(name: str) -> DemoConfig:
+        return DemoConfig(
+            business_name="Fixture Dental", demo_url=page.as_uri(),
+            script_text="", cues=[], output_dir=root / name,
+        )
+
+    # Serial: what generate_demo did before
+    cfg = config("serial")
+    t0 = time.monotonic()
+    stages = {}
+    rec = {}
+    for name, viewport in VIEWPORTS.items():
+        t = time.monotonic()
+        rec[name] = record_with_verify(cfg.demo_url, cues, args.duration,
+                                       cfg.output_dir / f"recording_{name}", viewport)
+        stages[f"record {name}"] = time.monotonic() - t
+    t = time.monotonic()
+    composite_horizontal(rec["desktop"], audio, cfg.output_dir)
+    stages["composite horizontal"] = time.monotonic() - t
+    t = time.monotonic()
+    composite_vertical(rec["mobile"], audio, cfg.output_dir, cfg.business_name)
+    stages["composite vertical"] = time.monotonic() - t
+    serial = time.monotonic() - t0
+
+    # Parallel: record_all + render_all
+    cfg = config("parallel")
+    t0 = time.monotonic()
+    recordings = record_all(cfg, cues, args.duration, set(VIEWPORTS))
+    rendered, failed = render_all(cfg, recordings, audio, {"horizontal", "vertical"})
+    parallel = time.monotonic() - t0
+
+    print()
+    for name, secs in stages.items():
+        print(f"  {name:<22} {secs:6.1f}s")
+    ideal = max(stages["record desktop"], stages["record mobile"]) + \
+        max(stages["composite horizontal"], stages["composite vertical"])
+    print(f"\n  serial:   {serial:6.1f}s")
+    print(f"  parallel: {parallel:6.1f}s  (ideal {ideal:.1f}s, "
+          f"{(1 - parallel / serial):.0%} saved vs {(1 - ideal / serial):.0%} parallelisable)")
+    for name, reason in failed.items():
+        print(f"  note: {reason} (fixture videos are short)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark viper.demos.video_verifier: per-cue seeks vs single-pass + parallel OCR.
+
+Renders a synthetic 1920x1080 demo (default 60s) with ffmpeg's drawtext,
+showing a different chat line on the right-hand side after each of a dozen
+cues, then times:
+
+  before — one `ffmpeg -ss T -frames:v 1` per cue + full-frame OCR, serially
+  after  — verify_video(): one decode pass, chat-region crop, OCR across cores
+
+and checks both see the same text. Needs ffmpeg (with drawtext) and tesseract.
+
+Usage:
+    python scripts/bench_video_verifier.py
+    python scripts/bench_video_verifier.py --duration 90 --checks 16
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from viper.demos.video_verifier import extract_frame, ocr_frame, verify_video
+from viper.demos.voiceover import CuePoint
+
+WORDS = ["Insurance", "Appointment", "Saturday", "Doctor", "Cleaning", "Whitening",
+         "Emergency", "Braces", "Implants", "Parking", "Payment", "Thanks",
+         "Crowns", "Veneers", "Xray", "Checkup"]
+
+
+def _render(path: Path, duration: float, cues: list[CuePoint], delay: float) -> None:
+    # Each word is visible from its cue (+ response delay) until the next cue
+    draws = []
+    for i, cue in enumerate(cues):
+        start = cue.timestamp + delay - 0.5
+        end = cues[i + 1].timestamp + delay - 0.5 if i + 1 < len(cues) else duration
+        draws.append(
+            f"drawtext=text='Bot reply {WORDS[i]}':x=w*0.6:y=h*0.5:fontsize=64:fontcolor=black:"
+            f"enable='between(t,{start:.2f},{end:.2f})'"
+        )
+    draws.append("drawtext=text='Fixture Dental hero banner':x=40:y=40:fontsize=56:fontcolor=gray")
+    subprocess.run([
+        "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", f"color=c=white:s=1920x1080:d={duration}:r=30",
+        "-vf", ",".join(draws), "-c:v", "libx264", "-preset", "veryfast",
+        "-pix_fmt", "yuv420p", str(path),
+    ], check=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--checks", type=int, default=12)
+    parser.add_argument("--delay", type=float, default=4.0, help="response delay (s)")
+    args = parser.parse_args()
+
+    n = min(args.checks, len(WORDS))
+    step = (args.duration - args.delay - 1) / n
+    cues = [CuePoint(f"step_{i}", 0.5 + i * step) for i in range(n)]
+    checks = [{"after_action": c.action, "expect": [WORDS[i]]} for i, c in enumerate(cues)]
+
+    tmp = Path(tempfile.mkdtemp(prefix="verify_bench_"))
+    video = tmp / "demo.mp4"
+    _render(video, args.duration, cues, args.delay)
+    print(f"{args.duration:.0f}s synthetic demo, {n} frame checks")
+
+    t0 = time.perf_counter()
+    before_ok = 0
+    for i, cue in enumerate(cues):
+        frame = tmp / f"old_{i}.png"
+        if extract_frame(video, cue.timestamp + args.delay, frame):
+            before_ok += WORDS[i].lower() in ocr_frame(frame).lower()
+    before = time.perf_counter() - t0
+    print(f"  before: {before:6.2f}s  ({before_ok}/{n} checks passed)")
+
+    t0 = time.perf_counter()
+    result = verify_video(video, cues, checks, response_delay=args.delay)
+    after = time.perf_counter() - t0
+    after_ok = sum(c.passed for c in result.checks)
+    print(f"  after:  {after:6.2f}s  ({after_ok}/{n} checks passed)")
+    print(f"  {after / before:.0%} of the previous time")
+    sys.exit(0 if after_ok == before_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
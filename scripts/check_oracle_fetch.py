@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Check oracle.data_pipeline fetchers against a local stub server.
+
+Serves canned CoinGecko / Fear & Greed / CoinGlass / FRED responses from a
+threaded localhost server, each with its own delay, points the pipeline at
+it and checks that:
+  - gather_context() takes about as long as the slowest source, not the sum
+  - every field is populated from the stubbed payloads
+  - a second run minutes later is served from the on-disk TTL cache
+  - a source that fails does not take the others down
+
+Exits 1 on any failure.
+
+Usage:
+    python scripts/check_oracle_fetch.py
+    python scripts/check_oracle_fetch.py --delay 0.8
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from oracle import data_pipeline
+from oracle.config import OracleConfig
+
+# path prefix -> (relative delay, payload)
+ROUTES = {
+    "/cg/simple/price": (1.0, {
+        "bitcoin": {"usd": 67500.0, "usd_7d_change": 2.5},
+        "ethereum": {"usd": 3500.0, "usd_7d_change": -1.0},
+        "solana": {"usd": 150.0, "usd_7d_change": 4.0},
+        "ripple": {"usd": 0.6, "usd_7d_change": 0.5},
+    }),
+    "/cg/coins/": (0.8, {"prices": [[0, 100.0], [1, 120.0], [2, 90.0]]}),
+    "/fng": (0.5, {"data": [{"value": "62", "value_classification": "Greed"}]}),
+    "/cglass/funding-rate": (0.7, {"data": [{"symbol": "BTC", "rate": 0.0001}]}),
+    "/cglass/open-interest": (0.9, {"data": [{"symbol": "BTC", "openInterest": 3e10, "change24h": 1.2}]}),
+    "/cglass/liquidation": (0.6, {"data": [{"symbol": "BTC", "totalVolUsd": 5e7}]}),
+    "/fred": (0.4, {"observations": [{"value": "104.2"}]}),
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    delay = 1.0
+    hits: list[str] = []
+    fail: set[str] = set()
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        _Handler.hits.append(path)
+        for prefix, (rel, payload) in ROUTES.items():
+            if path.startswith(prefix):
+                time.sleep(rel * self.delay)
+                if prefix in self.fail:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                body = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+        self.send_response(404)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def _run(cfg: OracleConfig) -> tuple[float, data_pipeline.MarketContext]:
+    t0 = time.perf_counter()
+    ctx = data_pipeline.gather_context(cfg)
+    return time.perf_counter() - t0, ctx
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delay", type=float, default=0.5, help="seconds for the slowest source")
+    args = parser.parse_args()
+
+    _Handler.delay = args.delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    data_pipeline.COINGECKO_API = f"{base}/cg"
+    data_pipeline.FEAR_GREED_URL = f"{base}/fng"
+    data_pipeline.COINGLASS_API = f"{base}/cglass"
+    data_pipeline.FRED_API = f"{base}/fred"
+    data_pipeline.CACHE_DIR = Path(tempfile.mkdtemp()) / "oracle_http_cache"
+
+    cfg = OracleConfig()
+    cfg.coinglass_api_key = "stub"
+    cfg.fred_api_key = "stub"
+
+    n_requests = 1 + len(data_pipeline.COINGECKO_IDS) + 1 + 3 + 2
+    serial = args.delay * (ROUTES["/cg/simple/price"][0] + 4 * ROUTES["/cg/coins/"][0]
+                           + sum(rel for p, (rel, _) in ROUTES.items()
+                                 if p not in ("/cg/simple/price", "/cg/coins/")) + ROUTES["/fred"][0])
+    failures = []
+
+    cold, ctx = _run(cfg)
+    print(f"cold run:   {cold:.2f}s for {len(_Handler.hits)} requests "
+          f"(slowest source {args.delay:.2f}s, serial sum {serial:.2f}s)")
+    if len(_Handler.hits) != n_requests:
+        failures.append(f"expected {n_requests} requests, server saw {len(_Handler.hits)}")
+    if cold > args.delay * 1.5 + 0.3:
+        failures.append(f"cold run {cold:.2f}s does not track the slowest source ({args.delay:.2f}s)")
+    expected = {
+        "prices.bitcoin": ctx.prices.get("bitcoin") == 67500.0,
+        "weekly_high.xrp": ctx.weekly_high.get("xrp") == 120.0,
+        "weekly_low.solana": ctx.weekly_low.get("solana") == 90.0,
+        "fear_greed": ctx.fear_greed == 62 and ctx.fear_greed_label == "Greed",
+        "funding_rates.bitcoin": abs(ctx.funding_rates.get("bitcoin", 0) - 0.01) < 1e-12,
+        "open_interest.bitcoin": ctx.open_interest.get("bitcoin") == 30000.0,
+        "liquidations_24h.bitcoin": ctx.liquidations_24h.get("bitcoin") == 50.0,
+        "dxy/fed_rate": ctx.dxy == 104.2 and ctx.fed_rate == 104.2,
+    }
+    failures += [f"field {name} not populated as stubbed" for name, ok in expected.items() if not ok]
+
+    _Handler.hits.clear()
+    warm, ctx2 = _run(cfg)
+    print(f"warm run:   {warm:.2f}s for {len(_Handler.hits)} requests (TTL cache)")
+    if _Handler.hits:
+        failures.append(f"warm run refetched {len(_Handler.hits)} cached sources")
+    if ctx2.to_dict() | {"timestamp": ""} != ctx.to_dict() | {"timestamp": ""}:
+        failures.append("cached context differs from the fetched one")
+
+    data_pipeline.CACHE_DIR = Path(tempfile.mkdtemp()) / "oracle_http_cache"
+    _Handler.fail = {"/fng"}
+    _, ctx3 = _run(cfg)
+    print(f"failed src: fear_greed={ctx3.fear_greed}, prices={len(ctx3.prices)}")
+    if ctx3.fear_greed is not None or len(ctx3.prices) != 4:
+        failures.append("a failing source affected the others")
+
+    server.shutdown()
+    for f in failures:
+        print(f"  FAIL {f}")
+    print("OK" if not failures else f"{len(failures)} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
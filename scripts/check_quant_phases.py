@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Check quant.scheduler on a synthetic graph shaped like a Quant cycle.
+
+Builds phases with the same dependency structure as QuantBot._cycle_phases
+(load -> optimize / walk-forward / Monte Carlo / regime / ... -> reports ->
+live push). I/O-like phases sleep on threads, the "Optuna" phases burn CPU
+in the process pool. Checks that:
+  - results are identical to a serial run (one thread, no processes)
+  - no phase starts before all of its deps have finished
+  - wall time is close to the critical path, well under the serial sum
+  - process phases really ran in other processes
+  - a failing phase aborts the run with a PhaseError carrying the partial
+    results, and its dependents never start
+  - unknown deps and dependency cycles are rejected
+
+Exits 1 on any failure.
+
+Usage:
+    python scripts/check_quant_phases.py
+    python scripts/check_quant_phases.py --scale 2
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quant.scheduler import Phase, PhaseError, run_phases
+
+# name -> (deps, seconds, process)
+GRAPH = {
+    "trades":              ((), 0.3, False),
+    "candles":             ((), 0.4, False),
+    "wf_folds":            (("trades",), 0.0, False),
+    "optimize":            (("trades",), 1.2, True),
+    "bootstrap_ci":        (("optimize",), 0.1, False),
+    "walk_forward":        (("trades", "wf_folds"), 1.0, True),
+    "walk_forward_v2":     (("trades", "wf_folds"), 1.0, True),
+    "monte_carlo":         (("trades",), 0.6, True),
+    "cusum":               (("trades",), 0.1, False),
+    "regime":              (("trades", "candles"), 0.5, False),
+    "odin_trades":         ((), 0.2, False),
+    "correlation":         (("trades", "odin_trades"), 0.2, False),
+    "self_learning":       (("trades", "odin_trades"), 0.3, False),
+    "pnl_impact":          (("trades", "optimize"), 0.3, False),
+    "report_results":      (("optimize",), 0.1, False),
+    "report_walk_forward": (("walk_forward", "bootstrap_ci"), 0.1, False),
+    "report_analytics":    (("trades", "optimize"), 0.2, False),
+    "report_phase1":       (("walk_forward_v2", "monte_carlo", "cusum"), 0.1, False),
+    "report_phase2":       (("regime", "correlation", "self_learning"), 0.1, False),
+    "live_push":           (("optimize", "walk_forward", "walk_forward_v2",
+                             "monte_carlo", "cusum", "report_phase1"), 0.1, False),
+    "ml_retrain":          ((), 0.8, False),
+    "publish_events":      (("optimize", "report_results"), 0.1, False),
+    "hawk_review":         ((), 0.1, False),
+    "odin_backtest":       ((), 1.0, False),
+    "odin_analyzer":       ((), 0.2, False),
+}
+
+
+def _phase(name: str, seconds: float, cpu: bool, *inputs) -> tuple[int, int]:
+    """Sleep (I/O-like) or burn CPU holding the GIL (Optuna-like) for seconds.
+
+    Returns (value, pid); value is a deterministic function of the phase name
+    and its inputs' values, so any scheduling mistake changes the results.
+    """
+    if cpu:
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            sum(i * i for i in range(1000))
+    else:
+        time.sleep(seconds)
+    values = tuple(v for v, _ in inputs)
+    return random.Random(f"{name}:{values}").randrange(1 << 30), os.getpid()
+
+
+def _phases(scale: float) -> list[Phase]:
+    return [Phase(name, partial(_phase, name, seconds * scale, process), deps, process=process)
+            for name, (deps, seconds, process) in GRAPH.items()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every phase duration")
+    args = parser.parse_args()
+    failures = []
+
+    t0 = time.perf_counter()
+    serial = run_phases(_phases(args.scale), max_workers=1, max_processes=0)
+    serial_wall = time.perf_counter() - t0
+    par = run_phases(_phases(args.scale), max_workers=8, max_processes=4)
+    print(f"serial:   {serial_wall:.2f}s")
+    print(f"parallel: {par.wall_seconds:.2f}s, critical path {par.critical_path_seconds:.2f}s "
+          f"({' -> '.join(par.critical_path)})")
+
+    values = {k: v for k, (v, _) in par.results.items()}
+    if values != {k: v for k, (v, _) in serial.results.items()}:
+        failures.append("parallel results differ from the serial run")
+
+    for name, (deps, _, _) in GRAPH.items():
+        t = par.timings[name]
+        for d in deps:
+            dep_end = par.timings[d].started + par.timings[d].seconds
+            if t.started < dep_end - 0.01:
+                failures.append(f"{name} started {dep_end - t.started:.2f}s before {d} finished")
+
+    # spawn start-up and pickling are paid once per run, on top of the critical path
+    if par.wall_seconds > par.critical_path_seconds + 2.0:
+        failures.append(f"wall {par.wall_seconds:.2f}s not bounded by the critical path")
+    if par.wall_seconds > serial_wall * 0.6:
+        failures.append("parallel run is not meaningfully faster than serial")
+
+    pids = {par.results[n][1] for n, (_, _, proc) in GRAPH.items() if proc}
+    if os.getpid() in pids or not all(par.timings[n].process for n, (_, _, p) in GRAPH.items() if p):
+        failures.append("process phases did not run in the process pool")
+
+    started = []
+
+    def record(name):
+        def run(*_):
+            started.append(name)
+            if name == "optimize":
+                raise RuntimeError("boom")
+            time.sleep(0.05)
+        return run
+
+    broken = [Phase(n, record(n), deps) for n, (deps, _, _) in GRAPH.items()]
+    try:
+        run_phases(broken, max_workers=4)
+        failures.append("failing phase did not abort the run")
+    except PhaseError as e:
+        downstream = {"bootstrap_ci", "pnl_impact", "report_results", "live_push", "publish_events"}
+        if downstream & set(started):
+            failures.append(f"dependents of a failed phase ran: {sorted(downstream & set(started))}")
+        if e.phase != "optimize" or not isinstance(e.__cause__, RuntimeError):
+            failures.append(f"PhaseError names {e.phase!r}, caused by {e.__cause__!r}")
+        finished = set(e.run.results)
+        if "trades" not in finished or finished & downstream or e.run.to_dict().get("failed") != "optimize":
+            failures.append(f"partial run after a failure is wrong: {sorted(finished)}")
+
+    for bad in ([Phase("a", print, ("missing",))],
+                [Phase("a", print, ("b",)), Phase("b", print, ("a",))]):
+        try:
+            run_phases(bad)
+            failures.append(f"invalid graph accepted: {[p.name for p in bad]}")
+        except ValueError:
+            pass
+
+    for f in failures:
+        print(f"  FAIL {f}")
+    print("OK" if not failures else f"{len(failures)} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
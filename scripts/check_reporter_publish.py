@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Stress quant.reporter.publish_json against concurrent readers.
+
+Reader processes poll a data file in a tight loop (like the dashboard and
+Garves do) while the writer keeps replacing it with documents of very
+different sizes. Checks that:
+  - no reader ever sees a missing, empty or unparseable file
+  - republishing unchanged content (only "updated" differs) skips the write
+  - large documents are written compact, small ones indented
+  - no temp files are left behind
+
+For comparison it runs the same readers against plain Path.write_text()
+and reports how many torn reads that produces.
+
+Exits 1 on any failure.
+
+Usage:
+    python scripts/check_reporter_publish.py
+    python scripts/check_reporter_publish.py --writes 2000 --readers 6
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing as mp
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _reader(path: str, stop, counts) -> None:
+    ok = torn = 0
+    while not stop.is_set():
+        try:
+            with open(path) as f:
+                doc = json.loads(f.read())
+            if "rows" not in doc:
+                torn += 1
+            else:
+                ok += 1
+        except (OSError, ValueError):
+            torn += 1
+    with counts.get_lock():
+        counts[0] += ok
+        counts[1] += torn
+
+
+def _payload(i: int) -> dict:
+    rows = 5 if i % 2 else 4000  # alternate ~200B and ~300KB documents
+    return {"rows": [{"i": i, "label": f"combo-{j}", "wr": j / 7} for j in range(rows)],
+            "updated": time.time()}
+
+
+def _hammer(path: Path, write, writes: int, readers: int) -> tuple[int, int]:
+    write(path, _payload(0))
+    stop = mp.Event()
+    counts = mp.Array("l", 2)
+    procs = [mp.Process(target=_reader, args=(str(path), stop, counts)) for _ in range(readers)]
+    for p in procs:
+        p.start()
+    for i in range(1, writes + 1):
+        write(path, _payload(i))
+    stop.set()
+    for p in procs:
+        p.join()
+    return counts[0], counts[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    from quant.reporter import COMPACT_JSON_BYTES, publish_json
+
+    root = Path(tempfile.mkdtemp(prefix="publish_check_"))
+    failures = []
+
+    ok, torn = _hammer(root / "naive.json", lambda p, d: p.write_text(json.dumps(d, indent=2)),
+                       args.writes, args.readers)
+    print(f"write_text:   {ok} good reads, {torn} torn")
+
+    ok, torn = _hammer(root / "quant_results.json", publish_json, args.writes, args.readers)
+    print(f"publish_json: {ok} good reads, {torn} torn")
+    if torn:
+        failures.append(f"{torn} torn reads through publish_json")
+    if not ok:
+        failures.append("readers never completed a read")
+
+    path = root / "quant_status.json"
+    doc = {"cycle": 1, "rows": [1, 2, 3], "updated": "09:00 AM ET"}
+    first = publish_json(path, doc)
+    mtime = path.stat().st_mtime_ns
+    again = publish_json(path, {**doc, "updated": "09:05 AM ET"})
+    if not first or again or path.stat().st_mtime_ns != mtime:
+        failures.append("unchanged content was rewritten")
+    if not publish_json(path, {**doc, "cycle": 2}):
+        failures.append("changed content was not written")
+    if "\n" not in path.read_text():
+        failures.append("small document not indented")
+    path.unlink()
+    if not publish_json(path, doc):
+        failures.append("deleted file was not rewritten")
+
+    big = root / "big.json"
+    publish_json(big, _payload(0))
+    if big.stat().st_size < COMPACT_JSON_BYTES or "\n" in big.read_text():
+        failures.append("large document not written compact")
+
+    leftovers = [p.name for p in root.iterdir() if p.suffix == ".tmp"]
+    if leftovers:
+        failures.append(f"temp files left behind: {leftovers}")
+
+    for f in failures:
+        print(f"  FAIL {f}")
+    print("OK" if not failures else f"{len(failures)} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Check viper.demos.scraper against a local fixture site.
+
+Serves a small dental practice site (homepage + seven subpages, one past
+MAX_SUBPAGES, each with a per-request delay) from a threaded localhost
+server, runs scrape_business() on it with a throwaway HTTP cache and
+checks that:
+  - every URL is requested exactly once (homepage included)
+  - subpages are fetched concurrently, but never more than
+    MAX_CONNECTIONS_PER_HOST at a time
+  - the extracted fields match what the fixture pages contain, with ranked
+    patterns tried across the whole site (the "Mon-Fri" hours on /contact
+    beat the generic time range on the homepage)
+  - no per-host connection slots are left behind after the scrape
+
+Exits 1 on any failure.
+
+Usage:
+    python scripts/check_scraper.py
+    python scripts/check_scraper.py --delay 0.5
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from viper import http_cache
+from viper.demos import scraper
+
+HOMEPAGE = """<html><head><title>Fixture Dental | Family Dentist</title>
+<meta name="description" content="Gentle family dentistry in Springfield.">
+<meta name="theme-color" content="#0f766e"></head>
+<body><h1>Fixture Dental</h1>
+<p>Our dentist team offers dental cleaning, Crowns and implant care for the whole family.</p>
+<a href="/about">About</a> <a href="/about/">About us</a> <a href="/about#team">Team</a>
+<a href="/services">Services</a> <a href="/contact">Contact</a> <a href="/faq">FAQ</a>
+<a href="/insurance">Insurance</a> <a href="/new-patients">Forms</a>
+<a href="/team">Meet the team</a> <a href="https://elsewhere.test/about">Partner</a>
+<p>Call (555) 123-4567 today. Open 9 AM - 5 PM.</p>
+</body></html>"""
+
+SUBPAGES = {
+    "/about": "<main><p>Dr. Alice Morgan founded the practice in 1998.</p></main>",
+    "/services": "<main><p>We offer Teeth Whitening, Dental Implants and Invisalign.</p></main>",
+    "/contact": "<main><p>Email hello@fixturedental.test. 12 Main Street, Springfield, IL 62701."
+                " Mon-Fri: 8:00 AM - 5:00 PM</p></main>",
+    "/faq": "<main><dl><dt>Do you see children under five?</dt>"
+            "<dd>Yes, from their very first tooth onwards.</dd></dl></main>",
+    "/insurance": "<main><p>We accept Delta Dental, Cigna and MetLife. CareCredit available.</p></main>",
+    "/new-patients": "<main><p>New patients: please arrive fifteen minutes early to fill in forms.</p></main>",
+    "/team": "<main><p>Meet Dr. Brian Chen, our orthodontist.</p></main>",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    delay = 0.3
+    hits: Counter = Counter()
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        with _Handler.lock:
+            _Handler.hits[path] += 1
+            _Handler.active += 1
+            _Handler.peak = max(_Handler.peak, _Handler.active)
+        try:
+            time.sleep(self.delay)
+            body = HOMEPAGE if path == "/" else SUBPAGES.get(path.rstrip("/"))
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            data = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with _Handler.lock:
+                _Handler.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delay", type=float, default=0.3, help="seconds per request")
+    args = parser.parse_args()
+
+    _Handler.delay = args.delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    cache = Path(tempfile.mkdtemp()) / "http_cache"
+    http_cache.CACHE_DIR = cache
+    http_cache._DB_PATH = cache / "index.db"
+    http_cache._BODY_DIR = cache / "bodies"
+
+    t0 = time.perf_counter()
+    biz = scraper.scrape_business(url)
+    elapsed = time.perf_counter() - t0
+    server.shutdown()
+
+    n_sub = min(scraper.MAX_SUBPAGES, len(SUBPAGES))
+    waves = -(-n_sub // scraper.MAX_CONNECTIONS_PER_HOST)
+    print(f"scraped {biz.pages_scraped} pages in {elapsed:.2f}s "
+          f"(serial would be ~{(1 + n_sub) * args.delay:.2f}s, peak {_Handler.peak} connections)")
+
+    failures = []
+    repeated = {p: n for p, n in _Handler.hits.items() if n > 1}
+    if repeated:
+        failures.append(f"URLs fetched more than once: {repeated}")
+    if "/team" in _Handler.hits:
+        failures.append("fetched more than MAX_SUBPAGES subpages")
+    if _Handler.peak > scraper.MAX_CONNECTIONS_PER_HOST:
+        failures.append(f"peak {_Handler.peak} connections > cap {scraper.MAX_CONNECTIONS_PER_HOST}")
+    if elapsed > (1 + waves) * args.delay + 0.5:
+        failures.append(f"{elapsed:.2f}s — subpages don't look concurrent")
+    if scraper._host_slots:
+        failures.append(f"host slots left behind: {sorted(scraper._host_slots)}")
+
+    expected = {
+        "name": biz.name == "Fixture Dental",
+        "niche": biz.niche == "dental",
+        "pages_scraped": biz.pages_scraped == 1 + n_sub,
+        "phone": biz.phone == "(555) 123-4567",
+        "email": biz.email == "hello@fixturedental.test",
+        "address": biz.address.startswith("12 Main Street"),
+        "hours": biz.hours.startswith("Mon-Fri") and "8:00 AM" in biz.hours,
+        "services": {"Teeth Whitening", "Dental Implants", "Invisalign", "Crowns"} <= set(biz.services),
+        "insurance": biz.insurance_plans[:3] == ["Delta Dental", "Cigna", "MetLife"],
+        "payment": "CareCredit" in biz.payment_methods,
+        "faq": len(biz.faq_entries) == 1,
+        "team": "Dr. Alice Morgan" in biz.team_members,
+        "new_patient_info": biz.new_patient_info.startswith("New patients"),
+        "raw_html": biz.raw_html == HOMEPAGE,
+    }
+    failures += [f"field {name} not extracted as expected" for name, ok in expected.items() if not ok]
+
+    for f in failures:
+        print(f"  FAIL {f}")
+    print("OK" if not failures else f"{len(failures)} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Parity check: FinBERT int8 (ONNX Runtime) backend vs the float pipeline.
+
+Scores a fixed headline set with both backends and fails (exit 1) if any
+label disagrees — unless the float model itself is within --tol between its
+top two classes — or any class probability differs by more than --tol.
+Skips (exit 0) when onnxruntime/optimum aren't installed.
+
+Usage:
+    python scripts/check_sentiment_parity.py
+    python scripts/check_sentiment_parity.py --tol 0.03
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from shared import sentiment
+
+FIXTURES = [
+    "Bitcoin crashes 10% amid market panic",
+    "Ethereum rallies to record high after ETF approval",
+    "Fed holds rates steady, signals patience on cuts",
+    "Tesla misses delivery estimates for third straight quarter",
+    "Apple beats earnings expectations on strong iPhone sales",
+    "Crypto exchange files for bankruptcy protection",
+    "Oil prices steady as OPEC+ extends output cuts",
+    "SEC sues major stablecoin issuer over reserve disclosures",
+    "Solana network suffers hours-long outage",
+    "Nvidia shares surge on record data-center revenue",
+    "Bank of Japan leaves policy unchanged",
+    "Inflation cools more than expected in September",
+    "Regional bank shares tumble on deposit outflows",
+    "Polymarket volume hits all-time high during election week",
+    "Retail sales flat as consumers pull back on spending",
+    "BTC up 5%",
+    "Market crash fears grow",
+    "Gold slips as dollar strengthens",
+    "Startup raises $50M Series B to expand lending platform",
+    "Layoffs announced at struggling media company",
+]
+
+_CLASSES = ("positive", "negative", "neutral")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tol", type=float, default=0.05)
+    args = parser.parse_args()
+
+    if not sentiment._int8_available():
+        print("onnxruntime/optimum not installed — skipping (the float pipeline is used)")
+        return
+
+    float_pipe = sentiment._build_float_pipeline()
+    int8_pipe = sentiment._build_int8_pipeline()
+    ref = [sentiment._to_result(s) for s in float_pipe(FIXTURES, top_k=None)]
+    got = [sentiment._to_result(s) for s in int8_pipe(FIXTURES, top_k=None)]
+
+    failures = 0
+    worst = 0.0
+    for text, r, g in zip(FIXTURES, ref, got):
+        diff = max(abs(r[c] - g[c]) for c in _CLASSES)
+        worst = max(worst, diff)
+        top2 = sorted((r[c] for c in _CLASSES), reverse=True)[:2]
+        label_ok = r["label"] == g["label"] or top2[0] - top2[1] < args.tol
+        if diff > args.tol or not label_ok:
+            failures += 1
+            print(f"  MISMATCH {text[:50]!r}: float={r['label']}/{r['score']} "
+                  f"int8={g['label']}/{g['score']} max_diff={diff:.4f}")
+
+    print(f"{len(FIXTURES) - failures}/{len(FIXTURES)} within tolerance {args.tol} "
+          f"(max prob diff {worst:.4f})")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
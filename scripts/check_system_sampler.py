@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Check the dashboard system sampler (bot.routes.system).
+
+Builds a throwaway HOME with a fake Brotherhood source tree and data dir
+(fresh agent status files, so read_fresh never falls back to ssh), serves
+/api/system/* and /api/overview through a Flask test client and checks that:
+  - after warm-up, repeated dashboard refreshes start no subprocesses; the
+    overview cache file is deleted before every /api/overview request, so
+    each one really recomputes (process_running, read_fresh)
+  - codebase stats match a full recount, and a rescan only re-reads the
+    files whose mtime/size changed
+
+Exits 1 on any failure.
+
+Usage:
+    python scripts/check_system_sampler.py
+    python scripts/check_system_sampler.py --files 3000 --refreshes 50
+"""
+from __future__ import annotations
+
+import argparse
+import builtins
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+ROUTES = [
+    "/api/system/metrics",
+    "/api/system/processes",
+    "/api/system/ports",
+    "/api/system/launchagents",
+    "/api/system/codebase-stats",
+    "/api/overview",
+]
+
+
+def _make_tree(home: Path, n_files: int) -> None:
+    for i in range(n_files):
+        proj = ("polymarket-bot", "shelby", "atlas")[i % 3]
+        path = home / proj / f"pkg{i % 17}" / f"mod{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n" * (i % 40 + 1))
+    (home / "atlas" / "__pycache__").mkdir(exist_ok=True)
+    (home / "atlas" / "__pycache__" / "skip.py").write_text("skipped\n" * 10)
+
+
+STATUS_FILES = ["hawk_status.json", "viper_status.json", "oracle_status.json",
+                "quant_status.json", "quant_results.json"]
+
+
+def _make_data(home: Path, data: Path) -> None:
+    data.mkdir(parents=True, exist_ok=True)
+    for name in STATUS_FILES:
+        (data / name).write_text(json.dumps({"running": False}))
+    for agent_file in ("odin/data/odin_status.json", "thor/data/status.json"):
+        path = home / agent_file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"running": False}))
+
+
+def _full_recount(home: Path, system) -> int:
+    total = 0
+    for dirname in system.BROTHERHOOD_DIRS:
+        for root, dirs, files in os.walk(home / dirname):
+            dirs[:] = [d for d in dirs if d not in system.SKIP_DIRS and not d.startswith(".")]
+            for f in files:
+                if os.path.splitext(f)[1].lower() in system.CODE_EXTENSIONS:
+                    total += Path(root, f).read_bytes().count(b"\n")
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=1500)
+    parser.add_argument("--refreshes", type=int, default=20)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="sampler_"))
+    home, data = root / "home", root / "data"
+    os.environ["HOME"] = str(home)
+    _make_tree(home, args.files)
+    _make_data(home, data)
+
+    from flask import Flask
+    from bot.routes import overview, system
+
+    # Keep the overview cache and status reads out of the repo's data/
+    overview.DATA_DIR = data
+    overview_cache = data / "overview_cache.json"
+
+    app = Flask(__name__)
+    app.register_blueprint(system.system_bp)
+    app.register_blueprint(overview.overview_bp)
+    client = app.test_client()
+    failures = []
+
+    spawned = []
+    real_popen = subprocess.Popen
+
+    class _CountingPopen(real_popen):
+        def __init__(self, cmd, *a, **kw):
+            spawned.append(cmd[0] if isinstance(cmd, (list, tuple)) else cmd)
+            super().__init__(cmd, *a, **kw)
+
+    subprocess.Popen = _CountingPopen
+
+    t0 = time.perf_counter()
+    for route in ROUTES:  # warm-up: each metric probed inline once
+        client.get(route)
+    warm = time.perf_counter() - t0
+    print(f"warm-up:   {warm:.2f}s, {len(spawned)} subprocesses ({', '.join(sorted(set(spawned)))})")
+
+    probes = []
+    real_process_running = overview.process_running
+
+    def _counting_process_running(pattern):
+        probes.append(pattern)
+        return real_process_running(pattern)
+
+    overview.process_running = _counting_process_running
+
+    system.SAMPLE_INTERVALS = {k: (fn, 10**6) for k, (fn, _) in system.SAMPLE_INTERVALS.items()}
+    time.sleep(system._SAMPLER_TICK_S + 0.5)  # let a pending background pass finish
+    spawned.clear()
+    t0 = time.perf_counter()
+    for _ in range(args.refreshes):
+        for route in ROUTES:
+            overview_cache.unlink(missing_ok=True)
+            resp = client.get(route)
+            if resp.status_code != 200:
+                failures.append(f"{route} returned {resp.status_code}")
+    hot = time.perf_counter() - t0
+    print(f"refreshes: {args.refreshes} x {len(ROUTES)} routes in {hot:.2f}s, "
+          f"{len(spawned)} subprocesses")
+    if spawned:
+        failures.append(f"refreshes started subprocesses: {sorted(set(spawned))}")
+    if len(probes) < args.refreshes:
+        failures.append(f"/api/overview recomputed only {len(probes)} times — served from cache?")
+    subprocess.Popen = real_popen
+
+    stats = client.get("/api/system/codebase-stats").get_json()
+    if stats["total_lines"] != _full_recount(home, system):
+        failures.append("codebase line count differs from a full recount")
+
+    reads = []
+    real_open = builtins.open
+
+    def _counting_open(file, mode="r", *a, **kw):
+        if "b" in mode and str(file).startswith(str(home)):
+            reads.append(file)
+        return real_open(file, mode, *a, **kw)
+
+    touched = home / "shelby" / "pkg2" / "mod2.py"
+    touched.write_text("x = 1\n" * 500)
+    builtins.open = _counting_open
+    t0 = time.perf_counter()
+    stats = system._get_codebase_stats()
+    rescan = time.perf_counter() - t0
+    builtins.open = real_open
+    print(f"rescan:    {rescan * 1000:.0f}ms, re-read {len(reads)} of {stats['total_files']} files")
+    if len(reads) != 1:
+        failures.append(f"rescan re-read {len(reads)} files, expected 1")
+    if stats["total_lines"] != _full_recount(home, system):
+        failures.append("line count after edit differs from a full recount")
+
+    for f in failures:
+        print(f"  FAIL {f}")
+    print("OK" if not failures else f"{len(failures)} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
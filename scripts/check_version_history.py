@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Check the quant.live_push version history (append-only log + offset index).
+
+Points the version store at a throwaway directory, migrates a few legacy
+v*.json snapshots, then records 100k synthetic pushes through _save_version()
+and checks that:
+  - legacy snapshots are imported once and keep their version numbers
+  - get_version_history(limit) returns the newest versions, newest first
+  - get_version(v) / rollback(v) return the right snapshot, with its stored
+    diff equal to a fresh _compute_diff() of the same params
+  - lookup latency stays flat as the history grows
+  - a torn index record or orphan log line (crash mid-append) is recovered
+
+Exits 1 on any failure.
+
+Usage:
+    python scripts/check_version_history.py
+    python scripts/check_version_history.py --pushes 20000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quant import live_push
+from quant.live_push import PushValidation
+
+
+def _point_at(root: Path) -> None:
+    live_push.DATA_DIR = root
+    live_push.VERSIONS_DIR = root / "quant_versions"
+    live_push.HISTORY_LOG = live_push.VERSIONS_DIR / "history.jsonl"
+    live_push.HISTORY_INDEX = live_push.VERSIONS_DIR / "history.idx"
+    live_push.HISTORY_LOCK = live_push.VERSIONS_DIR / "history.lock"
+    live_push.GARVES_PARAMS_FILE = root / "quant_live_params.json"
+
+
+def _params(rng: random.Random) -> dict:
+    return {
+        "min_confidence": round(rng.uniform(0.2, 0.4), 2),
+        "min_edge_absolute": round(rng.uniform(0.04, 0.12), 2),
+        "consensus_floor": rng.randint(3, 8),
+    }
+
+
+def _median_us(fn, repeat: int = 200) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pushes", type=int, default=100_000)
+    args = parser.parse_args()
+
+    logging.getLogger("quant").setLevel(logging.ERROR)
+    root = Path(tempfile.mkdtemp(prefix="version_history_"))
+    _point_at(root)
+    failures = []
+    rng = random.Random(7)
+    validation = PushValidation(passed=True, estimated_daily_pnl=1.5)
+
+    # Legacy layout: v0003..v0005 survived the old MAX_VERSIONS pruning
+    live_push.VERSIONS_DIR.mkdir(parents=True)
+    for v in (3, 4, 5):
+        (live_push.VERSIONS_DIR / f"v{v:04d}.json").write_text(json.dumps({
+            "version": v, "applied_at": "legacy", "target": "garves",
+            "previous_params": {"min_confidence": 0.25}, "new_params": {"min_confidence": 0.3},
+            "diff": [{"param": "min_confidence"}],
+        }, indent=2))
+    history = live_push.get_version_history(10)
+    if [h["version"] for h in history] != [5, 4, 3]:
+        failures.append(f"legacy migration gave {[h['version'] for h in history]}")
+
+    checkpoints = {1_000, 10_000, args.pushes}
+    print(f"{'pushes':>8} {'history(10) us':>15} {'get_version us':>15} {'rollback us':>12}")
+    t0 = time.perf_counter()
+    for i in range(1, args.pushes + 1):
+        if i % 500 == 1:  # occasionally change the live params so diffs vary
+            live_push.GARVES_PARAMS_FILE.write_text(json.dumps({"params": _params(rng)}))
+        live_push._save_version(_params(rng), validation, 55.0, 57.5, "garves")
+        if i in checkpoints:
+            latest = 5 + i
+            probe = [rng.randint(6, latest) for _ in range(50)]
+            hist_us = _median_us(lambda: live_push.get_version_history(10))
+            get_us = _median_us(lambda: live_push.get_version(rng.choice(probe)))
+            rb_us = _median_us(lambda: live_push.rollback(rng.choice(probe)), repeat=50)
+            print(f"{i:>8} {hist_us:>15.0f} {get_us:>15.0f} {rb_us:>12.0f}")
+    elapsed = time.perf_counter() - t0
+    size_mb = live_push.HISTORY_LOG.stat().st_size / 1e6
+    print(f"{args.pushes} pushes in {elapsed:.1f}s ({elapsed / args.pushes * 1e6:.0f}us each), "
+          f"log {size_mb:.1f}MB, index {live_push.HISTORY_INDEX.stat().st_size / 1e6:.1f}MB")
+
+    latest = 5 + args.pushes
+    history = live_push.get_version_history(10)
+    if [h["version"] for h in history] != list(range(latest, latest - 10, -1)):
+        failures.append("get_version_history(10) is not the newest 10, newest first")
+    if live_push.get_version()["version"] != latest:
+        failures.append("get_version() is not the latest")
+
+    for v in [4, 6, 7, latest // 2, latest] + [rng.randint(6, latest) for _ in range(200)]:
+        snap = live_push.get_version(v)
+        if snap is None or snap["version"] != v:
+            failures.append(f"get_version({v}) returned {snap and snap['version']}")
+            break
+        if v > 5 and snap["diff"] != live_push._compute_diff(snap["previous_params"], snap["new_params"]):
+            failures.append(f"stored diff for v{v} differs from a fresh diff")
+            break
+    if live_push.get_version(latest + 1) is not None or live_push.get_version(1) is not None:
+        failures.append("lookup of a missing version returned a snapshot")
+
+    v = latest - 1234
+    live_push.rollback(v)
+    live = json.loads(live_push.GARVES_PARAMS_FILE.read_text())
+    if live.get("rollback_from_version") != v or live["params"] != live_push.get_version(v)["previous_params"]:
+        failures.append(f"rollback({v}) did not restore v{v}'s previous params")
+
+    # Crash mid-append: orphan log line + half an index record
+    with open(live_push.HISTORY_LOG, "ab") as f:
+        f.write(b'{"version": 999999999, "orphan": true}\n')
+    with open(live_push.HISTORY_INDEX, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    if live_push.get_version()["version"] != latest:
+        failures.append("torn index tail changed the latest version")
+    new_v = live_push._save_version(_params(rng), validation, 55.0, 57.5, "garves")
+    if new_v != latest + 1 or live_push.get_version(new_v)["version"] != new_v:
+        failures.append(f"append after a torn write gave v{new_v}")
+    if live_push.HISTORY_INDEX.stat().st_size % live_push._INDEX_RECORD.size:
+        failures.append("torn index record was not dropped")
+
+    for f in failures:
+        print(f"  FAIL {f}")
+    print("OK" if not failures else f"{len(failures)} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""LLM Cost Index — incremental aggregates over ~/shared/llm_costs.jsonl.
+
+Every agent appends one JSON line per LLM call to llm_costs.jsonl. Instead of
+each reader (Viper's governor, cost audit, the dashboard) rescanning the file,
+this module tails it from a persisted byte offset and folds new lines into
+rolling aggregates in a small SQLite file:
+
+    hourly  — calls / cost per (hour, agent, model, provider, task_type)
+    totals  — the same without the hour, for all-time pattern analysis
+
+Queries call ingest() first (a stat + read of only the new bytes), then read
+the aggregates, so cost per query no longer grows with the log.
+
+Aggregates survive log compaction: /api/llm/actions/compact-costs calls
+mark_compacted() after rewriting the file. If the file is replaced some other
+way, ingest() notices (inode change or shrink) and replays only lines newer
+than the last ingested timestamp.
+
+Usage:
+    from shared.llm_cost_index import today_costs_by_agent, summary
+
+    today_costs_by_agent()      # {"thor": 1.23, "viper": 0.04, ...}
+    summary(hours=24)           # {"total_calls": .., "total_cost": .., "by_provider": {..}, ...}
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+log = logging.getLogger(__name__)
+
+ET = ZoneInfo("America/New_York")
+
+COSTS_FILE = Path.home() / "shared" / "llm_costs.jsonl"
+DB_PATH = Path.home() / "shared" / "llm_costs_index.db"
+
+_CHUNK_BYTES = 4 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cursor (
+    path TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    last_ts REAL NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS hourly (
+    hour INTEGER NOT NULL,
+    agent TEXT NOT NULL,
+    model TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    task_type TEXT NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (hour, agent, model, provider, task_type)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS totals (
+    agent TEXT NOT NULL,
+    model TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    task_type TEXT NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (agent, model, provider, task_type)
+) WITHOUT ROWID;
+"""
+
+_local = threading.local()
+
+
+def _conn() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(DB_PATH), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _local.conn = conn
+    return conn
+
+
+@contextmanager
+def _transaction():
+    conn = _conn()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+# ── Record parsing ──────────────────────────────────────────────────
+
+def _record_ts(rec: dict) -> float:
+    """Epoch seconds for a cost record. Naive ISO timestamps are ET (as the agents write them)."""
+    ts = rec.get("ts") or rec.get("timestamp") or 0
+    if isinstance(ts, (int, float)):
+        return float(ts)
+    try:
+        dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
+    except ValueError:
+        return 0.0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=ET)
+    return dt.timestamp()
+
+
+def _record_cost(rec: dict) -> float:
+    cost = rec.get("cost_usd", rec.get("cost", 0))
+    return float(cost) if isinstance(cost, (int, float)) else 0.0
+
+
+def _fold(lines: list[bytes], min_ts: float = 0.0) -> tuple[dict, float]:
+    """Aggregate raw lines into {(hour, agent, model, provider, task_type): [calls, cost]}."""
+    agg: dict[tuple, list] = {}
+    last_ts = 0.0
+    now = time.time()
+    for raw in lines:
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            rec = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if not isinstance(rec, dict):
+            continue
+        ts = _record_ts(rec) or now
+        if ts <= min_ts:
+            continue
+        last_ts = max(last_ts, ts)
+        key = (
+            int(ts // 3600),
+            str(rec.get("agent", "unknown")),
+            str(rec.get("model", "unknown")),
+            str(rec.get("provider", "")),
+            str(rec.get("task_type", "unknown")),
+        )
+        slot = agg.setdefault(key, [0, 0.0])
+        slot[0] += 1
+        slot[1] += _record_cost(rec)
+    return agg, last_ts
+
+
+def _apply(conn: sqlite3.Connection, agg: dict) -> None:
+    conn.executemany(
+        """INSERT INTO hourly (hour, agent, model, provider, task_type, calls, cost)
+           VALUES (?, ?, ?, ?, ?, ?, ?)
+           ON CONFLICT(hour, agent, model, provider, task_type)
+           DO UPDATE SET calls = calls + excluded.calls, cost = cost + excluded.cost""",
+        [(*key, calls, cost) for key, (calls, cost) in agg.items()],
+    )
+    totals: dict[tuple, list] = {}
+    for key, (calls, cost) in agg.items():
+        slot = totals.setdefault(key[1:], [0, 0.0])
+        slot[0] += calls
+        slot[1] += cost
+    conn.executemany(
+        """INSERT INTO totals (agent, model, provider, task_type, calls, cost)
+           VALUES (?, ?, ?, ?, ?, ?)
+           ON CONFLICT(agent, model, provider, task_type)
+           DO UPDATE SET calls = calls + excluded.calls, cost = cost + excluded.cost""",
+        [(*key, calls, cost) for key, (calls, cost) in totals.items()],
+    )
+
+
+# ── Tailing ─────────────────────────────────────────────────────────
+
+def ingest(path: Path | None = None) -> int:
+    """Fold any complete lines appended since the last call. Returns lines consumed."""
+    path = path or COSTS_FILE
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return 0
+
+    with _transaction() as conn:
+        row = conn.execute(
+            "SELECT inode, offset, last_ts FROM cursor WHERE path = ?", (str(path),)
+        ).fetchone()
+        offset, last_ts, min_ts = 0, 0.0, 0.0
+        if row:
+            offset, last_ts = row["offset"], row["last_ts"]
+            if row["inode"] != st.st_ino or st.st_size < offset:
+                # Rewritten behind our back — replay only what we haven't counted
+                log.info("[LLM_COSTS] %s was replaced; replaying entries after %.0f", path.name, last_ts)
+                offset, min_ts = 0, last_ts
+        if st.st_size == offset:
+            return 0
+
+        consumed = 0
+        with open(path, "rb") as f:
+            f.seek(offset)
+            while True:
+                chunk = f.read(_CHUNK_BYTES)
+                if not chunk:
+                    break
+                end = chunk.rfind(b"\n")
+                if end < 0:
+                    if len(chunk) < _CHUNK_BYTES:
+                        break  # partial trailing line — wait for the writer to finish it
+                    f.seek(offset)
+                    chunk = f.read()  # pathological single huge line
+                    end = chunk.rfind(b"\n")
+                    if end < 0:
+                        break
+                lines = chunk[:end].split(b"\n")
+                agg, chunk_ts = _fold(lines, min_ts)
+                _apply(conn, agg)
+                last_ts = max(last_ts, chunk_ts)
+                consumed += len(lines)
+                offset += end + 1
+                f.seek(offset)
+
+        conn.execute(
+            """INSERT INTO cursor (path, inode, offset, last_ts) VALUES (?, ?, ?, ?)
+               ON CONFLICT(path) DO UPDATE SET inode = excluded.inode,
+                   offset = excluded.offset, last_ts = excluded.last_ts""",
+            (str(path), st.st_ino, offset, last_ts),
+        )
+    return consumed
+
+
+def mark_compacted(path: Path | None = None) -> None:
+    """Point the cursor at the end of a just-compacted file (its lines are already counted)."""
+    path = path or COSTS_FILE
+    st = path.stat()
+    with _transaction() as conn:
+        conn.execute(
+            """INSERT INTO cursor (path, inode, offset, last_ts) VALUES (?, ?, ?, 0)
+               ON CONFLICT(path) DO UPDATE SET inode = excluded.inode, offset = excluded.offset""",
+            (str(path), st.st_ino, st.st_size),
+        )
+
+
+# ── Queries ─────────────────────────────────────────────────────────
+
+def costs_by_agent(since_ts: float) -> dict[str, float]:
+    """Sum cost by agent over hours starting at or after since_ts."""
+    ingest()
+    rows = _conn().execute(
+        "SELECT agent, SUM(cost) AS cost FROM hourly WHERE hour >= ? GROUP BY agent",
+        (int(since_ts // 3600),),
+    ).fetchall()
+    return {r["agent"]: r["cost"] for r in rows}
+
+
+def today_costs_by_agent() -> dict[str, float]:
+    """Cost by agent since midnight ET."""
+    midnight = datetime.now(ET).replace(hour=0, minute=0, second=0, microsecond=0)
+    return costs_by_agent(midnight.timestamp())
+
+
+def summary(hours: int = 24) -> dict:
+    """Calls and cost over the last N hours, broken down by provider, agent and model."""
+    ingest()
+    cutoff = int(time.time() // 3600) - hours + 1
+    rows = _conn().execute(
+        """SELECT agent, model, provider, SUM(calls) AS calls, SUM(cost) AS cost
+           FROM hourly WHERE hour >= ? GROUP BY agent, model, provider""",
+        (cutoff,),
+    ).fetchall()
+
+    out: dict = {"hours": hours, "total_calls": 0, "total_cost": 0.0,
+                 "by_provider": {}, "by_agent": {}, "by_model": {}}
+    for r in rows:
+        out["total_calls"] += r["calls"]
+        out["total_cost"] += r["cost"]
+        for bucket, name in (("by_provider", r["provider"] or "unknown"),
+                             ("by_agent", r["agent"]), ("by_model", r["model"])):
+            slot = out[bucket].setdefault(name, {"calls": 0, "cost": 0.0})
+            slot["calls"] += r["calls"]
+            slot["cost"] += r["cost"]
+
+    out["total_cost"] = round(out["total_cost"], 6)
+    for bucket in ("by_provider", "by_agent", "by_model"):
+        for slot in out[bucket].values():
+            slot["cost"] = round(slot["cost"], 6)
+    return out
+
+
+def totals() -> list[dict]:
+    """All-time calls and cost per (agent, model, provider, task_type), compaction included."""
+    ingest()
+    rows = _conn().execute(
+        "SELECT agent, model, provider, task_type, calls, cost FROM totals"
+    ).fetchall()
+    return [dict(r) for r in rows]
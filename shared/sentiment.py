@@ -4,7 +4,14 @@ Uses ProsusAI/finbert (fine-tuned BERT for financial text) to score
 news headlines and articles without burning cloud API tokens.
 
 Runs on CPU (Apple Silicon MPS when available). Model cached after
-first load (~500MB download, then instant).
+first load (~500MB download, then instant). Set FINBERT_BACKEND=int8 to
+run an int8-quantized ONNX Runtime copy instead (CPU boxes without a GPU);
+it falls back to the float pipeline if onnxruntime/optimum are missing.
+
+Results are cached by content hash in data/finbert_cache.db, so headlines
+re-polled every cycle are inferred once. score_batch also dedups within a
+batch and feeds the model length-sorted texts so each padded batch holds
+similar-length headlines.
 
 Usage:
     from shared.sentiment import score_headline, score_batch
@@ -16,46 +23,210 @@ Usage:
 """
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import json
 import logging
-from functools import lru_cache
+import os
+import platform
+import sqlite3
+import threading
+import time
+from pathlib import Path
 
 log = logging.getLogger(__name__)
 
+MODEL_ID = "ProsusAI/finbert"
+CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "finbert_cache.db"
+CACHE_TTL = 30 * 86400  # Cached scores older than this are re-inferred (and pruned)
+MAX_CHARS = 512
+
+# "float" (transformers, default) or "int8" (ONNX Runtime dynamic quantization, CPU)
+BACKEND = os.getenv("FINBERT_BACKEND", "float").strip().lower()
+INT8_DIR = CACHE_PATH.parent / "models" / "finbert-int8"
+
 _pipeline = None
 _load_attempted = False
+_active_backend = ""
+
+_cache_local = threading.local()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _int8_available() -> bool:
+    return all(importlib.util.find_spec(m) is not None for m in ("onnxruntime", "optimum"))
+
+
+def configured_backend() -> str:
+    """Backend scoring will use: "int8" only if requested and its runtime is installed."""
+    if _active_backend:
+        return _active_backend
+    if BACKEND == "int8" and _int8_available():
+        return "int8"
+    return "float"
+
+
+def _build_float_pipeline():
+    from transformers import pipeline
+    import torch
+
+    # Use MPS (Apple Silicon GPU) if available, else CPU
+    device = "mps" if torch.backends.mps.is_available() else "cpu"
+    log.info("Loading FinBERT model (device=%s)...", device)
+
+    pipe = pipeline(
+        "sentiment-analysis",
+        model=MODEL_ID,
+        device=device,
+        truncation=True,
+        max_length=512,
+    )
+    log.info("FinBERT loaded successfully on %s", device)
+    return pipe
+
+
+def _build_int8_pipeline():
+    """FinBERT exported to ONNX and dynamically quantized to int8 (CPU).
+
+    Export + quantization runs once; the quantized model is reused from INT8_DIR.
+    """
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer, pipeline
+
+    model_file = INT8_DIR / "model_quantized.onnx"
+    if not model_file.exists():
+        log.info("Exporting FinBERT to ONNX and quantizing to int8 (one-time)...")
+        fp32_dir = INT8_DIR / "fp32"
+        ORTModelForSequenceClassification.from_pretrained(MODEL_ID, export=True).save_pretrained(fp32_dir)
+        if platform.machine().lower() in ("arm64", "aarch64"):
+            qconfig = AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+        else:
+            qconfig = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+        ORTQuantizer.from_pretrained(fp32_dir).quantize(save_dir=INT8_DIR, quantization_config=qconfig)
+        AutoTokenizer.from_pretrained(MODEL_ID).save_pretrained(INT8_DIR)
+
+    model = ORTModelForSequenceClassification.from_pretrained(INT8_DIR, file_name=model_file.name)
+    pipe = pipeline(
+        "sentiment-analysis",
+        model=model,
+        tokenizer=AutoTokenizer.from_pretrained(INT8_DIR),
+        truncation=True,
+        max_length=512,
+    )
+    log.info("FinBERT int8 (onnxruntime) loaded from %s", INT8_DIR)
+    return pipe
 
 
 def _get_pipeline():
-    """Lazy-load FinBERT pipeline. Cached after first call."""
-    global _pipeline, _load_attempted
+    """Lazy-load FinBERT pipeline. Cached after first call.
+
+    FINBERT_BACKEND=int8 selects the quantized ONNX Runtime backend; if
+    onnxruntime/optimum aren't installed or the export fails, the float
+    transformers pipeline is used instead.
+    """
+    global _pipeline, _load_attempted, _active_backend
     if _pipeline is not None:
         return _pipeline
     if _load_attempted:
         return None  # Already failed, don't retry this session
 
     _load_attempted = True
+    if BACKEND == "int8":
+        if not _int8_available():
+            log.info("FINBERT_BACKEND=int8 but onnxruntime/optimum not installed — using float pipeline")
+        else:
+            try:
+                _pipeline = _build_int8_pipeline()
+                _active_backend = "int8"
+                return _pipeline
+            except Exception:
+                log.exception("FinBERT int8 backend failed — falling back to float pipeline")
+
     try:
-        from transformers import pipeline
-        import torch
-
-        # Use MPS (Apple Silicon GPU) if available, else CPU
-        device = "mps" if torch.backends.mps.is_available() else "cpu"
-        log.info("Loading FinBERT model (device=%s)...", device)
-
-        _pipeline = pipeline(
-            "sentiment-analysis",
-            model="ProsusAI/finbert",
-            device=device,
-            truncation=True,
-            max_length=512,
-        )
-        log.info("FinBERT loaded successfully on %s", device)
+        _pipeline = _build_float_pipeline()
+        _active_backend = "float"
         return _pipeline
     except Exception:
         log.exception("Failed to load FinBERT — sentiment scoring disabled")
         return None
 
 
+# ── Result cache ────────────────────────────────────────────────────
+
+def _cache_conn() -> sqlite3.Connection | None:
+    conn = getattr(_cache_local, "conn", None)
+    if conn is None:
+        try:
+            CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(CACHE_PATH), timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL, ts REAL NOT NULL)"
+            )
+            conn.execute("DELETE FROM results WHERE ts < ?", (time.time() - CACHE_TTL,))
+        except sqlite3.Error:
+            log.warning("FinBERT result cache unavailable at %s", CACHE_PATH)
+            return None
+        _cache_local.conn = conn
+    return conn
+
+
+def _cache_key(text: str) -> str:
+    # Backend is part of the key — int8 scores differ slightly from float
+    return hashlib.sha1(f"{MODEL_ID}\0{configured_backend()}\0{text}".encode()).hexdigest()
+
+
+def _cache_get(keys: list[str]) -> dict[str, dict]:
+    conn = _cache_conn()
+    if conn is None or not keys:
+        return {}
+    found: dict[str, dict] = {}
+    cutoff = time.time() - CACHE_TTL
+    for i in range(0, len(keys), 500):  # stay under SQLite's variable limit
+        chunk = keys[i:i + 500]
+        rows = conn.execute(
+            f"SELECT key, result FROM results WHERE ts >= ? AND key IN ({','.join('?' * len(chunk))})",
+            (cutoff, *chunk),
+        ).fetchall()
+        found.update((k, json.loads(r)) for k, r in rows)
+    return found
+
+
+def _cache_put(items: dict[str, dict]) -> None:
+    conn = _cache_conn()
+    if conn is None or not items:
+        return
+    now = time.time()
+    try:
+        conn.executemany(
+            "INSERT OR REPLACE INTO results (key, result, ts) VALUES (?, ?, ?)",
+            [(k, json.dumps(v), now) for k, v in items.items()],
+        )
+    except sqlite3.Error:
+        log.debug("FinBERT cache write failed")
+
+
+def cache_stats() -> dict:
+    """Hit/miss counts for this process."""
+    total = _cache_stats["hits"] + _cache_stats["misses"]
+    return {**_cache_stats, "hit_rate": round(_cache_stats["hits"] / total, 4) if total else 0.0}
+
+
+def _to_result(scores: list[dict]) -> dict:
+    probs = {s["label"]: round(s["score"], 4) for s in scores}
+    top = max(scores, key=lambda s: s["score"])
+    return {
+        "label": top["label"],
+        "score": round(top["score"], 4),
+        "positive": probs.get("positive", 0),
+        "negative": probs.get("negative", 0),
+        "neutral": probs.get("neutral", 0),
+    }
+
+
+# ── Scoring ─────────────────────────────────────────────────────────
+
 def score_headline(text: str) -> dict | None:
     """Score a single headline/text.
 
@@ -65,61 +236,67 @@ def score_headline(text: str) -> dict | None:
          "positive": float, "negative": float, "neutral": float}
         or None if model unavailable.
     """
+    text = text[:MAX_CHARS]
+    key = _cache_key(text)
+    cached = _cache_get([key])
+    if key in cached:
+        _cache_stats["hits"] += 1
+        return cached[key]
+
     pipe = _get_pipeline()
     if pipe is None:
         return None
 
     try:
         # top_k=None returns all class scores
-        all_scores = pipe(text[:512], top_k=None)
-        probs = {s["label"]: round(s["score"], 4) for s in all_scores}
-
-        # Top label
-        top = max(all_scores, key=lambda s: s["score"])
-
-        return {
-            "label": top["label"],
-            "score": round(top["score"], 4),
-            "positive": probs.get("positive", 0),
-            "negative": probs.get("negative", 0),
-            "neutral": probs.get("neutral", 0),
-        }
+        result = _to_result(pipe(text, top_k=None))
     except Exception:
         log.debug("FinBERT scoring failed for: %s", text[:50])
         return None
 
+    _cache_stats["misses"] += 1
+    _cache_put({_cache_key(text): result})  # re-keyed: backend is only final once loaded
+    return result
+
 
 def score_batch(texts: list[str], batch_size: int = 16) -> list[dict]:
     """Score a batch of headlines. Returns list of result dicts.
 
+    Cached and duplicate texts are inferred at most once; the rest run
+    shortest-first so each model batch pads to a similar length.
+
     Missing/failed entries are returned as
     {"label": "neutral", "score": 0.5, "positive": 0, "negative": 0, "neutral": 1}.
     """
-    pipe = _get_pipeline()
-    if pipe is None:
-        return [_neutral() for _ in texts]
+    truncated = [t[:MAX_CHARS] for t in texts]
+    keys = [_cache_key(t) for t in truncated]
+    unique = dict(zip(keys, truncated))  # in-batch dedup
 
-    try:
-        truncated = [t[:512] for t in texts]
-
-        # Batch inference with all scores
-        batch_results = pipe(truncated, batch_size=batch_size, top_k=None)
-
-        output = []
-        for scores in batch_results:
-            probs = {s["label"]: round(s["score"], 4) for s in scores}
-            top = max(scores, key=lambda s: s["score"])
-            output.append({
-                "label": top["label"],
-                "score": round(top["score"], 4),
-                "positive": probs.get("positive", 0),
-                "negative": probs.get("negative", 0),
-                "neutral": probs.get("neutral", 0),
-            })
-        return output
-    except Exception:
-        log.exception("FinBERT batch scoring failed")
-        return [_neutral() for _ in texts]
+    results = _cache_get(list(unique))
+    todo = [(k, t) for k, t in unique.items() if k not in results]
+    # Every position not needing its own inference counts as a hit (cache or in-batch dup)
+    _cache_stats["misses"] += len(todo)
+    _cache_stats["hits"] += len(keys) - len(todo)
+
+    if todo:
+        pipe = _get_pipeline()
+        if pipe is None:
+            return [results.get(k) or _neutral() for k in keys]
+
+        # Length buckets: sorted input means each batch_size slice pads to a near-equal length
+        todo.sort(key=lambda kt: len(kt[1]))
+        try:
+            batch_results = pipe([t for _, t in todo], batch_size=batch_size, top_k=None)
+            fresh = {k: _to_result(scores) for (k, _), scores in zip(todo, batch_results)}
+        except Exception:
+            log.exception("FinBERT batch scoring failed")
+            fresh = {}
+        # Keys were built before the model loaded; store under the backend that
+        # actually scored, since an int8 request can fall back to float.
+        _cache_put({_cache_key(t): fresh[k] for k, t in todo if k in fresh})
+        results.update(fresh)
+
+    return [results.get(k) or _neutral() for k in keys]
 
 
 def sentiment_to_float(result: dict) -> float:
@@ -473,44 +473,31 @@ LLM_COSTS_FILE = Path(os.path.expanduser("~/shared/llm_costs.jsonl"))
 
 
 def analyze_llm_call_patterns() -> list[dict]:
-    """Analyze ~/shared/llm_costs.jsonl for optimization opportunities.
+    """Analyze ~/shared/llm_costs.jsonl (via shared.llm_cost_index) for optimization opportunities.
 
     Groups by agent + task_type, flags:
     - Agents using expensive models for 'fast' tasks
     - High-volume patterns that could use local LLM
     Returns list of optimization recommendations with estimated savings.
     """
-    if not LLM_COSTS_FILE.exists():
-        return []
-
-    # Parse JSONL
-    entries = []
+    # All-time per-(agent, model, provider, task_type) counts from the incremental index
     try:
-        with open(LLM_COSTS_FILE) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        entries.append(json.loads(line))
-                    except Exception:
-                        pass
+        from shared.llm_cost_index import totals
+        rows = totals()
     except Exception:
-        log.exception("Failed to read LLM costs file")
+        log.exception("Failed to read LLM cost index")
         return []
 
-    if not entries:
+    if not rows:
         return []
 
     # Group by agent + task_type + model
     from collections import defaultdict
     groups = defaultdict(lambda: {"count": 0, "models": defaultdict(int)})
-    for e in entries:
-        agent = e.get("agent", "unknown")
-        task_type = e.get("task_type", "unknown")
-        model = e.get("model", "unknown")
-        key = f"{agent}:{task_type}"
-        groups[key]["count"] += 1
-        groups[key]["models"][model] += 1
+    for r in rows:
+        key = f"{r['agent']}:{r['task_type']}"
+        groups[key]["count"] += r["calls"]
+        groups[key]["models"][r["model"]] += r["calls"]
 
     recommendations = []
 
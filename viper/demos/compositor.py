@@ -1,6 +1,23 @@
-"""Compositor — Video + audio compositing for demo videos."""
+"""Compositor — Video + audio compositing for demo videos.
+
+The expensive part of a composite is the libx264 encode of the picture.
+That is rendered once per (recording content, layout, profile) into a
+video-only segment under RENDER_CACHE_DIR; the deliverable MP4 is then a
+stream-copy concat/mux of cached segments with the voiceover (only the
+audio is encoded). Re-rendering after a voiceover change, or for another
+business reusing the same recording, skips the video encode entirely.
+
+Profiles: "final" (libx264 medium, the shipped quality) and "draft"
+(ultrafast, lower quality) for verification runs. Draft deliverables get a
+"_draft" filename suffix so they never overwrite a final cut.
+"""
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
 from pathlib import Path
 
 from moviepy import (
@@ -15,38 +32,143 @@ from moviepy import (
 _FONT_BOLD = "/System/Library/Fonts/Supplemental/Arial Bold.ttf"
 _FONT_REGULAR = "/System/Library/Fonts/Supplemental/Arial.ttf"
 
+RENDER_CACHE_DIR = Path.home() / "polymarket-bot" / "data" / "demos" / "render_cache"
+RENDER_CACHE_MAX_SEGMENTS = 24
+
+# Bump when layout code below changes so stale segments aren't reused
+_LAYOUT_VERSION = 1
+
+RENDER_PROFILES: dict[str, dict] = {
+    "final": {"preset": "medium", "ffmpeg_params": [], "suffix": ""},
+    "draft": {"preset": "ultrafast", "ffmpeg_params": ["-crf", "30"], "suffix": "_draft"},
+}
+
+
+def _ffmpeg_exe() -> str:
+    try:
+        from imageio_ffmpeg import get_ffmpeg_exe  # ships with moviepy
+        return get_ffmpeg_exe()
+    except Exception:
+        return "ffmpeg"
+
+
+def output_path(output_dir: Path, layout: str, profile: str) -> Path:
+    """Deliverable MP4 path for a layout ("horizontal"/"vertical") and profile."""
+    return output_dir / f"dental_demo_{layout}{RENDER_PROFILES[profile]['suffix']}.mp4"
+
+
+def _file_hash(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _segment_key(video_path: Path, layout: str, profile: str, **params) -> str:
+    spec = {"src": _file_hash(video_path), "layout": layout, "profile": profile,
+            "version": _LAYOUT_VERSION, **params}
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:24]
+
+
+def _prune_cache() -> None:
+    segments = sorted(RENDER_CACHE_DIR.glob("*.mp4"), key=lambda p: p.stat().st_mtime)
+    for old in segments[:-RENDER_CACHE_MAX_SEGMENTS]:
+        old.unlink(missing_ok=True)
+        old.with_suffix(".json").unlink(missing_ok=True)
+
+
+def _cached_segment(key: str, render) -> tuple[Path, float]:
+    """Return (segment path, duration) for key, rendering it on a miss.
+
+    render(out_path) must write a video-only MP4 and return its duration.
+    """
+    RENDER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    seg = RENDER_CACHE_DIR / f"{key}.mp4"
+    meta = seg.with_suffix(".json")
+    if seg.exists() and meta.exists():
+        try:
+            duration = json.loads(meta.read_text())["duration"]
+            os.utime(seg)  # LRU touch
+            print(f"  [compositor] Reusing cached segment {key[:8]}")
+            return seg, duration
+        except (json.JSONDecodeError, KeyError):
+            pass
+
+    tmp = RENDER_CACHE_DIR / f"{key}.{os.getpid()}.tmp.mp4"
+    duration = render(tmp)
+    os.replace(tmp, seg)
+    meta.write_text(json.dumps({"duration": duration}))
+    _prune_cache()
+    return seg, duration
+
+
+def _encode(clip, out_path: Path, profile: str) -> float:
+    """Encode a video-only segment with the given profile. Returns its duration."""
+    settings = RENDER_PROFILES[profile]
+    clip.without_audio().write_videofile(
+        str(out_path),
+        fps=30,
+        codec="libx264",
+        audio=False,
+        preset=settings["preset"],
+        ffmpeg_params=list(settings["ffmpeg_params"]),
+        logger=None,
+    )
+    return clip.duration
+
+
+def _mux(segments: list[Path], audio_path: Path, out_path: Path, duration: float) -> None:
+    """Stream-copy the video segments (concatenated if several) and add the voiceover."""
+    with tempfile.TemporaryDirectory(prefix="compositor_") as tmp:
+        if len(segments) == 1:
+            video_input = ["-i", str(segments[0])]
+        else:
+            listing = Path(tmp) / "segments.txt"
+            listing.write_text("".join(f"file '{s}'\n" for s in segments))
+            video_input = ["-f", "concat", "-safe", "0", "-i", str(listing)]
+        cmd = [
+            _ffmpeg_exe(), "-y", "-loglevel", "error",
+            *video_input,
+            "-i", str(audio_path),
+            "-map", "0:v:0", "-map", "1:a:0",
+            "-c:v", "copy", "-c:a", "aac",
+            "-t", f"{duration:.3f}",
+            "-movflags", "+faststart",
+            str(out_path),
+        ]
+        subprocess.run(cmd, check=True, capture_output=True)
+
 
 def composite_horizontal(
     video_path: Path,
     audio_path: Path,
     output_dir: Path,
+    profile: str = "final",
 ) -> Path:
     """Composite horizontal (1920x1080) screen recording with voiceover."""
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    video = VideoFileClip(str(video_path))
     audio = AudioFileClip(str(audio_path))
-
     target_duration = audio.duration + 2.0
-    if video.duration > target_duration:
-        video = video.subclipped(0, target_duration)
+    audio.close()
 
-    print("  [compositor] Exporting horizontal (1920x1080)...")
-    final = video.with_audio(audio)
-    h_path = output_dir / "dental_demo_horizontal.mp4"
+    def render(out: Path) -> float:
+        print(f"  [compositor] Encoding horizontal (1920x1080, {profile})...")
+        video = VideoFileClip(str(video_path))
+        try:
+            return _encode(video, out, profile)
+        finally:
+            video.close()
 
-    final.write_videofile(
-        str(h_path),
-        fps=30,
-        codec="libx264",
-        audio_codec="aac",
-        preset="medium",
-        ffmpeg_params=["-movflags", "+faststart"],
-        logger=None,
+    segment, seg_duration = _cached_segment(
+        _segment_key(video_path, "horizontal", profile), render,
     )
 
-    video.close()
-    audio.close()
+    print("  [compositor] Exporting horizontal (1920x1080)...")
+    h_path = output_path(output_dir, "horizontal", profile)
+    _mux([segment], audio_path, h_path, min(seg_duration, target_duration))
+
     print(f"  [compositor] Horizontal: {h_path}")
     return h_path
 
@@ -56,6 +178,7 @@ def composite_vertical(
     audio_path: Path,
     output_dir: Path,
     business_name: str,
+    profile: str = "final",
 ) -> Path:
     """Composite vertical (1080x1920) from mobile recording.
 
@@ -64,53 +187,48 @@ def composite_vertical(
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    video = VideoFileClip(str(video_path))
     audio = AudioFileClip(str(audio_path))
-
     target_duration = audio.duration + 2.0
-    if video.duration > target_duration:
-        video = video.subclipped(0, target_duration)
-
-    print("  [compositor] Exporting vertical (1080x1920)...")
+    audio.close()
 
     v_width = 1080
     total_h = 1920
 
-    # Scale mobile recording to fill width
-    scaled = video.resized(width=v_width)
-
-    if scaled.h >= total_h:
-        # Recording is taller than 1920 — crop from top to keep chat visible
-        # (chat is the main content, hero header is less important)
-        crop_top = scaled.h - total_h
-        scaled = scaled.cropped(x1=0, y1=crop_top, x2=v_width, y2=scaled.h)
-    else:
-        # Recording is shorter — center vertically on black background
-        bg = ColorClip(
-            size=(v_width, total_h),
-            color=(248, 250, 252),
-        ).with_duration(scaled.duration)
-        y_offset = (total_h - scaled.h) // 2
-        scaled = CompositeVideoClip(
-            [bg, scaled.with_position((0, y_offset))],
-            size=(v_width, total_h),
-        )
-
-    final = scaled.with_audio(audio)
-    v_path = output_dir / "dental_demo_vertical.mp4"
-
-    final.write_videofile(
-        str(v_path),
-        fps=30,
-        codec="libx264",
-        audio_codec="aac",
-        preset="medium",
-        ffmpeg_params=["-movflags", "+faststart"],
-        logger=None,
+    def render(out: Path) -> float:
+        print(f"  [compositor] Encoding vertical (1080x1920, {profile})...")
+        video = VideoFileClip(str(video_path))
+        try:
+            # Scale mobile recording to fill width
+            scaled = video.resized(width=v_width)
+
+            if scaled.h >= total_h:
+                # Recording is taller than 1920 — crop from top to keep chat visible
+                # (chat is the main content, hero header is less important)
+                crop_top = scaled.h - total_h
+                scaled = scaled.cropped(x1=0, y1=crop_top, x2=v_width, y2=scaled.h)
+            else:
+                # Recording is shorter — center vertically on black background
+                bg = ColorClip(
+                    size=(v_width, total_h),
+                    color=(248, 250, 252),
+                ).with_duration(scaled.duration)
+                y_offset = (total_h - scaled.h) // 2
+                scaled = CompositeVideoClip(
+                    [bg, scaled.with_position((0, y_offset))],
+                    size=(v_width, total_h),
+                )
+            return _encode(scaled, out, profile)
+        finally:
+            video.close()
+
+    segment, seg_duration = _cached_segment(
+        _segment_key(video_path, "vertical", profile, width=v_width, height=total_h), render,
     )
 
-    video.close()
-    audio.close()
+    print("  [compositor] Exporting vertical (1080x1920)...")
+    v_path = output_path(output_dir, "vertical", profile)
+    _mux([segment], audio_path, v_path, min(seg_duration, target_duration))
+
     print(f"  [compositor] Vertical: {v_path}")
     return v_path
 
@@ -121,6 +239,7 @@ def composite(
     output_dir: Path,
     business_name: str,
     vertical_video_path: Path | None = None,
+    profile: str = "final",
 ) -> tuple[Path, Path]:
     """Composite both horizontal and vertical demo videos.
 
@@ -130,11 +249,12 @@ def composite(
         output_dir: directory for output MP4 files
         business_name: name shown on vertical video header
         vertical_video_path: separate mobile recording (390x844 WebM)
+        profile: "final" or "draft" (fast encode for verification runs)
 
     Returns:
         tuple of (horizontal_mp4_path, vertical_mp4_path)
     """
-    h_path = composite_horizontal(video_path, audio_path, output_dir)
+    h_path = composite_horizontal(video_path, audio_path, output_dir, profile)
     v_source = vertical_video_path if vertical_video_path else video_path
-    v_path = composite_vertical(v_source, audio_path, output_dir, business_name)
+    v_path = composite_vertical(v_source, audio_path, output_dir, business_name, profile)
     return h_path, v_path
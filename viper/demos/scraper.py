@@ -3,12 +3,16 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
+from viper.http_cache import cached_get, normalize_url
+
 log = logging.getLogger(__name__)
 
 _HEADERS = {
@@ -18,12 +22,19 @@ _HEADERS = {
     )
 }
 _TIMEOUT = 15
+MAX_SUBPAGES = 6
+SUBPAGE_WORKERS = 6
+MAX_CONNECTIONS_PER_HOST = 3  # politeness cap, shared by every scrape in the process
 _SUBPAGE_KEYWORDS = ["about", "services", "contact", "faq", "team", "staff",
                      "insurance", "listings", "agents", "hours", "meet",
                      # Dental/medical — emails often hide on these pages
                      "patient-forms", "new-patients", "new-patient", "appointments",
                      "forms", "billing", "referral", "providers", "doctors"]
 
+# host -> [semaphore, holders + waiters]; dropped when the count returns to 0
+_host_slots: dict[str, list] = {}
+_host_slots_lock = threading.Lock()
+
 
 @dataclass
 class ScrapedBusiness:
@@ -84,16 +95,20 @@ class ScrapedBusiness:
         return min(score, 100)
 
 
-def scrape_business(url: str, niche: str = "auto") -> ScrapedBusiness:
-    """Scrape a business website and extract structured data."""
+def scrape_business(url: str, niche: str = "auto", html: str = "") -> ScrapedBusiness:
+    """Scrape a business website and extract structured data.
+
+    If ``html`` is given it is used as the homepage body instead of fetching
+    it again (callers that already downloaded the page share one fetch).
+    """
     biz = ScrapedBusiness(url=url)
 
-    # Fetch homepage (also capture raw HTML for chatbot detection)
-    biz.raw_html = _fetch_raw_html(url)
-    homepage_soup = _fetch_page(url)
-    if homepage_soup is None:
+    # Fetch homepage once — the same body serves chatbot detection and parsing
+    biz.raw_html = html or _fetch_raw_html(url)
+    if not biz.raw_html:
         log.warning("Could not fetch homepage: %s", url)
         return biz
+    homepage_soup = BeautifulSoup(biz.raw_html, "html.parser")
 
     homepage_text = homepage_soup.get_text(" ", strip=True)
     biz.text_chars = len(homepage_text)
@@ -113,22 +128,22 @@ def scrape_business(url: str, niche: str = "auto") -> ScrapedBusiness:
     _extract_brand_color(homepage_soup, biz)
     _extract_tagline(homepage_soup, biz)
     _extract_description(homepage_soup, biz)
+    _extract_address(homepage_soup, "", biz)  # schema.org only; text pass below
 
     # Contact form fallback
     if not biz.email:
         biz.contact_form_url = _find_contact_form_url(homepage_soup, url)
 
-    # Discover and scrape subpages
-    subpage_urls = _discover_subpages(homepage_soup, url)
-    all_text = homepage_text
+    # Discover and scrape subpages (fetched concurrently, kept in link order)
+    page_texts = [homepage_text]
+    subpage_urls = _discover_subpages(homepage_soup, url)[:MAX_SUBPAGES]
 
-    for sub_url in subpage_urls[:6]:
-        sub_soup = _fetch_page(sub_url)
+    for sub_soup in _fetch_pages(subpage_urls):
         if sub_soup is None:
             continue
         biz.pages_scraped += 1
         sub_text = sub_soup.get_text(" ", strip=True)
-        all_text += " " + sub_text
+        page_texts.append(sub_text)
         biz.text_chars += len(sub_text)
 
         # Extract contact from subpages too
@@ -136,10 +151,12 @@ def scrape_business(url: str, niche: str = "auto") -> ScrapedBusiness:
         _extract_faq(sub_soup, biz)
         _extract_team(sub_soup, sub_text, biz)
 
-    # Extract niche-specific data from all text
+    # Extract niche-specific data from all text. Extractors with ranked
+    # patterns try each pattern across the whole site before the next one.
+    all_text = " ".join(page_texts)
     _extract_services(all_text, biz)
     _extract_hours(all_text, biz)
-    _extract_address(homepage_soup, all_text, biz)
+    _extract_address(None, all_text, biz)
     _extract_payment_methods(all_text, biz)
     _extract_new_patient_info(all_text, biz)
     _extract_emergency_info(all_text, biz)
@@ -164,24 +181,53 @@ def scrape_business(url: str, niche: str = "auto") -> ScrapedBusiness:
 
 def _fetch_page(url: str) -> BeautifulSoup | None:
     """Fetch and parse a single page."""
-    try:
-        resp = requests.get(url, headers=_HEADERS, timeout=_TIMEOUT, allow_redirects=True)
-        resp.raise_for_status()
-        return BeautifulSoup(resp.text, "html.parser")
-    except Exception as e:
-        log.debug("Failed to fetch %s: %s", url, e)
-        return None
+    html = _fetch_raw_html(url)
+    return BeautifulSoup(html, "html.parser") if html else None
 
 
 def _fetch_raw_html(url: str) -> str:
-    """Fetch raw HTML string for chatbot detection."""
+    """Fetch raw HTML string (one request; also backs _fetch_page)."""
+    with _host_slot(url):
+        try:
+            resp = cached_get(url, consumer="scraper", headers=_HEADERS, timeout=_TIMEOUT)
+            resp.raise_for_status()
+            return resp.text
+        except Exception as e:
+            log.debug("Failed to fetch %s: %s", url, e)
+            return ""
+
+
+@contextmanager
+def _host_slot(url: str):
+    """Hold one of MAX_CONNECTIONS_PER_HOST slots for url's host.
+
+    Shared across threads, so concurrent scrapes of the same site (mass scan
+    workers, subpage fan-out) never open more than the cap between them.
+    A host's entry is removed once no thread holds or waits for its slots.
+    """
+    host = urlparse(url).netloc.lower()
+    with _host_slots_lock:
+        entry = _host_slots.get(host)
+        if entry is None:
+            entry = _host_slots[host] = [threading.BoundedSemaphore(MAX_CONNECTIONS_PER_HOST), 0]
+        entry[1] += 1
     try:
-        resp = requests.get(url, headers=_HEADERS, timeout=_TIMEOUT, allow_redirects=True)
-        resp.raise_for_status()
-        return resp.text
-    except Exception as e:
-        log.debug("Failed to fetch raw HTML %s: %s", url, e)
-        return ""
+        with entry[0]:
+            yield
+    finally:
+        with _host_slots_lock:
+            entry[1] -= 1
+            if not entry[1]:
+                del _host_slots[host]
+
+
+def _fetch_pages(urls: list[str]) -> list[BeautifulSoup | None]:
+    """Fetch and parse urls concurrently. Results are in input order."""
+    if len(urls) <= 1:
+        return [_fetch_page(u) for u in urls]
+    with ThreadPoolExecutor(max_workers=min(len(urls), SUBPAGE_WORKERS),
+                            thread_name_prefix="scraper") as pool:
+        return list(pool.map(_fetch_page, urls))
 
 
 def _find_contact_form_url(soup: BeautifulSoup, base_url: str) -> str:
@@ -304,7 +350,7 @@ def _discover_subpages(soup: BeautifulSoup, base_url: str) -> list[str]:
     """Find relevant subpage links."""
     base_domain = urlparse(base_url).netloc
     found = []
-    seen = set()
+    seen = {normalize_url(base_url)}  # /about, /about/ and /about#team are one page
 
     for a in soup.find_all("a", href=True):
         href = a["href"]
@@ -313,12 +359,13 @@ def _discover_subpages(soup: BeautifulSoup, base_url: str) -> list[str]:
 
         if parsed.netloc != base_domain:
             continue
-        if full_url in seen or full_url.rstrip("/") == base_url.rstrip("/"):
+        key = normalize_url(full_url)
+        if key in seen:
             continue
 
         link_text = (a.get_text(strip=True) + " " + parsed.path).lower()
         if any(kw in link_text for kw in _SUBPAGE_KEYWORDS):
-            seen.add(full_url)
+            seen.add(key)
             found.append(full_url)
 
     return found
@@ -539,14 +586,14 @@ def _format_phone(phone: str) -> str:
     return phone  # Return original if can't normalize
 
 
-def _extract_address(soup: BeautifulSoup, text: str, biz: ScrapedBusiness) -> None:
-    """Extract full business address."""
+def _extract_address(soup: BeautifulSoup | None, text: str, biz: ScrapedBusiness) -> None:
+    """Extract full business address (schema.org from soup, else regex on text)."""
     if biz.address:
         return
 
     # 1. Schema.org PostalAddress
     import json as _json
-    for script in soup.find_all("script", type="application/ld+json"):
+    for script in soup.find_all("script", type="application/ld+json") if soup else ():
         try:
             data = _json.loads(script.string or "")
             items = data if isinstance(data, list) else [data]
@@ -569,6 +616,8 @@ def _extract_address(soup: BeautifulSoup, text: str, biz: ScrapedBusiness) -> No
             continue
 
     # 2. Regex: "123 Main St, City, ST 12345" pattern
+    if not text:
+        return
     addr_re = re.search(
         r'(\d{1,5}\s+[\w\s.]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd|Lane|Ln|Way|Place|Pl|Suite|Ste|Floor|Fl)[\w\s.,#]*,'
         r'\s*[A-Z][a-z]+[\w\s]*,?\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?)',
@@ -606,6 +655,9 @@ def _extract_new_patient_info(text: str, biz: ScrapedBusiness) -> None:
     if "not accepting new patients" in text_lower or "not taking new patients" in text_lower:
         biz.accepting_new_patients = False
 
+    if biz.new_patient_info:
+        return
+
     # Extract new patient process info
     np_patterns = [
         r'(?:new patient|first visit|first appointment)[s]?[:\s]+([^.]{20,200}\.)',
@@ -613,13 +665,15 @@ def _extract_new_patient_info(text: str, biz: ScrapedBusiness) -> None:
     ]
     for pat in np_patterns:
         m = re.search(pat, text, re.IGNORECASE)
-        if m and not biz.new_patient_info:
+        if m:
             biz.new_patient_info = m.group(0).strip()[:300]
             break
 
 
 def _extract_emergency_info(text: str, biz: ScrapedBusiness) -> None:
     """Extract emergency handling info."""
+    if biz.emergency_info:
+        return
     emergency_patterns = [
         r'(?:dental emergenc|emergency)[yies]*[:\s]+([^.]{20,250}\.)',
         r'(?:after.?hours|urgent care)[:\s]+([^.]{20,200}\.)',
@@ -627,7 +681,7 @@ def _extract_emergency_info(text: str, biz: ScrapedBusiness) -> None:
     ]
     for pat in emergency_patterns:
         m = re.search(pat, text, re.IGNORECASE)
-        if m and not biz.emergency_info:
+        if m:
             biz.emergency_info = m.group(0).strip()[:300]
             break
 
@@ -708,6 +762,9 @@ def _extract_languages(text: str, biz: ScrapedBusiness) -> None:
 
 def _extract_buying_process(text: str, biz: ScrapedBusiness) -> None:
     """Extract buying/selling process descriptions."""
+    if biz.buying_process and biz.selling_process:
+        return
+
     # Buying process
     buy_patterns = [
         r'(?:buying process|how to buy|steps to buy|buyer.s guide)[:\s]+([^.]{20,300}\.)',
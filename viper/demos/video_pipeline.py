@@ -10,11 +10,15 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import multiprocessing
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable
 
-from viper.demos.compositor import composite
+from viper.demos.compositor import composite_horizontal, composite_vertical
 from viper.demos.recorder import record_with_verify, verify_demo, DENTAL_ACTIONS
 from viper.demos.video_verifier import verify_video, DENTAL_FRAME_CHECKS
 from viper.demos.voiceover import generate_voiceover, load_cached_voiceover
@@ -80,6 +84,98 @@ CONFIGS = {
 }
 
 
+# ── Artifacts ──
+# Each recording feeds exactly one composite. On retry only the failed
+# artifact (and whatever is downstream of it) is redone.
+
+VIEWPORTS = {
+    "desktop": (1920, 1080),
+    "mobile": (390, 844),
+}
+RENDER_SOURCE = {
+    "horizontal": "desktop",
+    "vertical": "mobile",
+}
+MIN_VIDEO_BYTES = 100_000
+
+
+def _run_parallel(jobs: dict[str, tuple[Callable[..., Any], tuple]]) -> dict[str, Any]:
+    """Run independent record/render jobs in worker processes.
+
+    Returns {name: result or the exception it raised}. Workers are spawned,
+    not forked — Playwright and moviepy's ffmpeg pipes don't survive fork.
+    """
+    if not jobs:
+        return {}
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(jobs), mp_context=ctx) as pool:
+        futures = {name: pool.submit(fn, *args) for name, (fn, args) in jobs.items()}
+        results: dict[str, Any] = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = e
+    return results
+
+
+def record_all(
+    config: DemoConfig,
+    cue_sheet: list,
+    duration_sec: float,
+    names: set[str],
+) -> dict[str, Path]:
+    """Record the named viewports in parallel (each with its own retry loop)."""
+    t0 = time.monotonic()
+    results = _run_parallel({
+        name: (record_with_verify, (
+            config.demo_url, cue_sheet, duration_sec,
+            config.output_dir / f"recording_{name}", VIEWPORTS[name],
+        ))
+        for name in names
+    })
+    for name, res in results.items():
+        if isinstance(res, BaseException):
+            raise res
+    print(f"  Recorded {', '.join(sorted(names))} in {time.monotonic() - t0:.1f}s")
+    return results
+
+
+def render_all(
+    config: DemoConfig,
+    recordings: dict[str, Path],
+    audio_path: Path,
+    names: set[str],
+    profile: str = "final",
+) -> tuple[dict[str, Path], dict[str, str]]:
+    """Composite the named outputs in parallel. Returns (rendered paths, failure reasons).
+
+    profile="draft" uses the compositor's fast encode (for verification runs).
+    """
+    t0 = time.monotonic()
+    jobs: dict[str, tuple[Callable[..., Any], tuple]] = {}
+    if "horizontal" in names:
+        jobs["horizontal"] = (composite_horizontal, (
+            recordings["desktop"], audio_path, config.output_dir, profile,
+        ))
+    if "vertical" in names:
+        jobs["vertical"] = (composite_vertical, (
+            recordings["mobile"], audio_path, config.output_dir, config.business_name, profile,
+        ))
+
+    rendered: dict[str, Path] = {}
+    failed: dict[str, str] = {}
+    for name, res in _run_parallel(jobs).items():
+        if isinstance(res, BaseException):
+            failed[name] = f"{name}.mp4 export failed: {res}"
+        elif not res.exists() or res.stat().st_size <= MIN_VIDEO_BYTES:
+            failed[name] = f"{name}.mp4 missing or too small"
+        else:
+            rendered[name] = res
+    print(f"  Rendered {', '.join(sorted(rendered)) or 'nothing'} in {time.monotonic() - t0:.1f}s")
+    return rendered, failed
+
+
 def _load_api_key() -> str:
     """Load ElevenLabs API key from env or soren .env."""
     api_key = os.environ.get("ELEVENLABS_API_KEY")
@@ -102,23 +198,33 @@ def generate_demo(
     skip_voiceover: bool = False,
     max_pipeline_retries: int = 3,
     notify_jordan: bool = True,
+    draft: bool = False,
 ) -> tuple[Path, Path]:
     """Generate a complete demo video — self-verifying, auto-retry.
 
     Pipeline:
         1. Verify chatbot works (fast DOM replay, ~15s)
         2. Generate/load voiceover with character-level timestamps
-        3. Record desktop + mobile with retry (up to 3 attempts each)
-        4. Composite video + audio
+        3. Record desktop + mobile in parallel worker processes, each with
+           retry (up to 3 attempts each)
+        4. Composite horizontal + vertical in parallel worker processes
         5. OCR-verify final video (extract frames at cue timestamps)
-        6. If verification fails → retry from step 3 (up to max_pipeline_retries)
+        6. On failure redo only what failed (up to max_pipeline_retries):
+           a failed export is re-rendered from its existing recording; an
+           OCR failure re-records desktop and re-renders horizontal only
         7. Notify Jordan only when DONE or after all retries exhausted
 
+    draft=True composites with the fast draft encode — for checking a new
+    cue sheet or page; re-run without it to ship (unchanged recordings are
+    reused from the render cache). Draft outputs are written as
+    *_draft.mp4 and never notify Jordan.
+
     Returns:
         tuple of (horizontal_mp4, vertical_mp4)
     """
     config.output_dir.mkdir(parents=True, exist_ok=True)
     vo_dir = config.output_dir / "voiceover"
+    notify_jordan = notify_jordan and not draft
 
     # Step 1: Verify chatbot before recording
     print("\n=== Step 1: Verifying chatbot responds correctly ===")
@@ -153,8 +259,10 @@ def generate_demo(
         )
 
     # Steps 3-5: Record + Composite + Verify (with retry loop)
-    h_path = None
-    v_path = None
+    recordings: dict[str, Path] = {}
+    renders: dict[str, Path] = {}
+    to_record = set(VIEWPORTS)
+    to_render = set(RENDER_SOURCE)
     last_verify_result = None
 
     for attempt in range(1, max_pipeline_retries + 1):
@@ -162,41 +270,29 @@ def generate_demo(
         print(f"  PIPELINE ATTEMPT {attempt}/{max_pipeline_retries}")
         print(f"{'='*60}")
 
-        # Step 3a: Record desktop
-        print("\n=== Step 3a: Recording desktop (1920x1080) ===")
-        rec_desktop = config.output_dir / "recording_desktop"
-        video_path = record_with_verify(
-            config.demo_url, vo_result.cue_sheet, vo_result.duration_sec,
-            rec_desktop, viewport=(1920, 1080),
-        )
-
-        # Step 3b: Record mobile
-        print("\n=== Step 3b: Recording mobile (390x844) ===")
-        rec_mobile = config.output_dir / "recording_mobile"
-        mobile_video_path = record_with_verify(
-            config.demo_url, vo_result.cue_sheet, vo_result.duration_sec,
-            rec_mobile, viewport=(390, 844),
-        )
-
-        # Step 4: Composite
-        print("\n=== Step 4: Compositing final videos ===")
-        h_path, v_path = composite(
-            video_path, vo_result.audio_path, config.output_dir, config.business_name,
-            vertical_video_path=mobile_video_path,
+        # Step 3: Record (desktop 1920x1080 + mobile 390x844 in parallel)
+        if to_record:
+            print(f"\n=== Step 3: Recording {' + '.join(sorted(to_record))} ===")
+            recordings.update(record_all(
+                config, vo_result.cue_sheet, vo_result.duration_sec, to_record,
+            ))
+            to_render |= {out for out, src in RENDER_SOURCE.items() if src in to_record}
+            to_record = set()
+
+        # Step 4: Composite (horizontal + vertical in parallel)
+        print(f"\n=== Step 4: Compositing {' + '.join(sorted(to_render))} ===")
+        rendered, failed = render_all(
+            config, recordings, vo_result.audio_path, to_render,
+            profile="draft" if draft else "final",
         )
+        renders.update(rendered)
 
-        h_ok = h_path.exists() and h_path.stat().st_size > 100_000
-        v_ok = v_path.exists() and v_path.stat().st_size > 100_000
-
-        if not (h_ok and v_ok):
-            reason = []
-            if not h_ok:
-                reason.append("horizontal.mp4 missing or too small")
-            if not v_ok:
-                reason.append("vertical.mp4 missing or too small")
+        if failed:
+            reason = list(failed.values())
             print(f"  Composite failed: {'; '.join(reason)}")
             if attempt < max_pipeline_retries:
-                print("  Retrying...")
+                print(f"  Retrying {', '.join(sorted(failed))} only...")
+                to_render = set(failed)
                 continue
             else:
                 msg = "; ".join(reason)
@@ -206,11 +302,12 @@ def generate_demo(
                         f"after {max_pipeline_retries} attempts. {msg}"
                     )
                 raise RuntimeError(f"Pipeline failed after {max_pipeline_retries} attempts: {msg}")
+        to_render = set()
 
         # Step 5: OCR-verify final video
         print("\n=== Step 5: OCR-verifying final video ===")
         last_verify_result = verify_video(
-            h_path, vo_result.cue_sheet, DENTAL_FRAME_CHECKS,
+            renders["horizontal"], vo_result.cue_sheet, DENTAL_FRAME_CHECKS,
         )
         print(f"  {last_verify_result.summary()}")
 
@@ -221,17 +318,23 @@ def generate_demo(
         for f in last_verify_result.failures:
             print(f"  [ocr-fail] {f}")
 
+        # OCR checks the horizontal cut — only the desktop recording behind it is redone
+        to_record = {RENDER_SOURCE["horizontal"]}
         if attempt < max_pipeline_retries:
-            print(f"\n  OCR verification failed — retrying ({attempt}/{max_pipeline_retries})...")
+            print(f"\n  OCR verification failed — re-recording desktop ({attempt}/{max_pipeline_retries})...")
         else:
             print(f"\n  OCR verification failed after {max_pipeline_retries} attempts.")
 
+    h_path = renders.get("horizontal")
+    v_path = renders.get("vertical")
+
     # Step 6: Final status + notification
     print()
     if last_verify_result and last_verify_result.passed and h_path and v_path:
         h_mb = h_path.stat().st_size / 1_048_576
         v_mb = v_path.stat().st_size / 1_048_576
-        print(f"  PASS — horizontal.mp4 ({h_mb:.1f}MB) and vertical.mp4 ({v_mb:.1f}MB) ready")
+        label = "DRAFT (not for sending)" if draft else "ready"
+        print(f"  PASS — {h_path.name} ({h_mb:.1f}MB) and {v_path.name} ({v_mb:.1f}MB) {label}")
         print(f"  Horizontal: {h_path}")
         print(f"  Vertical:   {v_path}")
         if notify_jordan:
@@ -288,13 +391,18 @@ def main() -> None:
         action="store_true",
         help="Reuse cached voiceover + cue sheet (saves ElevenLabs credits)",
     )
+    parser.add_argument(
+        "--draft",
+        action="store_true",
+        help="Fast draft encode (verification run, not for sending)",
+    )
     args = parser.parse_args()
 
     config = CONFIGS[args.business]
     if args.output_dir:
         config.output_dir = args.output_dir
 
-    generate_demo(config, skip_voiceover=args.skip_voiceover)
+    generate_demo(config, skip_voiceover=args.skip_voiceover, draft=args.draft)
 
 
 if __name__ == "__main__":
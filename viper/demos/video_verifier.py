@@ -1,8 +1,9 @@
 """Post-recording video verification — ffmpeg frame extraction + tesseract OCR.
 
 After the compositor creates the final MP4, this module:
-1. Extracts a frame at each cue timestamp (+ response delay)
-2. OCRs each frame with tesseract
+1. Extracts a frame at each cue timestamp (+ response delay) — all of
+   them in one ffmpeg decode pass, cropped to the chat region
+2. OCRs the frames with tesseract, concurrently across CPU cores
 3. Checks for expected chat text
 4. Returns pass/fail with detailed breakdown
 
@@ -11,13 +12,16 @@ Jordan never reviews a video manually again.
 from __future__ import annotations
 
 import logging
+import os
+import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 
 try:
-    from PIL import Image
     import pytesseract
 except ImportError as e:
     raise ImportError(
@@ -33,6 +37,13 @@ log = logging.getLogger(__name__)
 # (gives chatbot time to respond visually)
 _RESPONSE_DELAY = 4.0
 
+# Chat widget region as (x, y, w, h) fractions of the frame. The widget sits
+# bottom-right in the desktop cut; cropping before OCR drops the page hero
+# text and roughly halves tesseract's work.
+DENTAL_CHAT_REGION: tuple[float, float, float, float] = (0.5, 0.0, 0.5, 1.0)
+
+_PTS_TIME = re.compile(r"pts_time:\s*([0-9.]+)")
+
 
 @dataclass
 class FrameCheck:
@@ -114,15 +125,95 @@ def extract_frame(video_path: Path, timestamp: float, output_path: Path) -> bool
         return False
 
 
-def ocr_frame(image_path: Path) -> str:
-    """OCR a frame image and return extracted text."""
+def _crop_filter(region: tuple[float, float, float, float] | None) -> str:
+    if region is None:
+        return ""
+    x, y, w, h = region
+    return f"crop=iw*{w}:ih*{h}:iw*{x}:ih*{y},"
+
+
+def _select_expr(timestamps: list[float]) -> str:
+    """select= expression keeping the first frame at or after each timestamp."""
+    return "+".join(
+        f"gte(t,{ts:.3f})*(isnan(prev_t)+lt(prev_t,{ts:.3f}))" for ts in timestamps
+    )
+
+
+def _map_frames(timestamps: list[float], pts_times: list[float], frames: list[Path]) -> dict[float, Path]:
+    """Match each requested timestamp to the first emitted frame at or after it."""
+    out: dict[float, Path] = {}
+    j = 0
+    for ts in timestamps:
+        while j < len(pts_times) and pts_times[j] < ts - 1e-3:
+            j += 1
+        if j < len(pts_times) and j < len(frames):
+            out[ts] = frames[j]
+    return out
+
+
+def extract_frames(
+    video_path: Path,
+    timestamps: list[float],
+    output_dir: Path,
+    region: tuple[float, float, float, float] | None = None,
+) -> dict[float, Path]:
+    """Extract frames at every timestamp in one ffmpeg decode pass.
+
+    A select filter keeps only the first frame at or after each requested
+    time, optionally cropped to region; showinfo reports which pts each
+    output file came from. Returns {timestamp: frame_path} for the
+    timestamps that produced a frame (past-the-end ones are left out).
+    """
+    wanted = sorted(set(timestamps))
+    if not wanted:
+        return {}
+    vf = f"select='{_select_expr(wanted)}',{_crop_filter(region)}showinfo"
+    pattern = output_dir / "frame_%03d.png"
+    cmd = [
+        "ffmpeg", "-y", "-hide_banner",
+        "-i", str(video_path),
+        "-vf", vf,
+        "-vsync", "0",
+        "-q:v", "2",
+        str(pattern),
+    ]
     try:
-        img = Image.open(image_path)
-        text = pytesseract.image_to_string(img, config="--psm 6")
-        return text.strip()
-    except Exception as e:
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, timeout=120,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        log.warning("ffmpeg batch frame extraction failed: %s", e)
+        return {}
+    if result.returncode != 0:
+        log.warning("ffmpeg batch frame extraction exited %d: %s",
+                    result.returncode, result.stderr[-300:])
+        return {}
+
+    pts_times = [float(m) for m in _PTS_TIME.findall(result.stderr)]
+    frames = sorted(output_dir.glob("frame_*.png"))
+    return _map_frames(wanted, pts_times, frames)
+
+
+def ocr_frame(image_path: Path, threads: int | None = None) -> str:
+    """OCR a frame image and return extracted text.
+
+    threads caps tesseract's OpenMP threads through the environment of
+    this one tesseract process (None keeps tesseract's default).
+    """
+    env = None
+    if threads is not None:
+        env = {**os.environ, "OMP_THREAD_LIMIT": str(threads)}
+    cmd = [pytesseract.pytesseract.tesseract_cmd, str(image_path), "stdout", "--psm", "6"]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, env=env)
+    except (subprocess.TimeoutExpired, OSError) as e:
         log.warning("OCR failed for %s: %s", image_path, e)
         return ""
+    if result.returncode != 0:
+        log.warning("OCR failed for %s: tesseract exited %d: %s",
+                    image_path, result.returncode, result.stderr[-300:])
+        return ""
+    return result.stdout.strip()
 
 
 def verify_video(
@@ -130,12 +221,14 @@ def verify_video(
     cue_sheet: list[CuePoint],
     frame_checks: list[dict] | None = None,
     response_delay: float = _RESPONSE_DELAY,
+    chat_region: tuple[float, float, float, float] | None = DENTAL_CHAT_REGION,
 ) -> VideoVerifyResult:
     """Verify a composited video by extracting frames and OCRing them.
 
     For each cue in the cue sheet that has a matching frame check,
     extracts a frame at (cue.timestamp + response_delay), OCRs it,
-    and checks for expected text.
+    and checks for expected text. Pass chat_region=None to OCR full frames
+    (e.g. for the vertical cut, where the chat fills the frame).
     """
     if frame_checks is None:
         frame_checks = DENTAL_FRAME_CHECKS
@@ -143,35 +236,48 @@ def verify_video(
     # Build lookup: action -> expected texts
     check_map = {c["after_action"]: c["expect"] for c in frame_checks}
 
+    planned = [
+        (cue.action, cue.timestamp + response_delay, check_map[cue.action])
+        for cue in cue_sheet
+        if cue.action in check_map
+    ]
+
     checks: list[FrameCheck] = []
     failures: list[str] = []
 
     with tempfile.TemporaryDirectory(prefix="viper_verify_") as tmp:
         tmp_dir = Path(tmp)
 
-        for cue in cue_sheet:
-            expected = check_map.get(cue.action)
-            if expected is None:
-                continue
-
-            ts = cue.timestamp + response_delay
-            frame_path = tmp_dir / f"frame_{cue.action}.png"
-
+        # One decode pass for every frame; per-frame seeks only as a fallback
+        frames = extract_frames(video_path, [ts for _, ts, _ in planned], tmp_dir, chat_region)
+        for action, ts, _ in planned:
+            if ts not in frames:
+                single = tmp_dir / f"single_{action}.png"
+                if extract_frame(video_path, ts, single):
+                    frames[ts] = single
+
+        # OCR concurrently — each tesseract is its own process, so threads suffice.
+        # One OpenMP thread per tesseract avoids oversubscribing the cores.
+        to_ocr = sorted({frames[ts] for _, ts, _ in planned if ts in frames})
+        workers = max(1, min(len(to_ocr), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            texts = pool.map(partial(ocr_frame, threads=1), to_ocr)
+            ocr_texts = dict(zip(to_ocr, texts))
+
+        for action, ts, expected in planned:
             fc = FrameCheck(
-                cue_action=cue.action,
+                cue_action=action,
                 timestamp=ts,
                 expected_texts=expected,
             )
 
-            # Extract frame
-            if not extract_frame(video_path, ts, frame_path):
+            if ts not in frames:
                 fc.missing_texts = expected
-                failures.append(f"frame extraction failed at {ts:.1f}s ({cue.action})")
+                failures.append(f"frame extraction failed at {ts:.1f}s ({action})")
                 checks.append(fc)
                 continue
 
-            # OCR
-            ocr_text = ocr_frame(frame_path)
+            ocr_text = ocr_texts.get(frames[ts], "")
             fc.ocr_text = ocr_text
             ocr_lower = ocr_text.lower()
 
@@ -184,7 +290,7 @@ def verify_video(
 
             if fc.missing_texts:
                 failures.append(
-                    f"after '{cue.action}' @ {ts:.1f}s: missing {fc.missing_texts}"
+                    f"after '{action}' @ {ts:.1f}s: missing {fc.missing_texts}"
                 )
             else:
                 fc.passed = True
@@ -192,7 +298,7 @@ def verify_video(
             checks.append(fc)
             log.debug(
                 "Frame %s @ %.1fs: found=%s missing=%s",
-                cue.action, ts, fc.found_texts, fc.missing_texts,
+                action, ts, fc.found_texts, fc.missing_texts,
             )
 
     return VideoVerifyResult(
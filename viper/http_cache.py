@@ -0,0 +1,351 @@
+"""Shared on-disk HTTP response cache for Viper scrapers and auditors.
+
+The same business website gets fetched by the scraper, the chatbot detector,
+the tech fingerprinter and PageSpeed during a scan, and again when a demo is
+built from Telegram. Every Viper fetcher goes through ``cached_get`` so the
+network is hit once per TTL window.
+
+Layout (under data/http_cache/):
+    index.db           — SQLite index: normalized URL → body hash + validators
+    bodies/ab/abcd…z   — zlib-compressed bodies, content-addressed by SHA-256
+
+Expired entries are revalidated with If-None-Match / If-Modified-Since, so an
+unchanged page costs a 304. The store is size-bounded: least recently used
+entries are evicted once total compressed size exceeds MAX_BYTES.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = Path.home() / "polymarket-bot" / "data" / "http_cache"
+_DB_PATH = CACHE_DIR / "index.db"
+_BODY_DIR = CACHE_DIR / "bodies"
+
+MAX_BYTES = 512 * 1024 * 1024  # compressed bodies on disk
+
+# Seconds a cached response is served without revalidation, per consumer.
+TTL_POLICIES: dict[str, int] = {
+    "scraper": 6 * 3600,         # business homepages + subpages
+    "site_auditor": 24 * 3600,
+    "tech_fingerprinter": 24 * 3600,
+    "pagespeed": 3 * 86400,      # Lighthouse scores move slowly
+    "default": 3600,
+}
+
+# Query params that never belong in a cache key (secrets, tracking).
+_DROP_PARAMS = {"key", "api_key", "apikey", "token", "fbclid", "gclid"}
+
+_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+_lock = threading.Lock()
+_session = requests.Session()
+_stats = {"hits": 0, "revalidated": 0, "misses": 0, "errors": 0}
+
+
+@dataclass
+class CachedResponse:
+    """Minimal requests.Response stand-in served from the cache or network."""
+    url: str = ""
+    status_code: int = 0
+    content: bytes = b""
+    headers: dict = field(default_factory=dict)
+    encoding: str = "utf-8"
+    from_cache: bool = False
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 400
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} for url: {self.url}")
+
+
+def normalize_url(url: str, params: dict | None = None) -> str:
+    """Canonical cache key: lowercase host, no fragment/default port, sorted query."""
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "http").lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    for k, v in (params or {}).items():
+        values = v if isinstance(v, (list, tuple)) else [v]
+        query.extend((k, str(item)) for item in values)
+    query = sorted(
+        (k, v) for k, v in query
+        if k.lower() not in _DROP_PARAMS and not k.lower().startswith("utm_")
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        url_key TEXT PRIMARY KEY,
+        body_hash TEXT NOT NULL,
+        status INTEGER NOT NULL,
+        headers TEXT DEFAULT '{}',
+        encoding TEXT DEFAULT 'utf-8',
+        etag TEXT DEFAULT '',
+        last_modified TEXT DEFAULT '',
+        fetched_at REAL NOT NULL,
+        last_access REAL NOT NULL,
+        size INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access);
+    CREATE INDEX IF NOT EXISTS idx_entries_hash ON entries(body_hash);
+"""
+
+_local = threading.local()
+
+
+def _conn() -> sqlite3.Connection:
+    """Per-thread connection (autocommit), opened once per thread and index path."""
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != _DB_PATH:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(_DB_PATH), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _local.conn, _local.path = conn, _DB_PATH
+    return conn
+
+
+def _body_path(body_hash: str) -> Path:
+    return _BODY_DIR / body_hash[:2] / f"{body_hash}.z"
+
+
+def _read_body(body_hash: str) -> bytes | None:
+    try:
+        return zlib.decompress(_body_path(body_hash).read_bytes())
+    except (OSError, zlib.error):
+        return None
+
+
+def _write_body(content: bytes) -> tuple[str, int]:
+    """Store a body under its content hash. Identical bodies share one file."""
+    body_hash = hashlib.sha256(content).hexdigest()
+    path = _body_path(body_hash)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(zlib.compress(content, 6))
+        tmp.replace(path)
+    return body_hash, path.stat().st_size
+
+
+def _evict(conn: sqlite3.Connection) -> None:
+    """Drop least-recently-used entries until the store fits in MAX_BYTES."""
+    total = conn.execute(
+        "SELECT COALESCE(SUM(size), 0) FROM "
+        "(SELECT body_hash, MAX(size) AS size FROM entries GROUP BY body_hash)"
+    ).fetchone()[0]
+    if total <= MAX_BYTES:
+        return
+    rows = conn.execute(
+        "SELECT url_key, body_hash, size FROM entries ORDER BY last_access ASC"
+    ).fetchall()
+    for row in rows:
+        if total <= MAX_BYTES:
+            break
+        conn.execute("DELETE FROM entries WHERE url_key = ?", (row["url_key"],))
+        still_used = conn.execute(
+            "SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", (row["body_hash"],)
+        ).fetchone()
+        if not still_used:
+            _body_path(row["body_hash"]).unlink(missing_ok=True)
+            total -= row["size"]
+
+
+def _store(conn: sqlite3.Connection, url_key: str, resp: requests.Response) -> None:
+    body_hash, size = _write_body(resp.content)
+    now = time.time()
+    keep = {k: v for k, v in resp.headers.items()
+            if k.lower() in ("content-type", "etag", "last-modified", "server")}
+    conn.execute(
+        """INSERT OR REPLACE INTO entries
+           (url_key, body_hash, status, headers, encoding, etag, last_modified,
+            fetched_at, last_access, size)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        (
+            url_key, body_hash, resp.status_code, json.dumps(keep),
+            resp.encoding or "utf-8",
+            resp.headers.get("ETag", ""), resp.headers.get("Last-Modified", ""),
+            now, now, size,
+        ),
+    )
+    _evict(conn)
+
+
+def _from_row(row: sqlite3.Row, body: bytes, url: str) -> CachedResponse:
+    return CachedResponse(
+        url=url,
+        status_code=row["status"],
+        content=body,
+        headers=json.loads(row["headers"] or "{}"),
+        encoding=row["encoding"] or "utf-8",
+        from_cache=True,
+    )
+
+
+def _bump(key: str) -> None:
+    with _lock:
+        _stats[key] += 1
+
+
+def cached_get(
+    url: str,
+    consumer: str = "default",
+    params: dict | None = None,
+    headers: dict | None = None,
+    timeout: float = 15,
+    ttl: int | None = None,
+) -> CachedResponse:
+    """GET through the shared cache.
+
+    Fresh entries (younger than the consumer's TTL) are served from disk.
+    Stale entries are revalidated with their ETag/Last-Modified. Only 200
+    responses are stored; errors and non-200s pass straight through.
+
+    Raises whatever ``requests`` raises on network failure, like requests.get.
+    """
+    url_key = normalize_url(url, params)
+    max_age = ttl if ttl is not None else TTL_POLICIES.get(consumer, TTL_POLICIES["default"])
+    req_headers = dict(_HEADERS)
+    req_headers.update(headers or {})
+
+    conn = _conn()
+    row = conn.execute("SELECT * FROM entries WHERE url_key = ?", (url_key,)).fetchone()
+    body = _read_body(row["body_hash"]) if row else None
+    now = time.time()
+
+    if row and body is not None:
+        conn.execute("UPDATE entries SET last_access = ? WHERE url_key = ?", (now, url_key))
+        if now - row["fetched_at"] < max_age:
+            _bump("hits")
+            return _from_row(row, body, url)
+        if row["etag"]:
+            req_headers["If-None-Match"] = row["etag"]
+        if row["last_modified"]:
+            req_headers["If-Modified-Since"] = row["last_modified"]
+
+    try:
+        resp = _session.get(url, params=params, headers=req_headers,
+                            timeout=timeout, allow_redirects=True)
+    except Exception:
+        _bump("errors")
+        raise
+
+    if resp.status_code == 304 and row and body is not None:
+        conn.execute("UPDATE entries SET fetched_at = ? WHERE url_key = ?", (now, url_key))
+        _bump("revalidated")
+        return _from_row(row, body, url)
+
+    _bump("misses")
+    if resp.status_code == 200:
+        _store(conn, url_key, resp)
+    return CachedResponse(
+        url=resp.url or url,
+        status_code=resp.status_code,
+        content=resp.content,
+        headers=dict(resp.headers),
+        encoding=resp.encoding or "utf-8",
+    )
+
+
+def cached_post(
+    url: str,
+    json_body: dict,
+    consumer: str = "default",
+    headers: dict | None = None,
+    timeout: float = 60,
+    ttl: int | None = None,
+) -> CachedResponse:
+    """POST through the cache, for idempotent API calls (e.g. a crawl request).
+
+    Keyed by URL plus a hash of the JSON payload. POST responses carry no
+    validators worth replaying, so stale entries are simply refetched.
+    """
+    payload = json.dumps(json_body, sort_keys=True, separators=(",", ":"))
+    url_key = f"POST {normalize_url(url)} {hashlib.sha256(payload.encode()).hexdigest()}"
+    max_age = ttl if ttl is not None else TTL_POLICIES.get(consumer, TTL_POLICIES["default"])
+
+    conn = _conn()
+    row = conn.execute("SELECT * FROM entries WHERE url_key = ?", (url_key,)).fetchone()
+    body = _read_body(row["body_hash"]) if row else None
+    now = time.time()
+    if row and body is not None and now - row["fetched_at"] < max_age:
+        conn.execute("UPDATE entries SET last_access = ? WHERE url_key = ?", (now, url_key))
+        _bump("hits")
+        return _from_row(row, body, url)
+
+    try:
+        resp = _session.post(url, json=json_body, headers=headers, timeout=timeout)
+    except Exception:
+        _bump("errors")
+        raise
+
+    _bump("misses")
+    if resp.status_code == 200:
+        _store(conn, url_key, resp)
+    return CachedResponse(
+        url=url,
+        status_code=resp.status_code,
+        content=resp.content,
+        headers=dict(resp.headers),
+        encoding=resp.encoding or "utf-8",
+    )
+
+
+def get_stats() -> dict:
+    """Hit-ratio stats for this process plus on-disk store size."""
+    with _lock:
+        stats = dict(_stats)
+    served = stats["hits"] + stats["revalidated"] + stats["misses"]
+    stats["hit_ratio"] = round((stats["hits"] + stats["revalidated"]) / served, 3) if served else 0.0
+    try:
+        conn = _conn()
+        row = conn.execute(
+            "SELECT COUNT(*) AS n, COUNT(DISTINCT body_hash) AS bodies FROM entries"
+        ).fetchone()
+        size = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT body_hash, MAX(size) AS size FROM entries GROUP BY body_hash)"
+        ).fetchone()[0]
+        stats.update(entries=row["n"], bodies=row["bodies"], bytes_on_disk=size)
+    except sqlite3.Error as e:
+        log.debug("http_cache stats unavailable: %s", e)
+    return stats
@@ -4,10 +4,12 @@ F5Bot monitors Reddit + Hacker News for keywords in real-time (free).
 This module logs into f5bot.com, scrapes recent hits from the dashboard,
 scores them with VIPER-Q, and sends HOT/WARM leads to Jordan via TG.
 
-Runs every 10 minutes as part of Viper's inbound loop.
+Alert histories are polled through viper.inbound.poller_engine as part of
+Viper's inbound loop.
 """
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
@@ -20,6 +22,9 @@ from zoneinfo import ZoneInfo
 import requests
 from bs4 import BeautifulSoup
 
+from viper import state_store
+from viper.inbound.poller_engine import FeedSource, PollResult, commit, poll_sources
+
 log = logging.getLogger(__name__)
 
 _TZ_ET = ZoneInfo("America/New_York")
@@ -165,85 +170,55 @@ def _get_alert_ids(session: requests.Session) -> list[dict]:
         return []
 
 
-def _scrape_history(session: requests.Session, alert_id: str, keyword: str) -> list[dict]:
-    """Scrape hit history for a single alert."""
-    try:
-        resp = session.get(f"{_HISTORY_URL}?id={alert_id}", timeout=15)
-        if resp.status_code != 200:
-            return []
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-        hits = []
-        table = soup.find("table")
-        if not table:
-            return []
-
-        for row in table.find_all("tr"):
-            cells = row.find_all("td")
-            if len(cells) < 5:
-                continue
-
-            # Columns: Keyword, Flags, Site, Title, Context, Timestamp
-            site = cells[2].get_text(strip=True) if len(cells) > 2 else ""
-            title = cells[3].get_text(strip=True) if len(cells) > 3 else ""
-            context = cells[4].get_text(strip=True) if len(cells) > 4 else ""
-
-            # Find the reddit/hn link
-            link = row.find("a", href=lambda h: h and ("reddit.com" in h or "ycombinator.com" in h))
-            if not link:
-                continue
-
-            url = link["href"]
-            source = "reddit" if "reddit.com" in url else "hackernews"
+def _parse_history(html: bytes, is_seen=lambda _url: False, keyword: str = "") -> list[dict]:
+    """Parse an alert's hit history, newest first, stopping at the first hit already seen."""
+    soup = BeautifulSoup(html, "html.parser")
+    hits = []
+    table = soup.find("table")
+    if not table:
+        return []
 
-            hits.append({
-                "title": title[:200],
-                "url": url,
-                "source": f"f5bot_{source}",
-                "keyword": keyword,
-                "context": context[:300],
-                "site": site,
-            })
+    for row in table.find_all("tr"):
+        cells = row.find_all("td")
+        if len(cells) < 5:
+            continue
 
-        return hits
-    except Exception as e:
-        log.error("[F5BOT] History scrape error for %s: %s", alert_id, str(e)[:200])
-        return []
+        # Columns: Keyword, Flags, Site, Title, Context, Timestamp
+        site = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+        title = cells[3].get_text(strip=True) if len(cells) > 3 else ""
+        context = cells[4].get_text(strip=True) if len(cells) > 4 else ""
 
+        # Find the reddit/hn link
+        link = row.find("a", href=lambda h: h and ("reddit.com" in h or "ycombinator.com" in h))
+        if not link:
+            continue
 
-def _scrape_all_hits(session: requests.Session) -> list[dict]:
-    """Scrape all keyword hit histories from F5Bot."""
-    alerts = _get_alert_ids(session)
-    if not alerts:
-        log.info("[F5BOT] No alerts configured")
-        return []
+        url = link["href"]
+        if is_seen(url):
+            break
+        source = "reddit" if "reddit.com" in url else "hackernews"
 
-    all_hits = []
-    for alert in alerts:
-        hits = _scrape_history(session, alert["id"], alert["keyword"])
-        all_hits.extend(hits)
+        hits.append({
+            "title": title[:200],
+            "url": url,
+            "source": f"f5bot_{source}",
+            "keyword": keyword,
+            "context": context[:300],
+            "site": site,
+        })
 
-    log.info("[F5BOT] Scraped %d total hits across %d keywords", len(all_hits), len(alerts))
-    return all_hits
+    return hits
 
 
 # ── Seen Tracking ───────────────────────────────────────────────────
 
-def _load_seen() -> set:
-    if _SEEN_FILE.exists():
-        try:
-            return set(json.loads(_SEEN_FILE.read_text()))
-        except Exception:
-            return set()
-    return set()
+def _load_seen() -> state_store.SeenSet:
+    state_store.migrate_seen("f5bot", _SEEN_FILE)
+    return state_store.SeenSet("f5bot", cap=_MAX_SEEN)
 
 
-def _save_seen(seen: set) -> None:
-    items = list(seen)
-    if len(items) > _MAX_SEEN:
-        items = items[-_MAX_SEEN:]
-    _DATA_DIR.mkdir(parents=True, exist_ok=True)
-    _SEEN_FILE.write_text(json.dumps(items))
+def _save_seen(seen: state_store.SeenSet) -> None:
+    seen.prune()
 
 
 def _log_lead(hit: dict, result: dict) -> None:
@@ -297,23 +272,41 @@ def _send_tg_alert(hit: dict, result: dict) -> None:
 
 # ── Main Poll Function ──────────────────────────────────────────────
 
-def poll_f5bot() -> dict:
-    """Poll F5Bot dashboard, score new hits, alert on high-intent.
-
-    Returns summary dict with counts.
-    """
-    stats = {"polled": 0, "new": 0, "hot": 0, "warm": 0, "archived": 0}
-
+def build_sources() -> list[FeedSource]:
+    """Log in and return one FeedSource per alert history (shares the F5Bot session)."""
     session = _login()
     if not session:
-        return stats
+        return []
+
+    alerts = _get_alert_ids(session)
+    if not alerts:
+        log.info("[F5BOT] No alerts configured")
+        return []
+
+    seen = _load_seen()
+    return [
+        FeedSource(
+            key=f"f5bot:{alert['id']}",
+            group="f5bot",
+            url=f"{_HISTORY_URL}?id={alert['id']}",
+            parse=functools.partial(_parse_history, keyword=alert["keyword"]),
+            seen=seen,
+            meta={"keyword": alert["keyword"]},
+            session=session,
+        )
+        for alert in alerts
+    ]
 
-    hits = _scrape_all_hits(session)
+
+def process_results(results: list[PollResult]) -> dict:
+    """Score new hits from polled alert histories, alert on high-intent."""
+    stats = {"polled": 0, "new": 0, "hot": 0, "warm": 0, "archived": 0}
+    hits = [hit for res in results for hit in res.entries]
     if not hits:
         return stats
 
     stats["polled"] = len(hits)
-    seen = _load_seen()
+    seen = results[0].source.seen
 
     try:
         from viper.viper_q import score as viper_q_score
@@ -321,30 +314,34 @@ def poll_f5bot() -> dict:
         log.error("[F5BOT] viper_q not available — cannot score")
         return stats
 
-    for hit in hits:
-        url = hit.get("url", "")
-        if not url or url in seen:
-            continue
+    for res in results:
+        handled: set[str] = set()
+        for hit in res.entries:
+            url = hit.get("url", "")
+            if not url or url in handled or url in seen:
+                continue
 
-        seen.add(url)
-        stats["new"] += 1
+            handled.add(url)
+            stats["new"] += 1
 
-        # Score with VIPER-Q (title + context for better signal detection)
-        snippet = hit.get("context", "") or hit.get("title", "")
-        result = viper_q_score(hit.get("title", ""), snippet)
+            # Score with VIPER-Q (title + context for better signal detection)
+            snippet = hit.get("context", "") or hit.get("title", "")
+            result = viper_q_score(hit.get("title", ""), snippet)
 
-        # Log all leads
-        _log_lead(hit, result)
+            # Log all leads
+            _log_lead(hit, result)
 
-        # Alert on HOT and WARM
-        if result["classification"] == "HOT":
-            stats["hot"] += 1
-            _send_tg_alert(hit, result)
-        elif result["classification"] == "WARM":
-            stats["warm"] += 1
-            _send_tg_alert(hit, result)
-        else:
-            stats["archived"] += 1
+            # Alert on HOT and WARM
+            if result["classification"] == "HOT":
+                stats["hot"] += 1
+                _send_tg_alert(hit, result)
+            elif result["classification"] == "WARM":
+                stats["warm"] += 1
+                _send_tg_alert(hit, result)
+            else:
+                stats["archived"] += 1
+
+        commit(res, handled)
 
     _save_seen(seen)
 
@@ -355,3 +352,11 @@ def poll_f5bot() -> dict:
         )
 
     return stats
+
+
+def poll_f5bot(force: bool = False) -> dict:
+    """Poll due F5Bot alert histories, score new hits, alert on high-intent.
+
+    Returns summary dict with counts.
+    """
+    return process_results(poll_sources(build_sources(), force=force))
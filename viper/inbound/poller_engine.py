@@ -0,0 +1,249 @@
+"""Viper Inbound Poller Engine — one conditional, concurrent fetch loop for all inbound feeds.
+
+Google Alerts RSS, Reddit /new listings and F5Bot alert histories are all
+"poll a URL, find the entries we haven't seen" sources. Each module describes
+its feeds as FeedSource objects; this engine:
+
+  - sends conditional GETs (If-None-Match / If-Modified-Since) using the
+    validators stored per feed, so unchanged feeds cost a 304
+  - skips re-parsing when a 200 body is byte-identical to the last one
+  - adapts each feed's poll interval to how often it actually changes
+    (halve on new entries, back off x1.5 when quiet)
+  - runs every due feed in one bounded pool, with per-group caps so Reddit
+    and F5Bot aren't hammered
+  - hands parsers an is_seen callback so they stop at the first entry
+    already processed (feeds are newest-first)
+  - holds back the validators of a feed with new entries until the caller
+    has handled them: commit() marks the entries seen and stores the
+    validators in one transaction, so a crash in between refetches the feed
+    instead of losing its entries behind a 304
+
+Feed state lives in the ``feeds`` table of viper.state_store.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Container, Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from viper import state_store
+
+log = logging.getLogger(__name__)
+
+MAX_WORKERS = 8
+MIN_INTERVAL = 300       # 5 min — never poll a feed more often than this
+MAX_INTERVAL = 7200      # 2 h — quiet feeds still get checked a few times a day
+FAST_FACTOR = 0.5        # new entries → poll sooner
+SLOW_FACTOR = 1.5        # no change → back off
+
+# Concurrent requests allowed per source group (others share MAX_WORKERS)
+GROUP_LIMITS = {"reddit": 3, "f5bot": 2}
+
+_session_lock = threading.Lock()
+_shared_session: requests.Session | None = None
+
+
+@dataclass
+class FeedSource:
+    """One pollable feed. ``parse(body, is_seen)`` returns new entries, newest first."""
+    key: str
+    group: str
+    url: str
+    parse: Callable[[bytes, Callable[[str], bool]], list[dict]]
+    seen: Container[str]
+    meta: dict = field(default_factory=dict)
+    session: requests.Session | None = None
+    headers: dict = field(default_factory=dict)
+    timeout: int = 15
+
+
+@dataclass
+class PollResult:
+    source: FeedSource
+    status: str                      # new | unchanged | not_modified | not_due | error
+    entries: list[dict] = field(default_factory=list)
+    pending_state: dict | None = None   # feed state to store via commit() ("new" only)
+
+
+def _get_session() -> requests.Session:
+    """Pooled session shared by every source that doesn't bring its own (F5Bot does)."""
+    global _shared_session
+    with _session_lock:
+        if _shared_session is None:
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _shared_session = s
+        return _shared_session
+
+
+def _is_due(state: dict, now: float) -> bool:
+    last = state.get("last_checked", 0)
+    return now - last >= state.get("interval", MIN_INTERVAL)
+
+
+def _adapt(state: dict, changed: bool) -> None:
+    interval = state.get("interval", MIN_INTERVAL)
+    if changed:
+        interval = max(MIN_INTERVAL, interval * FAST_FACTOR)
+        state["changes"] = state.get("changes", 0) + 1
+    else:
+        interval = min(MAX_INTERVAL, interval * SLOW_FACTOR)
+    state["interval"] = int(interval)
+    state["polls"] = state.get("polls", 0) + 1
+
+
+def _poll_one(source: FeedSource, gate: threading.Semaphore | None) -> PollResult:
+    state = state_store.feed_state(source.key)
+    headers = dict(source.headers)
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+
+    session = source.session or _get_session()
+    try:
+        if gate:
+            with gate:
+                resp = session.get(source.url, headers=headers, timeout=source.timeout)
+        else:
+            resp = session.get(source.url, headers=headers, timeout=source.timeout)
+    except requests.RequestException as e:
+        log.debug("[INBOUND] Fetch failed for %s: %s", source.key, str(e)[:100])
+        return PollResult(source, "error")
+
+    state["last_checked"] = time.time()
+
+    if resp.status_code == 304:
+        _adapt(state, changed=False)
+        state_store.save_feed_state(source.key, state)
+        return PollResult(source, "not_modified")
+
+    if resp.status_code != 200:
+        log.debug("[INBOUND] %s returned HTTP %d", source.key, resp.status_code)
+        state_store.save_feed_state(source.key, state)
+        return PollResult(source, "error")
+
+    body = resp.content
+    body_hash = hashlib.sha1(body).hexdigest()
+    if body_hash == state.get("body_hash"):
+        state["etag"] = resp.headers.get("ETag", "")
+        state["last_modified"] = resp.headers.get("Last-Modified", "")
+        _adapt(state, changed=False)
+        state_store.save_feed_state(source.key, state)
+        return PollResult(source, "unchanged")
+
+    try:
+        entries = source.parse(body, source.seen.__contains__)
+    except Exception as e:
+        # Keep the old validators so the next poll fetches and parses it again
+        log.debug("[INBOUND] Parse failed for %s: %s", source.key, str(e)[:100])
+        state_store.save_feed_state(source.key, state)
+        return PollResult(source, "error")
+
+    state["etag"] = resp.headers.get("ETag", "")
+    state["last_modified"] = resp.headers.get("Last-Modified", "")
+    state["body_hash"] = body_hash
+    _adapt(state, changed=bool(entries))
+    if not entries:
+        state_store.save_feed_state(source.key, state)
+        return PollResult(source, "unchanged")
+    return PollResult(source, "new", entries, pending_state=state)
+
+
+def commit(result: PollResult, seen_keys: Iterable[str]) -> None:
+    """Mark a result's handled entries seen and store its feed state, atomically.
+
+    Call once the result's entries have been processed. Until then the feed
+    keeps its previous validators, so an exception or crash during
+    processing means the next poll fetches and parses the feed again.
+    No-op for results without new entries (their state is already stored).
+    """
+    if result.pending_state is None:
+        return
+    with state_store.transaction():
+        for key in seen_keys:
+            result.source.seen.add(key)
+        state_store.save_feed_state(result.source.key, result.pending_state)
+
+
+def poll_sources(sources: list[FeedSource], force: bool = False,
+                 max_workers: int = MAX_WORKERS) -> list[PollResult]:
+    """Fetch every due source concurrently. Results come back in ``sources`` order."""
+    now = time.time()
+    gates = {g: threading.BoundedSemaphore(n) for g, n in GROUP_LIMITS.items()}
+
+    results: dict[int, PollResult] = {}
+    due: list[int] = []
+    for i, src in enumerate(sources):
+        if force or _is_due(state_store.feed_state(src.key), now):
+            due.append(i)
+        else:
+            results[i] = PollResult(src, "not_due")
+
+    if due:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(due))) as pool:
+            futures = {
+                pool.submit(_poll_one, sources[i], gates.get(sources[i].group)): i
+                for i in due
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    log.debug("[INBOUND] Poll error for %s: %s", sources[i].key, str(e)[:100])
+                    results[i] = PollResult(sources[i], "error")
+
+    return [results[i] for i in range(len(sources))]
+
+
+def summarize(results: list[PollResult]) -> dict:
+    counts = {"new": 0, "unchanged": 0, "not_modified": 0, "not_due": 0, "error": 0}
+    for r in results:
+        counts[r.status] = counts.get(r.status, 0) + 1
+    counts["entries"] = sum(len(r.entries) for r in results)
+    return counts
+
+
+def poll_all_inbound(force: bool = False) -> dict:
+    """Poll RSS, Reddit and F5Bot sources in one bounded pool and process new entries.
+
+    Returns {"rss": stats, "reddit": stats, "f5bot": stats, "feeds": fetch counts}.
+    """
+    from viper.inbound import f5bot_poller, reddit_monitor, rss_poller
+
+    modules = {"rss": rss_poller, "reddit": reddit_monitor, "f5bot": f5bot_poller}
+    sources: list[FeedSource] = []
+    for name, mod in modules.items():
+        try:
+            sources.extend(mod.build_sources())
+        except Exception as e:
+            log.warning("[INBOUND] Could not build %s sources: %s", name, str(e)[:200])
+
+    results = poll_sources(sources, force=force)
+
+    out: dict = {"feeds": summarize(results)}
+    for name, mod in modules.items():
+        group = [r for r in results if r.source.group == name]
+        try:
+            out[name] = mod.process_results(group)
+        except Exception as e:
+            log.exception("[INBOUND] %s processing error: %s", name, str(e)[:200])
+            out[name] = {}
+
+    feeds = out["feeds"]
+    log.info(
+        "[INBOUND] %d feeds: %d new, %d unchanged, %d 304, %d not due, %d errors (%d entries)",
+        len(results), feeds["new"], feeds["unchanged"], feeds["not_modified"],
+        feeds["not_due"], feeds["error"], feeds["entries"],
+    )
+    return out
@@ -19,15 +19,16 @@ Uses Reddit JSON API (no API key needed for public posts).
 """
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import time
 from datetime import datetime
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import URLError
 from zoneinfo import ZoneInfo
 
+from viper import state_store
+from viper.inbound.poller_engine import FeedSource, PollResult, commit, poll_sources
 from viper.viper_q import score as viper_q_score, detect_niche as vq_detect_niche
 
 log = logging.getLogger(__name__)
@@ -91,42 +92,41 @@ SKIP_PATTERNS = [
 SKIP_AUTHORS = {"AutoModerator", "[deleted]", "automoderator"}
 
 _FETCH_TIMEOUT = 10
+_HEADERS = {"User-Agent": "Viper-Inbound-Monitor/1.0"}
 _MAX_POSTS = 25  # per subreddit
 _POST_AGE_LIMIT = 86400 * 3  # 3 days
 
 
 # ── Reddit JSON API (no auth needed) ───────────────────────────────
 
-def _fetch_subreddit(sub: str) -> list[dict]:
-    """Fetch recent posts from a subreddit using public JSON API."""
-    url = f"https://www.reddit.com/r/{sub}/new.json?limit={_MAX_POSTS}"
-    headers = {"User-Agent": "Viper-Inbound-Monitor/1.0"}
-    try:
-        req = Request(url, headers=headers)
-        with urlopen(req, timeout=_FETCH_TIMEOUT) as resp:
-            data = json.loads(resp.read())
-        posts = []
-        now = time.time()
-        for child in data.get("data", {}).get("children", []):
-            post = child.get("data", {})
-            age = now - post.get("created_utc", 0)
-            if age > _POST_AGE_LIMIT:
-                continue
-            posts.append({
-                "id": post.get("id", ""),
-                "title": post.get("title", ""),
-                "body": (post.get("selftext", "") or "")[:1000],
-                "url": f"https://reddit.com{post.get('permalink', '')}",
-                "subreddit": sub,
-                "author": post.get("author", ""),
-                "created_utc": post.get("created_utc", 0),
-                "score": post.get("score", 0),
-                "num_comments": post.get("num_comments", 0),
-            })
-        return posts
-    except (URLError, json.JSONDecodeError, OSError) as e:
-        log.debug("[REDDIT] Failed to fetch r/%s: %s", sub, str(e)[:100])
-        return []
+def _sub_url(sub: str) -> str:
+    return f"https://www.reddit.com/r/{sub}/new.json?limit={_MAX_POSTS}"
+
+
+def _parse_listing(raw: bytes, is_seen=lambda _id: False, sub: str = "") -> list[dict]:
+    """Parse a /new.json listing, newest first, stopping at the first post already seen."""
+    data = json.loads(raw)
+    posts = []
+    now = time.time()
+    for child in data.get("data", {}).get("children", []):
+        post = child.get("data", {})
+        if is_seen(post.get("id", "")):
+            break
+        age = now - post.get("created_utc", 0)
+        if age > _POST_AGE_LIMIT:
+            break
+        posts.append({
+            "id": post.get("id", ""),
+            "title": post.get("title", ""),
+            "body": (post.get("selftext", "") or "")[:1000],
+            "url": f"https://reddit.com{post.get('permalink', '')}",
+            "subreddit": sub,
+            "author": post.get("author", ""),
+            "created_utc": post.get("created_utc", 0),
+            "score": post.get("score", 0),
+            "num_comments": post.get("num_comments", 0),
+        })
+    return posts
 
 
 def _has_buyer_intent(title: str, body: str) -> tuple[bool, list[str]]:
@@ -148,22 +148,13 @@ def _has_buyer_intent(title: str, body: str) -> tuple[bool, list[str]]:
 
 # ── Seen Tracking ───────────────────────────────────────────────────
 
-def _load_seen() -> set:
-    if _SEEN_FILE.exists():
-        try:
-            return set(json.loads(_SEEN_FILE.read_text()))
-        except Exception:
-            log.warning("Corrupted reddit seen file — starting fresh")
-            return set()
-    return set()
+def _load_seen() -> state_store.SeenSet:
+    state_store.migrate_seen("reddit", _SEEN_FILE)
+    return state_store.SeenSet("reddit", cap=10000)
 
 
-def _save_seen(seen: set) -> None:
-    items = list(seen)
-    if len(items) > 10000:
-        items = items[-10000:]
-    _SEEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-    _SEEN_FILE.write_text(json.dumps(items))
+def _save_seen(seen: state_store.SeenSet) -> None:
+    seen.prune()
 
 
 def _log_lead(post: dict, matched: list[str], score: int, classification: str) -> None:
@@ -213,40 +204,48 @@ def _send_alert(post: dict, matched: list[str], score: int) -> None:
 
 # ── Main ────────────────────────────────────────────────────────────
 
-def poll_reddit() -> dict:
-    """Poll all monitored subreddits for buyer-intent posts.
+def build_sources() -> list[FeedSource]:
+    """One FeedSource per monitored subreddit."""
+    seen = _load_seen()
+    return [
+        FeedSource(
+            key=f"reddit:{sub}",
+            group="reddit",
+            url=_sub_url(sub),
+            parse=functools.partial(_parse_listing, sub=sub),
+            seen=seen,
+            meta={"subreddit": sub},
+            headers=_HEADERS,
+            timeout=_FETCH_TIMEOUT,
+        )
+        for sub in ALL_SUBS
+    ]
 
-    Returns summary dict.
-    """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    seen = _load_seen()
+def process_results(results: list[PollResult]) -> dict:
+    """Gate and score new posts from polled subreddits, alert on buyer intent."""
     stats = {"subs_polled": 0, "new_posts": 0, "matches": 0, "alerts": 0}
-
-    # Fetch all subs in parallel
-    sub_results = {}
-    with ThreadPoolExecutor(max_workers=5) as pool:
-        futures = {pool.submit(_fetch_subreddit, sub): sub for sub in ALL_SUBS}
-        for future in as_completed(futures):
-            sub = futures[future]
-            try:
-                sub_results[sub] = future.result()
-            except Exception:
-                sub_results[sub] = []
+    if not results:
+        return stats
+    seen = results[0].source.seen
 
     # Industry subs get scored directly by VIPER-Q (subreddit itself signals intent)
     # Business/AI subs need the intent keyword gate first (too noisy otherwise)
     industry_set = set(INDUSTRY_SUBS)
 
-    for sub, posts in sub_results.items():
+    for res in results:
+        if res.status == "not_due":
+            continue
         stats["subs_polled"] += 1
+        sub = res.source.meta["subreddit"]
+        handled: set[str] = set()
 
-        for post in posts:
+        for post in res.entries:
             post_id = post.get("id", "")
-            if not post_id or post_id in seen:
+            if not post_id or post_id in handled or post_id in seen:
                 continue
 
-            seen.add(post_id)
+            handled.add(post_id)
             stats["new_posts"] += 1
 
             # Skip AutoModerator and deleted accounts
@@ -256,10 +255,10 @@ def poll_reddit() -> dict:
 
             # Skip duplicate URLs (same post seen via different path)
             post_url = post.get("url", "")
-            if post_url and post_url in seen:
+            if post_url and (post_url in handled or post_url in seen):
                 continue
             if post_url:
-                seen.add(post_url)
+                handled.add(post_url)
 
             title = post.get("title", "")
             body = post.get("body", "")
@@ -287,6 +286,8 @@ def poll_reddit() -> dict:
                 _send_alert(post, matched + result.get("signals", [])[:3], result["score"])
                 stats["alerts"] += 1
 
+        commit(res, handled)
+
     _save_seen(seen)
 
     if stats["matches"] > 0:
@@ -296,3 +297,11 @@ def poll_reddit() -> dict:
         )
 
     return stats
+
+
+def poll_reddit(force: bool = False) -> dict:
+    """Poll due subreddits for buyer-intent posts.
+
+    Returns summary dict.
+    """
+    return process_results(poll_sources(build_sources(), force=force))
@@ -1,6 +1,7 @@
 """Viper Inbound RSS Poller — monitors 25 Google Alert feeds for buyer intent.
 
-Runs every 5 minutes as part of Viper's loop. High-intent matches (score 50+)
+Polled through viper.inbound.poller_engine (conditional GETs, adaptive
+per-feed intervals) as part of Viper's loop. High-intent matches (score 50+)
 trigger immediate Telegram alerts to Jordan via Shelby.
 
 VIPER-Q scoring from spec:
@@ -10,17 +11,16 @@ VIPER-Q scoring from spec:
 """
 from __future__ import annotations
 
+import io
 import json
 import logging
-import time
 import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import URLError
 from zoneinfo import ZoneInfo
 
+from viper import state_store
+from viper.inbound.poller_engine import FeedSource, PollResult, commit, poll_sources
 from viper.viper_q import score as viper_q_score, detect_niche, niche_color, classify
 
 log = logging.getLogger(__name__)
@@ -41,56 +41,51 @@ def score_lead(title: str, snippet: str) -> dict:
 
 # ── RSS Parsing ─────────────────────────────────────────────────────
 
-def _fetch_feed(url: str) -> list[dict]:
-    """Fetch and parse a Google Alerts RSS feed. Returns list of entries."""
+_ATOM = "{http://www.w3.org/2005/Atom}"
+
+
+def _text(entry: ET.Element, tag: str) -> str:
+    el = entry.find(_ATOM + tag)
+    return (el.text or "") if el is not None else ""
+
+
+def _parse_feed(xml_data: bytes, is_seen=lambda _id: False) -> list[dict]:
+    """Incrementally parse a Google Alerts Atom feed, newest first.
+
+    Stops at the first entry already seen — everything after it is older.
+    """
+    entries = []
     try:
-        req = Request(url, headers={"User-Agent": "Viper-Inbound/1.0"})
-        with urlopen(req, timeout=_POLL_TIMEOUT) as resp:
-            xml_data = resp.read()
-        root = ET.fromstring(xml_data)
-
-        entries = []
-        # Atom feed format (Google Alerts uses Atom)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        for entry in root.findall("atom:entry", ns):
-            title_el = entry.find("atom:title", ns)
-            link_el = entry.find("atom:link", ns)
-            content_el = entry.find("atom:content", ns)
-            id_el = entry.find("atom:id", ns)
-            published_el = entry.find("atom:published", ns)
-
-            entries.append({
-                "id": id_el.text if id_el is not None else "",
-                "title": title_el.text if title_el is not None else "",
+        for _event, el in ET.iterparse(io.BytesIO(xml_data), events=("end",)):
+            if el.tag != _ATOM + "entry":
+                continue
+            link_el = el.find(_ATOM + "link")
+            entry = {
+                "id": _text(el, "id"),
+                "title": _text(el, "title"),
                 "url": link_el.get("href", "") if link_el is not None else "",
-                "snippet": (content_el.text or "")[:500] if content_el is not None else "",
-                "published": published_el.text if published_el is not None else "",
-            })
-        return entries
-    except (URLError, ET.ParseError, OSError) as e:
-        log.debug("Feed fetch failed for %s: %s", url[:60], e)
-        return []
+                "snippet": _text(el, "content")[:500],
+                "published": _text(el, "published"),
+            }
+            el.clear()
+            if is_seen(entry["id"] or entry["url"]):
+                break
+            entries.append(entry)
+    except ET.ParseError as e:
+        log.debug("Feed parse failed: %s", e)
+    return entries
 
 
 # ── Seen tracking ───────────────────────────────────────────────────
 
-def _load_seen() -> set:
-    if _SEEN_FILE.exists():
-        try:
-            return set(json.loads(_SEEN_FILE.read_text()))
-        except Exception:
-            log.warning("Corrupted seen file at %s — starting fresh", _SEEN_FILE)
-            return set()
-    return set()
+def _load_seen() -> state_store.SeenSet:
+    state_store.migrate_seen("rss", _SEEN_FILE)
+    # Cap at 25K to prevent unbounded growth (covers ~3 days of feeds)
+    return state_store.SeenSet("rss", cap=25000)
 
 
-def _save_seen(seen: set) -> None:
-    # Cap at 25K to prevent unbounded growth (covers ~3 days of feeds)
-    items = list(seen)
-    if len(items) > 25000:
-        items = items[-25000:]
-    _SEEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-    _SEEN_FILE.write_text(json.dumps(items))
+def _save_seen(seen: state_store.SeenSet) -> None:
+    seen.prune()
 
 
 def _log_lead(entry: dict, result: dict, feed_keyword: str) -> None:
@@ -142,44 +137,49 @@ def _send_tg_alert(entry: dict, result: dict) -> None:
 
 # ── Main Poll Loop ──────────────────────────────────────────────────
 
-def poll_all_feeds() -> dict:
-    """Poll all 25 RSS feeds, score new entries, alert on high-intent.
-
-    Returns summary dict with counts.
-    """
+def build_sources() -> list[FeedSource]:
+    """One FeedSource per configured Google Alert feed."""
     if not _FEEDS_FILE.exists():
         log.warning("No RSS feeds configured at %s", _FEEDS_FILE)
-        return {"polled": 0, "new": 0, "hot": 0, "warm": 0}
-
-    feeds_data = json.loads(_FEEDS_FILE.read_text())
-    feeds = feeds_data.get("feeds", [])
-    if not feeds:
-        return {"polled": 0, "new": 0, "hot": 0, "warm": 0}
+        return []
 
+    feeds = json.loads(_FEEDS_FILE.read_text()).get("feeds", [])
     seen = _load_seen()
+    return [
+        FeedSource(
+            key=f"rss:{f['url']}",
+            group="rss",
+            url=f["url"],
+            parse=_parse_feed,
+            seen=seen,
+            meta={"keyword": f.get("keyword", "")},
+            headers={"User-Agent": "Viper-Inbound/1.0"},
+            timeout=_POLL_TIMEOUT,
+        )
+        for f in feeds if f.get("url")
+    ]
+
+
+def process_results(results: list[PollResult]) -> dict:
+    """Score new entries from polled feeds, alert on high-intent."""
     stats = {"polled": 0, "new": 0, "hot": 0, "warm": 0, "archived": 0}
+    if not results:
+        return stats
+    seen = results[0].source.seen
 
-    # Fetch all feeds in parallel (10 threads)
-    feed_results = {}
-    valid_feeds = [(f.get("url", ""), f.get("keyword", "")) for f in feeds if f.get("url")]
-    with ThreadPoolExecutor(max_workers=10) as pool:
-        futures = {pool.submit(_fetch_feed, url): (url, kw) for url, kw in valid_feeds}
-        for future in as_completed(futures):
-            url, kw = futures[future]
-            try:
-                feed_results[(url, kw)] = future.result()
-            except Exception:
-                feed_results[(url, kw)] = []
-
-    for (url, keyword), entries in feed_results.items():
+    for res in results:
+        if res.status == "not_due":
+            continue
         stats["polled"] += 1
+        keyword = res.source.meta.get("keyword", "")
+        handled: set[str] = set()
 
-        for entry in entries:
+        for entry in res.entries:
             entry_id = entry.get("id") or entry.get("url", "")
-            if not entry_id or entry_id in seen:
+            if not entry_id or entry_id in handled or entry_id in seen:
                 continue
 
-            seen.add(entry_id)
+            handled.add(entry_id)
             stats["new"] += 1
 
             # Score it
@@ -198,6 +198,8 @@ def poll_all_feeds() -> dict:
             else:
                 stats["archived"] += 1
 
+        commit(res, handled)
+
     _save_seen(seen)
 
     if stats["new"] > 0:
@@ -207,3 +209,14 @@ def poll_all_feeds() -> dict:
         )
 
     return stats
+
+
+def poll_all_feeds(force: bool = False) -> dict:
+    """Poll due RSS feeds (conditional GETs), score new entries, alert on high-intent.
+
+    Returns summary dict with counts.
+    """
+    sources = build_sources()
+    if not sources:
+        return {"polled": 0, "new": 0, "hot": 0, "warm": 0}
+    return process_results(poll_sources(sources, force=force))
@@ -28,6 +28,7 @@ from viper.sources.google_alerts import scan_google_alerts
 from viper.sources.reddit import scan_reddit
 from viper.telegram_alerts import send_job_alert, send_summary
 from viper.lead_writer import write_leads
+from viper import state_store
 
 # Optional sources — only on Pro (graceful skip on Air)
 # Indie Hackers DISABLED (Mar 12 2026) — zero valid leads, all builder posts.
@@ -235,21 +236,15 @@ def _job_hash(source: str, job_id: str) -> str:
     return hashlib.md5(f"{source}:{job_id}".encode()).hexdigest()[:16]
 
 
-def _load_seen() -> dict[str, float]:
-    if not SEEN_JOBS_FILE.exists():
-        return {}
-    try:
-        data = json.loads(SEEN_JOBS_FILE.read_text())
-        now = time.time()
-        # Keep: permanent entries (v < 0 = Jordan BID/SKIP'd) + entries < 7 days old
-        return {k: v for k, v in data.items() if v < 0 or now - v < 604800}
-    except Exception:
-        return {}
+def _load_seen() -> state_store.SeenSet:
+    """Seen job hashes: permanent (ts < 0 = Jordan BID/SKIP'd) + entries < 7 days old."""
+    state_store.migrate_seen("jobs", SEEN_JOBS_FILE)
+    return state_store.SeenSet("jobs", ttl=604800)
 
 
-def _save_seen(seen: dict[str, float]) -> None:
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    SEEN_JOBS_FILE.write_text(json.dumps(seen, indent=2))
+def _save_seen(seen: state_store.SeenSet) -> None:
+    """Entries are written as they're added — just expire the stale ones."""
+    seen.prune()
 
 
 def _log_job(job: dict) -> None:
@@ -647,8 +642,7 @@ def run_scan() -> dict:
 def run_loop(interval_minutes: int = 30) -> None:
     """Run scanner in a loop with configurable interval."""
     from viper.drip_runner import run_drip_cycle
-    from viper.inbound.rss_poller import poll_all_feeds
-    from viper.inbound.reddit_monitor import poll_reddit
+    from viper.inbound.poller_engine import poll_all_inbound
 
     log.info("[JOB_HUNTER] Starting loop (interval=%d min)", interval_minutes)
     while True:
@@ -665,30 +659,18 @@ def run_loop(interval_minutes: int = 30) -> None:
         except Exception as e:
             log.exception("[JOB_HUNTER] Drip cycle error: %s", str(e)[:200])
 
-        # Poll inbound RSS feeds (Google Alerts)
-        try:
-            inbound = poll_all_feeds()
-            if inbound.get("hot", 0) or inbound.get("warm", 0):
-                log.info("[JOB_HUNTER] Inbound: %d hot, %d warm leads", inbound["hot"], inbound["warm"])
-        except Exception as e:
-            log.exception("[JOB_HUNTER] Inbound poll error: %s", str(e)[:200])
-
-        # Poll Reddit for buyer-intent posts
+        # Poll inbound sources (Google Alerts RSS, Reddit, F5Bot) in one pass
         try:
-            reddit_stats = poll_reddit()
+            inbound = poll_all_inbound()
+            rss, reddit_stats, f5bot = inbound["rss"], inbound["reddit"], inbound["f5bot"]
+            if rss.get("hot", 0) or rss.get("warm", 0):
+                log.info("[JOB_HUNTER] Inbound: %d hot, %d warm leads", rss["hot"], rss["warm"])
             if reddit_stats.get("matches", 0):
                 log.info("[JOB_HUNTER] Reddit: %d matches, %d alerts", reddit_stats["matches"], reddit_stats["alerts"])
-        except Exception as e:
-            log.exception("[JOB_HUNTER] Reddit poll error: %s", str(e)[:200])
-
-        # Poll F5Bot keyword alerts (Reddit + HN)
-        try:
-            from viper.inbound.f5bot_poller import poll_f5bot
-            f5bot = poll_f5bot()
             if f5bot.get("hot", 0) or f5bot.get("warm", 0):
                 log.info("[JOB_HUNTER] F5Bot: %d hot, %d warm leads", f5bot["hot"], f5bot["warm"])
         except Exception as e:
-            log.debug("[JOB_HUNTER] F5Bot poll failed: %s", str(e)[:100])
+            log.exception("[JOB_HUNTER] Inbound poll error: %s", str(e)[:200])
 
         # Poll Algora bounties (code bounties for cash)
         try:
@@ -2,36 +2,27 @@
 
 Writes the lead format that Claude Overseer reads every cycle.
 Scores leads using the 5-dimension system (fit, rate, effort, competition, client).
+
+Leads are kept in the Viper state store (indexed by hash); viper_leads.json
+is re-exported from the store after each change for Claude Overseer.
 """
 from __future__ import annotations
 
-import fcntl
 import json
 import logging
-from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+from viper import state_store
+
 log = logging.getLogger(__name__)
 ET = ZoneInfo("America/New_York")
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 LEADS_FILE = DATA_DIR / "viper_leads.json"
-LEADS_LOCK = DATA_DIR / "viper_leads.lock"
-
+SEEN_JOBS_FILE = DATA_DIR / "viper_seen_jobs.json"
 
-@contextmanager
-def _leads_lock():
-    """File lock for viper_leads.json — prevents race conditions between agents."""
-    LEADS_LOCK.parent.mkdir(parents=True, exist_ok=True)
-    fd = open(LEADS_LOCK, "w")
-    try:
-        fcntl.flock(fd, fcntl.LOCK_EX)
-        yield
-    finally:
-        fcntl.flock(fd, fcntl.LOCK_UN)
-        fd.close()
 
 # Also write to Claude Overseer data dir
 OVERSEER_LEADS = Path.home() / "claude_overseer" / "data" / "viper_leads.json"
@@ -205,31 +196,21 @@ def write_leads(jobs: list[dict]) -> int:
     """Write jobs to viper_leads.json in Claude-readable format.
 
     Only includes leads with composite >= COMPOSITE_THRESHOLD.
-    Returns number of leads written. Uses file locking to prevent race conditions.
+    Returns number of leads written. Runs in one store transaction, which
+    serializes concurrent writers (replaces the old viper_leads.lock).
     """
-    with _leads_lock():
+    state_store.migrate_leads(LEADS_FILE)
+    with state_store.transaction():
         return _write_leads_inner(jobs)
 
 
 def _write_leads_inner(jobs: list[dict]) -> int:
-    """Inner write function — called within file lock."""
-    # Load existing leads
-    existing = []
-    if LEADS_FILE.exists():
-        try:
-            data = json.loads(LEADS_FILE.read_text())
-            existing = data.get("leads", [])
-        except Exception:
-            existing = []
-
-    # Existing hashes for dedup
-    existing_hashes = {l.get("hash") for l in existing}
-
-    # Score and convert new jobs
+    """Inner write function — called within a store transaction."""
+    # Score and convert new jobs (dedup is an indexed hash lookup)
     new_leads = []
     for job in jobs:
         h = job.get("hash", "")
-        if h in existing_hashes:
+        if state_store.lead_exists(h):
             continue
 
         scores = _score_dimensions(job)
@@ -253,83 +234,65 @@ def _write_leads_inner(jobs: list[dict]) -> int:
             "bid_count": job.get("bid_count"),
             "client_country": job.get("client_country", ""),
         }
+        state_store.put_lead(lead)
         new_leads.append(lead)
 
-    # Merge: new first, then existing
-    all_leads = new_leads + existing
-
     # Keep only MAX_LEADS_KEPT, prioritize by composite score
-    all_leads.sort(key=lambda l: l.get("scores", {}).get("composite", 0), reverse=True)
-    all_leads = all_leads[:MAX_LEADS_KEPT]
+    state_store.prune_leads(MAX_LEADS_KEPT)
+    all_leads = _export_leads()
+
+    log.info("[LEAD_WRITER] Wrote %d leads (%d new, composite >= %.1f)",
+             len(all_leads), len(new_leads), COMPOSITE_THRESHOLD)
+    return len(new_leads)
 
-    # Write to both locations
+
+def _export_leads() -> list[dict]:
+    """Write the top leads from the store to both viper_leads.json locations."""
+    all_leads = state_store.top_leads(MAX_LEADS_KEPT)
     output = {"leads": all_leads, "updated_at": datetime.now(ET).isoformat()}
     output_json = json.dumps(output, indent=2)
 
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    LEADS_FILE.write_text(output_json)
+    tmp = LEADS_FILE.with_suffix(".tmp")
+    tmp.write_text(output_json)
+    tmp.replace(LEADS_FILE)
 
     if OVERSEER_LEADS.parent.exists():
         OVERSEER_LEADS.write_text(output_json)
+    return all_leads
 
-    log.info("[LEAD_WRITER] Wrote %d leads (%d new, composite >= %.1f)",
-             len(all_leads), len(new_leads), COMPOSITE_THRESHOLD)
-    return len(new_leads)
+
+def find_lead(lead_hash: str) -> dict | None:
+    """Look up a lead by hash prefix (indexed range scan)."""
+    state_store.migrate_leads(LEADS_FILE)
+    return state_store.find_lead(lead_hash)
 
 
 def mark_lead_status(lead_hash: str, status: str) -> bool:
     """Mark a lead's status in viper_leads.json (bid/skip/contacted).
 
-    Uses file locking to prevent race conditions with write_leads().
+    Runs in a store transaction so it can't interleave with write_leads().
     Returns True if found and updated, False otherwise.
     """
-    with _leads_lock():
-        return _mark_lead_status_inner(lead_hash, status)
-
-
-def _mark_lead_status_inner(lead_hash: str, status: str) -> bool:
-    if not LEADS_FILE.exists():
-        return False
-
-    try:
-        data = json.loads(LEADS_FILE.read_text())
-    except Exception:
-        return False
-
-    leads = data.get("leads", [])
-    updated = False
-
-    for lead in leads:
-        h = lead.get("hash", "")
-        if h.startswith(lead_hash) or lead_hash.startswith(h[:20]):
-            lead["status"] = status
-            lead["status_updated_at"] = datetime.now(ET).isoformat()
-            updated = True
-            break
-
-    if updated:
-        data["leads"] = leads
-        LEADS_FILE.write_text(json.dumps(data, indent=2))
-        if OVERSEER_LEADS.parent.exists():
-            OVERSEER_LEADS.write_text(json.dumps(data, indent=2))
-        log.info("[LEAD_WRITER] Marked lead %s as %s", lead_hash[:8], status)
+    state_store.migrate_leads(LEADS_FILE)
+    with state_store.transaction():
+        lead = state_store.find_lead(lead_hash)
+        if lead is None:
+            return False
+        lead["status"] = status
+        lead["status_updated_at"] = datetime.now(ET).isoformat()
+        state_store.put_lead(lead)
+        _export_leads()
 
-        # Permanently mark this hash in seen_jobs so it never resurfaces
-        # Uses -1 timestamp = permanent (survives the 7-day TTL cleanup)
-        _stamp_seen_permanent(lead_hash)
+    log.info("[LEAD_WRITER] Marked lead %s as %s", lead_hash[:8], status)
 
-    return updated
+    # Permanently mark this hash in seen_jobs so it never resurfaces
+    # Uses -1 timestamp = permanent (survives the 7-day TTL cleanup)
+    _stamp_seen_permanent(lead_hash)
+    return True
 
 
 def _stamp_seen_permanent(lead_hash: str) -> None:
-    """Add a lead hash to viper_seen_jobs.json as permanent (never expires)."""
-    seen_file = DATA_DIR / "viper_seen_jobs.json"
-    seen: dict = {}
-    if seen_file.exists():
-        try:
-            seen = json.loads(seen_file.read_text())
-        except Exception:
-            seen = {}
-    # -1 = permanent — _load_seen() preserves entries with v < 0
-    seen[lead_hash] = -1
-    seen_file.write_text(json.dumps(seen, indent=2))
+    """Mark a lead hash in the job-hunter seen set as permanent (never expires)."""
+    state_store.migrate_seen("jobs", SEEN_JOBS_FILE)
+    state_store.SeenSet("jobs").mark_permanent(lead_hash)
@@ -50,45 +50,15 @@ THROTTLE_PCT = 80   # At 80% → force local (free, all routes use local 14B)
 BLOCK_PCT = 100     # At 100% → force local (free, all routes use local 14B)
 SPIKE_MULTIPLIER = 3.0  # Hourly burn > 3x expected → alert
 
-# Tail read limit for large JSONL files
-_TAIL_BYTES = 3 * 1024 * 1024  # 3 MB
-
 
 def _parse_today_costs() -> dict[str, float]:
-    """Read tail of llm_costs.jsonl and sum cost_usd by agent for today (ET)."""
-    if not LLM_COSTS_FILE.exists():
-        return {}
-
-    today_str = datetime.now(ET).strftime("%Y-%m-%d")
-    costs: dict[str, float] = {}
-
+    """Sum cost_usd by agent for today (ET) from the incremental llm_costs index."""
     try:
-        file_size = LLM_COSTS_FILE.stat().st_size
-        with open(LLM_COSTS_FILE, "r") as f:
-            # Seek to tail for speed on large files
-            if file_size > _TAIL_BYTES:
-                f.seek(file_size - _TAIL_BYTES)
-                f.readline()  # discard partial line
-
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                # Fast date check before parsing JSON
-                if today_str not in line[:35]:
-                    continue
-                try:
-                    rec = json.loads(line)
-                    ts = rec.get("ts", "")
-                    if ts[:10] == today_str:
-                        agent = rec.get("agent", "unknown")
-                        costs[agent] = costs.get(agent, 0.0) + rec.get("cost_usd", 0.0)
-                except (json.JSONDecodeError, KeyError):
-                    continue
+        from shared.llm_cost_index import today_costs_by_agent
+        return today_costs_by_agent()
     except Exception:
-        log.exception("Failed to parse llm_costs.jsonl")
-
-    return costs
+        log.exception("Failed to read llm_costs index")
+        return {}
 
 
 def _compute_budgets(today_costs: dict[str, float]) -> dict[str, dict]:
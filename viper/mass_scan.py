@@ -12,15 +12,17 @@ import json
 import logging
 import os
 import sys
+import threading
 import time
-from dataclasses import asdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # Allow running from repo root
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from viper.prospecting.maps_scraper import discover_businesses, deduplicate_listings
+from viper.prospecting.maps_scraper import discover_businesses, deduplicate_listings, MapsListing
 from viper.prospecting.chatbot_detector import detect_chatbot, ChatbotDetectionResult
 from viper.prospecting.local_scorer import score_prospect, score_prospect_v3
 from viper.prospecting.prospect_writer import build_prospect, LocalProspect
@@ -29,7 +31,7 @@ from viper.prospecting.tech_fingerprinter import fingerprint_tech_stack
 from viper.prospecting.pagespeed_auditor import audit_pagespeed
 from viper.prospecting.gbp_enricher import enrich_from_gbp
 from viper.prospecting.apollo_enricher import enrich_email as apollo_enrich_email, extract_domain
-from viper.demos.scraper import scrape_business, ScrapedBusiness
+from viper.demos.scraper import scrape_business, ScrapedBusiness, _fetch_raw_html
 from viper.outreach.outreach_engine import run_outreach
 from viper.tg_router import send as tg_send
 
@@ -48,9 +50,15 @@ NICHES = ["HVAC contractor", "personal injury lawyer", "med spa"]
 CITIES = ["Portland ME", "Boston MA", "Manchester NH", "Nashua NH", "Concord NH", "Worcester MA", "Providence RI"]
 MAX_PER_CITY = 25
 MIN_SCORE = 7.0
-SITE_DELAY = 1.5  # seconds between scrapes
+SITE_DELAY = 1.5  # min seconds between requests to the same website
 MAPS_DELAY = 2.5  # seconds between Maps scrolls
-SCAN_PAUSE = 10   # seconds between city scans (avoid rate limits)
+SCAN_PAUSE = 10   # min seconds between Maps discoveries (avoid rate limits)
+
+# Enrichment pipeline — bounded worker pool per stage
+FETCH_WORKERS = 8       # homepage fetch + scrape + chatbot + fingerprint
+PAGESPEED_WORKERS = 6   # PageSpeed API calls (mobile + desktop run concurrently)
+ENRICH_WORKERS = 4      # GBP + Apollo + V3 scoring
+AUDIT_WORKERS = 4       # crawl_and_audit
 
 DATA_DIR = Path.home() / "polymarket-bot" / "data"
 
@@ -74,6 +82,228 @@ def _send_tg(text: str) -> bool:
     return tg_send(text, channel="OUTREACH")
 
 
+# ── Enrichment Pipeline ──────────────────────────────────────────────────
+
+class _DomainThrottle:
+    """Per-domain politeness limiter — replaces global sleeps between sites.
+
+    Requests to different domains proceed in parallel; requests to the same
+    domain are spaced at least ``min_interval`` seconds apart.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot: dict[str, float] = {}
+
+    def wait(self, url: str, min_interval: float | None = None) -> None:
+        interval = self.min_interval if min_interval is None else min_interval
+        domain = extract_domain(url) or url
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(domain, 0.0))
+            self._next_slot[domain] = slot + interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_site_throttle = _DomainThrottle(SITE_DELAY)
+
+
+class _StageMeter:
+    """Thread-safe throughput counter for one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self._first_start = 0.0
+        self._last_end = 0.0
+        self._lock = threading.Lock()
+
+    def run(self, fn, *args, **kwargs):
+        start = time.monotonic()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            end = time.monotonic()
+            with self._lock:
+                self.count += 1
+                if not self._first_start or start < self._first_start:
+                    self._first_start = start
+                self._last_end = max(self._last_end, end)
+
+    def listings_per_minute(self) -> float:
+        with self._lock:
+            elapsed = self._last_end - self._first_start
+            if self.count == 0 or elapsed <= 0:
+                return 0.0
+            return round(self.count / (elapsed / 60), 1)
+
+
+@dataclass
+class _FetchedSite:
+    """Output of the fetch stage — one homepage download shared by all consumers."""
+    scraped: ScrapedBusiness | None = None
+    chatbot: ChatbotDetectionResult | None = None
+    tech_stack: dict | None = None
+
+
+def _fetch_stage(listing: MapsListing) -> _FetchedSite:
+    """Fetch the homepage once, then scrape, detect chatbot and fingerprint from it."""
+    site = _FetchedSite()
+    url = listing.website_url
+    if not url:
+        return site
+
+    _site_throttle.wait(url)
+    raw_html = _fetch_raw_html(url) or ""
+    if raw_html:
+        try:
+            site.scraped = scrape_business(url, html=raw_html)
+        except Exception as e:
+            log.debug("Scrape failed for %s: %s", url, e)
+
+        site.chatbot = detect_chatbot(raw_html)
+
+        try:
+            site.tech_stack = fingerprint_tech_stack(url, raw_html).to_dict()
+        except Exception as e:
+            log.debug("Tech fingerprint failed for %s: %s", url, e)
+    else:
+        # Keep the UNCERTAIN verdict for unreachable sites
+        site.chatbot = detect_chatbot("")
+
+    return site
+
+
+def _pagespeed_stage(url: str, strategy: str) -> dict | None:
+    """One PageSpeed audit; mobile and desktop are submitted as separate tasks."""
+    try:
+        ps = audit_pagespeed(url, strategy)
+        if not ps.error:
+            return ps.to_dict()
+    except Exception as e:
+        log.debug("PageSpeed %s failed for %s: %s", strategy, url, e)
+    return None
+
+
+def _enrich_stage(
+    listing: MapsListing,
+    site: _FetchedSite,
+    pagespeed: tuple[Future, Future] | None,
+) -> LocalProspect:
+    """GBP + Apollo (budget-guarded), then V3 score once PageSpeed lands."""
+    scraped, chatbot = site.scraped, site.chatbot
+    gbp_data_dict: dict | None = None
+    apollo_contacts_list: list | None = None
+
+    # GBP enrichment (V3) — budget guard: pre-score >= 6.0
+    pre_score = score_prospect(listing, scraped, chatbot)
+    if pre_score.total >= 6.0:
+        try:
+            gbp_result = enrich_from_gbp(listing.business_name, listing.address)
+            if not gbp_result.error:
+                gbp_data_dict = gbp_result.to_dict()
+        except Exception as e:
+            log.debug("GBP enrich failed for %s: %s", listing.business_name, e)
+
+    # Apollo email enrichment (V3) — budget guard: score >= 7.0 AND no email
+    if pre_score.total >= 7.0 and scraped and not scraped.email and listing.website_url:
+        domain = extract_domain(listing.website_url)
+        if domain:
+            try:
+                contacts = apollo_enrich_email(domain, listing.business_name, limit=3)
+                if contacts:
+                    apollo_contacts_list = [c.to_dict() for c in contacts]
+                    # Use best contact's email
+                    best = contacts[0]
+                    scraped.email = best.email
+                    name = f"{best.first_name} {best.last_name}".strip()
+                    if name and not scraped.team_members:
+                        scraped.team_members.append(name)
+            except Exception as e:
+                log.debug("Apollo enrich failed for %s: %s", listing.business_name, e)
+
+    pagespeed_mobile_data: dict | None = None
+    pagespeed_desktop_data: dict | None = None
+    if pagespeed:
+        pagespeed_mobile_data = pagespeed[0].result()
+        pagespeed_desktop_data = pagespeed[1].result()
+
+    # Score with V3 (8 dimensions) using enrichment data
+    score = score_prospect_v3(
+        listing, scraped, chatbot,
+        tech_stack=site.tech_stack,
+        pagespeed=pagespeed_mobile_data,
+        gbp=gbp_data_dict,
+    )
+    return build_prospect(
+        listing, scraped, chatbot, score,
+        tech_stack=site.tech_stack,
+        pagespeed_mobile=pagespeed_mobile_data,
+        pagespeed_desktop=pagespeed_desktop_data,
+        gbp_data=gbp_data_dict,
+        apollo_contacts=apollo_contacts_list,
+    )
+
+
+def _run_enrichment_pipeline(
+    listings: list[MapsListing],
+) -> tuple[list[LocalProspect], dict[str, float]]:
+    """Run fetch → pagespeed → enrich as overlapping stages with bounded pools.
+
+    Each listing moves to the enrich stage as soon as its fetch finishes;
+    PageSpeed audits start immediately for every listing since they only
+    need the URL. Returns prospects (in listing order) and listings/minute
+    per stage.
+    """
+    meters = {name: _StageMeter(name) for name in ("fetch", "pagespeed", "enrich")}
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as fetch_pool, \
+            ThreadPoolExecutor(max_workers=PAGESPEED_WORKERS) as ps_pool, \
+            ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as enrich_pool:
+
+        pagespeed: list[tuple[Future, Future] | None] = []
+        for listing in listings:
+            if listing.website_url:
+                pagespeed.append((
+                    ps_pool.submit(meters["pagespeed"].run, _pagespeed_stage,
+                                   listing.website_url, "mobile"),
+                    ps_pool.submit(meters["pagespeed"].run, _pagespeed_stage,
+                                   listing.website_url, "desktop"),
+                ))
+            else:
+                pagespeed.append(None)
+
+        fetch_futures = {
+            fetch_pool.submit(meters["fetch"].run, _fetch_stage, listing): i
+            for i, listing in enumerate(listings)
+        }
+
+        enrich_futures: dict[int, Future] = {}
+        for fut in as_completed(fetch_futures):
+            i = fetch_futures[fut]
+            try:
+                site = fut.result()
+            except Exception as e:
+                log.debug("Fetch stage failed for %s: %s", listings[i].website_url, e)
+                site = _FetchedSite()
+            enrich_futures[i] = enrich_pool.submit(
+                meters["enrich"].run, _enrich_stage, listings[i], site, pagespeed[i],
+            )
+
+        prospects = [enrich_futures[i].result() for i in range(len(listings))]
+
+    # PageSpeed runs two audits per listing — report listings, not calls
+    rates = {name: m.listings_per_minute() for name, m in meters.items()}
+    rates["pagespeed"] = round(rates["pagespeed"] / 2, 1)
+    log.info(
+        "Pipeline throughput (listings/min): fetch=%.1f pagespeed=%.1f enrich=%.1f",
+        rates["fetch"], rates["pagespeed"], rates["enrich"],
+    )
+    return prospects, rates
+
+
 # ── Single City Scan ─────────────────────────────────────────────────────
 
 def scan_city_niche(niche: str, city: str) -> dict:
@@ -92,12 +322,14 @@ def scan_city_niche(niche: str, city: str) -> dict:
         "skipped": 0,
         "already_contacted": 0,
         "prospects": [],
+        "stage_rates": {},
         "error": None,
     }
 
     log.info("Scanning: %s in %s", niche, city)
 
-    # Step 1 — Google Maps discovery
+    # Step 1 — Google Maps discovery (spaced SCAN_PAUSE apart, not slept after)
+    _site_throttle.wait("https://www.google.com/maps", SCAN_PAUSE)
     try:
         listings = discover_businesses(
             niche=niche,
@@ -119,106 +351,19 @@ def scan_city_niche(niche: str, city: str) -> dict:
     result["found"] = len(listings)
     log.info("Found %d unique businesses for %s in %s", len(listings), niche, city)
 
-    # Step 2 — Enrich + detect + score (V3 pipeline)
-    prospects: list[LocalProspect] = []
-
-    for i, listing in enumerate(listings, 1):
-        scraped: ScrapedBusiness | None = None
-        chatbot: ChatbotDetectionResult | None = None
-        tech_stack_data: dict | None = None
-        pagespeed_mobile_data: dict | None = None
-        pagespeed_desktop_data: dict | None = None
-        gbp_data_dict: dict | None = None
-        apollo_contacts_list: list | None = None
-
-        if listing.website_url:
-            try:
-                scraped = scrape_business(listing.website_url)
-            except Exception as e:
-                log.debug("Scrape failed for %s: %s", listing.website_url, e)
-
-            # Chatbot detection
-            raw_html = ""
-            if scraped and scraped.raw_html:
-                raw_html = scraped.raw_html
-                chatbot = detect_chatbot(raw_html)
-            elif listing.website_url:
-                from viper.demos.scraper import _fetch_raw_html
-                raw_html = _fetch_raw_html(listing.website_url) or ""
-                if raw_html:
-                    chatbot = detect_chatbot(raw_html)
-
-            # Tech stack fingerprinting (V3)
-            if raw_html:
-                try:
-                    ts_result = fingerprint_tech_stack(listing.website_url, raw_html)
-                    tech_stack_data = ts_result.to_dict()
-                except Exception as e:
-                    log.debug("Tech fingerprint failed for %s: %s", listing.website_url, e)
-
-            # PageSpeed audit (V3) — mobile + desktop
-            try:
-                ps_mobile = audit_pagespeed(listing.website_url, "mobile")
-                if not ps_mobile.error:
-                    pagespeed_mobile_data = ps_mobile.to_dict()
-                ps_desktop = audit_pagespeed(listing.website_url, "desktop")
-                if not ps_desktop.error:
-                    pagespeed_desktop_data = ps_desktop.to_dict()
-            except Exception as e:
-                log.debug("PageSpeed failed for %s: %s", listing.website_url, e)
-
-            time.sleep(SITE_DELAY)
-
-        # GBP enrichment (V3) — budget guard: pre-score >= 6.0
-        pre_score = score_prospect(listing, scraped, chatbot)
-        if pre_score.total >= 6.0:
-            try:
-                gbp_result = enrich_from_gbp(listing.business_name, listing.address)
-                if not gbp_result.error:
-                    gbp_data_dict = gbp_result.to_dict()
-            except Exception as e:
-                log.debug("GBP enrich failed for %s: %s", listing.business_name, e)
-
-        # Apollo email enrichment (V3) — budget guard: score >= 7.0 AND no email
-        if pre_score.total >= 7.0 and scraped and not scraped.email and listing.website_url:
-            domain = extract_domain(listing.website_url)
-            if domain:
-                try:
-                    contacts = apollo_enrich_email(domain, listing.business_name, limit=3)
-                    if contacts:
-                        apollo_contacts_list = [c.to_dict() for c in contacts]
-                        # Use best contact's email
-                        best = contacts[0]
-                        scraped.email = best.email
-                        name = f"{best.first_name} {best.last_name}".strip()
-                        if name and not scraped.team_members:
-                            scraped.team_members.append(name)
-                except Exception as e:
-                    log.debug("Apollo enrich failed for %s: %s", listing.business_name, e)
-
-        # Score with V3 (8 dimensions) using enrichment data
-        score = score_prospect_v3(
-            listing, scraped, chatbot,
-            tech_stack=tech_stack_data,
-            pagespeed=pagespeed_mobile_data,
-            gbp=gbp_data_dict,
-        )
-        prospect = build_prospect(
-            listing, scraped, chatbot, score,
-            tech_stack=tech_stack_data,
-            pagespeed_mobile=pagespeed_mobile_data,
-            pagespeed_desktop=pagespeed_desktop_data,
-            gbp_data=gbp_data_dict,
-            apollo_contacts=apollo_contacts_list,
-        )
-        prospects.append(prospect)
+    # Step 2 — Enrich + detect + score (V3 pipeline, staged + concurrent)
+    prospects, stage_rates = _run_enrichment_pipeline(listings)
+    result["stage_rates"] = stage_rates
 
     # Sort by score descending
     prospects.sort(key=lambda p: p.score, reverse=True)
 
     # Site audit — full crawl via Cloudflare if available, else local fallback
-    for p in prospects:
-        crawl, findings = crawl_and_audit(p)
+    audit_meter = _StageMeter("audit")
+    with ThreadPoolExecutor(max_workers=AUDIT_WORKERS) as pool:
+        audits = list(pool.map(lambda p: audit_meter.run(crawl_and_audit, p), prospects))
+    result["stage_rates"]["audit"] = audit_meter.listings_per_minute()
+    for p, (crawl, findings) in zip(prospects, audits):
         p.audit_findings = findings
         if crawl and not crawl.error:
             # Override chatbot detection with crawl data (more thorough)
@@ -285,9 +430,6 @@ def main() -> int:
             all_results.append(result)
             all_prospects_flat.extend(result["prospects"])
 
-            # Pause between scans to avoid rate limits
-            time.sleep(SCAN_PAUSE)
-
     # ── Save full results to JSON ────────────────────────────────────
     output_payload = {
         "scan_date": start_time.isoformat(),
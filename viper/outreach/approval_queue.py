@@ -7,16 +7,20 @@ Two-gate flow:
     4. Jordan taps GO → status: approved → Resend fires
     5. Jordan taps NO (Gate 1) or SKIP (Gate 2) → status: declined
     6. No reply in 24h → status: expired
+
+Entries live in the Viper state store (viper/state_store.py); the old
+outreach_queue.json is imported on first use.
 """
 from __future__ import annotations
 
-import json
 import logging
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+from viper import state_store
+
 log = logging.getLogger(__name__)
 
 _QUEUE_PATH = Path.home() / "polymarket-bot" / "data" / "outreach_queue.json"
@@ -24,18 +28,38 @@ _TZ = ZoneInfo("America/New_York")
 _AUTO_SKIP_HOURS = 24
 
 
+def _ensure_store() -> None:
+    state_store.migrate_queue(_QUEUE_PATH)
+
+
 def _load_queue() -> list[dict]:
-    if _QUEUE_PATH.exists():
-        try:
-            return json.loads(_QUEUE_PATH.read_text())
-        except (json.JSONDecodeError, OSError):
-            return []
-    return []
+    """All queue entries in queue order (read from the state store)."""
+    _ensure_store()
+    return state_store.queue_list()
 
 
 def _save_queue(queue: list[dict]) -> None:
-    _QUEUE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    _QUEUE_PATH.write_text(json.dumps(queue, indent=2, ensure_ascii=False))
+    """Upsert edited entries back into the state store."""
+    _ensure_store()
+    state_store.queue_replace_all(queue)
+
+
+def update_lead(lead_id: str, **fields) -> dict | None:
+    """Merge fields into one queued lead. Returns the updated lead or None."""
+    _ensure_store()
+    return state_store.queue_update(lead_id, fields)
+
+
+def list_leads(*statuses: str) -> list[dict]:
+    """Queued leads in queue order, optionally filtered by status."""
+    _ensure_store()
+    return state_store.queue_list(statuses or None)
+
+
+def find_by_email(email: str, statuses: tuple[str, ...] | None = None) -> list[dict]:
+    """Queued leads with this email address (indexed lookup)."""
+    _ensure_store()
+    return state_store.queue_find_by_email(email, statuses)
 
 
 def queue_lead(
@@ -79,103 +103,94 @@ def queue_lead(
         "prospect_data": prospect_data or {},
     }
 
-    queue = _load_queue()
-
     # Dedup — never queue the same business twice
-    existing_names = {e["business_name"].lower().strip() for e in queue}
-    if business_name.lower().strip() in existing_names:
+    _ensure_store()
+    if not state_store.queue_insert(entry):
         log.info("Skipped duplicate: %s already in queue", business_name)
         return ""
 
-    queue.append(entry)
-    _save_queue(queue)
     log.info("Queued lead %s: %s (%s)", lead_id, business_name, email)
     return lead_id
 
 
 def approve_lead_gate(lead_id: str) -> dict | None:
     """Gate 1: Jordan approved the lead. Move to draft review stage."""
-    queue = _load_queue()
-    for entry in queue:
-        if entry["id"] == lead_id and entry["status"] == "pending":
-            entry["status"] = "lead_approved"
-            entry["decided_at"] = datetime.now(_TZ).isoformat(timespec="seconds")
-            _save_queue(queue)
-            log.info("Lead %s passed Gate 1: %s", lead_id, entry["business_name"])
-            return entry
-    return None
+    _ensure_store()
+    entry = state_store.queue_update(
+        lead_id,
+        {"status": "lead_approved", "decided_at": datetime.now(_TZ).isoformat(timespec="seconds")},
+        from_status=("pending",),
+    )
+    if entry:
+        log.info("Lead %s passed Gate 1: %s", lead_id, entry["business_name"])
+    return entry
 
 
 def approve_lead(lead_id: str) -> dict | None:
     """Gate 2: Jordan approved the email draft. Ready to send."""
-    queue = _load_queue()
-    for entry in queue:
-        if entry["id"] == lead_id and entry["status"] == "lead_approved":
-            entry["status"] = "approved"
-            entry["decided_at"] = datetime.now(_TZ).isoformat(timespec="seconds")
-            _save_queue(queue)
-            log.info("Lead %s passed Gate 2 (GO): %s", lead_id, entry["business_name"])
-            return entry
-    return None
+    _ensure_store()
+    entry = state_store.queue_update(
+        lead_id,
+        {"status": "approved", "decided_at": datetime.now(_TZ).isoformat(timespec="seconds")},
+        from_status=("lead_approved",),
+    )
+    if entry:
+        log.info("Lead %s passed Gate 2 (GO): %s", lead_id, entry["business_name"])
+    return entry
 
 
 def decline_lead(lead_id: str) -> dict | None:
     """Mark lead as declined. Works from pending or lead_approved status."""
-    queue = _load_queue()
-    for entry in queue:
-        if entry["id"] == lead_id and entry["status"] in ("pending", "lead_approved"):
-            entry["status"] = "declined"
-            entry["decided_at"] = datetime.now(_TZ).isoformat(timespec="seconds")
-            _save_queue(queue)
-            log.info("Lead %s declined: %s", lead_id, entry["business_name"])
-            return entry
-    return None
+    _ensure_store()
+    entry = state_store.queue_update(
+        lead_id,
+        {"status": "declined", "decided_at": datetime.now(_TZ).isoformat(timespec="seconds")},
+        from_status=("pending", "lead_approved"),
+    )
+    if entry:
+        log.info("Lead %s declined: %s", lead_id, entry["business_name"])
+    return entry
 
 
 def get_lead(lead_id: str) -> dict | None:
     """Get a lead by ID."""
-    queue = _load_queue()
-    for entry in queue:
-        if entry["id"] == lead_id:
-            return entry
-    return None
+    _ensure_store()
+    return state_store.queue_get(lead_id)
 
 
 def get_expired_leads() -> list[dict]:
     """Find leads that have been pending longer than _AUTO_SKIP_HOURS."""
-    queue = _load_queue()
     now = datetime.now(_TZ)
     cutoff = now - timedelta(hours=_AUTO_SKIP_HOURS)
     expired = []
 
-    changed = False
-    for entry in queue:
-        if entry["status"] != "pending":
-            continue
+    for entry in list_leads("pending"):
         queued_at = datetime.fromisoformat(entry["queued_at"])
         if queued_at < cutoff:
-            entry["status"] = "expired"
-            entry["decided_at"] = now.isoformat(timespec="seconds")
-            expired.append(entry)
-            changed = True
-
-    if changed:
-        _save_queue(queue)
+            updated = state_store.queue_update(
+                entry["id"],
+                {"status": "expired", "decided_at": now.isoformat(timespec="seconds")},
+                from_status=("pending",),
+            )
+            if updated:
+                expired.append(updated)
     return expired
 
 
 def get_pending_count() -> int:
     """Count of leads awaiting Jordan's decision."""
-    return sum(1 for e in _load_queue() if e["status"] == "pending")
+    _ensure_store()
+    return state_store.queue_status_counts().get("pending", 0)
 
 
 def get_queue_stats() -> dict:
     """Stats for reporting."""
-    queue = _load_queue()
+    _ensure_store()
+    counts = state_store.queue_status_counts()
     return {
-        "pending": sum(1 for e in queue if e["status"] == "pending"),
-        "approved": sum(1 for e in queue if e["status"] == "approved"),
-        "declined": sum(1 for e in queue if e["status"] == "declined"),
-        "expired": sum(1 for e in queue if e["status"] == "expired"),
-        "total": len(queue),
+        "pending": counts.get("pending", 0),
+        "approved": counts.get("approved", 0),
+        "declined": counts.get("declined", 0),
+        "expired": counts.get("expired", 0),
+        "total": sum(counts.values()),
     }
@@ -10,15 +10,19 @@ Sequence steps:
   Day 14 — Closing / break-up
 
 Auto-cancels on reply detection.
+
+Sequences and their steps live in the Viper state store; the old
+outreach_sequences.json is imported on first use.
 """
 from __future__ import annotations
 
-import json
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from viper import state_store
+
 log = logging.getLogger(__name__)
 
 ET = timezone(timedelta(hours=-5))
@@ -34,15 +38,14 @@ _CAN_SPAM_FOOTER = (
 )
 
 
-def _load_sequences() -> list[dict]:
-    if _SEQUENCES_FILE.exists():
-        return json.loads(_SEQUENCES_FILE.read_text())
-    return []
+def _ensure_store() -> None:
+    state_store.migrate_sequences(_SEQUENCES_FILE)
 
 
-def _save_sequences(sequences: list[dict]) -> None:
-    _SEQUENCES_FILE.parent.mkdir(parents=True, exist_ok=True)
-    _SEQUENCES_FILE.write_text(json.dumps(sequences, indent=2, ensure_ascii=False))
+def _load_sequences() -> list[dict]:
+    """All sequences with their steps (read from the state store)."""
+    _ensure_store()
+    return state_store.sequence_list()
 
 
 def create_sequence(lead_data: dict) -> str:
@@ -129,9 +132,8 @@ def create_sequence(lead_data: dict) -> str:
         "steps": steps,
     }
 
-    sequences = _load_sequences()
-    sequences.append(sequence)
-    _save_sequences(sequences)
+    _ensure_store()
+    state_store.sequence_insert(sequence)
 
     log.info("Created follow-up sequence %s for %s (%s)",
              seq_id, lead_data.get("business_name"), lead_data.get("email"))
@@ -152,29 +154,23 @@ def get_due_followups() -> list[dict]:
 
     Returns list of dicts with sequence + step info merged.
     """
-    sequences = _load_sequences()
+    _ensure_store()
     now = datetime.now(ET)
     due = []
 
-    for seq in sequences:
-        if seq["status"] != "active":
-            continue
-        for step in seq["steps"]:
-            if step["status"] != "pending":
-                continue
-            send_at = datetime.fromisoformat(step["send_at"])
-            if send_at <= now:
-                due.append({
-                    "seq_id": seq["id"],
-                    "lead_id": seq["lead_id"],
-                    "business_name": seq["business_name"],
-                    "email": seq["email"],
-                    "niche": seq["niche"],
-                    "contact_name": seq["contact_name"],
-                    "original_subject": seq["original_subject"],
-                    "finding_snippet": seq["finding_snippet"],
-                    **step,
-                })
+    # Indexed range scan on (status, send_ts) — no full-file walk
+    for seq, step in state_store.due_steps(now.timestamp()):
+        due.append({
+            "seq_id": seq["id"],
+            "lead_id": seq["lead_id"],
+            "business_name": seq["business_name"],
+            "email": seq["email"],
+            "niche": seq["niche"],
+            "contact_name": seq["contact_name"],
+            "original_subject": seq["original_subject"],
+            "finding_snippet": seq["finding_snippet"],
+            **step,
+        })
     return due
 
 
@@ -276,61 +272,39 @@ def generate_followup_draft(step_info: dict) -> dict:
 
 def approve_followup(step_id: str) -> bool:
     """Mark a follow-up step as approved (ready to send)."""
-    sequences = _load_sequences()
-    for seq in sequences:
-        for step in seq["steps"]:
-            if step["step_id"] == step_id:
-                step["status"] = "approved"
-                _save_sequences(sequences)
-                log.info("Approved follow-up %s", step_id)
-                return True
+    _ensure_store()
+    if state_store.step_update(step_id, {"status": "approved"}):
+        log.info("Approved follow-up %s", step_id)
+        return True
     return False
 
 
 def mark_sent(step_id: str) -> bool:
     """Mark a follow-up step as sent."""
-    sequences = _load_sequences()
+    _ensure_store()
     now = datetime.now(ET)
-    for seq in sequences:
-        for step in seq["steps"]:
-            if step["step_id"] == step_id:
-                step["status"] = "sent"
-                step["sent_at"] = now.isoformat()
-                _save_sequences(sequences)
-                log.info("Marked follow-up %s as sent", step_id)
-                return True
+    if state_store.step_update(step_id, {"status": "sent", "sent_at": now.isoformat()}):
+        log.info("Marked follow-up %s as sent", step_id)
+        return True
     return False
 
 
 def cancel_sequence(lead_id: str) -> bool:
     """Cancel all remaining steps for a lead (e.g., on reply detection)."""
-    sequences = _load_sequences()
-    found = False
-    for seq in sequences:
-        if seq["lead_id"] == lead_id and seq["status"] == "active":
-            seq["status"] = "cancelled"
-            for step in seq["steps"]:
-                if step["status"] == "pending":
-                    step["status"] = "cancelled"
-            found = True
-            log.info("Cancelled sequence for lead %s (%s)", lead_id, seq["business_name"])
-    if found:
-        _save_sequences(sequences)
-    return found
+    _ensure_store()
+    cancelled = state_store.sequence_cancel(lead_id=lead_id)
+    for seq in cancelled:
+        log.info("Cancelled sequence for lead %s (%s)", lead_id, seq["business_name"])
+    return bool(cancelled)
 
 
 def cancel_sequence_by_id(seq_id: str) -> str:
     """Cancel a sequence by its seq_id. Returns business_name or empty string."""
-    sequences = _load_sequences()
-    for seq in sequences:
-        if seq["id"] == seq_id and seq["status"] == "active":
-            seq["status"] = "cancelled"
-            for step in seq["steps"]:
-                if step["status"] == "pending":
-                    step["status"] = "cancelled"
-            _save_sequences(sequences)
-            log.info("Cancelled sequence %s (%s)", seq_id, seq["business_name"])
-            return seq["business_name"]
+    _ensure_store()
+    cancelled = state_store.sequence_cancel(seq_id=seq_id)
+    if cancelled:
+        log.info("Cancelled sequence %s (%s)", seq_id, cancelled[0]["business_name"])
+        return cancelled[0]["business_name"]
     return ""
 
 
@@ -341,14 +315,5 @@ def mark_replied(lead_id: str) -> bool:
 
 def get_sequence_stats() -> dict:
     """Return summary stats for all sequences."""
-    sequences = _load_sequences()
-    return {
-        "total": len(sequences),
-        "active": sum(1 for s in sequences if s["status"] == "active"),
-        "cancelled": sum(1 for s in sequences if s["status"] == "cancelled"),
-        "completed": sum(1 for s in sequences if s["status"] == "completed"),
-        "pending_steps": sum(
-            1 for s in sequences if s["status"] == "active"
-            for st in s["steps"] if st["status"] == "pending"
-        ),
-    }
+    _ensure_store()
+    return state_store.sequence_stats()
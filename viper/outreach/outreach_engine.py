@@ -149,14 +149,11 @@ def _validate_lead(lead: dict) -> tuple[bool, str]:
         return False, f"Empty subject or body for {biz}"
 
     # 5. No duplicate — check queue for same email
-    from viper.outreach.approval_queue import _load_queue
-    queue = _load_queue()
-    for existing in queue:
+    from viper.outreach.approval_queue import find_by_email
+    for existing in find_by_email(email, ("pending", "lead_approved", "approved")):
         if existing["id"] == lead.get("id"):
             continue
-        if existing["status"] in ("pending", "lead_approved", "approved"):
-            if existing.get("email") == email:
-                return False, f"Duplicate email: {email} already queued as {existing['business_name']}"
+        return False, f"Duplicate email: {email} already queued as {existing['business_name']}"
 
     # 6. Every URL in email must be live (200 status)
     dead = _check_urls_live(body)
@@ -287,13 +284,8 @@ def send_draft_review(lead: dict) -> None:
         lead["gate2_message_id"] = msg_id
         # Persist to queue
         try:
-            from viper.outreach.approval_queue import _load_queue, _save_queue
-            queue = _load_queue()
-            for entry in queue:
-                if entry["id"] == lead["id"]:
-                    entry["gate2_message_id"] = msg_id
-                    break
-            _save_queue(queue)
+            from viper.outreach.approval_queue import update_lead
+            update_lead(lead["id"], gate2_message_id=msg_id)
         except Exception:
             pass
         log.info("Gate 2 draft sent for %s (lead %s, msg %s)", lead["business_name"], lead["id"], msg_id)
@@ -378,12 +370,8 @@ def run_outreach(
             continue
 
         # Also check approval queue — never re-queue accepted or declined leads
-        from viper.outreach.approval_queue import _load_queue
-        existing_queue = _load_queue()
-        already_queued = any(
-            e.get("email") == p.email
-            for e in existing_queue
-        )
+        from viper.outreach.approval_queue import find_by_email
+        already_queued = bool(find_by_email(p.email))
         if already_queued:
             log.info("Already in queue %s — skipping", p.business_name)
             stats["already_contacted"] += 1
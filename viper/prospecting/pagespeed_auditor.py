@@ -11,6 +11,8 @@ from pathlib import Path
 
 import requests
 
+from viper.http_cache import cached_get
+
 log = logging.getLogger(__name__)
 
 _API_URL = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
@@ -116,7 +118,7 @@ def audit_pagespeed(url: str, strategy: str = "mobile") -> PageSpeedResult:
         params["key"] = api_key
 
     try:
-        resp = requests.get(_API_URL, params=params, timeout=_TIMEOUT)
+        resp = cached_get(_API_URL, consumer="pagespeed", params=params, timeout=_TIMEOUT)
         if resp.status_code != 200:
             result.error = f"PageSpeed API {resp.status_code}: {resp.text[:200]}"
             log.error("[PAGESPEED] API error for %s: %s", url[:60], result.error)
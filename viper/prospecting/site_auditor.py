@@ -20,6 +20,8 @@ from pathlib import Path
 
 import requests
 
+from viper.http_cache import cached_post
+
 log = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
@@ -292,7 +294,8 @@ def _crawl_site_cf(website_url: str) -> CrawlResult:
     }
 
     try:
-        resp = requests.post(_CRAWL_URL, json=payload, headers=headers, timeout=60)
+        resp = cached_post(_CRAWL_URL, payload, consumer="site_auditor",
+                           headers=headers, timeout=60)
         if resp.status_code != 200:
             result.error = f"CF API {resp.status_code}: {resp.text[:200]}"
             log.error("[SITE_AUDIT] Cloudflare crawl failed: %s", result.error)
@@ -246,7 +246,8 @@ def fingerprint_tech_stack(url: str, html: str = "") -> TechStackResult:
 
     Args:
         url: Website URL.
-        html: Raw HTML (if already fetched). If empty, Wappalyzer fetches it.
+        html: Raw HTML (if already fetched). If empty, it is fetched through
+            the shared HTTP cache.
 
     Returns:
         TechStackResult with detected technologies.
@@ -254,6 +255,15 @@ def fingerprint_tech_stack(url: str, html: str = "") -> TechStackResult:
     if not html and not url:
         return TechStackResult()
 
+    if not html:
+        from viper.http_cache import cached_get
+        try:
+            resp = cached_get(url, consumer="tech_fingerprinter")
+            if resp.status_code == 200:
+                html = resp.text
+        except Exception as e:
+            log.debug("[TECH] Fetch failed for %s: %s", url[:60], e)
+
     # Try Wappalyzer
     wap_result = None
     if html:
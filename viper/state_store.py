@@ -0,0 +1,596 @@
+"""Embedded SQLite store for Viper lead, queue, sequence and seen-hash state.
+
+Replaces the whole-file JSON read/mutate/rewrite cycle used by lead_writer,
+approval_queue, email_sequences and the inbound/job-hunter seen sets, and
+holds per-feed polling state for the inbound poller engine. Each record is
+one row holding its full dict as JSON plus the few columns we look up by,
+so lookups and updates are single indexed statements.
+
+WAL mode lets the Telegram poller threads, the dashboard and the scan loop
+read and write concurrently; read-modify-write sequences run inside
+``transaction()`` (BEGIN IMMEDIATE) instead of a file lock.
+
+Legacy JSON files are imported once by ``migrate_*`` and renamed to
+``*.migrated`` (a ``meta`` row records each migration).
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+log = logging.getLogger(__name__)
+
+DB_PATH = Path.home() / "polymarket-bot" / "data" / "viper_state.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leads (
+    hash TEXT PRIMARY KEY,
+    lead_id TEXT DEFAULT '',
+    status TEXT DEFAULT 'new',
+    composite REAL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_leads_composite ON leads(composite DESC);
+
+CREATE TABLE IF NOT EXISTS queue (
+    id TEXT PRIMARY KEY,
+    name_key TEXT NOT NULL,
+    email TEXT DEFAULT '',
+    status TEXT NOT NULL,
+    niche TEXT DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_queue_status ON queue(status);
+CREATE INDEX IF NOT EXISTS idx_queue_name ON queue(name_key);
+CREATE INDEX IF NOT EXISTS idx_queue_email ON queue(email);
+
+CREATE TABLE IF NOT EXISTS sequences (
+    id TEXT PRIMARY KEY,
+    lead_id TEXT DEFAULT '',
+    status TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sequences_lead ON sequences(lead_id, status);
+CREATE INDEX IF NOT EXISTS idx_sequences_status ON sequences(status);
+
+CREATE TABLE IF NOT EXISTS sequence_steps (
+    step_id TEXT PRIMARY KEY,
+    seq_id TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    send_ts REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_steps_due ON sequence_steps(status, send_ts);
+CREATE INDEX IF NOT EXISTS idx_steps_seq ON sequence_steps(seq_id, step);
+
+CREATE TABLE IF NOT EXISTS seen (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    ts REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_seen_ts ON seen(namespace, ts);
+
+CREATE TABLE IF NOT EXISTS feeds (
+    feed_key TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_local = threading.local()
+
+
+def _conn() -> sqlite3.Connection:
+    """Per-thread connection (autocommit; explicit transactions via transaction())."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(DB_PATH), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _local.conn = conn
+        _local.depth = 0
+    return conn
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Serialize a read-modify-write across threads and processes.
+
+    Nested use on the same thread joins the outer transaction.
+    """
+    conn = _conn()
+    if _local.depth:
+        _local.depth += 1
+        try:
+            yield conn
+        finally:
+            _local.depth -= 1
+        return
+
+    conn.execute("BEGIN IMMEDIATE")
+    _local.depth = 1
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        _local.depth = 0
+
+
+def _dumps(obj: dict) -> str:
+    return json.dumps(obj, ensure_ascii=False)
+
+
+# ── Migration ───────────────────────────────────────────────────────
+
+def _migrate_once(name: str, path: Path, importer: Callable[[sqlite3.Connection, object], int],
+                  rename: bool = True) -> None:
+    """Import a legacy JSON file exactly once, then set it aside."""
+    marker = f"migrated:{name}"
+    conn = _conn()
+    if conn.execute("SELECT 1 FROM meta WHERE key = ?", (marker,)).fetchone():
+        return
+    with transaction() as conn:
+        if conn.execute("SELECT 1 FROM meta WHERE key = ?", (marker,)).fetchone():
+            return
+        count = 0
+        if path.exists():
+            try:
+                count = importer(conn, json.loads(path.read_text()))
+            except (json.JSONDecodeError, OSError) as e:
+                log.warning("[STATE] Could not read %s for migration: %s", path, e)
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (marker, json.dumps({"source": str(path), "rows": count, "at": time.time()})),
+        )
+    if count:
+        log.info("[STATE] Migrated %d %s rows from %s", count, name, path.name)
+        if rename:
+            try:
+                path.rename(path.with_name(path.name + ".migrated"))
+            except OSError as e:
+                log.debug("[STATE] Could not rename %s: %s", path, e)
+
+
+def migrate_leads(path: Path) -> None:
+    """Import viper_leads.json. The file itself stays — it's the export for Claude Overseer."""
+    def _import(conn, data) -> int:
+        leads = data.get("leads", []) if isinstance(data, dict) else []
+        for lead in leads:
+            _put_lead(conn, lead)
+        return len(leads)
+    _migrate_once("leads", path, _import, rename=False)
+
+
+def migrate_queue(path: Path) -> None:
+    def _import(conn, data) -> int:
+        entries = data if isinstance(data, list) else []
+        for entry in entries:
+            _put_queue(conn, entry)
+        return len(entries)
+    _migrate_once("queue", path, _import)
+
+
+def migrate_sequences(path: Path) -> None:
+    def _import(conn, data) -> int:
+        sequences = data if isinstance(data, list) else []
+        for seq in sequences:
+            _put_sequence(conn, seq)
+        return len(sequences)
+    _migrate_once("sequences", path, _import)
+
+
+def migrate_seen(namespace: str, path: Path) -> None:
+    """Import a seen file — either a list (insertion-ordered) or a {key: ts} dict."""
+    def _import(conn, data) -> int:
+        if isinstance(data, dict):
+            rows = [(namespace, str(k), float(v)) for k, v in data.items()]
+        else:
+            # Preserve list order so cap-pruning still drops the oldest first
+            base = time.time() - len(data)
+            rows = [(namespace, str(k), base + i) for i, k in enumerate(data)]
+        conn.executemany(
+            "INSERT OR IGNORE INTO seen (namespace, key, ts) VALUES (?, ?, ?)", rows,
+        )
+        return len(rows)
+    _migrate_once(f"seen:{namespace}", path, _import)
+
+
+# ── Leads (viper_leads.json) ────────────────────────────────────────
+
+def _put_lead(conn: sqlite3.Connection, lead: dict) -> None:
+    conn.execute(
+        """INSERT INTO leads (hash, lead_id, status, composite, data)
+           VALUES (?, ?, ?, ?, ?)
+           ON CONFLICT(hash) DO UPDATE SET lead_id = excluded.lead_id,
+               status = excluded.status, composite = excluded.composite,
+               data = excluded.data""",
+        (
+            lead.get("hash", ""), lead.get("id", ""), lead.get("status", "new"),
+            (lead.get("scores") or {}).get("composite", 0), _dumps(lead),
+        ),
+    )
+
+
+def put_lead(lead: dict) -> None:
+    _put_lead(_conn(), lead)
+
+
+def lead_exists(lead_hash: str) -> bool:
+    return _conn().execute(
+        "SELECT 1 FROM leads WHERE hash = ?", (lead_hash,)
+    ).fetchone() is not None
+
+
+def find_lead(lead_hash: str) -> dict | None:
+    """Lead whose hash starts with ``lead_hash`` (or that ``lead_hash`` starts with)."""
+    if not lead_hash:
+        return None
+    conn = _conn()
+    # Prefix match as an index range scan: prefix <= hash < prefix+1
+    upper = lead_hash[:-1] + chr(ord(lead_hash[-1]) + 1)
+    row = conn.execute(
+        "SELECT data FROM leads WHERE hash >= ? AND hash < ? ORDER BY hash LIMIT 1",
+        (lead_hash, upper),
+    ).fetchone()
+    if row is None:
+        # Callback payloads sometimes carry more than the stored hash
+        row = conn.execute(
+            "SELECT data FROM leads WHERE hash != '' AND substr(?, 1, length(hash)) = hash LIMIT 1",
+            (lead_hash,),
+        ).fetchone()
+    return json.loads(row["data"]) if row else None
+
+
+def top_leads(limit: int) -> list[dict]:
+    rows = _conn().execute(
+        "SELECT data FROM leads ORDER BY composite DESC LIMIT ?", (limit,)
+    ).fetchall()
+    return [json.loads(r["data"]) for r in rows]
+
+
+def prune_leads(keep: int) -> int:
+    """Drop everything below the top ``keep`` leads by composite score."""
+    cur = _conn().execute(
+        """DELETE FROM leads WHERE hash NOT IN
+           (SELECT hash FROM leads ORDER BY composite DESC LIMIT ?)""",
+        (keep,),
+    )
+    return cur.rowcount
+
+
+# ── Approval queue (outreach_queue.json) ────────────────────────────
+
+def _name_key(name: str) -> str:
+    return (name or "").lower().strip()
+
+
+def _put_queue(conn: sqlite3.Connection, entry: dict) -> None:
+    conn.execute(
+        """INSERT INTO queue (id, name_key, email, status, niche, data)
+           VALUES (?, ?, ?, ?, ?, ?)
+           ON CONFLICT(id) DO UPDATE SET name_key = excluded.name_key,
+               email = excluded.email, status = excluded.status,
+               niche = excluded.niche, data = excluded.data""",
+        (
+            entry["id"], _name_key(entry.get("business_name", "")),
+            entry.get("email", "") or "", entry.get("status", "pending"),
+            entry.get("niche", "") or "", _dumps(entry),
+        ),
+    )
+
+
+def queue_insert(entry: dict) -> bool:
+    """Insert a queue entry unless the business is already queued. Returns True if added."""
+    with transaction() as conn:
+        dup = conn.execute(
+            "SELECT 1 FROM queue WHERE name_key = ? LIMIT 1",
+            (_name_key(entry.get("business_name", "")),),
+        ).fetchone()
+        if dup:
+            return False
+        _put_queue(conn, entry)
+    return True
+
+
+def queue_get(lead_id: str) -> dict | None:
+    row = _conn().execute("SELECT data FROM queue WHERE id = ?", (lead_id,)).fetchone()
+    return json.loads(row["data"]) if row else None
+
+
+def queue_update(lead_id: str, fields: dict, from_status: Iterable[str] | None = None) -> dict | None:
+    """Merge ``fields`` into one entry; optionally only if its status is in ``from_status``.
+
+    Returns the updated entry, or None if not found / status didn't match.
+    """
+    with transaction() as conn:
+        row = conn.execute("SELECT data FROM queue WHERE id = ?", (lead_id,)).fetchone()
+        if row is None:
+            return None
+        entry = json.loads(row["data"])
+        if from_status is not None and entry.get("status") not in set(from_status):
+            return None
+        entry.update(fields)
+        _put_queue(conn, entry)
+    return entry
+
+
+def queue_list(statuses: Iterable[str] | None = None) -> list[dict]:
+    """Entries in queue order, optionally filtered by status (index lookup)."""
+    conn = _conn()
+    if statuses is None:
+        rows = conn.execute("SELECT data FROM queue ORDER BY rowid").fetchall()
+    else:
+        statuses = list(statuses)
+        marks = ",".join("?" * len(statuses))
+        rows = conn.execute(
+            f"SELECT data FROM queue WHERE status IN ({marks}) ORDER BY rowid", statuses,
+        ).fetchall()
+    return [json.loads(r["data"]) for r in rows]
+
+
+def queue_find_by_email(email: str, statuses: Iterable[str] | None = None) -> list[dict]:
+    conn = _conn()
+    rows = conn.execute("SELECT data FROM queue WHERE email = ?", (email,)).fetchall()
+    entries = [json.loads(r["data"]) for r in rows]
+    if statuses is not None:
+        wanted = set(statuses)
+        entries = [e for e in entries if e.get("status") in wanted]
+    return entries
+
+
+def queue_status_counts() -> dict[str, int]:
+    rows = _conn().execute("SELECT status, COUNT(*) AS n FROM queue GROUP BY status").fetchall()
+    return {r["status"]: r["n"] for r in rows}
+
+
+def queue_replace_all(entries: list[dict]) -> None:
+    """Upsert a full list of entries (bulk callers that still edit the list)."""
+    with transaction() as conn:
+        for entry in entries:
+            _put_queue(conn, entry)
+
+
+# ── Follow-up sequences (outreach_sequences.json) ───────────────────
+
+def _send_ts(send_at: str | None) -> float:
+    try:
+        return datetime.fromisoformat(send_at).timestamp() if send_at else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _put_step(conn: sqlite3.Connection, seq_id: str, step: dict) -> None:
+    conn.execute(
+        """INSERT INTO sequence_steps (step_id, seq_id, step, status, send_ts, data)
+           VALUES (?, ?, ?, ?, ?, ?)
+           ON CONFLICT(step_id) DO UPDATE SET status = excluded.status,
+               send_ts = excluded.send_ts, data = excluded.data""",
+        (
+            step["step_id"], seq_id, step.get("step", 0), step.get("status", "pending"),
+            _send_ts(step.get("send_at")), _dumps(step),
+        ),
+    )
+
+
+def _put_sequence(conn: sqlite3.Connection, seq: dict) -> None:
+    header = {k: v for k, v in seq.items() if k != "steps"}
+    conn.execute(
+        """INSERT INTO sequences (id, lead_id, status, data) VALUES (?, ?, ?, ?)
+           ON CONFLICT(id) DO UPDATE SET lead_id = excluded.lead_id,
+               status = excluded.status, data = excluded.data""",
+        (seq["id"], seq.get("lead_id", ""), seq.get("status", "active"), _dumps(header)),
+    )
+    for step in seq.get("steps", []):
+        _put_step(conn, seq["id"], step)
+
+
+def sequence_insert(seq: dict) -> None:
+    with transaction() as conn:
+        _put_sequence(conn, seq)
+
+
+def _assemble(conn: sqlite3.Connection, header_rows: list[sqlite3.Row]) -> list[dict]:
+    sequences = []
+    for row in header_rows:
+        seq = json.loads(row["data"])
+        steps = conn.execute(
+            "SELECT data FROM sequence_steps WHERE seq_id = ? ORDER BY step", (seq["id"],)
+        ).fetchall()
+        seq["steps"] = [json.loads(s["data"]) for s in steps]
+        sequences.append(seq)
+    return sequences
+
+
+def sequence_list(statuses: Iterable[str] | None = None) -> list[dict]:
+    conn = _conn()
+    if statuses is None:
+        rows = conn.execute("SELECT data FROM sequences ORDER BY rowid").fetchall()
+    else:
+        statuses = list(statuses)
+        marks = ",".join("?" * len(statuses))
+        rows = conn.execute(
+            f"SELECT data FROM sequences WHERE status IN ({marks}) ORDER BY rowid", statuses,
+        ).fetchall()
+    return _assemble(conn, rows)
+
+
+def due_steps(now_ts: float) -> list[tuple[dict, dict]]:
+    """(sequence header, step) pairs for pending steps due at ``now_ts`` in active sequences."""
+    rows = _conn().execute(
+        """SELECT s.data AS step_data, q.data AS seq_data
+           FROM sequence_steps s JOIN sequences q ON q.id = s.seq_id
+           WHERE s.status = 'pending' AND s.send_ts <= ? AND q.status = 'active'
+           ORDER BY s.send_ts""",
+        (now_ts,),
+    ).fetchall()
+    return [(json.loads(r["seq_data"]), json.loads(r["step_data"])) for r in rows]
+
+
+def step_update(step_id: str, fields: dict) -> bool:
+    with transaction() as conn:
+        row = conn.execute(
+            "SELECT seq_id, data FROM sequence_steps WHERE step_id = ?", (step_id,)
+        ).fetchone()
+        if row is None:
+            return False
+        step = json.loads(row["data"])
+        step.update(fields)
+        _put_step(conn, row["seq_id"], step)
+    return True
+
+
+def sequence_cancel(seq_id: str | None = None, lead_id: str | None = None) -> list[dict]:
+    """Cancel active sequence(s) by id or lead_id and their pending steps. Returns headers."""
+    with transaction() as conn:
+        if seq_id is not None:
+            rows = conn.execute(
+                "SELECT data FROM sequences WHERE id = ? AND status = 'active'", (seq_id,)
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT data FROM sequences WHERE lead_id = ? AND status = 'active'", (lead_id,)
+            ).fetchall()
+        cancelled = []
+        for row in rows:
+            header = json.loads(row["data"])
+            header["status"] = "cancelled"
+            conn.execute(
+                "UPDATE sequences SET status = 'cancelled', data = ? WHERE id = ?",
+                (_dumps(header), header["id"]),
+            )
+            for srow in conn.execute(
+                "SELECT data FROM sequence_steps WHERE seq_id = ? AND status = 'pending'",
+                (header["id"],),
+            ).fetchall():
+                step = json.loads(srow["data"])
+                step["status"] = "cancelled"
+                _put_step(conn, header["id"], step)
+            cancelled.append(header)
+    return cancelled
+
+
+def sequence_stats() -> dict:
+    conn = _conn()
+    by_status = {
+        r["status"]: r["n"]
+        for r in conn.execute("SELECT status, COUNT(*) AS n FROM sequences GROUP BY status")
+    }
+    pending_steps = conn.execute(
+        """SELECT COUNT(*) FROM sequence_steps s JOIN sequences q ON q.id = s.seq_id
+           WHERE s.status = 'pending' AND q.status = 'active'"""
+    ).fetchone()[0]
+    return {
+        "total": sum(by_status.values()),
+        "active": by_status.get("active", 0),
+        "cancelled": by_status.get("cancelled", 0),
+        "completed": by_status.get("completed", 0),
+        "pending_steps": pending_steps,
+    }
+
+
+# ── Seen-hash sets ──────────────────────────────────────────────────
+
+class SeenSet:
+    """Set-like view over one namespace of the ``seen`` table.
+
+    ``key in seen`` and ``seen.add(key)`` are single indexed statements, so
+    pollers no longer load and rewrite the whole set each cycle. Entries
+    with a negative timestamp are permanent and survive TTL/cap pruning.
+    Also supports ``seen[key] = ts`` for callers that stored {hash: ts}.
+    """
+
+    def __init__(self, namespace: str, ttl: float | None = None, cap: int | None = None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.cap = cap
+
+    def __contains__(self, key: object) -> bool:
+        if not key:
+            return False
+        row = _conn().execute(
+            "SELECT ts FROM seen WHERE namespace = ? AND key = ?", (self.namespace, str(key)),
+        ).fetchone()
+        if row is None:
+            return False
+        ts = row["ts"]
+        return ts < 0 or self.ttl is None or time.time() - ts < self.ttl
+
+    def add(self, key: str, ts: float | None = None) -> None:
+        self[key] = time.time() if ts is None else ts
+
+    def __setitem__(self, key: str, ts: float) -> None:
+        # Never downgrade a permanent (-1) entry back to a timestamp
+        _conn().execute(
+            """INSERT INTO seen (namespace, key, ts) VALUES (?, ?, ?)
+               ON CONFLICT(namespace, key) DO UPDATE SET
+                   ts = CASE WHEN seen.ts < 0 THEN seen.ts ELSE excluded.ts END""",
+            (self.namespace, str(key), float(ts)),
+        )
+
+    def mark_permanent(self, key: str) -> None:
+        _conn().execute(
+            "INSERT OR REPLACE INTO seen (namespace, key, ts) VALUES (?, ?, -1)",
+            (self.namespace, str(key)),
+        )
+
+    def __len__(self) -> int:
+        return _conn().execute(
+            "SELECT COUNT(*) FROM seen WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
+
+    def prune(self) -> int:
+        """Apply TTL expiry and the size cap (oldest non-permanent first)."""
+        removed = 0
+        with transaction() as conn:
+            if self.ttl is not None:
+                removed += conn.execute(
+                    "DELETE FROM seen WHERE namespace = ? AND ts >= 0 AND ts < ?",
+                    (self.namespace, time.time() - self.ttl),
+                ).rowcount
+            if self.cap is not None:
+                excess = conn.execute(
+                    "SELECT COUNT(*) FROM seen WHERE namespace = ?", (self.namespace,)
+                ).fetchone()[0] - self.cap
+                if excess > 0:
+                    removed += conn.execute(
+                        """DELETE FROM seen WHERE namespace = ? AND key IN (
+                               SELECT key FROM seen WHERE namespace = ? AND ts >= 0
+                               ORDER BY ts LIMIT ?)""",
+                        (self.namespace, self.namespace, excess),
+                    ).rowcount
+        return removed
+
+
+# ── Inbound feed polling state ──────────────────────────────────────
+
+def feed_state(feed_key: str) -> dict:
+    """Validators and adaptive-interval state for one inbound feed ({} if new)."""
+    row = _conn().execute("SELECT data FROM feeds WHERE feed_key = ?", (feed_key,)).fetchone()
+    return json.loads(row["data"]) if row else {}
+
+
+def save_feed_state(feed_key: str, state: dict) -> None:
+    _conn().execute(
+        """INSERT INTO feeds (feed_key, data) VALUES (?, ?)
+           ON CONFLICT(feed_key) DO UPDATE SET data = excluded.data""",
+        (feed_key, _dumps(state)),
+    )
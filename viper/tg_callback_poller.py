@@ -7,7 +7,6 @@ Runs as a daemon thread inside the Viper process.
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
 import threading
@@ -39,15 +38,10 @@ def _load_bot_tokens() -> dict[str, str]:
 
 
 def _find_lead_by_hash(lead_hash: str) -> dict | None:
-    """Find a lead in viper_leads.json by hash prefix."""
-    leads_file = Path.home() / "polymarket-bot" / "data" / "viper_leads.json"
-    if not leads_file.exists():
-        return None
+    """Find a lead by hash prefix (indexed lookup in the Viper state store)."""
     try:
-        data = json.loads(leads_file.read_text())
-        for lead in data.get("leads", []):
-            if lead.get("hash", "").startswith(lead_hash):
-                return lead
+        from viper.lead_writer import find_lead
+        return find_lead(lead_hash)
     except Exception as e:
         log.warning("[TG_CALLBACK] _find_lead_by_hash failed: %s", str(e)[:100])
     return None
@@ -229,16 +223,14 @@ def _build_demo_and_review(bot_token: str, lead: dict) -> None:
         lead["body"] = msg["body"]
 
         # 6. Save updated lead back to queue
-        from viper.outreach.approval_queue import _load_queue, _save_queue
-        queue = _load_queue()
-        for entry in queue:
-            if entry["id"] == lead_id:
-                entry["demo_url"] = demo_url
-                entry["demo_is_custom"] = True
-                entry["subject"] = msg["subject"]
-                entry["body"] = msg["body"]
-                break
-        _save_queue(queue)
+        from viper.outreach.approval_queue import update_lead
+        update_lead(
+            lead_id,
+            demo_url=demo_url,
+            demo_is_custom=True,
+            subject=msg["subject"],
+            body=msg["body"],
+        )
 
         # 7. Send Gate 2 draft review
         from viper.outreach.outreach_engine import send_draft_review
@@ -364,15 +356,13 @@ def _handle_outreach_skip(bot_token, cb_id, chat_id, message_id, original_text,
 def _handle_batch_go(bot_token, cb_id, chat_id, message_id, original_text, niche_key):
     """Batch Gate 2: Send ALL emails for a niche in one tap."""
     try:
-        from viper.outreach.approval_queue import _load_queue, _save_queue
+        from viper.outreach.approval_queue import list_leads
         from viper.outreach.outreach_engine import send_approved_email
         import time
 
-        queue = _load_queue()
         targets = [
-            l for l in queue
-            if l.get("status") == "lead_approved"
-            and l.get("demo_is_custom", False)
+            l for l in list_leads("lead_approved")
+            if l.get("demo_is_custom", False)
             and _normalize_niche(l.get("niche", "")) == niche_key
             and l.get("email")
         ]
@@ -408,16 +398,13 @@ def _handle_batch_go(bot_token, cb_id, chat_id, message_id, original_text, niche
 def _handle_batch_skip(bot_token, cb_id, chat_id, message_id, original_text, niche_key):
     """Batch Gate 2: Skip (decline) all leads for a niche."""
     try:
-        from viper.outreach.approval_queue import _load_queue, _save_queue
+        from viper.outreach.approval_queue import list_leads, update_lead
 
-        queue = _load_queue()
         count = 0
-        for lead in queue:
-            if (lead.get("status") == "lead_approved"
-                    and _normalize_niche(lead.get("niche", "")) == niche_key):
-                lead["status"] = "declined"
+        for lead in list_leads("lead_approved"):
+            if _normalize_niche(lead.get("niche", "")) == niche_key:
+                update_lead(lead["id"], status="declined")
                 count += 1
-        _save_queue(queue)
 
         _answer_callback(bot_token, cb_id, f"Skipped {count} {niche_key} leads")
         _edit_message(bot_token, chat_id, message_id,
@@ -639,14 +626,11 @@ def _auto_regen_gate2_emails() -> None:
     Also cleans up duplicate Gate 2 messages.
     """
     try:
-        from viper.outreach.approval_queue import _load_queue, _save_queue
+        from viper.outreach.approval_queue import list_leads, update_lead
         from viper.outreach.templates import get_outreach_message, resolve_niche_key
 
-        queue = _load_queue()
         regen = 0
-        for lead in queue:
-            if lead.get("status") != "lead_approved":
-                continue
+        for lead in list_leads("lead_approved"):
             if not lead.get("contact_name"):
                 continue
 
@@ -660,13 +644,11 @@ def _auto_regen_gate2_emails() -> None:
                 findings=findings,
             )
             if lead.get("subject") != msg["subject"] or lead.get("body") != msg["body"]:
-                lead["subject"] = msg["subject"]
-                lead["body"] = msg["body"]
+                update_lead(lead["id"], subject=msg["subject"], body=msg["body"])
                 regen += 1
                 log.info("[STARTUP] Regenerated email for %s", lead["business_name"])
 
         if regen:
-            _save_queue(queue)
             log.info("[STARTUP] Auto-regenerated %d lead_approved emails with latest templates", regen)
         else:
             log.info("[STARTUP] All lead_approved emails are up-to-date")